@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the one-pass coloring behind gscale with the loop of one
+    cmd.color call per element that it replaced.
+
+    Give the file name of a large model, for example a cryo-EM model of a
+    ribonucleoprotein particle like a ribosome (e.g., 4v9d.cif), to time
+    both methods on it. Without a file name, synthetic models made by
+    bench_vdw.py are used. The colors that the two methods assign are compared.
+
+
+USAGE
+
+    python benchmarks/bench_gscale.py [model file]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import sys, time
+
+from bench_vdw import cmd, load_test_object, shortcuts, sizes
+
+
+def legacy_loop():
+    '''The coloring from the earlier gscale, one selection over all atoms per element.'''
+    for element, color in sorted(shortcuts._elementGrays.items()):
+        cmd.color(color, 'elem %s' % element)
+
+
+def colors(name):
+    values = []
+    cmd.iterate(name, 'values.append(color)', space={'values': values})
+    return values
+
+
+def compare(name):
+    start = time.time()
+    legacy_loop()
+    slow = time.time() - start
+    expected = colors(name)
+
+    cmd.color('red', name)
+    start = time.time()
+    shortcuts.gscale(name)
+    fast = time.time() - start
+    print("%10d %12.3f %12.3f %10.1f %8s" % (cmd.count_atoms(name), slow, fast,
+        slow / max(fast, 1e-9), expected == colors(name)))
+
+
+def main(fileName=None):
+    print("%10s %12s %12s %10s %8s" % ("atoms", "loop/s", "one pass/s", "speedup", "same"))
+    if fileName:
+        cmd.load(fileName, 'model')
+        compare('model')
+        return
+    for nAtoms in sizes:
+        cmd.delete('all')
+        load_test_object(nAtoms)
+        compare('test')
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
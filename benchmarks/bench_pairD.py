@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the cell-list pair search behind pairD with the double loop that it replaced.
+
+    The test systems are two slabs of random atoms at the density of a protein
+    crystal (0.1 atoms per cubic Angstrom) that touch at a plane. As in pairD,
+    only the atoms of each slab within max_dist of the other slab take part
+    in the pair search.
+
+    The double loop is O(N*M), so it is timed on the first rows of the first
+    selection until the time budget is used up. Its total time is then
+    extrapolated linearly and marked with an asterisk.
+
+
+USAGE
+
+    python benchmarks/bench_pairD.py [max_dist] [budget in seconds]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import importlib.util, math, os, os.path, sys, time
+
+import numpy
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location('pymolshortcuts4rnaUpdated',
+    os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py'))
+shortcuts = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shortcuts)
+
+sizes = [10000, 100000, 1000000]
+density = 0.1
+
+
+def interface_atoms(nAtoms, maxDist, seed=0):
+    rng = numpy.random.RandomState(seed)
+    edge = (nAtoms / density) ** (1 / 3)
+    xyz = rng.uniform(0, edge, (nAtoms, 3))
+    left = xyz[:, 0] < edge / 2
+    m1 = xyz[left & (xyz[:, 0] > edge / 2 - maxDist)]
+    m2 = xyz[~left & (xyz[:, 0] < edge / 2 + maxDist)]
+    return m1, m2
+
+
+def legacy_loop(m1, m2, maxDist, budget):
+    '''The pair search from the earlier pairD, without the string building.'''
+    m1, m2 = m1.tolist(), m2.tolist()
+    counter = 0
+    start = time.time()
+    for c1 in range(len(m1)):
+        for c2 in range(len(m2)):
+            distance = math.sqrt(sum(map(lambda f: (f[0]-f[1])**2, zip(m1[c1], m2[c2]))))
+            if distance < float(maxDist):
+                counter += 1
+        elapsed = time.time() - start
+        if elapsed > budget:
+            return elapsed * len(m1) / (c1 + 1), True
+    return time.time() - start, False
+
+
+def main(maxDist=4.0, budget=10.0):
+    print("%10s %10s %10s %10s %12s %12s %10s" % ("atoms", "sel1", "sel2", "pairs", "loop/s", "cell list/s", "speedup"))
+    for nAtoms in sizes:
+        m1, m2 = interface_atoms(nAtoms, maxDist)
+        start = time.time()
+        i, j, d = shortcuts._neighbor_pairs(m1, m2, maxDist)
+        fast = time.time() - start
+        slow, extrapolated = legacy_loop(m1, m2, maxDist, budget)
+        print("%10d %10d %10d %10d %11.2f%s %12.3f %10.0f" % (nAtoms, len(m1), len(m2), len(i),
+            slow, '*' if extrapolated else ' ', fast, slow / max(fast, 1e-9)))
+
+
+if __name__ == '__main__':
+    main(*[float(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the batch metadata fetch behind PDBmeta with one request per
+    entry on a new connection.
+
+    The RCSB Data API is stood in for by a local HTTP/1.1 server that
+    answers every request after a fixed latency and counts the connections
+    that it accepts, so nothing is sent to the real server. The entries
+    are fetched three times: one request at a time, through PDBmeta into
+    an empty SQLite store, and again from the store offline. The stored
+    metadata are compared with the served entries.
+
+
+USAGE
+
+    python benchmarks/bench_pdbmeta.py [number of entries] [latency in seconds]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import contextlib, http.server, importlib.util, io, json, os, os.path, shutil, sys, tempfile, threading, time
+import urllib.request
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location('pymolshortcuts4rnaUpdated',
+    os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py'))
+shortcuts = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shortcuts)
+
+connections = []
+
+
+def entry(code):
+    '''Return a made-up entry of the RCSB Data API for code.'''
+    k = int(code[1:], 36)
+    return {'rcsb_id': code, 'struct': {'title': 'Synthetic RNA %s' % code},
+        'exptl': [{'method': 'X-RAY DIFFRACTION'}], 'rcsb_accession_info': {'deposit_date': '2019-10-02T00:00:00+0000'},
+        'rcsb_entry_info': {'resolution_combined': [1.5 + k % 20 / 10], 'deposited_polymer_entity_instance_count': 2 + k % 3,
+            'polymer_entity_count_protein': k % 2, 'polymer_entity_count_RNA': 1, 'polymer_entity_count_DNA': 0,
+            'nonpolymer_bound_components': ['MG', 'K'][:k % 3]}}
+
+
+def start_server(latency):
+    '''Start a local HTTP/1.1 server that answers every GET after latency seconds; return it.'''
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            connections.append(self.client_address)
+            http.server.BaseHTTPRequestHandler.setup(self)
+
+        def do_GET(self):
+            time.sleep(latency)
+            content = json.dumps(entry(self.path.rsplit('/', 1)[1])).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def legacy_loop(codes):
+    '''One request per entry, each on a new connection.'''
+    for code in codes:
+        with urllib.request.urlopen(shortcuts.pdbMetaURL + code) as response:
+            json.loads(response.read().decode())
+
+
+def main(nEntries=200, latency=0.05):
+    server = start_server(latency)
+    shortcuts.pdbMetaURL = 'http://127.0.0.1:%d/rest/v1/core/entry/' % server.server_address[1]
+    directory = tempfile.mkdtemp()
+    shortcuts.pdbMetaDatabase = os.path.join(directory, 'pdbmeta.sqlite')
+    codes = ['%d%s' % (1 + k % 9, shortcuts.numpy.base_repr(k, 36).rjust(3, '0')) for k in range(nEntries)]
+    try:
+        del connections[:]
+        start = time.time()
+        legacy_loop(codes)
+        slow, slowConnections = time.time() - start, len(connections)
+
+        del connections[:]
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.time()
+            fetched = shortcuts.PDBmeta(' '.join(codes), offline=0)
+            fast, fastConnections = time.time() - start, len(connections)
+
+            start = time.time()
+            stored = shortcuts.PDBmeta(' '.join(codes), offline=1)
+            offline = time.time() - start
+    finally:
+        server.shutdown()
+        shutil.rmtree(directory)
+
+    same = all(row['source'] == 'store' and tuple(row)[:10] == shortcuts._entry_metadata(row['id'], entry(row['id']))
+        for row in stored) and [tuple(row)[:10] for row in fetched] == [tuple(row)[:10] for row in stored]
+    print("%10s %10s %12s %12s %12s %12s %10s %8s" % ("entries", "latency", "loop/s", "batch/s", "offline/s",
+        "connections", "speedup", "same"))
+    print("%10d %10.2f %12.3f %12.3f %12.3f %5d/%-6d %10.1f %8s" % (len(codes), latency, slow, fast, offline,
+        slowConnections, fastConnections, slow / max(fast, 1e-9), same))
+
+
+if __name__ == '__main__':
+    main(*[float(arg) if k else int(arg) for k, arg in enumerate(sys.argv[1:3])])
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the one-object assembly builder behind quat (segments and states
+    modes) with the copy per operator of earlier versions (objects mode).
+
+    The test system is a synthetic asymmetric unit made by bench_vdw.py with
+    a REMARK 350 of random rotations, like those of an icosahedral virus
+    (60 operators) or a long helical filament (up to 1000 operators).
+
+
+USAGE
+
+    python benchmarks/bench_quat.py [atoms in the asymmetric unit]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import os, os.path, sys, tempfile, time
+
+from bench_vdw import cmd, load_test_object, shortcuts
+from synthetic import remark350
+
+operatorCounts = [60, 240, 1000]
+
+
+def main(nAtoms=2000):
+    print("%10s %12s %12s %12s %12s" % ("operators", "atoms", "objects/s", "segments/s", "states/s"))
+    for nOperators in operatorCounts:
+        fileName = os.path.join(tempfile.mkdtemp(), 'test.pdb')
+        with open(fileName, 'w') as f:
+            f.write('\n'.join(remark350(nOperators)) + '\nEND\n')
+        times = []
+        for mode in ('objects', 'segments', 'states'):
+            cmd.delete('all')
+            load_test_object(nAtoms)
+            cmd.alter('test', 'chain="A"')
+            start = time.time()
+            shortcuts.quat('test', fileName, quiet=1, mode=mode)
+            times.append(time.time() - start)
+        os.remove(fileName)
+        print("%10d %12d %12.3f %12.3f %12.3f" % (nOperators, nAtoms * nOperators, times[0], times[1], times[2]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the batched bump check behind sb with the sculpting VDW pass,
+    one state at a time, that it replaced.
+
+    The test systems are synthetic ensembles: the random atoms of
+    bench_vdw.py in the first state and copies with random displacements
+    (0.5 Angstrom r.m.s.) in the other states.
+
+
+USAGE
+
+    python benchmarks/bench_sb.py [atoms per state]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import sys, time
+
+import numpy
+
+from bench_vdw import cmd, load_test_object, shortcuts
+
+stateCounts = [10, 100, 1000]
+
+
+def legacy_loop(name):
+    '''The bump check from the earlier sb, without the copy of the selection.'''
+    cmd.set('sculpt_field_mask', 0x020)  # cSculptVDW
+    for state in range(1, 1 + cmd.count_states(name)):
+        cmd.sculpt_activate(name, state)
+        cmd.sculpt_iterate(name, state, cycles=0)
+    cmd.sculpt_deactivate(name)
+
+
+def load_ensemble(nAtoms, nStates, seed=0):
+    rng = numpy.random.RandomState(seed)
+    cmd.delete('all')
+    load_test_object(nAtoms)
+    xyz = cmd.get_coords('test')
+    for state in range(2, nStates + 1):
+        cmd.create('test', 'test', 1, state)
+        cmd.load_coordset(xyz + rng.normal(0, 0.5 / 3 ** 0.5, xyz.shape), 'test', state)
+
+
+def main(nAtoms=1000):
+    print("%10s %10s %12s %12s %10s" % ("states", "clashes", "sculpt/s", "batch/s", "speedup"))
+    for nStates in stateCounts:
+        load_ensemble(nAtoms, nStates)
+        start = time.time()
+        legacy_loop('test')
+        slow = time.time() - start
+        start = time.time()
+        table = shortcuts.sb('test', show=0)
+        fast = time.time() - start
+        print("%10d %10d %12.3f %12.3f %10.1f" % (nStates, table['clashes'].sum(), slow, fast,
+            slow / max(fast, 1e-9)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
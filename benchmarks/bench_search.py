@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the concurrent search dispatch behind MC and searchSweep with
+    sending the searches one after the other, as MC did before.
+
+    The search sites are stood in for by local HTTP servers, one per site,
+    that answer every request after a fixed latency, so nothing is sent to
+    the real sites. The sweep is run three times: one request at a time,
+    through the dispatcher with an empty cache, and again from the cache.
+    The pages that the dispatcher saves are compared with the pages served.
+
+
+USAGE
+
+    python benchmarks/bench_search.py [number of terms] [latency in seconds]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import http.server, importlib.util, os, os.path, shutil, sys, tempfile, threading, time, urllib.parse, urllib.request
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location('pymolshortcuts4rnaUpdated',
+    os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py'))
+shortcuts = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shortcuts)
+
+nSites = 10
+interval = 0.05
+
+
+def page(parts):
+    '''Return the page that the local servers send for the parts of a URL from urlsplit.'''
+    return ('<html><body>%s?%s</body></html>' % (parts.path, parts.query)).encode()
+
+
+def start_server(latency):
+    '''Start a local server that answers every GET after latency seconds; return it.'''
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            content = page(urllib.parse.urlsplit(self.path))
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def legacy_loop(urls):
+    '''One request after the other, as the earlier MC opened one site after the other.'''
+    for url in urls:
+        with urllib.request.urlopen(url) as response:
+            response.read()
+
+
+def main(nTerms=20, latency=0.2):
+    servers = [start_server(latency) for site in range(nSites)]
+    urls = ['http://127.0.0.1:%d/search?q=term%d' % (server.server_address[1], term)
+        for term in range(nTerms) for server in servers]
+    shortcuts.searchCachePath = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        legacy_loop(urls)
+        slow = time.time() - start
+
+        start = time.time()
+        results = shortcuts._search_requests(urls, fetch=True, show=False, interval=interval)
+        fast = time.time() - start
+        same = all(open(r['path'], 'rb').read() == page(urllib.parse.urlsplit(r['url'])) for r in results)
+
+        start = time.time()
+        results = shortcuts._search_requests(urls, fetch=True, show=False, interval=interval)
+        cached = time.time() - start
+    finally:
+        shutil.rmtree(shortcuts.searchCachePath)
+        for server in servers:
+            server.shutdown()
+
+    print("%10s %10s %12s %12s %12s %10s %8s" % ("searches", "latency", "loop/s", "dispatch/s", "cache/s",
+        "speedup", "same"))
+    print("%10d %10.2f %12.3f %12.3f %12.3f %10.1f %8s" % (len(urls), latency, slow, fast, cached,
+        slow / max(fast, 1e-9), same and all(r['cached'] for r in results)))
+
+
+if __name__ == '__main__':
+    main(*[float(arg) if k else int(arg) for k, arg in enumerate(sys.argv[1:3])])
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the startup cost of the eager and lazy ways of loading the shortcuts.
+
+    eager: run pymolshortcuts4rnaUpdated.py, the way most pymolrc files do it.
+    lazy:  run pymolshortcuts4rnaLazy.py, which registers stubs only.
+    lazy+first use: the lazy mode followed by the first call of a shortcut,
+           which imports the full script as a module.
+
+    Each measurement is made in a fresh headless PyMOL process so that the
+    modes do not share any state. The timings exclude the launch of PyMOL.
+
+
+USAGE
+
+    python benchmarks/bench_startup.py [repeats]
+
+    The Python interpreter must be the one that PyMOL uses (e.g., the
+    Anaconda Python of incentive PyMOL or the Python of Open Source PyMOL).
+
+'''
+from __future__ import division, print_function
+
+import os, os.path, subprocess, sys
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+timer = '''
+import sys, time
+import pymol
+pymol.finish_launching(['pymol', '-qc'])
+from pymol import cmd
+start = time.time()
+cmd.run(sys.argv[1])
+loaded = time.time()
+if sys.argv[2] == 'firstuse':
+    cmd.do('nmr')
+print('%f %f' % (loaded - start, time.time() - start))
+'''
+
+modes = [
+    ('eager', 'pymolshortcuts4rnaUpdated.py', 'none'),
+    ('lazy', 'pymolshortcuts4rnaLazy.py', 'none'),
+    ('lazy+first use', 'pymolshortcuts4rnaLazy.py', 'firstuse'),
+    ]
+
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+
+def time_mode(script, firstUse, repeats):
+    times = []
+    for i in range(repeats):
+        out = subprocess.check_output([sys.executable, '-c', timer,
+            os.path.join(repoDirectory, script), firstUse])
+        times.append(float(out.split()[-1]))
+    return times
+
+
+def main(repeats=5):
+    print("%-16s %10s %10s %10s" % ("mode", "median/s", "min/s", "max/s"))
+    for label, script, firstUse in modes:
+        times = time_mode(script, firstUse, repeats)
+        print("%-16s %10.3f %10.3f %10.3f" % (label, median(times), min(times), max(times)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Time the computational shortcuts on synthetic structures of 1,000 to
+    1,000,000 atoms and save the results as JSON for comparison across
+    versions of pymolshortcuts4rnaUpdated.py.
+
+    The structures are made by synthetic.py (RNA duplexes, helix bundles,
+    and RNA-protein complexes with waters, a crystal cell, and a REMARK 350),
+    so nothing is fetched. Every case is run on a freshly loaded copy of its
+    structure in headless PyMOL; the loading is not timed, except in the
+    load case. The shortest of the repeats is reported. Once a case takes
+    longer than the budget or fails, its larger sizes are skipped. Errors
+    are saved with the results.
+
+
+USAGE
+
+    python benchmarks/bench_suite.py [-h] [--sizes 1000 10000 ...] [--cases sb hb ...]
+        [--repeats 3] [--budget 60] [--output results.json] [--compare old.json]
+
+    Run with the Python interpreter that PyMOL uses. For example, save the
+    results of the current version and compare a later version with them:
+
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --output after.json --compare before.json
+
+'''
+from __future__ import division, print_function
+
+import argparse, contextlib, datetime, io, json, os, os.path, platform, shutil, subprocess, tempfile, time
+
+import numpy
+
+from bench_vdw import cmd, repoDirectory, shortcuts
+import synthetic
+
+sizes = [1000, 10000, 100000, 1000000]
+operators = 4
+
+# name, kind of structure, and the call that is timed with the name of the file of the structure.
+cases = [
+    ('load', 'complex', lambda fileName: cmd.load(fileName, 'timed')),
+    ('pairD', 'complex', lambda fileName: shortcuts.pairD('bench and c. A', 'bench and c. C', '4.0')),
+    ('interface', 'complex', lambda fileName: shortcuts.interface('bench', 'c. A', 'c. C')),
+    ('buriedW', 'complex', lambda fileName: shortcuts.buriedW('bench')),
+    ('findSeq', 'rna', lambda fileName: shortcuts.findSeq(synthetic.rnaSequence[0:8], 'bench')),
+    ('supercell', 'protein', lambda fileName: shortcuts.supercell(1, 1, 1, 'bench')),
+    ('symexpcell', 'protein', lambda fileName: shortcuts.symexpcell('mate', 'bench', 0, 0, 0)),
+    ('quat', 'complex', lambda fileName: shortcuts.quat('bench', fileName, quiet=1, mode='segments')),
+    ('sb', 'complex', lambda fileName: shortcuts.sb('bench', show=0)),
+    ('hb', 'rna', lambda fileName: shortcuts.hb('bench')),
+    ('gscale', 'rna', lambda fileName: shortcuts.gscale('bench')),
+    ('yrb', 'protein', lambda fileName: shortcuts.yrb('bench', removeH=0)),
+    ('colorh1', 'protein', lambda fileName: shortcuts.colorh1('bench')),
+    ('timcolor', 'protein', lambda fileName: shortcuts.timcolor('bench')),
+    ('bs', 'rna', lambda fileName: shortcuts.bs('bench')),
+    ]
+
+
+def environment():
+    '''Return the versions of the software that the timings depend on.'''
+    try:
+        commit = subprocess.check_output(['git', '-C', repoDirectory, 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.STDOUT).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'date': datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit,
+        'pymol': cmd.get_version()[0], 'python': platform.python_version(), 'numpy': numpy.__version__,
+        'machine': platform.platform()}
+
+
+def time_case(call, fileName, repeats):
+    '''Return the shortest time of repeats calls, each on a freshly loaded structure.'''
+    times = []
+    for repeat in range(repeats):
+        cmd.delete('all')
+        cmd.load(fileName, 'bench')
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.time()
+            call(fileName)
+            times.append(time.time() - start)
+    return min(times)
+
+
+def compare(results, fileName):
+    '''Print the ratio of the times in an earlier results file to the times in results.'''
+    with open(fileName) as f:
+        old = json.load(f)
+    before = dict(((r['case'], r['size']), r['seconds']) for r in old['results'] if r['seconds'] is not None)
+    print('\nCompared with %s (commit %s): ratio > 1 means faster now' % (fileName, old['environment']['commit']))
+    print("%-12s %10s %12s %12s %8s" % ("case", "size", "before/s", "now/s", "ratio"))
+    for r in results:
+        key = (r['case'], r['size'])
+        if key in before and r['seconds']:
+            print("%-12s %10d %12.3f %12.3f %8.2f" % (r['case'], r['size'], before[key], r['seconds'],
+                before[key] / r['seconds']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the computational shortcuts on synthetic structures.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=sizes, help='numbers of atoms')
+    parser.add_argument('--cases', nargs='+', default=[case[0] for case in cases], help='cases to run')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=60.0, help='seconds after which larger sizes are skipped')
+    parser.add_argument('--output', default='bench_suite.json')
+    parser.add_argument('--compare', help='results file of an earlier run')
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    files = {}
+    results = []
+    print("%-12s %-8s %10s %10s %12s" % ("case", "kind", "size", "atoms", "seconds"))
+    try:
+        for name, kind, call in cases:
+            if name not in args.cases:
+                continue
+            overBudget = False
+            for size in sorted(args.sizes):
+                if (kind, size) not in files:
+                    fileName = os.path.join(directory, '%s%d.pdb' % (kind, size))
+                    files[kind, size] = (fileName, synthetic.write_pdb(fileName, kind, size, cell=True, operators=operators))
+                fileName, nAtoms = files[kind, size]
+                seconds, error = None, None
+                if not overBudget:
+                    # A failing case (e.g., a shortcut missing from an older version) is recorded, not fatal.
+                    try:
+                        seconds = time_case(call, fileName, args.repeats)
+                    except Exception as exception:
+                        error = '%s: %s' % (type(exception).__name__, exception)
+                overBudget = overBudget or error is not None or seconds > args.budget
+                results.append({'case': name, 'kind': kind, 'size': size, 'atoms': nAtoms, 'seconds': seconds,
+                    'error': error})
+                print("%-12s %-8s %10d %10d %12s" % (name, kind, size, nAtoms,
+                    'error' if error else ('skipped' if seconds is None else '%.3f' % seconds)))
+    finally:
+        shutil.rmtree(directory)
+
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'repeats': args.repeats, 'results': results}, f, indent=1)
+    print('Wrote %s' % args.output)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Compare the one-pass vdw assignment behind bs, bsbw, bsbwsc, bsvdw, and
+    tvdw with the loop of one cmd.alter call per element that it replaced.
+
+    The test systems are random coordinates with the element composition of
+    a hydrated nucleic acid (C, N, O, P, H, Na, Mg). Both methods are run
+    on the same object and the radii that they assign are compared.
+
+
+USAGE
+
+    python benchmarks/bench_vdw.py [largest number of atoms]
+
+    Run with the Python interpreter that PyMOL uses.
+
+'''
+from __future__ import division, print_function
+
+import importlib.util, os, os.path, sys, tempfile, time
+
+import numpy
+
+import pymol
+pymol.finish_launching(['pymol', '-qc'])
+from pymol import cmd
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location('pymolshortcuts4rnaUpdated',
+    os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py'))
+shortcuts = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shortcuts)
+
+sizes = [10000, 100000, 1000000]
+elements = ['C'] * 9 + ['N'] * 4 + ['O'] * 7 + ['P', 'H', 'H', 'H', 'H', 'NA', 'MG']
+
+
+def load_test_object(nAtoms, name='test', seed=0):
+    rng = numpy.random.RandomState(seed)
+    xyz = rng.uniform(0, 999, (nAtoms, 3))
+    elems = [elements[k] for k in rng.randint(0, len(elements), nAtoms)]
+    lines = []
+    for i in range(nAtoms):
+        lines.append('HETATM%5d %-4s UNK %s%4d    %8.3f%8.3f%8.3f  1.00  0.00          %2s' % (
+            i % 100000, elems[i], 'ABCDEFGHIJ'[(i // 100000) % 10], (i // 10) % 10000,
+            xyz[i, 0], xyz[i, 1], xyz[i, 2], elems[i]))
+    fileName = os.path.join(tempfile.mkdtemp(), name + '.pdb')
+    with open(fileName, 'w') as f:
+        f.write('\n'.join(lines) + '\nEND\n')
+    cmd.load(fileName, name)
+    os.remove(fileName)
+
+
+def legacy_loop(selection='all'):
+    '''The vdw assignment from the earlier bs, one selection over all atoms per element.'''
+    for element, radius in sorted(shortcuts._bondiRadii.items()):
+        cmd.alter("elem %-2s" % element, "vdw=%.2f" % radius)
+    cmd.rebuild()
+
+
+def radii(name):
+    values = []
+    cmd.iterate(name, 'values.append(vdw)', space={'values': values})
+    return numpy.array(values)
+
+
+def main(largest=sizes[-1]):
+    print("%10s %12s %12s %10s %8s" % ("atoms", "loop/s", "one pass/s", "speedup", "same"))
+    for nAtoms in [n for n in sizes if n <= largest]:
+        cmd.delete('all')
+        load_test_object(nAtoms)
+        start = time.time()
+        legacy_loop()
+        slow = time.time() - start
+        expected = radii('test')
+
+        cmd.alter('all', 'vdw=1.0')
+        start = time.time()
+        shortcuts._set_vdw('all')
+        fast = time.time() - start
+        same = numpy.allclose(expected, radii('test'))
+        print("%10d %12.3f %12.3f %10.1f %8s" % (nAtoms, slow, fast, slow / max(fast, 1e-9), same))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
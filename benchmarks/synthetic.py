@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Synthetic structures for the benchmarks, made offline and of any size.
+
+    rna:     A-form RNA duplexes of 12 base pairs with their hydration shell.
+    protein: bundles of four alpha helices of 24 residues with side chains.
+    complex: an RNA duplex packed against two protein helices, with waters.
+
+    A structure is a grid of copies of one unit. Each unit has its own segi,
+    and its chains are A and B (RNA), C to F (protein), and W (water), so
+    selections like "c. A" and "c. C" pick the two sides of every interface.
+    The atoms sit on ideal helices (rise and twist of A-form RNA and of the
+    alpha helix) with approximate bond geometry: the structures have the
+    sizes, densities, names, and sequences of real ones but are not meant
+    for modeling. The same arguments always give the same structure.
+
+
+USAGE
+
+    import synthetic
+    nAtoms = synthetic.write_pdb('complex.pdb', 'complex', 100000, cell=True, operators=4)
+
+'''
+from __future__ import division, print_function
+
+import math
+
+import numpy
+
+kinds = ['rna', 'protein', 'complex']
+
+# Sequence of the first strand of the duplexes; findSeq benchmarks search for its first 8 nucleotides.
+rnaSequence = 'GGCUAGCCAUGC'
+complement = {'A': 'U', 'U': 'A', 'G': 'C', 'C': 'G'}
+proteinSequence = ['LEU', 'LYS', 'GLU', 'ALA', 'SER', 'LEU', 'ARG', 'GLU']
+
+# Atoms of the sugar-phosphate backbone from the outside of the duplex inward:
+# (name, radius in Angstroms, phase in degrees, height in Angstroms) relative to the phosphorus.
+backbone = [('P', 8.9, 0, 0), ('OP1', 10.1, -5, 0.6), ('OP2', 9.6, 6, -1.0), ("O5'", 8.0, -2, 1.2),
+    ("C5'", 8.4, 6, 2.2), ("C4'", 7.6, 13, 1.4), ("O4'", 6.6, 8, 0.6), ("C3'", 8.4, 18, 0.6),
+    ("O3'", 8.9, 24, 1.4), ("C2'", 7.2, 20, -0.6), ("O2'", 7.6, 26, -1.5), ("C1'", 6.2, 13, -1.2)]
+bases = {
+    'A': ['N9', 'C8', 'N7', 'C5', 'C6', 'N6', 'N1', 'C2', 'N3', 'C4'],
+    'G': ['N9', 'C8', 'N7', 'C5', 'C6', 'O6', 'N1', 'C2', 'N2', 'N3', 'C4'],
+    'C': ['N1', 'C2', 'O2', 'N3', 'C4', 'N4', 'C5', 'C6'],
+    'U': ['N1', 'C2', 'O2', 'N3', 'C4', 'O4', 'C5', 'C6'],
+    }
+
+# Main chain of one residue of an alpha helix: (name, radius, phase, height) relative to CA.
+mainChain = [('N', 1.6, -28, -0.9), ('CA', 2.3, 0, 0), ('C', 1.7, 28, 0.95), ('O', 2.0, 38, 2.1),
+    ('CB', 3.3, -10, -0.6)]
+sideChains = {
+    'ALA': [], 'SER': ['OG'], 'LEU': ['CG', 'CD1', 'CD2'], 'LYS': ['CG', 'CD', 'CE', 'NZ'],
+    'GLU': ['CG', 'CD', 'OE1', 'OE2'], 'ARG': ['CG', 'CD', 'NE', 'CZ', 'NH1', 'NH2'],
+    }
+
+
+def helix(rows, rise, twist, phase=0.0, sense=1):
+    '''
+    Return (names, steps, xyz) of a helix about the z axis. rows[k] lists
+    the atoms of step k as (name, radius, phase, height). sense=-1 gives
+    the image of the helix under a twofold rotation about the x axis.
+    '''
+    names, steps, xyz = [], [], []
+    for k, atoms in enumerate(rows):
+        for name, radius, delta, height in atoms:
+            angle = math.radians(phase + sense * (k * twist + delta))
+            names.append(name)
+            steps.append(k)
+            xyz.append((radius * math.cos(angle), radius * math.sin(angle), sense * (k * rise + height)))
+    return names, steps, numpy.array(xyz)
+
+
+def strand(sequence, phase, sense):
+    '''Return the atoms of one strand of an A-form duplex as (name, resn, resi, xyz) lists.'''
+    rows = []
+    for resn in sequence:
+        base = bases[resn]
+        # The base atoms fill rows of three, 1.25 Angstroms apart, from the C1' toward the axis.
+        rows.append(backbone + [(name, 4.9 - 1.2 * (n // 3), 14 + math.degrees(1.25 * (n % 3 - 1) / (4.9 - 1.2 * (n // 3))), -0.4)
+            for n, name in enumerate(base)])
+    names, steps, xyz = helix(rows, 2.81, 32.7, phase, sense)
+    return names, [sequence[k] for k in steps], [k + 1 for k in steps], xyz
+
+
+def alpha_helix(nResidues, start=0):
+    '''Return the atoms of an alpha helix as (name, resn, resi, xyz) lists.'''
+    rows = []
+    for k in range(nResidues):
+        resn = proteinSequence[(start + k) % len(proteinSequence)]
+        side = sideChains[resn]
+        rows.append(mainChain + [(name, 4.8 + 1.3 * n, -10 + 12 * (n % 2), -0.6) for n, name in enumerate(side)])
+    names, steps, xyz = helix(rows, 1.5, 100.0)
+    resns = [proteinSequence[(start + k) % len(proteinSequence)] for k in steps]
+    return names, resns, [k + 1 for k in steps], xyz
+
+
+def waters(nWaters, inner, outer, height, rng):
+    '''Return the coordinates of water oxygens in a cylindrical shell about the z axis.'''
+    radius = rng.uniform(inner, outer, nWaters)
+    angle = rng.uniform(0, 2 * math.pi, nWaters)
+    return numpy.column_stack((radius * numpy.cos(angle), radius * numpy.sin(angle), rng.uniform(0, height, nWaters)))
+
+
+def unit(kind, seed=0):
+    '''Return the atoms of one unit as a list of (chain, names, resns, resis, xyz, hetatm).'''
+    rng = numpy.random.RandomState(seed)
+    second = ''.join(complement[resn] for resn in reversed(rnaSequence))
+    length = len(rnaSequence) * 2.81
+    parts = []
+    if kind in ('rna', 'complex'):
+        parts.append(('A',) + strand(rnaSequence, 0.0, 1) + (False,))
+        # The second strand is the twofold image of the first, so that base k pairs with base n - k + 1.
+        names, resns, resis, xyz = strand(second, 150.0 + 32.7 * (len(rnaSequence) - 1), -1)
+        xyz[:, 2] += length - 2.81 - 2 * 0.4
+        parts.append(('B', names, resns, resis, xyz, False))
+    if kind == 'protein':
+        for chain, (x, y) in zip('CDEF', [(-5, -5), (5, -5), (5, 5), (-5, 5)]):
+            names, resns, resis, xyz = alpha_helix(24, start=ord(chain))
+            parts.append((chain, names, resns, resis, xyz + (x, y, 0), False))
+    if kind == 'complex':
+        for chain, (x, y) in zip('CD', [(13.5, -4), (13.5, 6)]):
+            names, resns, resis, xyz = alpha_helix(22, start=ord(chain))
+            parts.append((chain, names, resns, resis, xyz + (x, y, 0), False))
+    nWaters = 80 if kind == 'protein' else 120
+    xyz = waters(nWaters, 10.5, 14.0, length, rng)
+    # Drop the waters that overlap the other atoms of the unit.
+    solute = numpy.concatenate([part[4] for part in parts])
+    xyz = xyz[(((xyz[:, None] - solute[None]) ** 2).sum(axis=2) > 2.6 ** 2).all(axis=1)]
+    parts.append(('W', ['O'] * len(xyz), ['HOH'] * len(xyz), list(range(1, len(xyz) + 1)), xyz, True))
+    return parts
+
+
+def segment_id(k):
+    '''Return a segi of at most four characters for unit k.'''
+    digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    text = ''
+    while True:
+        k, r = divmod(k, 36)
+        text = digits[r] + text
+        if k == 0:
+            return text
+
+
+def atoms(kind, nAtoms, seed=0):
+    '''
+    Return (lines, xyz) of the ATOM and HETATM records of a structure of
+    about nAtoms atoms (whole units), with the coordinates of all atoms.
+    '''
+    parts = unit(kind, seed)
+    perUnit = sum(len(part[1]) for part in parts)
+    nUnits = max(1, int(round(nAtoms / perUnit)))
+    side = int(math.ceil(nUnits ** (1 / 3)))
+    spacing = numpy.array([34.0, 34.0, 40.0]) if kind == 'complex' else numpy.array([30.0, 30.0, 40.0])
+    lines, blocks = [], []
+    serial = 0
+    for k in range(nUnits):
+        shift = spacing * (k % side, (k // side) % side, k // (side * side))
+        segi = segment_id(k)
+        for chain, names, resns, resis, xyz, hetatm in parts:
+            xyz = xyz + shift
+            blocks.append(xyz)
+            record = 'HETATM' if hetatm else 'ATOM  '
+            for name, resn, resi, (x, y, z) in zip(names, resns, resis, xyz.tolist()):
+                serial += 1
+                label = name if len(name) == 4 else ' ' + name
+                lines.append('%s%5d %-4s %3s %s%4d    %8.3f%8.3f%8.3f  1.00 20.00      %-4s%2s' % (
+                    record, serial % 100000, label, resn, chain, resi, x, y, z, segi, name[0]))
+    return lines, numpy.concatenate(blocks)
+
+
+def remark350(nOperators, center=(0.0, 0.0, 0.0), seed=0, chains='A'):
+    '''Return REMARK 350 lines with nOperators random rotations about center.'''
+    rng = numpy.random.RandomState(seed)
+    center = numpy.asarray(center, dtype=float)
+    lines = ['REMARK 350 BIOMOLECULE: 1',
+        'REMARK 350 APPLY THE FOLLOWING TO CHAINS: %s' % ', '.join(chains)]
+    for num in range(1, nOperators + 1):
+        q, r = numpy.linalg.qr(rng.normal(size=(3, 3)))
+        q *= numpy.sign(numpy.linalg.det(q))
+        if num == 1:
+            q = numpy.identity(3)
+        t = center - q.dot(center)
+        for row in range(3):
+            lines.append('REMARK 350   BIOMT%d %3d%10.6f%10.6f%10.6f%15.5f' % (
+                row + 1, num, q[row, 0], q[row, 1], q[row, 2], t[row]))
+    return lines
+
+
+def write_pdb(fileName, kind, nAtoms, cell=False, operators=0, seed=0):
+    '''
+    Write a synthetic structure to a PDB file and return its number of atoms.
+
+    cell adds a CRYST1 record (P 21 21 21, with a cell that encloses the
+    structure) for the symmetry shortcuts. operators adds a REMARK 350 with
+    that many rotations of all chains about the center of the structure for quat.
+    '''
+    lines, xyz = atoms(kind, nAtoms, seed)
+    header = []
+    if operators:
+        chains = 'AB' if kind == 'rna' else ('CDEF' if kind == 'protein' else 'ABCD')
+        header.extend(remark350(operators, xyz.mean(axis=0), seed, chains + 'W'))
+    if cell:
+        a, b, c = xyz.max(axis=0) - xyz.min(axis=0) + 10.0
+        header.append('CRYST1%9.3f%9.3f%9.3f%7.2f%7.2f%7.2f %-11s%4d' % (a, b, c, 90, 90, 90, 'P 21 21 21', 4))
+    with open(fileName, 'w') as f:
+        f.write('\n'.join(header + lines) + '\nEND\n')
+    return len(lines)
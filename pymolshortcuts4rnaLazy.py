@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+'''
+DESCRIPTION
+
+    Registers the shortcuts in pymolshortcuts4rnaUpdated.py without loading them.
+
+    Sourcing pymolshortcuts4rnaUpdated.py from the pymolrc file compiles and
+    executes the whole script (about 16,000 lines) every time that PyMOL starts.
+    This file is a light-weight alternative. It scans the full script for the
+    names of the shortcuts and the first line of their descriptions and
+    registers a small stub for each shortcut. The full script is imported as
+    a Python module the first time that any shortcut is used. The module
+    is compiled once and cached as a .pyc file by Python, so later sessions
+    skip the compilation step too. The settings that the full script applies
+    when it starts (e.g., ray_opaque_background) are applied at once; its 
+    startup messages are not printed when it is imported later.
+
+
+INSTALLATION
+
+    Keep this file in the same directory as pymolshortcuts4rnaUpdated.py.
+    Replace the run command in your .pymolrc file (pymolrc.pml on Windows)
+    with the following line (adjust the file path as appropriate):
+
+    run ~/Scripts/PyMOLscripts/pymolshortcuts4rnaLazy.py
+
+    Enter "SC" to print the list of shortcuts as before. This loads the full
+    script. Enter "SCload" to load the full script without running a shortcut.
+
+
+HELP
+
+    Before a shortcut is loaded, "help <ShortCutName>" prints the one-line
+    summary. After loading, "help <ShortCutName>" prints the full documentation.
+
+    Run benchmarks/bench_startup.py to compare the startup time of the eager
+    and lazy modes.
+
+
+ Copyright Notice
+ ================
+
+ Copyright (c) 2019 Board of Regents for the University of Oklahoma
+
+ See the LICENSE file for the MIT License.
+
+  Blaine Mooers , PhD
+  blaine@ouhsc.edu
+
+'''
+from __future__ import division, print_function
+
+import os, os.path, re, sys
+
+from pymol import cmd
+
+__author__ = "Blaine Mooers"
+__copyright__ = "2019 Board of Regents for the University of Oklahoma"
+__license__ = "MIT Licencse"
+
+
+# PyMOL's run command sets __script__ to the path of this file; __file__ is then
+# the path of the pymol package, or is not defined.
+try:
+    shortcutsDirectory = os.path.dirname(os.path.abspath(globals().get('__script__') or __file__))
+except NameError:
+    shortcutsDirectory = os.getcwd()
+
+shortcutsModuleName = 'pymolshortcuts4rnaUpdated'
+shortcutsFilePath = os.path.join(shortcutsDirectory, shortcutsModuleName + '.py')
+
+# Each shortcut is registered at the left margin of the full script with a line like
+# cmd.extend('AB',AB). The same line is repeated inside the docstring, so names are deduplicated.
+_extendPattern = re.compile(r'''^cmd\.extend\(\s*['"](\w+)['"]\s*,\s*(\w+)\s*\)''', re.M)
+_summaryPattern = re.compile(r'''^def (\w+)\([^\n]*\):\s*\'\'\'\s*DESCRIPTION:\s*([^\n]*)''', re.M)
+# Settings applied at the left margin of the full script before its first function, e.g.,
+# cmd.set('ray_opaque_background','on'); the stubs apply them at startup as the full script does.
+_settingPattern = re.compile(r'''^cmd\.set\(\s*['"](\w+)['"]\s*,\s*['"]?([^'")]*?)['"]?\s*\)''', re.M)
+
+_shortcutsModule = []
+
+
+def _scan_settings(path):
+    '''Return the list of (setting, value) applied by the full script when it starts.'''
+    with open(path) as f:
+        source = f.read()
+    return _settingPattern.findall(source.split('\ndef ', 1)[0])
+
+
+def _scan_shortcuts(path):
+    '''Return an ordered list of (shortcut name, function name, one-line summary).'''
+    with open(path) as f:
+        source = f.read()
+
+    summaries = {}
+    for funcName, summary in _summaryPattern.findall(source):
+        summaries.setdefault(funcName, summary.strip())
+
+    shortcuts, seen = [], set()
+    for name, funcName in _extendPattern.findall(source):
+        if name in seen:
+            continue
+        seen.add(name)
+        shortcuts.append((name, funcName, summaries.get(funcName, '')))
+    return shortcuts
+
+
+def _load_shortcuts():
+    '''Import the full script once; its own cmd.extend calls replace the stubs.'''
+    if _shortcutsModule:
+        return _shortcutsModule[0]
+    if shortcutsModuleName in sys.modules:
+        module = sys.modules[shortcutsModuleName]
+    else:
+        # The full script needs Python 3, so importlib is always available.
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(shortcutsModuleName, shortcutsFilePath)
+        module = importlib.util.module_from_spec(spec)
+        # The full script skips its startup messages; this file has printed its own.
+        module.shortcutsLoadedLazily = True
+        sys.modules[shortcutsModuleName] = module
+        spec.loader.exec_module(module)
+    _shortcutsModule.append(module)
+    return module
+
+
+def _make_stub(name, funcName, summary):
+    def stub(*args, **kwargs):
+        func = getattr(_load_shortcuts(), funcName)
+        cmd.extend(name, func)
+        code = getattr(func, '__code__', None)
+        if code is None or '_self' not in code.co_varnames:
+            kwargs.pop('_self', None)
+        return func(*args, **kwargs)
+    stub.__name__ = str(funcName)
+    stub.__doc__ = '''
+    DESCRIPTION:
+    %s
+
+    The full documentation is loaded with the shortcut on its first use.
+    Enter SCload to load all of the shortcuts now.
+    ''' % summary
+    return stub
+
+
+def SCload():
+    '''
+    DESCRIPTION:
+    Load the full set of shortcuts now instead of on the first use of a shortcut.
+
+    USAGE:
+    SCload
+
+    ARGUMENTS:
+    None
+
+    EXAMPLE:
+    SCload
+
+    MORE DETAILS:
+    The shortcuts are registered by pymolshortcuts4rnaLazy.py as stubs.
+    This command imports pymolshortcuts4rnaUpdated.py so that "help <ShortCutName>"
+    prints the full documentation of every shortcut.
+    '''
+    _load_shortcuts()
+    print("Loaded the shortcuts from %s." % shortcutsFilePath)
+
+cmd.extend('SCload', SCload)
+
+
+def registerShortcuts(path=shortcutsFilePath):
+    '''
+    Apply the startup settings of the full script, register one stub per 
+    shortcut found in it, and return the number of shortcuts.
+    '''
+    for name, value in _scan_settings(path):
+        cmd.set(name, value)
+    shortcuts = _scan_shortcuts(path)
+    for name, funcName, summary in shortcuts:
+        cmd.extend(name, _make_stub(name, funcName, summary))
+    return len(shortcuts)
+
+
+if shortcutsModuleName not in sys.modules:
+    print("Registered %d shortcuts. Enter SC to list them." % registerShortcuts())
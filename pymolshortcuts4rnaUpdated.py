@@ -138,8 +138,10 @@ import subprocess
 from math import cos, sin, radians, sqrt
 import datetime, time, webbrowser, random, glob
 import os, os.path
+import contextlib, hashlib, json, re, shlex, shutil, sys, tempfile
+import urllib.error, urllib.parse, urllib.request
 
-from pymol import cmd, stored, math, cgo, xray
+from pymol import cmd, stored, cgo, xray
 import numpy
 
 __author__ = "Blaine Mooers"
@@ -154,18 +156,60 @@ __maintainer__ = "Blaine Mooers"
 __email__ = "blaine-mooers@ouhsc.edu"
 __status__ = "Production" 
 
+# True when pymolshortcuts4rnaLazy.py imports this file on the first use of a shortcut;
+# the startup messages below are then not printed again.
+shortcutsLoadedLazily = globals().get('shortcutsLoadedLazily', False)
+
 cmd.set('ray_opaque_background','on')
 
 
 ##################################  Edit PATHS to local directories of files ###############################################
 # $HOME/ is the user's main directory: /Users/username or /home/username. r'$HOME' is equivalent to ~. 
-localPDBfilePath = r'$HOME/pdbFiles/'
-localEMAPfilePath = r'$HOME/emapFiles/'
-localHKLfilePath = r'$HOME/hklFiles/'
+# os.path.expandvars replaces $HOME with the path to the user's main directory.
+localPDBfilePath = os.path.expandvars(r'$HOME/pdbFiles/')
+localEMAPfilePath = os.path.expandvars(r'$HOME/emapFiles/')
+localHKLfilePath = os.path.expandvars(r'$HOME/hklFiles/')
+
+# Content-addressed cache of the structures and maps used by the scene shortcuts (GU, BST, U8, NA, ...).
+# Set structureOffline to True to never use the network; missing structures are then reported.
+structureCachePath = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/structures/')
+structureOffline = False
+
+# Index of the biological assemblies read by quat and indexAssemblies (e.g., from the files in local_mirror_divided).
+assemblyIndexFile = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/assemblies.json')
+
+# Headless PyMOL used by renderScenes for its worker processes and the cache of rendered figures.
+pymolBatchCommand = [sys.executable, '-m', 'pymol', '-cq']
+figureCachePath = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/figures/')
+# PyMOL's run command sets __script__ to the path of this file; __file__ is then
+# the path of the pymol package, or is not defined.
+try:
+    shortcutsFilePath = os.path.abspath(globals().get('__script__') or __file__)
+except NameError:
+    shortcutsFilePath = os.path.abspath('pymolshortcuts4rnaUpdated.py')
+
+# Set shortcutTiming to True to record the cost of every call of a shortcut from the start of the session (see SCtime and SCstats).
+shortcutTiming = False
+
+# Result pages saved by MC and searchSweep, the hours for which a saved page is reused,
+# and the shortest time in seconds between the starts of two requests to the same host.
+searchCachePath = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/searches/')
+searchCacheHours = 24
+searchHostInterval = 1.0
+
+# Entry metadata read by PDBmeta from the RCSB Data API and the SQLite database in which it is kept.
+pdbMetaURL = 'https://data.rcsb.org/rest/v1/core/entry/'
+pdbMetaDatabase = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/pdbmeta.sqlite')
+
+# Versioned store of the files saved by the save shortcuts with a time stamp (spdb, spse, scif, spng, ...);
+# see slist and srestore. outputCompression is None, 'gzip', or 'zstd' (needs the zstandard module).
+outputStorePath = os.path.expandvars(r'$HOME/.pymolshortcuts4rna/outputs/')
+outputCompression = None
 
 
 AppPaths='''You may have to edit the file paths to your applications around line 477 in pymolshortcut.py.'''
-print(AppPaths)
+if not shortcutsLoadedLazily:
+    print(AppPaths)
 
 ##################################  Edit PATHS to Applications ###############################################
 #
@@ -559,6 +603,1004 @@ local_mirror_divided = '/mnt/bio/db/pdb.divided'
 # local_mirror_divided = '/mnt/bio/db/pdb.divided'
 
 
+##################################  Helper functions shared by several shortcuts ###############################################
+#
+# These functions are not shortcuts and are not registered with cmd.extend.
+#
+
+def _neighbor_pairs(xyz1, xyz2, cutoff, chunk=200000):
+    '''
+    Return the index arrays (i, j) and the distances of all pairs of points
+    in xyz1 and xyz2 that are closer than cutoff, sorted by i and then by j.
+
+    The points of xyz2 are binned into a cell list with cubic cells of edge cutoff.
+    Each point of xyz1 is then compared only with the points in the 27 cells
+    around its own cell. The points of xyz1 are processed in chunks to bound
+    the memory used for the candidate pairs.
+    '''
+    xyz1 = numpy.asarray(xyz1, dtype=float).reshape(-1, 3)
+    xyz2 = numpy.asarray(xyz2, dtype=float).reshape(-1, 3)
+    cutoff = float(cutoff)
+    if len(xyz1) == 0 or len(xyz2) == 0 or cutoff <= 0:
+        return (numpy.zeros(0, dtype=int), numpy.zeros(0, dtype=int), numpy.zeros(0))
+
+    origin = numpy.minimum(xyz1.min(axis=0), xyz2.min(axis=0))
+    # Shift the cells by one so that the neighbor cells of every point have non-negative indices.
+    cells1 = numpy.floor((xyz1 - origin) / cutoff).astype(numpy.int64) + 1
+    cells2 = numpy.floor((xyz2 - origin) / cutoff).astype(numpy.int64) + 1
+    dims = numpy.maximum(cells1.max(axis=0), cells2.max(axis=0)) + 2
+
+    def cell_keys(cells):
+        return (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    keys2 = cell_keys(cells2)
+    order2 = numpy.argsort(keys2, kind='stable')
+    sortedKeys2 = keys2[order2]
+    offsets = numpy.array([(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)])
+    cutoff2 = cutoff * cutoff
+
+    found_i, found_j, found_d = [], [], []
+    for begin in range(0, len(xyz1), chunk):
+        block = numpy.arange(begin, min(begin + chunk, len(xyz1)))
+        for offset in offsets:
+            keys = cell_keys(cells1[block] + offset)
+            starts = numpy.searchsorted(sortedKeys2, keys, side='left')
+            counts = numpy.searchsorted(sortedKeys2, keys, side='right') - starts
+            total = counts.sum()
+            if total == 0:
+                continue
+            # Expand the ranges [start, start + count) into explicit candidate pairs.
+            ii = numpy.repeat(block, counts)
+            firsts = numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+            jj = order2[firsts + numpy.arange(total)]
+            d2 = ((xyz1[ii] - xyz2[jj]) ** 2).sum(axis=1)
+            keep = d2 < cutoff2
+            found_i.append(ii[keep])
+            found_j.append(jj[keep])
+            found_d.append(numpy.sqrt(d2[keep]))
+
+    if not found_i:
+        return (numpy.zeros(0, dtype=int), numpy.zeros(0, dtype=int), numpy.zeros(0))
+    i, j, d = numpy.concatenate(found_i), numpy.concatenate(found_j), numpy.concatenate(found_d)
+    order = numpy.lexsort((j, i))
+    return i[order], j[order], d[order]
+
+
+def _select_residues(selName, residues, chunk=500):
+    '''
+    Make one selection named selName from an iterable of (model, chain, resi) tuples.
+
+    The residues are grouped by model and chain and written as resi lists
+    like "resi 5+6+12". At most chunk residues go into each call of
+    cmd.select so that no single selection string becomes very large.
+    Returns the number of residues selected.
+    '''
+    groups = {}
+    for model, chain, resi in residues:
+        resi = str(resi)
+        # A leading minus sign in a resi list has to be escaped.
+        if resi.startswith('-'):
+            resi = '\\' + resi
+        groups.setdefault((model, chain), []).append(resi)
+
+    cmd.select(selName, "none")
+    total = 0
+    for (model, chain), resis in groups.items():
+        for begin in range(0, len(resis), chunk):
+            block = resis[begin:begin + chunk]
+            cmd.select(selName, '%s or (model %s and chain "%s" and resi %s)' % (selName, model, chain, "+".join(block)))
+            total += len(block)
+    return total
+
+
+def _record_array(rows, fields):
+    '''
+    Return a NumPy structured array made from a list of tuples.
+
+    fields is a list of (name, type) pairs. The type 'U' marks a text field;
+    its width is set to the longest value in rows.
+    '''
+    dtype = []
+    for column, (name, kind) in enumerate(fields):
+        if kind == 'U':
+            width = max([len(str(row[column])) for row in rows] + [1])
+            kind = 'U%d' % width
+        dtype.append((name, kind))
+    return numpy.array([tuple(row) for row in rows], dtype=dtype)
+
+
+def _dash_cgo(start, end, color=(0.3, 0.3, 0.3), dashLength=0.25, gapLength=0.4, width=1.5):
+    '''
+    Return a CGO list of dashed lines that join each row of start to the same row of end.
+
+    All dashes are built with NumPy and go into one CGO object, so any number
+    of dashed lines is loaded with a single call of cmd.load_cgo.
+    '''
+    start = numpy.asarray(start, dtype=float).reshape(-1, 3)
+    end = numpy.asarray(end, dtype=float).reshape(-1, 3)
+    vectors = end - start
+    lengths = numpy.sqrt((vectors ** 2).sum(axis=1))
+    period = dashLength + gapLength
+    nDashes = numpy.maximum(numpy.ceil(lengths / period), 1).astype(int)
+
+    line = numpy.repeat(numpy.arange(len(start)), nDashes)
+    dash = numpy.arange(nDashes.sum()) - numpy.repeat(numpy.cumsum(nDashes) - nDashes, nDashes)
+    safe = numpy.maximum(lengths[line], 1e-6)
+    t0 = numpy.minimum(dash * period / safe, 1.0)
+    t1 = numpy.minimum(t0 + dashLength / safe, 1.0)
+
+    vertices = numpy.empty((len(line), 2, 4))
+    vertices[:, :, 0] = cgo.VERTEX
+    vertices[:, 0, 1:] = start[line] + t0[:, None] * vectors[line]
+    vertices[:, 1, 1:] = start[line] + t1[:, None] * vectors[line]
+    return ([cgo.LINEWIDTH, float(width), cgo.BEGIN, cgo.LINES, cgo.COLOR] + list(color)
+        + vertices.ravel().tolist() + [cgo.END])
+
+
+# Bondi van der Waals radii used by the ball-and-stick and vdw shortcuts (bs, bsbw, bsbwsc, bsvdw, tvdw).
+# Hydrogen keeps the PyMOL default radius.
+_bondiRadii = {
+    'Ac': 2.00, 'Ag': 1.72, 'Al': 2.00, 'Am': 2.00, 'Ar': 1.88, 'As': 1.85, 'At': 2.00, 'Au': 1.66,
+    'B': 2.00, 'Ba': 2.00, 'Be': 2.00, 'Bh': 2.00, 'Bi': 2.00, 'Bk': 2.00, 'Br': 1.85, 'C': 1.70,
+    'Ca': 2.00, 'Cd': 1.58, 'Ce': 2.00, 'Cf': 2.00, 'Cl': 1.75, 'Cm': 2.00, 'Co': 2.00, 'Cr': 2.00,
+    'Cs': 2.00, 'Cu': 1.40, 'Db': 2.00, 'Ds': 2.00, 'Dy': 2.00, 'Er': 2.00, 'Es': 2.00, 'Eu': 2.00,
+    'F': 1.47, 'Fe': 2.00, 'Fm': 2.00, 'Fr': 2.00, 'Ga': 1.87, 'Gd': 2.00, 'Ge': 2.00, 'He': 1.40,
+    'Hf': 2.00, 'Hg': 1.55, 'Ho': 2.00, 'Hs': 2.00, 'I': 1.98, 'In': 1.93, 'Ir': 2.00, 'K': 2.75,
+    'Kr': 2.02, 'La': 2.00, 'Li': 1.82, 'Lr': 2.00, 'Lu': 2.00, 'Md': 2.00, 'Mg': 1.73, 'Mn': 2.00,
+    'Mo': 2.00, 'Mt': 2.00, 'N': 1.55, 'Na': 2.27, 'Nb': 2.00, 'Nd': 2.00, 'Ne': 1.54, 'Ni': 1.63,
+    'No': 2.00, 'Np': 2.00, 'O': 1.52, 'Os': 2.00, 'P': 1.80, 'Pa': 2.00, 'Pb': 2.02, 'Pd': 1.63,
+    'Pm': 2.00, 'Po': 2.00, 'Pr': 2.00, 'Pt': 1.72, 'Pu': 2.00, 'Ra': 2.00, 'Rb': 2.00, 'Re': 2.00,
+    'Rf': 2.00, 'Rh': 2.00, 'Rn': 2.00, 'Ru': 2.00, 'S': 1.80, 'Sb': 2.00, 'Sc': 2.00, 'Se': 1.90,
+    'Sg': 2.00, 'Si': 2.10, 'Sm': 2.00, 'Sn': 2.17, 'Sr': 2.00, 'Ta': 2.00, 'Tb': 2.00, 'Tc': 2.00,
+    'Te': 2.06, 'Th': 2.00, 'Ti': 2.00, 'Tl': 1.96, 'Tm': 2.00, 'U': 1.86, 'V': 2.00, 'W': 2.00,
+    'Xe': 2.16, 'Y': 2.00, 'Yb': 2.00, 'Zn': 1.39, 'Zr': 2.00,
+    }
+
+# Colors applied by element in the ball-and-stick shortcuts; later entries win.
+_ballAndStickColors = [('gray85', 'C'), ('gray98', 'H'), ('slate', 'N')]
+_ballAndStickGrays = [('gray85', 'C'), ('gray98', 'H'), ('gray55', 'O'), ('gray70', 'S'),
+    ('gray40', 'CL'), ('gray40', 'K'), ('gray40', 'N')]
+
+
+def _set_vdw(selection='all', radii=_bondiRadii):
+    '''
+    Set the vdw radius of each atom in selection from a table of radii by element.
+
+    This is one cmd.alter pass over the selection instead of one pass over
+    the whole scene per element. Elements that are not in the table keep
+    their radius.
+    '''
+    table = dict((element.upper(), radius) for element, radius in radii.items())
+    cmd.alter(selection, 'vdw = table.get(elem.upper(), vdw)', space={'table': table})
+    cmd.rebuild()
+
+
+def _ball_and_stick_workspace():
+    '''Apply the workspace settings shared by the ball-and-stick and vdw shortcuts.'''
+    cmd.bg_color("white")
+    cmd.set("ray_opaque_background", "off")
+    cmd.set("orthoscopic", 0)
+    cmd.set("transparency", 0.5)
+    cmd.set("dash_gap", 0)
+    cmd.set("ray_trace_mode", 1)
+    cmd.set("ray_texture", 2)
+    cmd.set("antialias", 3)
+    cmd.set("ambient", 0.5)
+    cmd.set("spec_count", 5)
+    cmd.set("shininess", 50)
+    cmd.set("specular", 1)
+    cmd.set("reflect", .1)
+    cmd.space("cmyk")
+
+
+def _ball_and_stick(selection, colors):
+    '''Show selection as balls and sticks colored by element with colors, a list of (color, element).'''
+    cmd.show("sticks", selection)
+    cmd.show("spheres", selection)
+    for color, element in colors:
+        cmd.color(color, "elem %s and (%s)" % (element, selection))
+    cmd.set("stick_radius", 0.07, selection)
+    cmd.set("sphere_scale", 0.18, selection)
+    cmd.set("sphere_scale", 0.13, "(%s) and elem H" % selection)
+    cmd.set("dash_gap", 0.01, selection)
+    cmd.set("dash_radius", 0.07, selection)
+    cmd.set("stick_color", "black", selection)
+    cmd.set("dash_gap", 0.01)
+    cmd.set("dash_radius", 0.035)
+    cmd.hide("nonbonded", selection)
+    cmd.hide("lines", selection)
+    cmd.zoom(selection)
+    cmd.hide("labels")
+
+
+def _vdw_copy(selection):
+    '''Make a copy of an object named <selection>_vdw shown as full-sized transparent spheres.'''
+    vdwName = selection + "_vdw"
+    cmd.copy(vdwName, selection)
+    cmd.set("sphere_scale", 1.0, vdwName + " and elem H")
+    cmd.rebuild()
+    cmd.set("sphere_scale", 1, vdwName)
+    cmd.hide("nonbonded", vdwName)
+    cmd.hide("lines", vdwName)
+    cmd.hide("sticks", vdwName)
+    cmd.hide("cartoon", vdwName)
+    cmd.show("spheres", vdwName)
+    cmd.set("sphere_transparency", 0.7, vdwName)
+    print("Note that the selection of 'all' does not work when applying this function")
+    print("to multiple models as are found in pdb1 files and when multiple chains")
+    print("make up the biological unit.")
+    print("The shortcut has to be applied separately to each model.")
+
+
+# Gray level of each element for gscale, from the luminance of the PyMOL element colors
+# (Y = 0.2126 R + 0.7152 G + 0.0722 B).
+_elementGrays = {
+    'Ac': 'grey64', 'Ag': 'grey75', 'Al': 'grey67', 'Am': 'grey39', 'Ar': 'grey75', 'As': 'grey58', 'At': 'grey33',
+    'Au': 'grey80', 'B': 'grey77', 'Ba': 'grey56', 'Be': 'grey87', 'Bh': 'grey20', 'Bi': 'grey40', 'Bk': 'grey40',
+    'Br': 'grey26', 'C': 'grey77', 'Ca': 'grey76', 'Cd': 'grey86', 'Ce': 'grey98', 'Cf': 'grey34', 'Cl': 'grey70',
+    'Cm': 'grey42', 'Co': 'grey64', 'Cr': 'grey60', 'Cs': 'grey17', 'Cu': 'grey54', 'D': 'grey89', 'Db': 'grey19',
+    'Dy': 'grey79', 'Er': 'grey67', 'Es': 'grey29', 'Eu': 'grey85', 'F': 'grey93', 'Fe': 'grey48', 'Fm': 'grey28',
+    'Fr': 'grey8', 'Ga': 'grey60', 'Gd': 'grey82', 'Ge': 'grey52', 'H': 'grey89', 'He': 'grey96', 'Hf': 'grey68',
+    'Hg': 'grey72', 'Ho': 'grey75', 'Hs': 'grey20', 'I': 'grey16', 'In': 'grey49', 'Ir': 'grey29', 'K': 'grey35',
+    'Kr': 'grey65', 'La': 'grey76', 'Li': 'grey60', 'Lr': 'grey19', 'Lu': 'grey48', 'Md': 'grey23', 'Mg': 'grey83',
+    'Mn': 'grey52', 'Mo': 'grey62', 'Mt': 'grey20', 'N': 'grey25', 'Na': 'grey46', 'Nb': 'grey69', 'Nd': 'grey93',
+    'Ne': 'grey85', 'Ni': 'grey67', 'No': 'grey23', 'Np': 'grey43', 'O': 'grey44', 'Os': 'grey36', 'P': 'grey57',
+    'Pa': 'grey52', 'Pb': 'grey34', 'Pd': 'grey33', 'Pm': 'grey90', 'Po': 'grey40', 'Pr': 'grey95', 'Pt': 'grey82',
+    'Pu': 'grey37', 'Ra': 'grey35', 'Rb': 'grey27', 'Re': 'grey43', 'Rf': 'grey19', 'Rh': 'grey39', 'Rn': 'grey46',
+    'Ru': 'grey47', 'S': 'grey76', 'Sb': 'grey46', 'Sc': 'grey90', 'Se': 'grey66', 'Sg': 'grey20', 'Si': 'grey80',
+    'Sm': 'grey89', 'Sn': 'grey48', 'Sr': 'grey71', 'Ta': 'grey60', 'Tb': 'grey81', 'Tc': 'grey53', 'Te': 'grey51',
+    'Th': 'grey59', 'Ti': 'grey75', 'Tl': 'grey39', 'Tm': 'grey61', 'U': 'grey47', 'V': 'grey65', 'W': 'grey50',
+    'Xe': 'grey54', 'Y': 'grey91', 'Yb': 'grey55', 'Zn': 'grey51', 'Zr': 'grey81',
+    }
+
+
+def _color_by_element(selection, colors):
+    '''
+    Color the atoms in selection with colors, a dictionary of element to color name.
+
+    The color names are converted to color indices once and the atoms are
+    recolored in a single cmd.alter pass over the selection instead of one
+    cmd.color call, each a selection over all atoms, per element. Atoms of
+    other elements keep their color.
+    '''
+    table = dict((element.upper(), cmd.get_color_index(color)) for element, color in colors.items())
+    cmd.alter(selection, 'color = table.get(elem.upper(), color)', space={'table': table})
+    cmd.recolor()
+
+
+# Palettes for _color_by_residue. 'colors' defines new colors by RGB; 'atoms' maps
+# (residue name, atom name) to a color, with '*' matching any residue or any atom name.
+_yrbAtoms = {('*', 'N'): 'yrb_grey', ('*', 'C'): 'yrb_grey', ('*', 'CA'): 'yrb_grey', ('*', 'O'): 'yrb_grey',
+    ('*', 'CB'): 'yrb_yellow'}
+for _resn, _groups in [
+        ('ARG', [('NE,NH2,NH1', 'yrb_blue'), ('CD,CZ', 'yrb_grey'), ('CG', 'yrb_yellow')]),
+        ('ASN', [('CG,OD1,ND2', 'yrb_grey')]),
+        ('ASP', [('CG', 'yrb_grey'), ('OD2,OD1', 'yrb_red')]),
+        ('CYS', [('SG', 'yrb_grey')]),
+        ('GLN', [('CG', 'yrb_yellow'), ('CD,OE1,NE2', 'yrb_grey')]),
+        ('GLU', [('CG', 'yrb_yellow'), ('CD', 'yrb_grey'), ('OE1,OE2', 'yrb_red')]),
+        ('HIS', [('CG,CD2,ND1,NE2,CE1', 'yrb_grey')]),
+        ('ILE', [('CG1,CG2,CD1', 'yrb_yellow')]),
+        ('LEU', [('CG,CD1,CD2', 'yrb_yellow')]),
+        ('LYS', [('CG,CD', 'yrb_yellow'), ('CE', 'yrb_grey'), ('NZ', 'yrb_blue')]),
+        ('MET', [('CG,CE', 'yrb_yellow'), ('SD', 'yrb_grey')]),
+        ('PHE', [('CG,CD1,CE1,CZ,CE2,CD2', 'yrb_yellow')]),
+        ('PRO', [('CG', 'yrb_yellow'), ('CD', 'yrb_grey')]),
+        ('SER', [('CB,OG', 'yrb_grey')]),
+        ('THR', [('CB,OG1', 'yrb_grey'), ('CG2', 'yrb_yellow')]),
+        ('TRP', [('CG,CD2,CZ2,CH2,CZ3,CE3', 'yrb_yellow'), ('CD1,NE1,CE2', 'yrb_grey')]),
+        ('TYR', [('CG,CE1,CD1,CE2,CD2', 'yrb_yellow'), ('CZ,OH', 'yrb_grey')]),
+        ('VAL', [('CG1,CG2', 'yrb_yellow')]),
+        ]:
+    for _names, _color in _groups:
+        for _name in _names.split(','):
+            _yrbAtoms[(_resn, _name)] = _color
+del _resn, _groups, _names, _color, _name
+
+# Eisenberg hydrophobicity from https://pymolwiki.org/index.php/Color_h, most hydrophobic first.
+_eisenbergOrder = ['ILE', 'PHE', 'VAL', 'LEU', 'TRP', 'MET', 'ALA', 'GLY', 'CYS', 'TYR',
+    'PRO', 'THR', 'SER', 'HIS', 'GLU', 'ASN', 'GLN', 'ASP', 'LYS', 'ARG']
+_eisenbergScheme1 = [[0.996, 0.062, 0.062], [0.996, 0.109, 0.109], [0.992, 0.156, 0.156], [0.992, 0.207, 0.207],
+    [0.992, 0.254, 0.254], [0.988, 0.301, 0.301], [0.988, 0.348, 0.348], [0.984, 0.394, 0.394],
+    [0.984, 0.445, 0.445], [0.984, 0.492, 0.492], [0.980, 0.539, 0.539], [0.980, 0.586, 0.586],
+    [0.980, 0.637, 0.637], [0.977, 0.684, 0.684], [0.977, 0.730, 0.730], [0.973, 0.777, 0.777],
+    [0.973, 0.824, 0.824], [0.973, 0.875, 0.875], [0.899, 0.922, 0.922], [0.899, 0.969, 0.969]]
+_eisenbergScheme2 = [[0.938, 1, 0.938], [0.891, 1, 0.891], [0.844, 1, 0.844], [0.793, 1, 0.793],
+    [0.746, 1, 0.746], [0.699, 1, 0.699], [0.652, 1, 0.652], [0.606, 1, 0.606], [0.555, 1, 0.555],
+    [0.508, 1, 0.508], [0.461, 1, 0.461], [0.414, 1, 0.414], [0.363, 1, 0.363], [0.316, 1, 0.316],
+    [0.27, 1, 0.27], [0.223, 1, 0.223], [0.176, 1, 0.176], [0.125, 1, 0.125], [0.078, 1, 0.078],
+    [0.031, 1, 0.031]]
+
+_timcolorGroups = [('red', 'ASP GLU CGU'), ('blue', 'ARG LYS HIS'), ('orange', 'MET PHE PRO TRP VAL LEU ILE ALA'),
+    ('green', 'SER THR ASN GLN TYR'), ('yellow', 'CYS CYX')]
+
+_colorPalettes = {
+    'yrb': {
+        'colors': {'yrb_yellow': [0.950, 0.78, 0.0], 'yrb_grey': [0.95, 0.95, 0.95],
+            'yrb_red': [1.0, 0.4, 0.4], 'yrb_blue': [0.2, 0.5, 0.8]},
+        'atoms': _yrbAtoms,
+        },
+    'eisenberg1': {
+        'colors': dict(('color_' + resn.lower(), rgb) for resn, rgb in zip(_eisenbergOrder, _eisenbergScheme1)),
+        'atoms': dict(((resn, '*'), 'color_' + resn.lower()) for resn in _eisenbergOrder),
+        },
+    'eisenberg2': {
+        'colors': dict(('color_' + resn.lower() + '2', rgb) for resn, rgb in zip(_eisenbergOrder, _eisenbergScheme2)),
+        'atoms': dict(((resn, '*'), 'color_' + resn.lower() + '2') for resn in _eisenbergOrder),
+        },
+    'timcolor': {
+        'colors': {},
+        'atoms': dict([((resn, '*'), color) for color, resns in _timcolorGroups for resn in resns.split()]
+            + [(('*', name), 'white') for name in ('CA', 'N', 'C', 'O')]),
+        },
+    }
+
+
+def _color_by_residue(selection, palette):
+    '''
+    Color the atoms in selection by residue name and atom name in a single pass.
+
+    palette is the name of an entry in _colorPalettes or a dictionary with the
+    same keys. The colors of an atom are looked up in this order: (resn, name),
+    ('*', name), and (resn, '*'). Atoms without a match keep their color.
+    The residue and atom names are read once per atom by one cmd.alter pass
+    instead of one cmd.color selection per residue and atom name.
+    '''
+    if not isinstance(palette, dict):
+        palette = _colorPalettes[palette]
+    for name, rgb in palette.get('colors', {}).items():
+        cmd.set_color(name, rgb)
+    table = dict(((resn.upper(), name.upper()), cmd.get_color_index(color))
+        for (resn, name), color in palette['atoms'].items())
+
+    def lookup(resn, name, color):
+        for key in ((resn, name), ('*', name), (resn, '*')):
+            if key in table:
+                return table[key]
+        return color
+
+    cmd.alter(selection, 'color = lookup(resn.upper(), name.upper(), color)', space={'lookup': lookup})
+    cmd.recolor()
+
+
+# File names of each fetch type in the local mirror, the local directories, and fetch_path.
+_structureFileNames = {
+    'pdb': ['%s.pdb', 'pdb%s.ent', 'pdb%s.ent.gz', '%s.pdb.gz', '%s.ent'],
+    'cif': ['%s.cif', '%s.cif.gz'],
+    'pdb1': ['%s.pdb1', '%s.pdb1.gz'],
+    '2fofc': ['%s_2fofc.ccp4', '%s2FoFc.ccp4'],
+    'fofc': ['%s_fofc.ccp4', '%sFoFc.ccp4'],
+    }
+_structureFormats = {'pdb': 'pdb', 'pdb1': 'pdb', 'cif': 'cif', '2fofc': 'ccp4', 'fofc': 'ccp4'}
+_structureIndex = {}
+
+
+def _structure_index():
+    '''Return the index of the structure cache. It is read from disk once per session.'''
+    if not _structureIndex:
+        indexFile = os.path.join(structureCachePath, 'index.json')
+        if os.path.exists(indexFile):
+            with open(indexFile) as f:
+                _structureIndex.update(json.load(f))
+    return _structureIndex
+
+
+@contextlib.contextmanager
+def _structure_cache_lock():
+    '''Hold an exclusive lock on the index of the structure cache, which several PyMOL processes may share.'''
+    os.makedirs(structureCachePath, exist_ok=True)
+    with open(os.path.join(structureCachePath, 'index.lock'), 'a+') as f:
+        if sys.platform == 'win32':
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _file_sha256(fileName):
+    '''Return the SHA-256 hash of the content of a file.'''
+    sha = hashlib.sha256()
+    with open(fileName, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def _cache_structure(key, fileName, source):
+    '''
+    Copy a file into the cache under the SHA-256 hash of its content and record it in the index.
+
+    The copy and the index are written to temporary files with unique names
+    and renamed into place. The index is updated under _structure_cache_lock
+    after reading it again from disk, so entries added by other processes 
+    (e.g., the workers of renderScenes) are kept.
+    '''
+    digest = _file_sha256(fileName)
+    stem, suffix = os.path.splitext(os.path.basename(fileName).lower())
+    if suffix == '.gz':
+        suffix = os.path.splitext(stem)[1] + suffix
+    relativePath = os.path.join(digest[:2], digest + suffix)
+    target = os.path.join(structureCachePath, relativePath)
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        handle, part = tempfile.mkstemp(suffix='.part', dir=os.path.dirname(target))
+        os.close(handle)
+        shutil.copyfile(fileName, part)
+        os.replace(part, target)
+
+    entry = {'file': relativePath, 'sha256': digest, 'source': source,
+        'date': datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}
+    indexFile = os.path.join(structureCachePath, 'index.json')
+    with _structure_cache_lock():
+        if os.path.exists(indexFile):
+            with open(indexFile) as f:
+                _structureIndex.update(json.load(f))
+        _structureIndex[key] = entry
+        handle, part = tempfile.mkstemp(suffix='.part', dir=structureCachePath)
+        with os.fdopen(handle, 'w') as f:
+            json.dump(_structureIndex, f, indent=1, sort_keys=True)
+        os.replace(part, indexFile)
+    return target
+
+
+def _resolve_structure(code, type='pdb'):
+    '''
+    Return (path, source) of a local copy of a structure or map, or (None, None).
+
+    The places are searched in this order: the content-addressed cache, the
+    local mirror of the PDB (local_mirror_divided), localPDBfilePath or
+    localEMAPfilePath, and fetch_path. Files found in fetch_path are added
+    to the cache because PyMOL does not manage that directory.
+    '''
+    key = '%s:%s' % (code.lower(), type)
+    entry = _structure_index().get(key)
+    if entry:
+        path = os.path.join(structureCachePath, entry['file'])
+        if os.path.exists(path):
+            return path, 'cache'
+
+    names = [pattern % variant for pattern in _structureFileNames.get(type, ['%s.' + type])
+        for variant in (code, code.lower(), code.upper())]
+    localPath = localEMAPfilePath if type in ('2fofc', 'fofc') else localPDBfilePath
+    places = [('mirror', os.path.join(local_mirror_divided, code.lower()[1:3])),
+        ('local', localPath), ('fetch_path', cmd.get('fetch_path'))]
+    for source, directory in places:
+        for fileName in names:
+            path = os.path.join(directory, fileName)
+            if os.path.isfile(path):
+                if source == 'fetch_path':
+                    return _cache_structure(key, path, source), source
+                return path, source
+    return None, None
+
+
+def _load_structure(code, type='pdb', name=None, quiet=1):
+    '''
+    Load a structure or map for a scene shortcut without using the network when
+    a local copy exists; see _resolve_structure. Downloads go through cmd.fetch
+    and are added to the cache. Returns the name of the new object or None.
+    '''
+    if name is None:
+        name = code + ('_' + type if type in ('2fofc', 'fofc') else '')
+    path, source = _resolve_structure(code, type)
+    if path is None:
+        if structureOffline:
+            print("%s (%s) is not in the structure cache or the local mirror; structureOffline is set." % (code, type))
+            return None
+        # a download directory of its own, as other processes may fetch the same code at the same time
+        os.makedirs(structureCachePath, exist_ok=True)
+        downloadPath = tempfile.mkdtemp(prefix='download', dir=structureCachePath)
+        try:
+            if cmd.fetch(code, name, type=type, path=downloadPath, async_=0) == -1:
+                print("Could not fetch %s (%s)." % (code, type))
+                return None
+            for fileName in os.listdir(downloadPath):
+                if fileName.lower().startswith(code.lower()):
+                    _cache_structure('%s:%s' % (code.lower(), type), os.path.join(downloadPath, fileName), 'network')
+        finally:
+            shutil.rmtree(downloadPath, ignore_errors=True)
+        source = 'network'
+    else:
+        cmd.load(path, name, format=_structureFormats.get(type, ''))
+    if not quiet:
+        print("Loaded %s (%s) from the %s." % (code, type, source))
+    return name
+
+
+# Executables tried for each application shortcut when the program of its Open command above
+# is missing, e.g., the macOS open command on Linux or the start command of the shell on Windows.
+_appExecutables = {
+    'JASP': ['jasp'], 'JMP': ['jmp'], 'RStudio': ['rstudio'], 'atom': ['atom'], 'bbedit': ['bbedit'],
+    'ccp4mg': ['ccp4mg', 'qtmg'], 'chimera': ['chimera', 'chimerax'], 'code': ['code'], 'coot': ['coot'],
+    'cranR': ['R'], 'ddb': ['sqlitebrowser'], 'emacs': ['emacs'], 'excel': ['excel'], 'gedit': ['gedit'],
+    'gimp': ['gimp'], 'inkscape': ['inkscape'], 'iterm': ['x-terminal-emulator', 'xterm'], 'jabref': ['jabref'],
+    'jedit': ['jedit'], 'jmol': ['jmol'], 'julia': ['julia'], 'juliapro': ['julia'], 'mate': ['mate'],
+    'npp': ['notepad++'], 'nv': ['nvim-qt', 'nvim'], 'oc': ['octave'], 'oni': ['oni'], 'pdbed': [],
+    'ppt': ['powerpnt'], 'st3': ['subl'], 'term': ['x-terminal-emulator', 'gnome-terminal', 'konsole', 'xterm'],
+    'vim': ['gvim'], 'vmd': ['vmd'], 'word': ['winword'], 'x11': ['xterm'], 'xquartz': ['xterm'],
+    'yasara': ['yasara'],
+    }
+_appResolved = {}
+_appProcesses = []
+_appStartupWait = 0.2
+_appHandoff = {}
+
+
+def _which(program):
+    '''Return the full path of a program from the PATH or, on Windows, from the App Paths of the registry.'''
+    path = shutil.which(os.path.expanduser(program))
+    if path is None and sys.platform == 'win32':
+        try:
+            import winreg
+            executable = program if program.lower().endswith('.exe') else program + '.exe'
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                    r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\%s' % executable) as key:
+                path = winreg.QueryValue(key, None) or None
+        except OSError:
+            pass
+    return path
+
+
+def _resolve_app(name, command):
+    '''
+    Return the command line that starts the application of a shortcut, or None.
+
+    The program of command (the Open setting of the application) is looked 
+    up first, then the executables in _appExecutables. command is skipped 
+    when it uses the macOS open command on another system or names a .app
+    or .jar path that does not exist. The result is kept for the session,
+    so the PATH is searched once per application.
+    '''
+    key = (name, tuple(command))
+    if key not in _appResolved:
+        _appResolved[key] = None
+        program = _which(command[0])
+        if os.path.basename(command[0]) == 'open' and sys.platform != 'darwin':
+            program = None
+        for argument in command[1:]:
+            if os.path.dirname(argument) and re.search(r'\.(app|jar)(/|$)', argument, re.I) \
+                    and not os.path.exists(os.path.expanduser(argument)):
+                program = None
+        if program:
+            _appResolved[key] = [program] + list(command[1:])
+        else:
+            for executable in _appExecutables.get(name, []):
+                program = _which(executable)
+                if program:
+                    _appResolved[key] = [program]
+                    break
+    return _appResolved[key]
+
+
+def _launch_app(name, command, arguments=()):
+    '''
+    Start the application of a shortcut without waiting for it and return 
+    the Popen object, or None. 
+
+    The application gets its own session and no terminal output, so PyMOL 
+    stays responsive and the application is not stopped with PyMOL. It is
+    recorded in _appProcesses, with the time that Popen took to start the
+    process, for the apps shortcut. A program that exits with an error
+    within _appStartupWait seconds is reported and None is returned.
+    '''
+    if isinstance(command, str):
+        command = shlex.split(command)
+    resolved = _resolve_app(name, command)
+    if resolved is None:
+        print("%s was not found on the PATH. Edit its Open command near the top of this file." % name)
+        return None
+    if os.name == 'posix':
+        options = {'start_new_session': True}
+    else:
+        options = {'creationflags': getattr(subprocess, 'DETACHED_PROCESS', 0)}
+    start = time.time()
+    try:
+        process = subprocess.Popen(resolved + [str(argument) for argument in arguments], stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **options)
+    except OSError as e:
+        print("Could not start %s: %s" % (name, e))
+        return None
+    latency = time.time() - start
+    # The macOS open command exits at once with status 0; a nonzero status means that the start failed.
+    while process.poll() is None and time.time() - start < _appStartupWait:
+        time.sleep(0.01)
+    if process.returncode:
+        print("%s exited at once with status %d: %s" % (name, process.returncode, ' '.join(process.args)))
+        return None
+    # Collect the exit status of the applications that were closed since the last launch.
+    for entry in _appProcesses:
+        entry['process'].poll()
+    _appProcesses.append({'name': name, 'process': process, 'command': ' '.join(process.args),
+        'started': start, 'latency': latency})
+    print("Started %s (pid %d) in %.0f ms." % (name, process.pid, 1000 * latency))
+    return process
+
+
+def _handoff_selection(selection, name):
+    '''
+    Save a selection to a new file in a temporary directory of the session
+    and return its path, so that an external program can open it. Selections
+    of more than 99,999 atoms are saved as mmCIF.
+    '''
+    if 'directory' not in _appHandoff:
+        _appHandoff['directory'] = tempfile.mkdtemp(prefix='pymolshortcuts4rna_')
+    suffix = '.cif' if cmd.count_atoms(selection) > 99999 else '.pdb'
+    _appHandoff['count'] = _appHandoff.get('count', 0) + 1
+    fileName = os.path.join(_appHandoff['directory'], '%s_%s_%d%s' % (name, re.sub(r'\W+', '_', selection).strip('_'),
+        _appHandoff['count'], suffix))
+    cmd.save(fileName, selection)
+    return fileName
+
+
+# Formats that the save shortcuts and sexport serialize in memory; the other formats are written by cmd.save
+# to a staging file. _outputLoadable lists the formats that srestore loads back into PyMOL.
+_outputSerialized = ['pdb', 'cif', 'sdf', 'mol', 'mol2', 'mae', 'pqr', 'xyz', 'fasta', 'pse']
+_outputLoadable = ['pdb', 'cif', 'sdf', 'mol', 'mol2', 'mae', 'pqr', 'xyz', 'pse']
+_outputSuffixes = {'gzip': '.gz', 'zstd': '.zst'}
+_outputStore = {}
+
+
+def _output_store():
+    '''
+    Return the state of the output store: the queue and thread of the 
+    writer, the last version of each stem and format, and the stored file
+    of each content hash. The manifest is read on first use.
+    '''
+    if not _outputStore:
+        import atexit, queue
+        versions, objects = {}, {}
+        for entry in _output_manifest():
+            key = (entry['stem'], entry['format'])
+            versions[key] = max(versions.get(key, 0), entry['version'])
+            objects[entry['sha256']] = entry['file']
+        _outputStore.update(queue=queue.Queue(), thread=None, versions=versions, objects=objects)
+        # Pending writes are finished before the interpreter exits.
+        atexit.register(_outputStore['queue'].join)
+    return _outputStore
+
+
+def _output_manifest():
+    '''Return the entries of the manifest of the output store, oldest first.'''
+    entries = []
+    manifest = os.path.join(outputStorePath, 'manifest.jsonl')
+    if os.path.exists(manifest):
+        with open(manifest) as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    return entries
+
+
+def _compress_output(content, compression):
+    '''Return content compressed with gzip or zstd (if the zstandard module is installed) and the method used.'''
+    if compression == 'zstd':
+        try:
+            import zstandard
+            return zstandard.ZstdCompressor(level=3).compress(content), 'zstd'
+        except ImportError:
+            compression = 'gzip'
+    if compression == 'gzip':
+        import gzip
+        return gzip.compress(content, 6), 'gzip'
+    return content, None
+
+
+def _decompress_output(content, compression):
+    '''Return the content of a file of the output store.'''
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(content)
+    if compression == 'gzip':
+        import gzip
+        return gzip.decompress(content)
+    return content
+
+
+def _output_writer():
+    '''
+    Write the saves in the queue of the output store until the session ends.
+
+    Each save is hashed; content that is already in the store is not
+    written again. Every save, duplicate or not, is appended to the manifest.
+    '''
+    store = _output_store()
+    while True:
+        entry, content, stagingFile = store['queue'].get()
+        try:
+            if content is None:
+                with open(stagingFile, 'rb') as f:
+                    content = f.read()
+                os.remove(stagingFile)
+            start = time.time()
+            entry['sha256'] = hashlib.sha256(content).hexdigest()
+            entry['bytes'] = len(content)
+            existing = store['objects'].get(entry['sha256'])
+            entry['duplicate'] = existing is not None and os.path.exists(os.path.join(outputStorePath, existing))
+            if entry['duplicate']:
+                entry['file'], entry['stored'] = existing, 0
+                entry['compression'] = ([method for method, suffix in _outputSuffixes.items()
+                    if existing.endswith(suffix)] + [None])[0]
+            else:
+                data, entry['compression'] = _compress_output(content, entry['compression'])
+                entry['file'] = os.path.join('objects', entry['sha256'][:2], '%s.%s%s' % (entry['sha256'],
+                    entry['format'], _outputSuffixes.get(entry['compression'], '')))
+                target = os.path.join(outputStorePath, entry['file'])
+                if not os.path.isdir(os.path.dirname(target)):
+                    os.makedirs(os.path.dirname(target))
+                with open(target + '.part', 'wb') as f:
+                    f.write(data)
+                os.replace(target + '.part', target)
+                entry['stored'] = len(data)
+                store['objects'][entry['sha256']] = entry['file']
+            entry['writeSeconds'] = time.time() - start
+            with open(os.path.join(outputStorePath, 'manifest.jsonl'), 'a') as f:
+                f.write(json.dumps(entry, sort_keys=True) + '\n')
+        except Exception as e:
+            print("Could not store %s version %d (%s): %s" % (entry['stem'], entry['version'], entry['format'], e))
+        finally:
+            store['queue'].task_done()
+
+
+def _serialize_output(format, selection='all', state=-1):
+    '''
+    Return the content of a file of the format in memory, or None for the 
+    formats that only cmd.save writes (png, obj, wrl, ...). pse files hold
+    the whole session, whatever the selection.
+    '''
+    if format == 'pse':
+        import pickle
+        return pickle.dumps(cmd.get_session(), 1)
+    if format == 'fasta':
+        return cmd.get_fastastr(selection).encode()
+    if format in _outputSerialized and hasattr(cmd, 'get_str'):
+        return cmd.get_str(format, selection, state).encode()
+    return None
+
+
+def _store_output(stemName, format):
+    '''
+    Save the session (pse, png, ...) or all atoms in a format to the output
+    store and return the version number.
+
+    Only the serialization runs in the foreground: the formats in 
+    _outputSerialized are kept in memory, the others are written by 
+    cmd.save to a staging file. Hashing, compression, and writing are left
+    to a background thread; see _output_writer.
+    '''
+    import threading
+    store = _output_store()
+    staging = os.path.join(outputStorePath, 'staging')
+    if not os.path.isdir(staging):
+        os.makedirs(staging)
+
+    start = time.time()
+    content, stagingFile = _serialize_output(format), None
+    if content is None:
+        handle, stagingFile = tempfile.mkstemp(suffix='.' + format, dir=staging)
+        os.close(handle)
+        cmd.save(stagingFile)
+
+    key = (stemName, format)
+    store['versions'][key] = store['versions'].get(key, 0) + 1
+    entry = {'stem': stemName, 'format': format, 'version': store['versions'][key],
+        'date': datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'), 'compression': outputCompression,
+        'saveSeconds': time.time() - start}
+    store['queue'].put((entry, content, stagingFile))
+    if store['thread'] is None:
+        store['thread'] = threading.Thread(target=_output_writer, name='output store', daemon=True)
+        store['thread'].start()
+    print("Saved %s version %d as %s in %.0f ms; it is written to %s in the background." % (stemName,
+        entry['version'], format, 1000 * entry['saveSeconds'], outputStorePath))
+    return entry['version']
+
+
+# Scenes stored as data for _build_scene. Atoms are named object/chain/resi/name;
+# the residue name may precede the residue number as in PyMOL macros (e.g., HOH`319).
+_sceneDefinitions = {
+    'NA': {
+        'structure': ('3nd4', 'pdb1'),
+        'viewport': (900, 600),
+        'commands': ['split_states 3nd4'],
+        'settings': [('valence', 'off'), ('stick_radius', '0.125'), ('nb_spheres_size', '.35'),
+            ('depth_cue', '0'), ('ray_trace_fog', '0'), ('dash_color', 'black'), ('label_font_id', '5'),
+            ('label_size', '36'), ('label_position', '(0.5, 1.0,2.0)'), ('label_color', 'black'),
+            ('dash_gap', '0.2'), ('dash_width', '2.0'), ('dash_length', '0.2')],
+        'representations': [('hide', 'cartoon', 'all'), ('hide', 'spheres', 'all'), ('show', 'sticks', 'all'),
+            ('hide', 'everything', 'elem H*'), ('show', 'nb_spheres', 'all')],
+        'background': 'white',
+        'objects': [('coorCov', '3nd4_0001 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7))')],
+        'bonds': [
+            ('coorCov/A/NA`19/NA', 'coorCov/A/A`3/N7'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`119/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`219/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`319/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`419/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`519/O'),
+            ],
+        'distances': [
+            ('dist01', '3nd4_0001/A/NA`19/NA', '3nd4_0001/A/HOH`519/O'),
+            ('dist02', '3nd4_0001/A/NA`19/NA', '3nd4_0001/A/HOH`419/O'),
+            ('dist03', '3nd4_0001/A/NA`19/NA', '3nd4_0001/A/HOH`119/O'),
+            ('dist04', '3nd4_0001/A/NA`19/NA', '3nd4_0001/A/HOH`319/O'),
+            ('dist05', '3nd4_0001/A/NA`19/NA', '3nd4_0001/A/HOH`219/O'),
+            ('hbond1', '3nd4_0001/A/HOH`119/O', '3nd4_0001/A/1/OP2'),
+            ('hbond2', '3nd4_0001/A/HOH`319/O', '3nd4_0001/A/A`3/OP2'),
+            ('hbond3', '3nd4_0001/A/HOH`91/O', '3nd4_0001/A/HOH`119/O'),
+            ('hbond4', '3nd4_0001/A/G`4/N7', '3nd4_0001/A/HOH`91/O'),
+            ('hbond5', '3nd4_0001/A/G`4/O6', '3nd4_0001/A/HOH`419/O'),
+            ('hbond6', '3nd4_0001/A/HOH`91/O', '3nd4_0001/A/G`4/OP2'),
+            ('hbond7', '3nd4_0001/A/HOH`319/O', '3nd4_0001/A/G`2/OP2'),
+            ('hbond9', '3nd4_0001/A/HOH`419/O', '3nd4_0002/A/HOH`74/O'),
+            ('hbond10', '3nd4_0002/A/C`15/O2', '3nd4_0001/A/G`2/N2'),
+            ('hbond11', '3nd4_0002/A/C`15/N3', '3nd4_0001/A/G`2/N1'),
+            ('hbond12', '3nd4_0002/A/C`15/N4', '3nd4_0001/A/G`2/O6'),
+            ('hbond13', '3nd4_0002/A/U`14/N3', '3nd4_0001/A/A`3/N1'),
+            ('hbond14', '3nd4_0002/A/U`14/O4', '3nd4_0001/A/A`3/N6'),
+            ('hbond15', '3nd4_0002/A/C`13/N4', '3nd4_0001/A/G`4/O6'),
+            ('hbond16', '3nd4_0002/A/C`13/N3', '3nd4_0001/A/G`4/N1'),
+            ('hbond17', '3nd4_0001/A/G`4/N2', '3nd4_0002/A/C`13/O2'),
+            ('hbond18', '3nd4_0001/A/G`2/N2', '3nd4_0002/A/C`15/O2'),
+            ('hbond19', '3nd4_0001/A/HOH`91/O', '3nd4_0001/A/G`4/OP2'),
+            ],
+        'colors': [('yellow', 'element C')],
+        'view': '-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0',
+        },
+    'LNA': {
+        'structure': ('3nd4', 'pdb'),
+        'viewport': (900, 600),
+        'commands': ['run $HOME/Scripts/PyMOLScripts/quat3.py', 'quat 3nd4'],
+        'settings': [('valence', 'off'), ('stick_radius', '0.125'), ('sphere_scale', '0.225'),
+            ('nb_spheres_size', '.35'), ('depth_cue', '0'), ('ray_trace_fog', '0'), ('dash_color', 'black'),
+            ('label_font_id', '5'), ('label_size', '36'), ('label_position', '(0.5, 1.0,2.0)'),
+            ('label_color', 'black'), ('dash_gap', '0.2'), ('dash_width', '2.0'), ('dash_length', '0.2')],
+        'representations': [('hide', 'cartoon', 'all'), ('show', 'sticks', 'all'),
+            ('hide', 'everything', 'name H*'), ('show', 'nb_spheres', 'all')],
+        'background': 'white',
+        'objects': [('coorCov', '3nd4_1 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7))')],
+        'bonds': [
+            ('coorCov/A/NA`19/NA', 'coorCov/A/A`3/N7'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`119/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`219/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`319/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`419/O'),
+            ('coorCov/A/NA`19/NA', 'coorCov/A/HOH`519/O'),
+            ],
+        'distances': [
+            ('dist01', '3nd4_1/A/NA`19/NA', '3nd4_1/A/HOH`519/O'),
+            ('dist02', '3nd4_1/A/NA`19/NA', '3nd4_1/A/HOH`419/O'),
+            ('dist03', '3nd4_1/A/NA`19/NA', '3nd4_1/A/HOH`119/O'),
+            ('dist04', '3nd4_1/A/NA`19/NA', '3nd4_1/A/HOH`319/O'),
+            ('dist05', '3nd4_1/A/NA`19/NA', '3nd4_1/A/HOH`219/O'),
+            ('hbond1', '3nd4_1/A/HOH`119/O', '3nd4_1/A/A`3/OP2'),
+            ('hbond2', '3nd4_1/A/HOH`319/O', '3nd4_1/A/A`3/OP2'),
+            ('hbond3', '3nd4_1/A/HOH`91/O', '3nd4_1/A/HOH`119/O'),
+            ('hbond4', '3nd4_1/A/G`4/N7', '3nd4_1/A/HOH`91/O'),
+            ('hbond5', '3nd4_1/A/G`4/O6', '3nd4_1/A/HOH`419/O'),
+            ('hbond6', '3nd4_1/A/HOH`91/O', '3nd4_1/A/G`4/OP2'),
+            ('hbond7', '3nd4_1/A/HOH`319/O', '3nd4_1/A/G`2/OP2'),
+            ('hbond9', '3nd4_1/A/HOH`419/O', '3nd4_2/A/HOH`74/O'),
+            ('hbond10', '3nd4_2/A/C`15/O2', '3nd4_1/A/G`2/N2'),
+            ('hbond11', '3nd4_2/A/C`15/N3', '3nd4_1/A/G`2/N1'),
+            ('hbond12', '3nd4_2/A/C`15/N4', '3nd4_1/A/G`2/O6'),
+            ('hbond13', '3nd4_2/A/U`14/N3', '3nd4_1/A/A`3/N1'),
+            ('hbond14', '3nd4_2/A/U`14/O4', '3nd4_1/A/A`3/N6'),
+            ('hbond15', '3nd4_2/A/C`13/N4', '3nd4_1/A/G`4/O6'),
+            ('hbond16', '3nd4_2/A/C`13/N3', '3nd4_1/A/G`4/N1'),
+            ('hbond17', '3nd4_1/A/G`4/N2', '3nd4_2/A/C`13/O2'),
+            ('hbond18', '3nd4_1/A/G`2/N2', '3nd4_2/A/C`15/O2'),
+            ('hbond19', '3nd4_1/A/HOH`91/O', '3nd4_1/A/G`4/OP2'),
+            ],
+        'colors': [('yellow', 'element C')],
+        'view': '-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0',
+        'finish': ['rock'],
+        },
+    }
+
+# Atom indices of compiled scenes, keyed by scene name and the hashes of its structure files.
+_compiledScenes = {}
+
+
+def _scene_atoms(definition):
+    '''Return the set of atom identifiers used by the bonds and distances of a scene.'''
+    atoms = set()
+    for pair in definition.get('bonds', []):
+        atoms.update(pair)
+    for distance in definition.get('distances', []):
+        atoms.update(distance[1:])
+    return atoms
+
+
+def _compile_scene(sceneName, definition):
+    '''
+    Return a dictionary that maps each atom identifier of a scene to (object, atom index).
+
+    Each object named in the identifiers is read with one call of cmd.iterate,
+    so the cost is proportional to the number of atoms and not to the number
+    of selections. The result is cached under the scene name, the hash of
+    its definition, the hash of its structure file, and the atom counts of
+    the objects; a scene is compiled again only if one of them changes.
+    '''
+    atoms = _scene_atoms(definition)
+    objects = sorted(set(atom.split('/')[0] for atom in atoms))
+    counts = tuple(cmd.count_atoms(obj) for obj in objects)
+    code, type = definition['structure']
+    entry = _structure_index().get('%s:%s' % (code.lower(), type), {})
+    digest = hashlib.sha256(json.dumps(definition, sort_keys=True).encode('utf-8')).hexdigest()
+    key = (sceneName, digest, entry.get('sha256'), tuple(objects), counts)
+    if key in _compiledScenes:
+        return _compiledScenes[key]
+
+    wanted = {}
+    for atom in atoms:
+        obj, chain, resi, name = atom.split('/')
+        wanted[(obj, chain, resi.split('`')[-1], name)] = atom
+
+    found = {}
+    space = {'wanted': wanted, 'found': found}
+    for obj in objects:
+        space['obj'] = obj
+        cmd.iterate(obj, 'atom = wanted.get((obj, chain, resi, name))\nif atom: found.setdefault(atom, (obj, index))', space=space)
+    for atom in sorted(atoms - set(found)):
+        print("Scene %s: no atom %s." % (sceneName, atom))
+    _compiledScenes[key] = found
+    return found
+
+
+def _build_scene(sceneName, definition=None):
+    '''
+    Build a scene from its data in _sceneDefinitions or from definition.
+
+    The structure is loaded with _load_structure. The bonds and distances are
+    made with the atom indices from _compile_scene, so PyMOL looks each atom
+    up by its index instead of parsing a full selection string.
+    '''
+    if definition is None:
+        definition = _sceneDefinitions[sceneName]
+    cmd.reinitialize()
+    if 'viewport' in definition:
+        cmd.viewport(*definition['viewport'])
+    code, type = definition['structure']
+    _load_structure(code, type)
+    for command in definition.get('commands', []):
+        cmd.do(command)
+    for name, value in definition.get('settings', []):
+        cmd.set(name, value)
+    for action, representation, selection in definition.get('representations', []):
+        getattr(cmd, action)(representation, selection)
+    cmd.bg_color(definition.get('background', 'white'))
+    for name, selection in definition.get('objects', []):
+        cmd.create(name, selection)
+
+    atoms = _compile_scene(sceneName, definition)
+    for atom1, atom2 in definition.get('bonds', []):
+        if atom1 in atoms and atom2 in atoms:
+            cmd.bond('%s`%d' % atoms[atom1], '%s`%d' % atoms[atom2])
+    for name, atom1, atom2 in definition.get('distances', []):
+        if atom1 in atoms and atom2 in atoms:
+            cmd.distance(name, '%s`%d' % atoms[atom1], '%s`%d' % atoms[atom2])
+
+    for color, selection in definition.get('colors', []):
+        cmd.color(color, selection)
+    if 'view' in definition:
+        cmd.set_view(definition['view'])
+    for command in definition.get('finish', []):
+        cmd.do(command)
+
+
 ########################################################################################################
 def AB(searchTerm="pymol"):
     ''' 
@@ -1090,7 +2132,7 @@ def BST():
     PYTHON CODE:
 def BST():
     cmd.reinitialize()
-    cmd.fetch('4PCO', type='pdb')
+    _load_structure('4PCO', 'pdb')
     cmd.select('G2G3', '( ((resi 2 or resi 3) and chain A)or ((resi 8 or resi 9) and chain B) )')
     cmd.hide('cartoon')
     cmd.set('valence', 'off')
@@ -1126,7 +2168,7 @@ cmd.extend('BST',BST)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('4PCO', type='pdb')
+    _load_structure('4PCO', 'pdb')
     cmd.select('G2G3', '( ((resi 2 or resi 3) and chain A)or ((resi 8 or resi 9) and chain B) )')
     cmd.hide('cartoon')
     cmd.set('valence', 'off')
@@ -2029,7 +3071,7 @@ def GGT():
     PYTHON CODE:
 def GGT():
     cmd.reinitialize()
-    cmd.fetch('4gdx', type='pdb', async_='0')
+    _load_structure('4gdx', 'pdb')
     cmd.remove('name H*')
     cmd.show_as('cartoon')
     cmd.bg_color('white')
@@ -2051,7 +3093,7 @@ cmd.extend('GGT',GGT)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('4gdx', type='pdb', async_='0')
+    _load_structure('4gdx', 'pdb')
     cmd.remove('name H*')
     cmd.show_as('cartoon')
     cmd.bg_color('white')
@@ -2293,7 +3335,7 @@ Type 'help GU' to see this documentation
     PYTHON CODE:
 def GU():
     cmd.reinitialize();
-    cmd.fetch('4PCO', type='pdb')
+    _load_structure('4PCO', 'pdb')
     cmd.hide('everything')
     cmd.bg_color('white')
     cmd.cartoon('oval')
@@ -2323,7 +3365,7 @@ cmd.extend('GU',GU)
     '''
 
     cmd.reinitialize();
-    cmd.fetch('4PCO', type='pdb')
+    _load_structure('4PCO', 'pdb')
     cmd.hide('everything')
     cmd.bg_color('white')
     cmd.cartoon('oval')
@@ -2445,51 +3487,39 @@ def IPM(searchTerms = [], *args):
     search=[string,string]; IPM(search)
     EXAMPLE:
     search=["pymol","vmd","jmol"]; IPM(search)
+    IPM pymol, vmd, jmol
 
     MORE DETAILS:
     Read list of search terms and submit each term to PubMed in a separate browser tab.
-    There a time delay based on the response time of the site to which the request is made.
     The default web browser is used.
     Must enclose each search term (can be of multiple words) in single or double quotes.
-    Has a time delay to avoid overwhelming the webserver.
+    The searches start at least searchHostInterval seconds apart to avoid
+    overwhelming the webserver.
 
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
 def IPM(searchTerms = [], *args):
-    url = ipmURL
-    try:
-        print('Sending',  searchTerm, ' to Pubmed and display list of search results in separate tabs of the default brower.')
-        for term in searchTerms:
-            t0 = time.time()
-            sterm = str(term)
-            webbrowser.open_new_tab(url+sterm)
-            response_delay = time.time() - t0
-            time.sleep(10*response_delay)  # wait 10x longer than it took them to respond
-            print('Finished searching PubMed for ', sterm, '.')
-        print('Finished searching PubMed for  ',  searchTerms, '.') 
-    except Exception as e:
-        print("Webbrowser error: " % e) # prints error if browser is not found
+    if isinstance(searchTerms, str):
+        searchTerms = [searchTerms] + list(args)
+    searchTerms = [str(term).strip() for term in searchTerms]
+    print('Sending', searchTerms, ' to Pubmed and display list of search results in separate tabs of the default brower.')
+    _search_requests([ipmURL + urllib.parse.quote(term) for term in searchTerms])
+    print('Finished searching PubMed for  ',  searchTerms, '.') 
 
 cmd.extend('IPM',IPM)
     '''
 
-    url = ipmURL
-    try:
-        print('Sending',  searchTerm, ' to Pubmed and display list of search results in separate tabs of the default brower.')
-        for term in searchTerms:
-            t0 = time.time()
-            sterm = str(term)
-            webbrowser.open_new_tab(url+sterm)
-            response_delay = time.time() - t0
-            time.sleep(10*response_delay)  # wait 10x longer than it took them to respond
-            print('Finished searching PubMed for ', sterm, '.')
-        print('Finished searching PubMed for  ',  searchTerms, '.') 
-    except Exception as e:
-        print("Webbrowser error: " % e) # prints error if browser is not found
+    if isinstance(searchTerms, str):
+        searchTerms = [searchTerms] + list(args)
+    searchTerms = [str(term).strip() for term in searchTerms]
+    print('Sending', searchTerms, ' to Pubmed and display list of search results in separate tabs of the default brower.')
+    _search_requests([ipmURL + urllib.parse.quote(term) for term in searchTerms])
+    print('Finished searching PubMed for  ',  searchTerms, '.') 
 
 cmd.extend('IPM',IPM)
 
@@ -2566,28 +3596,14 @@ def JASP():
         subprocess.call(jaspOpen);return
     PYTHON CODE:
 def JASP():
-    try:
-        print("Opening the JASP.");
-        subprocess.check_output(jaspOpen)
-        print("Success opening JASP.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jaspOpen'. \n  Or use 'jaspPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the JASP.")
+    _launch_app('JASP', jaspOpen)
 
 cmd.extend('JASP',JASP)
     '''
 
-    try:
-        print("Opening the JASP.");
-        subprocess.check_output(jaspOpen)
-        print("Success opening JASP.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jaspOpen'. \n  Or use 'jaspPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the JASP.")
+    _launch_app('JASP', jaspOpen)
 
 cmd.extend('JASP',JASP)
 
@@ -2669,28 +3685,14 @@ def JMP():
 
     PYTHON CODE:
 def JMP():
-    try:
-        print("Opening the JMP.");
-        subprocess.check_output(jmpOpen)
-        print("Success opening JMP.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jmpOpen'. \n  Or use 'jmpPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the JMP.")
+    _launch_app('JMP', jmpOpen)
 
 cmd.extend('JMP',JMP)
     '''
 
-    try:
-        print("Opening the JMP.");
-        subprocess.check_output(jmpOpen)
-        print("Success opening JMP.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jmpOpen'. \n  Or use 'jmpPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the JMP.")
+    _launch_app('JMP', jmpOpen)
 
 cmd.extend('JMP',JMP)
 
@@ -2809,72 +3811,12 @@ def LBST():
     delete all;load 4PCO.pdb;hide cartoon;set valence, off;select G2G3, ( ((resi 2 or resi 3) and chain A) or ((resi 8 or resi 9) and chain B));remove not G2G3;bg_color white;show sticks;set stick_radius=0.14;set stick_ball, on;set stick_ball_ratio,1.9;set_view (-0.75,0.09,0.66,-0.2,0.92,-0.35,-0.64,-0.39,-0.67,-0.0,-0.0,-43.7,7. 24,9.55,11.78,29.46,57.91,-20.0);remove name H*;select carbon1, element C and (resi 3 or resi 8);select carbon2, element C and (resi 2 or resi 9);color gray70, carbon1;color gray10, carbon2;show sticks;space cmyk;distance hbond1, /4PCO//B/U`9/N3,/4PCO//A/G`2/O6;distance hbond2, /4PCO//B/U`9/O2,/4PCO//A/G`2/N1;distance hbond3, /4PCO//A/U`3/N3,/4PCO//B/G`8/O6;distance hbond4, /4PCO//A/U`3/O2,/4PCO//B/G`8/N1;color black, hbond1;color black, hbond2;color gray70, hbond3;color gray70, hbond4;show nb_spheres;set nb_spheres_size, 0.35;hide labels;ray 1600,1000;png 4PCO.png
     PYTHON CODE:
 def LBST():
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4pco.pdb')
-    cmd.hide('cartoon')
-    cmd.set('valence', 'off')
-    cmd.select('G2G3', '( ((resi 2 or resi 3) and chain A)or ((resi 8 or resi 9) and chain B) )')
-    cmd.remove('not G2G3')
-    cmd.bg_color('white')
-    cmd.set('stick_radius', '0.14')
-    cmd.set('stick_ball', 'on')
-    cmd.set('stick_ball_ratio', '1.9')
-    cmd.set_view('(-0.75,0.09,0.66,-0.2,0.92,-0.35,-0.64,-0.39,-0.67,-0.0,-0.0,-43.7,7.24,9.55,11.78,29.46,57.91,-20.0)')
-    cmd.remove('name H*')
-    cmd.select('carbon1', 'element C and (resi 3 or resi 8)')
-    cmd.select('carbon2', 'element C and (resi 2 or resi 9)')
-    cmd.color('gray70', 'carbon1')
-    cmd.color('gray10', 'carbon2')
-    cmd.show('sticks')
-    cmd.space('cmyk')
-    cmd.distance('hbond1', '/4PCO//B/U`9/N3', '/4PCO//A/G`2/O6')
-    cmd.distance('hbond2', '/4PCO//B/U`9/O2', '/4PCO//A/G`2/N1')
-    cmd.distance('hbond3', '/4PCO//A/U`3/N3', '/4PCO//B/G`8/O6')
-    cmd.distance('hbond4', '/4PCO//A/U`3/O2', '/4PCO//B/G`8/N1')
-    cmd.color('black', 'hbond1')
-    cmd.color('black', 'hbond2')
-    cmd.color('gray70', 'hbond3')
-    cmd.color('gray70', 'hbond4')
-    cmd.show('nb_spheres')
-    cmd.set('nb_spheres_size', '0.35')
-    cmd.hide('labels')
-    cmd.ray('1600', '1000')
-    cmd.png('4PCO.png')
+    BST()
 
 cmd.extend('LBST',LBST)
     '''
 
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4pco.pdb')
-    cmd.hide('cartoon')
-    cmd.set('valence', 'off')
-    cmd.select('G2G3', '( ((resi 2 or resi 3) and chain A)or ((resi 8 or resi 9) and chain B) )')
-    cmd.remove('not G2G3')
-    cmd.bg_color('white')
-    cmd.set('stick_radius', '0.14')
-    cmd.set('stick_ball', 'on')
-    cmd.set('stick_ball_ratio', '1.9')
-    cmd.set_view('(-0.75,0.09,0.66,-0.2,0.92,-0.35,-0.64,-0.39,-0.67,-0.0,-0.0,-43.7,7.24,9.55,11.78,29.46,57.91,-20.0)')
-    cmd.remove('name H*')
-    cmd.select('carbon1', 'element C and (resi 3 or resi 8)')
-    cmd.select('carbon2', 'element C and (resi 2 or resi 9)')
-    cmd.color('gray70', 'carbon1')
-    cmd.color('gray10', 'carbon2')
-    cmd.show('sticks')
-    cmd.space('cmyk')
-    cmd.distance('hbond1', '/4PCO//B/U`9/N3', '/4PCO//A/G`2/O6')
-    cmd.distance('hbond2', '/4PCO//B/U`9/O2', '/4PCO//A/G`2/N1')
-    cmd.distance('hbond3', '/4PCO//A/U`3/N3', '/4PCO//B/G`8/O6')
-    cmd.distance('hbond4', '/4PCO//A/U`3/O2', '/4PCO//B/G`8/N1')
-    cmd.color('black', 'hbond1')
-    cmd.color('black', 'hbond2')
-    cmd.color('gray70', 'hbond3')
-    cmd.color('gray70', 'hbond4')
-    cmd.show('nb_spheres')
-    cmd.set('nb_spheres_size', '0.35')
-    cmd.hide('labels')
-    cmd.ray('1600', '1000')
-    cmd.png('4PCO.png')
+    BST()
 
 cmd.extend('LBST',LBST)
 
@@ -2952,8 +3894,8 @@ def LG():
     PYTHON CODE:
 def LG():
     cmd.reinitialize()
-    cmd.fetch('4dgr')
-    cmd.fetch('4dgr', type='2fofc')
+    _load_structure('4dgr', 'cif')
+    _load_structure('4dgr', '2fofc')
     cmd.select('LongGlycan', 'resi 469:477')
     cmd.orient('LongGlycan')
     cmd.remove('not LongGlycan')
@@ -2995,8 +3937,8 @@ cmd.extend('LG',LG)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('4dgr')
-    cmd.fetch('4dgr', type='2fofc')
+    _load_structure('4dgr', 'cif')
+    _load_structure('4dgr', '2fofc')
     cmd.select('LongGlycan', 'resi 469:477')
     cmd.orient('LongGlycan')
     cmd.remove('not LongGlycan')
@@ -3089,46 +4031,12 @@ def LGGT():
 
     PYTHON CODE:
 def LGGT():
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4gdx.pdb')
-    cmd.remove('name H*')
-    cmd.show_as('cartoon')
-    cmd.bg_color('white')
-    cmd.hide('(name c+o+n)')
-    cmd.set('cartoon_side_chain_helper', 'on')
-    cmd.color('red', '4gdx and ss H')
-    cmd.color('yellow', '4gdx and ss S')
-    cmd.color('green', '4gdx and ss L+')
-    cmd.select('ASNNAG', 'resn NAG or resi 95 or i. 120  or i. 230 or i. 266 or i. 344 or i. 511 or i. 381')
-    cmd.color('red', 'elem o and ASNNAG')
-    cmd.color('blue', 'elem n and ASNNAG')
-    cmd.color('yellow', 'elem c and ASNNAG')
-    cmd.show('sticks', 'ASNNAG')
-    cmd.disable('ASNNAG')
-    cmd.set_view('(0.55,-0.83,0.07,0.5,0.26,-0.82,0.66,0.49,0.56,0.0,0.0,-197.16,-22.42,-22.69,-12.01,155.44,238.88,-20.0)')
-    cmd.draw()
+    GGT()
 
 cmd.extend('LGGT',LGGT)
     '''
 
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4gdx.pdb')
-    cmd.remove('name H*')
-    cmd.show_as('cartoon')
-    cmd.bg_color('white')
-    cmd.hide('(name c+o+n)')
-    cmd.set('cartoon_side_chain_helper', 'on')
-    cmd.color('red', '4gdx and ss H')
-    cmd.color('yellow', '4gdx and ss S')
-    cmd.color('green', '4gdx and ss L+')
-    cmd.select('ASNNAG', 'resn NAG or resi 95 or i. 120  or i. 230 or i. 266 or i. 344 or i. 511 or i. 381')
-    cmd.color('red', 'elem o and ASNNAG')
-    cmd.color('blue', 'elem n and ASNNAG')
-    cmd.color('yellow', 'elem c and ASNNAG')
-    cmd.show('sticks', 'ASNNAG')
-    cmd.disable('ASNNAG')
-    cmd.set_view('(0.55,-0.83,0.07,0.5,0.26,-0.82,0.66,0.49,0.56,0.0,0.0,-197.16,-22.42,-22.69,-12.01,155.44,238.88,-20.0)')
-    cmd.draw()
+    GGT()
 
 cmd.extend('LGGT',LGGT)
 
@@ -3189,62 +4097,12 @@ def LGU():
 
     PYTHON CODE:
 def LGU():
-    cmd.reinitialize();
-    cmd.load(localPDBfilePath + '4PCO.pdb')
-    cmd.hide('everything')
-    cmd.bg_color('white')
-    cmd.cartoon('oval')
-    cmd.set('cartoon_ring_mode', '3')
-    cmd.set('cartoon_nucleic_acid_color', 'blue')
-    cmd.select('rna_A', 'resn A')
-    cmd.select('rna_C', 'resn C')
-    cmd.select('rna_G', 'resn G')
-    cmd.select('rna_U', 'resn U')
-    cmd.color('yellow', 'rna_A')
-    cmd.color('red', 'rna_C')
-    cmd.color('gray40', 'rna_G')
-    cmd.color('palecyan', 'rna_U')
-    cmd.show_as('cartoon')
-    cmd.disable('rna_U')
-    cmd.set('stick_radius', '0.12')
-    cmd.set('nb_spheres_size', '0.3')
-    cmd.show('nb_spheres')
-    cmd.set('stick_ball', 'on')
-    cmd.set('stick_ball_ratio', '1.8')
-    cmd.show('sticks', 'resn NCO')
-    cmd.show('spheres', 'name Cl')
-    cmd.set_view('(0.34,-0.81, 0.48,0.89,0.11,-0.45,0.31,0.58,0.76,-0.0,0.0,-196.36,-9.82,6.76,15.84,159.01,233.71,-20.0)')
-    cmd.draw()
+    GU()
 
 cmd.extend('LGU',LGU)
     '''
 
-    cmd.reinitialize();
-    cmd.load(localPDBfilePath + '4PCO.pdb')
-    cmd.hide('everything')
-    cmd.bg_color('white')
-    cmd.cartoon('oval')
-    cmd.set('cartoon_ring_mode', '3')
-    cmd.set('cartoon_nucleic_acid_color', 'blue')
-    cmd.select('rna_A', 'resn A')
-    cmd.select('rna_C', 'resn C')
-    cmd.select('rna_G', 'resn G')
-    cmd.select('rna_U', 'resn U')
-    cmd.color('yellow', 'rna_A')
-    cmd.color('red', 'rna_C')
-    cmd.color('gray40', 'rna_G')
-    cmd.color('palecyan', 'rna_U')
-    cmd.show_as('cartoon')
-    cmd.disable('rna_U')
-    cmd.set('stick_radius', '0.12')
-    cmd.set('nb_spheres_size', '0.3')
-    cmd.show('nb_spheres')
-    cmd.set('stick_ball', 'on')
-    cmd.set('stick_ball_ratio', '1.8')
-    cmd.show('sticks', 'resn NCO')
-    cmd.show('spheres', 'name Cl')
-    cmd.set_view('(0.34,-0.81, 0.48,0.89,0.11,-0.45,0.31,0.58,0.76,-0.0,0.0,-196.36,-9.82,6.76,15.84,159.01,233.71,-20.0)')
-    cmd.draw()
+    GU()
 
 cmd.extend('LGU',LGU)
 
@@ -3324,8 +4182,8 @@ def LLG():
     PYTHON CODE:
 def LLG():
     cmd.reinitialize()
-    cmd.load('4dgr.pdb')
-    cmd.load(localEMAPfilePath + '4dgr2FoFc.ccp4')
+    _load_structure('4dgr', 'pdb')
+    _load_structure('4dgr', '2fofc', '4dgr2FoFc')
     cmd.select('LongGlycan', 'resi 469:477')
     cmd.orient('LongGlycan')
     cmd.remove('not LongGlycan')
@@ -3367,8 +4225,8 @@ cmd.extend('LLG',LLG)
     '''
 
     cmd.reinitialize()
-    cmd.load('4dgr.pdb')
-    cmd.load(localEMAPfilePath + '4dgr2FoFc.ccp4')
+    _load_structure('4dgr', 'pdb')
+    _load_structure('4dgr', '2fofc', '4dgr2FoFc')
     cmd.select('LongGlycan', 'resi 469:477')
     cmd.orient('LongGlycan')
     cmd.remove('not LongGlycan')
@@ -3460,7 +4318,7 @@ def LN9():
     PYTHON CODE:
 def LN9():
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4dgr.pdb')
+    _load_structure('4dgr', 'pdb')
     #cmd.do('run $HOME/mg18OU/quat.py')
     cmd.do('quat 4dgr')
     cmd.show_as('cartoon')
@@ -3478,7 +4336,7 @@ cmd.extend('LN9',LN9)
     '''
 
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '4dgr.pdb')
+    _load_structure('4dgr', 'pdb')
     #cmd.do('run $HOME/mg18OU/quat.py')
     cmd.do('quat 4dgr')
     cmd.show_as('cartoon')
@@ -3595,140 +4453,17 @@ def LNA():
     rock
     HORIZONTAL PML SCRIPT:
     delete all;viewport 900,600;load 3nd4.pdb;hide cartoon;run ~/mg18OU/quat.py;quat 3nd4; show sticks;set stick_radius=0.125;hide everything, name H*;bg_color white;create coorCov, (3nd4_1 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)));bond (coorCov//A/NA`19/NA),(coorCov//A/A`3/N7); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`119/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`219/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`319/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`419/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`519/O);distance (3nd4_1 and chain Aand resi 19 and name NA), (3nd4_1 and chain A and resi 519);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 419);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 119);distance (3nd4_1 and chain A and resi 19 and name NA),(3nd4_1 and chain A and resi 319);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 219);show nb_spheres; set nb_spheres_size, .35;distance hbond1,/3nd4_1/1/A/HOH`119/O, /3nd4_1/1/A/A`3/OP2;distance hbond2,/3nd4_1/1/A/HOH`319/O, /3nd4_1/1/A/A`3/OP2;distance hbond3,/3nd4_1/1/A/HOH`91/O, /3nd4_1/1/A/HOH`119/O;distance hbond4,/3nd4_1/1/A/G`4/N7,/3nd4_1/1/A/HOH`91/O;distance hbond5,/3nd4_1/1/A/G`4/O6, /3nd4_1/1/A/HOH`419/O;distance hbond6,/3nd4_1/1/A/HOH`91/O, /3nd4_1/1/A/G`4/OP2;distance hbond7,/3nd4_1/1/A/HOH`319/O, /3nd4_1/1/A/G`2/OP2;distance  hbond9,/3nd4_1/1/A/HOH`419/O,/3nd4_2/2/A/HOH`74/O;distance hbond10,/3nd4_2/2/A/C`15/O2,/3nd4_1/1/A/G`2/N2;distance hbond11, /3nd4_2/2/A/C`15/N3,/3nd4_1/1/A/G`2/N1;distance hbond12,/3nd4_2/2/A/C`15/N4,/3nd4_1/1/A/G`2/O6;distance hbond13, /3nd4_2/2/A/U`14/N3,/3nd4_1/1/A/A`3/N1;distance hbond14,3nd4_2/2/A/U`14/O4,/3nd4_1/1/A/A`3/N6;distance hbond15, /3nd4_2/2/A/C`13/N4,/3nd4_1/1/A/G`4/O6;distance hbond16,/3nd4_2/2/A/C`13/N3, /3nd4_1/1/A/G`4/N1;distance hbond17, /3nd4_1/1/A/G`4/N2,/3nd4_2/2/A/C`13/O2;distance hbond18,/3nd4_1/1/A/G`2/N2,/3nd4_2/2/A/C`15/O2;distance hbond19,/3nd4_1/1/A/HOH`91/O,/3nd4_1/1/A/G`4/OP2;set depth_cue=0;set ray_trace_fog=0;set dash_color, black;set label_font_id, 5;set label_size, 36;set label_position, (0.5, 1.0, 2.0);set label_color, black;set dash_gap, 0.2;set dash_width, 2.0;set dash_length, 0.2;set label_color, black;set dash_gap, 0.2;set dash_width, 2.0;set dash_length, 0.2;select carbon, element C; color yellow, carbon;disable carbon;rock;AOset_view (-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0); 
+    The scene is stored as data in _sceneDefinitions['LNA']. Copy and edit
+    the entry to make a new scene of the same kind.
+
     PYTHON CODE:
 def LNA():
-    cmd.reinitialize();
-    cmd.viewport('900','600');
-    cmd.load(localPDBfilePath + '3nd4.pdb');
-    cmd.hide('cartoon');
-    cmd.set('valence','off');
-    cmd.show('sticks');
-    cmd.do('run $HOME/Scripts/PyMOLScripts/quat3.py')
-    cmd.do('quat 3nd4');
-    cmd.show('sticks');
-    cmd.set('stick_radius', '0.125');
-    cmd.set('sphere_scale', '0.225');
-    cmd.hide('everything', 'name H*');
-    cmd.bg_color('white');
-    cmd.create('coorCov', '(3nd4_1 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)))');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/A`3/N7)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`119/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`219/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`319/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`419/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`519/O)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 519)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 419)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 119)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 319)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 219)');
-    cmd.show('nb_spheres');
-    cmd.set('nb_spheres_size', '.35');
-    cmd.distance('hbond1', '/3nd4_1/1/A/HOH`119/O', '/3nd4_1/1/A/A`3/OP2');
-    cmd.distance('hbond2', '/3nd4_1/1/A/HOH`319/O', '/3nd4_1/1/A/A`3/OP2');
-    cmd.distance('hbond3', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/HOH`119/O');
-    cmd.distance('hbond4', '/3nd4_1/1/A/G`4/N7', '/3nd4_1/1/A/HOH`91/O');
-    cmd.distance('hbond5', '/3nd4_1/1/A/G`4/O6', '/3nd4_1/1/A/HOH`419/O');
-    cmd.distance('hbond6', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/G`4/OP2');
-    cmd.distance('hbond7', '/3nd4_1/1/A/HOH`319/O', '/3nd4_1/1/A/G`2/OP2');
-    cmd.distance('hbond9', '/3nd4_1/1/A/HOH`419/O', '/3nd4_2/2/A/HOH`74/O');
-    cmd.distance('hbond10', '/3nd4_2/2/A/C`15/O2', '/3nd4_1/1/A/G`2/N2');
-    cmd.distance('hbond11', '/3nd4_2/2/A/C`15/N3', '/3nd4_1/1/A/G`2/N1');
-    cmd.distance('hbond12', '/3nd4_2/2/A/C`15/N4', '/3nd4_1/1/A/G`2/O6');
-    cmd.distance('hbond13', '/3nd4_2/2/A/U`14/N3', '/3nd4_1/1/A/A`3/N1');
-    cmd.distance('hbond14', '/3nd4_2/2/A/U`14/O4', '/3nd4_1/1/A/A`3/N6');
-    cmd.distance('hbond15', '/3nd4_2/2/A/C`13/N4', '/3nd4_1/1/A/G`4/O6');
-    cmd.distance('hbond16', '/3nd4_2/2/A/C`13/N3', '/3nd4_1/1/A/G`4/N1');
-    cmd.distance('hbond17', '/3nd4_1/1/A/G`4/N2', '/3nd4_2/2/A/C`13/O2');
-    cmd.distance('hbond18', '/3nd4_1/1/A/G`2/N2', '/3nd4_2/2/A/C`15/O2');
-    cmd.distance('hbond19', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/G`4/OP2');
-    cmd.set('depth_cue', '0');
-    cmd.set('ray_trace_fog', '0');
-    cmd.set('dash_color', 'black');
-    cmd.set('label_font_id', '5');
-    cmd.set('label_size', '36')
-    cmd.set('label_position', '(0.5, 1.0,2.0)');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.select('carbon', 'element C');
-    cmd.color('yellow', 'carbon');
-    cmd.disable('carbon');
-    cmd.set_view('-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0');
-    cmd.rock()
+    _build_scene('LNA')
 
 cmd.extend('LNA',LNA)
     '''
 
-    cmd.reinitialize();
-    cmd.viewport('900','600');
-    cmd.load(localPDBfilePath + '3nd4.pdb');
-    cmd.hide('cartoon');
-    cmd.set('valence','off');
-    cmd.show('sticks');
-    cmd.do('run $HOME/Scripts/PyMOLScripts/quat3.py')
-    cmd.do('quat 3nd4');
-    cmd.show('sticks');
-    cmd.set('stick_radius', '0.125');
-    cmd.set('sphere_scale', '0.225');
-    cmd.hide('everything', 'name H*');
-    cmd.bg_color('white');
-    cmd.create('coorCov', '(3nd4_1 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)))');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/A`3/N7)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`119/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`219/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`319/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`419/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`519/O)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 519)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 419)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 119)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 319)');
-    cmd.distance('(3nd4_1 and chain A and resi 19 and name NA)','(3nd4_1 and chain A and resi 219)');
-    cmd.show('nb_spheres');
-    cmd.set('nb_spheres_size', '.35');
-    cmd.distance('hbond1', '/3nd4_1/1/A/HOH`119/O', '/3nd4_1/1/A/A`3/OP2');
-    cmd.distance('hbond2', '/3nd4_1/1/A/HOH`319/O', '/3nd4_1/1/A/A`3/OP2');
-    cmd.distance('hbond3', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/HOH`119/O');
-    cmd.distance('hbond4', '/3nd4_1/1/A/G`4/N7', '/3nd4_1/1/A/HOH`91/O');
-    cmd.distance('hbond5', '/3nd4_1/1/A/G`4/O6', '/3nd4_1/1/A/HOH`419/O');
-    cmd.distance('hbond6', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/G`4/OP2');
-    cmd.distance('hbond7', '/3nd4_1/1/A/HOH`319/O', '/3nd4_1/1/A/G`2/OP2');
-    cmd.distance('hbond9', '/3nd4_1/1/A/HOH`419/O', '/3nd4_2/2/A/HOH`74/O');
-    cmd.distance('hbond10', '/3nd4_2/2/A/C`15/O2', '/3nd4_1/1/A/G`2/N2');
-    cmd.distance('hbond11', '/3nd4_2/2/A/C`15/N3', '/3nd4_1/1/A/G`2/N1');
-    cmd.distance('hbond12', '/3nd4_2/2/A/C`15/N4', '/3nd4_1/1/A/G`2/O6');
-    cmd.distance('hbond13', '/3nd4_2/2/A/U`14/N3', '/3nd4_1/1/A/A`3/N1');
-    cmd.distance('hbond14', '/3nd4_2/2/A/U`14/O4', '/3nd4_1/1/A/A`3/N6');
-    cmd.distance('hbond15', '/3nd4_2/2/A/C`13/N4', '/3nd4_1/1/A/G`4/O6');
-    cmd.distance('hbond16', '/3nd4_2/2/A/C`13/N3', '/3nd4_1/1/A/G`4/N1');
-    cmd.distance('hbond17', '/3nd4_1/1/A/G`4/N2', '/3nd4_2/2/A/C`13/O2');
-    cmd.distance('hbond18', '/3nd4_1/1/A/G`2/N2', '/3nd4_2/2/A/C`15/O2');
-    cmd.distance('hbond19', '/3nd4_1/1/A/HOH`91/O', '/3nd4_1/1/A/G`4/OP2');
-    cmd.set('depth_cue', '0');
-    cmd.set('ray_trace_fog', '0');
-    cmd.set('dash_color', 'black');
-    cmd.set('label_font_id', '5');
-    cmd.set('label_size', '36')
-    cmd.set('label_position', '(0.5, 1.0,2.0)');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.select('carbon', 'element C');
-    cmd.color('yellow', 'carbon');
-    cmd.disable('carbon');
-    cmd.set_view('-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0');
-    cmd.rock()
+    _build_scene('LNA')
 
 cmd.extend('LNA',LNA)
 
@@ -3773,40 +4508,12 @@ def LT4L():
 
     PYTHON CODE:
 def LT4L():
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3fa0.pdb')
-    cmd.orient()
-    cmd.turn('z', '-90')
-    cmd.turn('y', '-5')
-    cmd.turn('x', '10')
-    cmd.hide('everything')
-    cmd.bg_color('white')
-    cmd.show('cartoon')
-    cmd.color('red', 'ss H')
-    cmd.color('yellow', 'ss S')
-    cmd.color('green', 'ss L+')
-    cmd.set_view('(-0.18,-0.69,-0.7,0.98,-0.17,-0.09,-0.06,-0.7,0.71,0.0,0.0,-165.67,34.77,11.27,9.52,132.07,199.27,-20.0)')
-    cmd.ray('1500', '1600')
-    cmd.png("T4L.png")
+    T4L()
 
 cmd.extend('LT4L',LT4L)
     '''
 
-    cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3fa0.pdb')
-    cmd.orient()
-    cmd.turn('z', '-90')
-    cmd.turn('y', '-5')
-    cmd.turn('x', '10')
-    cmd.hide('everything')
-    cmd.bg_color('white')
-    cmd.show('cartoon')
-    cmd.color('red', 'ss H')
-    cmd.color('yellow', 'ss S')
-    cmd.color('green', 'ss L+')
-    cmd.set_view('(-0.18,-0.69,-0.7,0.98,-0.17,-0.09,-0.06,-0.7,0.71,0.0,0.0,-165.67,34.77,11.27,9.52,132.07,199.27,-20.0)')
-    cmd.ray('1500', '1600')
-    cmd.png("T4L.png")
+    T4L()
 
 cmd.extend('LT4L',LT4L)
 
@@ -3853,7 +4560,7 @@ def LU8():
     PYTHON CODE:
 def LU8():
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3nd3.pdb')
+    _load_structure('3nd3', 'pdb')
     #cmd.do('run $HOME/mg18OU/quat.py')
     cmd.do('quat 3nd3')
     cmd.hide('everything')
@@ -3872,7 +4579,7 @@ cmd.extend('LU8',LU8)
     '''
 
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3nd3.pdb')
+    _load_structure('3nd3', 'pdb')
     #cmd.do('run $HOME/mg18OU/quat.py')
     cmd.do('quat 3nd3')
     cmd.hide('everything')
@@ -3933,7 +4640,7 @@ def LWC8():
     PYTHON CODE:
 def LWC8():
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3nd4.pdb')
+    _load_structure('3nd4', 'pdb')
     cmd.remove('name H*')
     cmd.hide('everything')
     # cmd.do('run $HOME/mg18OU/quat.py')
@@ -3952,7 +4659,7 @@ cmd.extend('LWC8',LWC8)
     '''
 
     cmd.reinitialize()
-    cmd.load(localPDBfilePath + '3nd4.pdb')
+    _load_structure('3nd4', 'pdb')
     cmd.remove('name H*')
     cmd.hide('everything')
     # cmd.do('run $HOME/mg18OU/quat.py')
@@ -4068,18 +4775,144 @@ cmd.extend('MB',MB)
 cmd.extend('MB',MB)
 
 
-def MC(searchTerm='pymol'):
+# URLs of the searches sent by MC, built as in the shortcut of each site from the URLs above.
+_searchURLs = {
+    'BX': '{bxURL}{term}',
+    'GH': '{ghURL}{term}',
+    'GO': '{goURL}{term}&num=200',
+    'GS': '{gsURL}{term}',
+    'PM': '{pmURL}{term}',
+    'PML': '{pmlURL}{term}',
+    'PW': '{pymolURL}{term}',
+    'RG': '{researchGateURL}{term}',
+    'SD': '{scienceDirectURL1}{term}{scienceDirectURL2}',
+    'SF': '{sourceForgeURL}{term}',
+    }
+_coreSearchSites = ['BX', 'GH', 'GO', 'GS', 'PM', 'PML', 'PW', 'RG', 'SD', 'SF']
+
+
+def _search_url(site, term):
+    '''Return the URL of the search for term at site (the name of its shortcut, e.g., PM).'''
+    return _searchURLs[site].format(**dict(globals(), term=urllib.parse.quote(str(term).strip())))
+
+
+def _fetch_search_page(url, timeout, path=None):
+    '''
+    Return (status, content) of the page at url; HTTP errors are returned, not raised.
+    With path, a page with status 200 is also saved there by the calling thread,
+    so _search_requests does not write files in its event loop.
+    '''
+    request = urllib.request.Request(url, headers={'User-Agent': 'pymolshortcuts4rna/%s' % __version__})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, content = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, b''
+    if path and status == 200:
+        handle, part = tempfile.mkstemp(suffix='.part', dir=os.path.dirname(path))
+        with os.fdopen(handle, 'wb') as f:
+            f.write(content)
+        os.replace(part, path)
+    return status, content
+
+
+def _run_coroutine(coroutine):
+    '''Run an asyncio coroutine to the end, also when an event loop already runs in this thread (e.g., Jupyter).'''
+    import asyncio
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+def _search_requests(urls, fetch=False, show=True, hours=None, interval=None, timeout=30):
+    '''
+    Send many searches at once and return one dictionary per URL with the 
+    keys url, status (HTTP status of a fetched page, else 0), cached, bytes,
+    seconds, and path.
+
+    The requests to different hosts run concurrently; the requests to one
+    host start at least interval seconds apart {default: searchHostInterval}.
+    show opens each search in a tab of the default browser. fetch downloads
+    the result pages into searchCachePath instead, where they are reused for
+    hours {default: searchCacheHours}; with show, the saved pages are opened.
+    '''
+    import asyncio
+    hours = searchCacheHours if hours is None else float(hours)
+    interval = searchHostInterval if interval is None else float(interval)
+    if fetch and not os.path.isdir(searchCachePath):
+        os.makedirs(searchCachePath)
+
+    from concurrent.futures import ThreadPoolExecutor
+    # The threads only wait on the network and the browser.
+    pool = ThreadPoolExecutor(max_workers=max(1, min(64, len(urls))))
+
+    async def dispatch():
+        loop = asyncio.get_running_loop()
+        hosts = {}
+
+        async def wait_turn(host):
+            # The lock of a host is held only while its next start time is claimed.
+            turn = hosts.setdefault(host, {'lock': asyncio.Lock(), 'next': 0.0})
+            async with turn['lock']:
+                delay = turn['next'] - time.time()
+                turn['next'] = max(time.time(), turn['next']) + interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async def send(url):
+            result = {'url': url, 'status': 0, 'cached': False, 'bytes': 0, 'seconds': 0.0, 'path': ''}
+            start = time.time()
+            target = url
+            try:
+                if fetch:
+                    path = os.path.join(searchCachePath, hashlib.sha256(url.encode()).hexdigest() + '.html')
+                    if os.path.exists(path) and time.time() - os.path.getmtime(path) < hours * 3600:
+                        result.update(status=200, cached=True)
+                    else:
+                        await wait_turn(urllib.parse.urlsplit(url).netloc)
+                        status, content = await loop.run_in_executor(pool, _fetch_search_page, url, timeout, path)
+                        result['status'] = status
+                    if os.path.exists(path):
+                        result.update(bytes=os.path.getsize(path), path=path)
+                        target = 'file://' + path
+                else:
+                    await wait_turn(urllib.parse.urlsplit(url).netloc)
+                if show:
+                    await loop.run_in_executor(pool, webbrowser.open_new_tab, target)
+            except (OSError, ValueError, webbrowser.Error) as e:
+                print("Search error for %s: %s" % (url, e))
+            result['seconds'] = time.time() - start
+            return result
+
+        return await asyncio.gather(*[send(url) for url in urls])
+
+    try:
+        return _run_coroutine(dispatch())
+    finally:
+        pool.shutdown()
+
+
+def MC(searchTerm='pymol', fetch=0, show=1, hours=None):
     ''' 
     DESCRIPTION:
     Send search term to search ten core websites in pymolshortcuts:
 
     USAGE:
-    MC
+    MC [searchTerm [, fetch [, show [, hours]]]]
 
     ARGUMENTS:
-    searchTerm
+    searchTerm = string {default: pymol}
+    fetch = 0 or 1: save the result pages in searchCachePath {default: 0}
+    show = 0 or 1: open the searches in the default browser {default: 1}
+    hours = float: age in hours up to which saved pages are reused {default: searchCacheHours}
+
     EXAMPLE:
     MC pymol
+    MC RNA crystal packing, fetch=1
 
     MORE DETAILS:
     Send search term to search ten core websites in pymolshortcuts:
@@ -4093,39 +4926,48 @@ def MC(searchTerm='pymol'):
     Pymol Wiki
     Research Gate
     Science Direct
-    Stackoverflow
+    SourceForge
 
+    The ten searches are sent at once instead of one site after the other.
+    Requests to the same host start at least searchHostInterval seconds
+    apart. With fetch=1, the result pages are downloaded and the saved
+    copies are opened; a repeated search within searchCacheHours is 
+    answered from the saved pages without using the network. Use 
+    searchSweep for many search terms.
+
+    RETURNS
+        A NumPy structured array with one record per site and the fields
+        ( site, url, status, cached, bytes, seconds, path ).
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
-def MC(searchTerm='pymol'):
-    BX(searchTerm)
-    GH(searchTerm)
-    GO(searchTerm)
-    GS(searchTerm)
-    PM(searchTerm)
-    PML(searchTerm)
-    PW(searchTerm)
-    RG(searchTerm)
-    SD(searchTerm)
-    SF(searchTerm)
+def MC(searchTerm='pymol', fetch=0, show=1, hours=None):
+    fetch, show = int(fetch), int(show)
+    print("Sending %s to %d sites." % (searchTerm, len(_coreSearchSites)))
+    start = time.time()
+    results = _search_requests([_search_url(site, searchTerm) for site in _coreSearchSites], fetch, show, hours)
+    rows = [(site, r['url'], r['status'], r['cached'], r['bytes'], r['seconds'], r['path'])
+        for site, r in zip(_coreSearchSites, results)]
+    print("Sent %s to %d sites in %.1f s." % (searchTerm, len(rows), time.time() - start))
+    return _record_array(rows, [('site', 'U'), ('url', 'U'), ('status', 'i4'), ('cached', '?'),
+        ('bytes', 'i8'), ('seconds', 'f8'), ('path', 'U')])
 
 cmd.extend('MC',MC)
     '''
 
-    BX(searchTerm)
-    GH(searchTerm)
-    GO(searchTerm)
-    GS(searchTerm)
-    PM(searchTerm)
-    PML(searchTerm)
-    PW(searchTerm)
-    RG(searchTerm)
-    SD(searchTerm)
-    SF(searchTerm)
+    fetch, show = int(fetch), int(show)
+    print("Sending %s to %d sites." % (searchTerm, len(_coreSearchSites)))
+    start = time.time()
+    results = _search_requests([_search_url(site, searchTerm) for site in _coreSearchSites], fetch, show, hours)
+    rows = [(site, r['url'], r['status'], r['cached'], r['bytes'], r['seconds'], r['path'])
+        for site, r in zip(_coreSearchSites, results)]
+    print("Sent %s to %d sites in %.1f s." % (searchTerm, len(rows), time.time() - start))
+    return _record_array(rows, [('site', 'U'), ('url', 'U'), ('status', 'i4'), ('cached', '?'),
+        ('bytes', 'i8'), ('seconds', 'f8'), ('path', 'U')])
 
 cmd.extend('MC',MC)
 
@@ -4375,7 +5217,7 @@ def N9():
     PYTHON CODE:
 def N9():
     cmd.reinitialize()
-    cmd.fetch('4dgr', type='pdb1')
+    _load_structure('4dgr', 'pdb1')
     cmd.show_as('cartoon')
     cmd.bg_color('white')
     cmd.do('split_state 4dgr')	
@@ -4392,7 +5234,7 @@ cmd.extend('N9',N9)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('4dgr', type='pdb1')
+    _load_structure('4dgr', 'pdb1')
     cmd.show_as('cartoon')
     cmd.bg_color('white')
     cmd.do('split_state 4dgr')	
@@ -4502,134 +5344,17 @@ def NA():
     HORIZONTAL PML SCRIPT:
     delete all;viewport 900,600;fetch 3nd4, type=pdb,async=0;run ~/mg18OU/quat.py;quat 3nd4; show sticks;set stick_radius=0.125;hide everything, name H*;bg_color white;create coorCov, (3nd4_1 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)));bond (coorCov//A/NA`19/NA),(coorCov//A/A`3/N7); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`119/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`219/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`319/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`419/O); bond (coorCov//A/NA`19/NA),(coorCov//A/HOH`519/O);distance (3nd4_1 and chain Aand resi 19 and name NA), (3nd4_1 and chain A and resi 519);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 419);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 119);distance (3nd4_1 and chain A and resi 19 and name NA),(3nd4_1 and chain A and resi 319);distance (3nd4_1 and chain A and resi 19 and name NA), (3nd4_1 and chain A and resi 219);show nb_spheres; set nb_spheres_size, .35;distance hbond1,/3nd4_1/1/A/HOH`119/O, /3nd4_1/1/A/A`3/OP2;distance hbond2,/3nd4_1/1/A/HOH`319/O, /3nd4_1/1/A/A`3/OP2;distance hbond3,/3nd4_1/1/A/HOH`91/O, /3nd4_1/1/A/HOH`119/O;distance hbond4,/3nd4_1/1/A/G`4/N7,/3nd4_1/1/A/HOH`91/O;distance hbond5,/3nd4_1/1/A/G`4/O6, /3nd4_1/1/A/HOH`419/O;distance hbond6,/3nd4_1/1/A/HOH`91/O, /3nd4_1/1/A/G`4/OP2;distance hbond7,/3nd4_1/1/A/HOH`319/O, /3nd4_1/1/A/G`2/OP2;distance  hbond9,/3nd4_1/1/A/HOH`419/O,/3nd4_2/2/A/HOH`74/O;distance hbond10,/3nd4_2/2/A/C`15/O2,/3nd4_1/1/A/G`2/N2;distance hbond11, /3nd4_2/2/A/C`15/N3,/3nd4_1/1/A/G`2/N1;distance hbond12,/3nd4_2/2/A/C`15/N4,/3nd4_1/1/A/G`2/O6;distance hbond13, /3nd4_2/2/A/U`14/N3,/3nd4_1/1/A/A`3/N1;distance hbond14,3nd4_2/2/A/U`14/O4,/3nd4_1/1/A/A`3/N6;distance hbond15, /3nd4_2/2/A/C`13/N4,/3nd4_1/1/A/G`4/O6;distance hbond16,/3nd4_2/2/A/C`13/N3, /3nd4_1/1/A/G`4/N1;distance hbond17, /3nd4_1/1/A/G`4/N2,/3nd4_2/2/A/C`13/O2;distance hbond18,/3nd4_1/1/A/G`2/N2,/3nd4_2/2/A/C`15/O2;distance hbond19,/3nd4_1/1/A/HOH`91/O,/3nd4_1/1/A/G`4/OP2;set depth_cue=0;set ray_trace_fog=0;set dash_color, black;set label_font_id, 5;set label_size, 36;set label_position, (0.5, 1.0, 2.0);set label_color, black;set dash_gap, 0.2;set dash_width, 2.0;set dash_length, 0.2;set label_color, black;set dash_gap, 0.2;set dash_width, 2.0;set dash_length, 0.2;select carbon, element C; color yellow, carbon;disable carbon;set_view (-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0); 
 
+    The scene is stored as data in _sceneDefinitions['NA']. Copy and edit
+    the entry to make a new scene of the same kind.
+
     PYTHON CODE:
 def NA():
-    cmd.reinitialize();
-    cmd.viewport('900','600');
-    cmd.fetch('3nd4', type='pdb1');
-    cmd.do('split_states 3nd4');
-    cmd.hide('cartoon');
-    cmd.hide('spheres');
-    cmd.set('valence','off');
-    cmd.show('sticks');
-    cmd.set('stick_radius', '0.125');
-    cmd.hide('everything', 'elem H*');
-    cmd.bg_color('white');
-    cmd.create('coorCov', '(3nd4_0001 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)))');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/A`3/N7)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`119/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`219/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`319/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`419/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`519/O)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 519)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 419)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 119)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 319)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 219)');
-    cmd.show('nb_spheres');
-    cmd.set('nb_spheres_size', '.35');
-    cmd.distance('hbond1', '3nd4_0001 and resi 119 and name O', '3nd4_0001 and resi 1 and name OP2');
-    cmd.distance('hbond2', '/3nd4_0001/1/A/HOH`319/O', '/3nd4_0001/1/A/A`3/OP2');
-    cmd.distance('hbond3', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/HOH`119/O');
-    cmd.distance('hbond4', '/3nd4_0001/1/A/G`4/N7', '/3nd4_0001/1/A/HOH`91/O');
-    cmd.distance('hbond5', '/3nd4_0001/1/A/G`4/O6', '/3nd4_0001/1/A/HOH`419/O');
-    cmd.distance('hbond6', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/G`4/OP2');
-    cmd.distance('hbond7', '/3nd4_0001/1/A/HOH`319/O', '/3nd4_0001/1/A/G`2/OP2');
-    cmd.distance('hbond9', '/3nd4_0001/1/A/HOH`419/O', '/3nd4_0002/2/A/HOH`74/O');
-    cmd.distance('hbond10', '/3nd4_0002/2/A/C`15/O2', '/3nd4_0001/1/A/G`2/N2');
-    cmd.distance('hbond11', '/3nd4_0002/2/A/C`15/N3', '/3nd4_0001/1/A/G`2/N1');
-    cmd.distance('hbond12', '/3nd4_0002/2/A/C`15/N4', '/3nd4_0001/1/A/G`2/O6');
-    cmd.distance('hbond13', '/3nd4_0002/2/A/U`14/N3', '/3nd4_0001/1/A/A`3/N1');
-    cmd.distance('hbond14', '/3nd4_0002/2/A/U`14/O4', '/3nd4_0001/1/A/A`3/N6');
-    cmd.distance('hbond15', '/3nd4_0002/2/A/C`13/N4', '/3nd4_0001/1/A/G`4/O6');
-    cmd.distance('hbond16', '/3nd4_0002/2/A/C`13/N3', '/3nd4_0001/1/A/G`4/N1');
-    cmd.distance('hbond17', '/3nd4_0001/1/A/G`4/N2', '/3nd4_0002/2/A/C`13/O2');
-    cmd.distance('hbond18', '/3nd4_0001/1/A/G`2/N2', '/3nd4_0002/2/A/C`15/O2');
-    cmd.distance('hbond19', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/G`4/OP2');
-    cmd.set('depth_cue', '0');
-    cmd.set('ray_trace_fog', '0');
-    cmd.set('dash_color', 'black');
-    cmd.set('label_font_id', '5');
-    cmd.set('label_size', '36')
-    cmd.set('label_position', '(0.5, 1.0,2.0)');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.select('carbon', 'element C');
-    cmd.color('yellow', 'carbon');
-    cmd.disable('carbon');
-    cmd.set_view('-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0');
+    _build_scene('NA')
 
 cmd.extend('NA',NA)
     '''
 
-    cmd.reinitialize();
-    cmd.viewport('900','600');
-    cmd.fetch('3nd4', type='pdb1');
-    cmd.do('split_states 3nd4');
-    cmd.hide('cartoon');
-    cmd.hide('spheres');
-    cmd.set('valence','off');
-    cmd.show('sticks');
-    cmd.set('stick_radius', '0.125');
-    cmd.hide('everything', 'elem H*');
-    cmd.bg_color('white');
-    cmd.create('coorCov', '(3nd4_0001 and (resi 19 or resi 119 or resi 219 or resi 319 or resi 419 or resi 519 or (resi 3 and name N7)))');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/A`3/N7)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`119/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`219/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`319/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`419/O)');
-    cmd.bond('(coorCov//A/NA`19/NA)','(coorCov//A/HOH`519/O)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 519)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 419)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 119)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 319)');
-    cmd.distance('(3nd4_0001 and chain A and resi 19 and name NA)','(3nd4_0001 and chain A and resi 219)');
-    cmd.show('nb_spheres');
-    cmd.set('nb_spheres_size', '.35');
-    cmd.distance('hbond1', '3nd4_0001 and resi 119 and name O', '3nd4_0001 and resi 1 and name OP2');
-    cmd.distance('hbond2', '/3nd4_0001/1/A/HOH`319/O', '/3nd4_0001/1/A/A`3/OP2');
-    cmd.distance('hbond3', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/HOH`119/O');
-    cmd.distance('hbond4', '/3nd4_0001/1/A/G`4/N7', '/3nd4_0001/1/A/HOH`91/O');
-    cmd.distance('hbond5', '/3nd4_0001/1/A/G`4/O6', '/3nd4_0001/1/A/HOH`419/O');
-    cmd.distance('hbond6', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/G`4/OP2');
-    cmd.distance('hbond7', '/3nd4_0001/1/A/HOH`319/O', '/3nd4_0001/1/A/G`2/OP2');
-    cmd.distance('hbond9', '/3nd4_0001/1/A/HOH`419/O', '/3nd4_0002/2/A/HOH`74/O');
-    cmd.distance('hbond10', '/3nd4_0002/2/A/C`15/O2', '/3nd4_0001/1/A/G`2/N2');
-    cmd.distance('hbond11', '/3nd4_0002/2/A/C`15/N3', '/3nd4_0001/1/A/G`2/N1');
-    cmd.distance('hbond12', '/3nd4_0002/2/A/C`15/N4', '/3nd4_0001/1/A/G`2/O6');
-    cmd.distance('hbond13', '/3nd4_0002/2/A/U`14/N3', '/3nd4_0001/1/A/A`3/N1');
-    cmd.distance('hbond14', '/3nd4_0002/2/A/U`14/O4', '/3nd4_0001/1/A/A`3/N6');
-    cmd.distance('hbond15', '/3nd4_0002/2/A/C`13/N4', '/3nd4_0001/1/A/G`4/O6');
-    cmd.distance('hbond16', '/3nd4_0002/2/A/C`13/N3', '/3nd4_0001/1/A/G`4/N1');
-    cmd.distance('hbond17', '/3nd4_0001/1/A/G`4/N2', '/3nd4_0002/2/A/C`13/O2');
-    cmd.distance('hbond18', '/3nd4_0001/1/A/G`2/N2', '/3nd4_0002/2/A/C`15/O2');
-    cmd.distance('hbond19', '/3nd4_0001/1/A/HOH`91/O', '/3nd4_0001/1/A/G`4/OP2');
-    cmd.set('depth_cue', '0');
-    cmd.set('ray_trace_fog', '0');
-    cmd.set('dash_color', 'black');
-    cmd.set('label_font_id', '5');
-    cmd.set('label_size', '36')
-    cmd.set('label_position', '(0.5, 1.0,2.0)');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.set('label_color', 'black');
-    cmd.set('dash_gap', '0.2');
-    cmd.set('dash_width', '2.0');
-    cmd.set('dash_length', '0.2');
-    cmd.select('carbon', 'element C');
-    cmd.color('yellow', 'carbon');
-    cmd.disable('carbon');
-    cmd.set_view('-0.9,0.34,-0.26,0.33,0.18,-0.93,-0.27,-0.92,-0.28,-0.07,-0.23,-27.83,8.63,19.85,13.2,16.0,31.63,-20.0');
+    _build_scene('NA')
 
 cmd.extend('NA',NA)
 
@@ -4651,6 +5376,7 @@ def NDB():
 
     MORE DETAILS:
     Open website of the Nucleic Acid Database.
+    Use PDBmeta for the method, resolution, chains, and ligands of many nucleic acid entries.
 
 
     VERTICAL PML SCRIPT:
@@ -4739,43 +5465,288 @@ def PDB(searchTerm="3fa0",numHits="5"):
     PDB
 
     ARGUMENTS:
-    searchTerm
+    searchTerm = one or more pdbcodes separated by spaces
+    numHits = most pages to open {default: 5}
     EXAMPLE:
-    PBB 3fa0
+    PDB 3fa0
+    PDB 1ehz 3nd4 4fe5
 
 
 
     MORE DETAILS:
     Submit a pdbcode to the Protein Data Bank and get back the webpage for the orrespondong structure.
+    Each pdbcode opens in its own tab, up to numHits tabs.
+    Use PDBmeta to get the resolution, method, chains, and ligands of many entries without the browser.
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
 def PDB(searchTerm="3fa0",numHits="5"):
     url = pdbURL
     try:
-        print("Sending",  searchTerm, " to the PBD webpage in default browser.");
-        webbrowser.open_new_tab(url+searchTerm)
-        print("Sent ",  searchTerm, "to the PBD webpage in default browser.")
+        for code in searchTerm.replace(',', ' ').split()[:int(numHits)]:
+            print("Sending",  code, " to the PBD webpage in default browser.");
+            webbrowser.open_new_tab(url+code)
+            print("Sent ",  code, "to the PBD webpage in default browser.")
     except Exception as e:
-        print("Webbrowser error: " % e) # prints error if browser is not found
+        print("Webbrowser error: %s" % e) # prints error if browser is not found
 
 cmd.extend('PDB',PDB)
     '''
 
     url = pdbURL
     try:
-        print("Sending",  searchTerm, " to the PBD webpage in default browser.");
-        webbrowser.open_new_tab(url+searchTerm)
-        print("Sent ",  searchTerm, "to the PBD webpage in default browser.")
+        for code in searchTerm.replace(',', ' ').split()[:int(numHits)]:
+            print("Sending",  code, " to the PBD webpage in default browser.");
+            webbrowser.open_new_tab(url+code)
+            print("Sent ",  code, "to the PBD webpage in default browser.")
     except Exception as e:
-        print("Webbrowser error: " % e) # prints error if browser is not found
+        print("Webbrowser error: %s" % e) # prints error if browser is not found
 
 cmd.extend('PDB',PDB)
 
 
+# Columns of the table of entry metadata kept by PDBmeta in pdbMetaDatabase.
+_pdbMetaFields = [('id', 'U'), ('method', 'U'), ('resolution', 'f8'), ('deposited', 'U'), ('chains', 'i4'),
+    ('protein', 'i4'), ('rna', 'i4'), ('dna', 'i4'), ('ligands', 'U'), ('title', 'U'), ('source', 'U')]
+
+
+def _entry_metadata(code, entry):
+    '''Return the row of PDBmeta (without source) from the JSON of an entry of the RCSB Data API.'''
+    info = entry.get('rcsb_entry_info') or {}
+    resolution = (info.get('resolution_combined') or [float('nan')])[0]
+    method = ', '.join(experiment.get('method', '') for experiment in entry.get('exptl') or [])
+    deposited = ((entry.get('rcsb_accession_info') or {}).get('deposit_date') or '')[:10]
+    ligands = ' '.join(info.get('nonpolymer_bound_components') or [])
+    title = (entry.get('struct') or {}).get('title') or ''
+    return (code, method, resolution, deposited, info.get('deposited_polymer_entity_instance_count') or 0,
+        info.get('polymer_entity_count_protein') or 0, info.get('polymer_entity_count_RNA') or 0,
+        info.get('polymer_entity_count_DNA') or 0, ligands, title)
+
+
+def _stored_entry(row):
+    '''Return a row of the SQLite store as a row of PDBmeta. SQLite keeps nan as NULL, so None becomes nan again.'''
+    return row[:2] + (float('nan') if row[2] is None else row[2],) + row[3:] + ('store',)
+
+
+def _pdb_meta_database():
+    '''Return a connection to the SQLite store of PDBmeta; the table is made on first use.'''
+    import sqlite3
+    if not os.path.isdir(os.path.dirname(pdbMetaDatabase)):
+        os.makedirs(os.path.dirname(pdbMetaDatabase))
+    database = sqlite3.connect(pdbMetaDatabase)
+    database.execute('CREATE TABLE IF NOT EXISTS entries (id TEXT PRIMARY KEY, method TEXT, resolution REAL, '
+        'deposited TEXT, chains INTEGER, protein INTEGER, rna INTEGER, dna INTEGER, ligands TEXT, title TEXT, '
+        'fetched TEXT, json TEXT)')
+    return database
+
+
+def _fetch_entries(codes, workers=8, timeout=30):
+    '''
+    Return a list of (code, status, content) of the entries at pdbMetaURL.
+
+    At most workers requests are open at a time. Each worker thread keeps
+    one connection alive for all of its requests, so a batch of hundreds
+    of entries needs only a few TLS handshakes.
+    '''
+    import http.client, threading
+    from concurrent.futures import ThreadPoolExecutor
+    parts = urllib.parse.urlsplit(pdbMetaURL)
+    connectionClass = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    headers = {'Accept': 'application/json', 'User-Agent': 'pymolshortcuts4rna/%s' % __version__}
+    local = threading.local()
+    connections = []
+
+    def get(code):
+        # A kept-alive connection may have been closed by the server; then retry once on a new one.
+        for attempt in range(2):
+            if getattr(local, 'connection', None) is None:
+                local.connection = connectionClass(parts.netloc, timeout=timeout)
+                connections.append(local.connection)
+            try:
+                local.connection.request('GET', parts.path + code, headers=headers)
+                response = local.connection.getresponse()
+                return code, response.status, response.read()
+            except (http.client.HTTPException, OSError) as e:
+                local.connection.close()
+                local.connection = None
+                error = e
+        return code, 0, str(error).encode()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+            return list(pool.map(get, codes))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def PDBmeta(codes='', offline=None, refresh=0, workers=8, quiet=0):
+    ''' 
+    DESCRIPTION:
+    Get the resolution, method, chain composition, and ligands of many PDB entries at once.
+
+    USAGE:
+    PDBmeta [codes [, offline [, refresh [, workers [, quiet]]]]]
+
+    ARGUMENTS:
+    codes = string: PDB ids separated by spaces or commas, or the name of a file of PDB ids {default: all stored entries}
+    offline = 0 or 1: use only the local store {default: structureOffline}
+    refresh = 0 or 1: fetch the entries again even if they are stored {default: 0}
+    workers = integer: most requests open at a time {default: 8}
+    quiet = 0 or 1: do not print the table {default: 0}
+
+    EXAMPLE:
+    PDBmeta 1ehz 3nd4 4fe5 6ugg
+    PDBmeta ~/rnaEntries.txt
+    PDBmeta offline=1
+
+    MORE DETAILS:
+    The metadata of the entries are read from the RCSB Data API 
+    (pdbMetaURL) and stored in the SQLite database pdbMetaDatabase 
+    with the full JSON of each entry. Stored entries are answered from 
+    the database without the network, so later queries of the same 
+    entries also work offline. Without codes, all stored entries are 
+    listed. The file of codes may have several codes per line. 
+
+    The missing entries are fetched by a few worker threads, each of 
+    which keeps one connection open (HTTP keep-alive) for all of its 
+    requests. chains is the number of polymer chains in the deposited 
+    model; protein, rna, and dna are the numbers of distinct polymer 
+    entities of each type. The resolution is nan for NMR entries.
+
+    RETURNS
+        A NumPy structured array with one record per entry and the fields
+        ( id, method, resolution, deposited, chains, protein, rna, dna, 
+        ligands, title, source ). source is store, network, or the reason
+        that the entry is missing.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def PDBmeta(codes='', offline=None, refresh=0, workers=8, quiet=0):
+    offline = structureOffline if offline is None else int(offline)
+    refresh, quiet = int(refresh), int(quiet)
+    if isinstance(codes, str):
+        if os.path.isfile(os.path.expanduser(codes.strip())):
+            with open(os.path.expanduser(codes.strip())) as f:
+                codes = f.read()
+        codes = codes.replace(',', ' ').split()
+    codes = [code.strip().upper() for code in codes]
+
+    database = _pdb_meta_database()
+    columns = ', '.join(name for name, kind in _pdbMetaFields[:-1])
+    try:
+        if codes:
+            stored = {}
+            for chunk in range(0, len(codes), 500):
+                part = codes[chunk:chunk + 500]
+                for row in database.execute('SELECT %s FROM entries WHERE id IN (%s)' % (columns,
+                        ', '.join('?' * len(part))), part):
+                    stored[row[0]] = _stored_entry(row)
+        else:
+            stored = dict((row[0], _stored_entry(row)) for row in
+                database.execute('SELECT %s FROM entries ORDER BY id' % columns))
+            codes = list(stored)
+
+        missing = sorted(set(code for code in codes if refresh or code not in stored))
+        start = time.time()
+        if missing and offline:
+            for code in missing:
+                stored.setdefault(code, (code, '', float('nan'), '', 0, 0, 0, 0, '', '', 'not stored'))
+        elif missing:
+            fetched = []
+            for code, status, content in _fetch_entries(missing, workers):
+                if status != 200:
+                    reason = 'not found' if status == 404 else ('HTTP %d' % status if status else content.decode())
+                    stored.setdefault(code, (code, '', float('nan'), '', 0, 0, 0, 0, '', '', reason))
+                    continue
+                row = _entry_metadata(code, json.loads(content.decode()))
+                stored[code] = row + ('network',)
+                fetched.append(row + (datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'), content.decode()))
+            with database:
+                database.executemany('INSERT OR REPLACE INTO entries VALUES (%s)' % ', '.join('?' * 12), fetched)
+            if not quiet:
+                print("Fetched %d of %d entries in %.1f s." % (len(fetched), len(missing), time.time() - start))
+    finally:
+        database.close()
+
+    rows = [stored[code] for code in codes]
+    if not quiet:
+        print("%-6s %-22s %6s %-10s %6s %7s %4s %4s  %s" % ('id', 'method', 'res', 'deposited', 'chains',
+            'protein', 'rna', 'dna', 'ligands'))
+        for row in rows:
+            print("%-6s %-22s %6.2f %-10s %6d %7d %4d %4d  %s" % (row[:8] +
+                (row[8] if row[10] in ('store', 'network') else row[10],)))
+    return _record_array(rows, _pdbMetaFields)
+
+cmd.extend('PDBmeta', PDBmeta)
+    '''
+
+    offline = structureOffline if offline is None else int(offline)
+    refresh, quiet = int(refresh), int(quiet)
+    if isinstance(codes, str):
+        if os.path.isfile(os.path.expanduser(codes.strip())):
+            with open(os.path.expanduser(codes.strip())) as f:
+                codes = f.read()
+        codes = codes.replace(',', ' ').split()
+    codes = [code.strip().upper() for code in codes]
+
+    database = _pdb_meta_database()
+    columns = ', '.join(name for name, kind in _pdbMetaFields[:-1])
+    try:
+        if codes:
+            stored = {}
+            for chunk in range(0, len(codes), 500):
+                part = codes[chunk:chunk + 500]
+                for row in database.execute('SELECT %s FROM entries WHERE id IN (%s)' % (columns,
+                        ', '.join('?' * len(part))), part):
+                    stored[row[0]] = _stored_entry(row)
+        else:
+            stored = dict((row[0], _stored_entry(row)) for row in
+                database.execute('SELECT %s FROM entries ORDER BY id' % columns))
+            codes = list(stored)
+
+        missing = sorted(set(code for code in codes if refresh or code not in stored))
+        start = time.time()
+        if missing and offline:
+            for code in missing:
+                stored.setdefault(code, (code, '', float('nan'), '', 0, 0, 0, 0, '', '', 'not stored'))
+        elif missing:
+            fetched = []
+            for code, status, content in _fetch_entries(missing, workers):
+                if status != 200:
+                    reason = 'not found' if status == 404 else ('HTTP %d' % status if status else content.decode())
+                    stored.setdefault(code, (code, '', float('nan'), '', 0, 0, 0, 0, '', '', reason))
+                    continue
+                row = _entry_metadata(code, json.loads(content.decode()))
+                stored[code] = row + ('network',)
+                fetched.append(row + (datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'), content.decode()))
+            with database:
+                database.executemany('INSERT OR REPLACE INTO entries VALUES (%s)' % ', '.join('?' * 12), fetched)
+            if not quiet:
+                print("Fetched %d of %d entries in %.1f s." % (len(fetched), len(missing), time.time() - start))
+    finally:
+        database.close()
+
+    rows = [stored[code] for code in codes]
+    if not quiet:
+        print("%-6s %-22s %6s %-10s %6s %7s %4s %4s  %s" % ('id', 'method', 'res', 'deposited', 'chains',
+            'protein', 'rna', 'dna', 'ligands'))
+        for row in rows:
+            print("%-6s %-22s %6.2f %-10s %6d %7d %4d %4d  %s" % (row[:8] +
+                (row[8] if row[10] in ('store', 'network') else row[10],)))
+    return _record_array(rows, _pdbMetaFields)
+
+cmd.extend('PDBmeta', PDBmeta)
+
+
 def PE(selection):
     ''' 
     DESCRIPTION:
@@ -5233,28 +6204,14 @@ return
     subprocess.call(RStudioOpen); return
     PYTHON CODE:
 def RStudio():
-    try:
-        print("Opening the RStudio.");
-        subprocess.check_output(RStudioOpen)
-        print("Success opening RStudio.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'RStudioOpen'. \n  Or use ''RStudioPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the RStudio.")
+    _launch_app('RStudio', RStudioOpen)
 
 cmd.extend('RStudio',RStudio)
     '''
 
-    try:
-        print("Opening the RStudio.");
-        subprocess.check_output(RStudioOpen)
-        print("Success opening RStudio.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'RStudioOpen'. \n  Or use ''RStudioPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the RStudio.")
+    _launch_app('RStudio', RStudioOpen)
 
 cmd.extend('RStudio',RStudio)
 
@@ -5663,6 +6620,265 @@ cmd.extend('SC',SC)
 cmd.extend('SC',SC)
 
 
+_shortcutStats = {}
+_shortcutProfiles = {}
+_shortcutOriginals = {}
+_shortcutTracing = {'memory': False, 'profile': False}
+_shortcutStatsFields = [('shortcut', 'U'), ('calls', 'i8'), ('wall', 'f8'), ('cpu', 'f8'),
+    ('mean', 'f8'), ('longest', 'f8'), ('peak', 'i8')]
+
+
+def _timed_shortcut(name, function):
+    '''
+    Return a wrapper of a shortcut that adds the cost of each call to _shortcutStats[name].
+
+    The wall time and CPU time are always recorded. The peak memory of the
+    call (tracemalloc) and a cProfile of the call are recorded when they
+    are switched on in _shortcutTracing.
+    '''
+    import functools
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = _shortcutStats.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'longest': 0.0, 'peak': 0})
+        profile = None
+        memory = _shortcutTracing['memory']
+        if memory:
+            import tracemalloc
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            base = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+        if _shortcutTracing['profile']:
+            import cProfile
+            profile = cProfile.Profile()
+            profile.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            if profile is not None:
+                import pstats
+                profile.disable()
+                if name in _shortcutProfiles:
+                    _shortcutProfiles[name].add(profile)
+                else:
+                    _shortcutProfiles[name] = pstats.Stats(profile)
+            if memory:
+                stats['peak'] = max(stats['peak'], tracemalloc.get_traced_memory()[1] - base)
+                if started:
+                    tracemalloc.stop()
+            stats['calls'] += 1
+            stats['wall'] += wall
+            stats['cpu'] += cpu
+            stats['longest'] = max(stats['longest'], wall)
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def SCstats(top=20, sort='wall', fileName='', name='', reset=0):
+    ''' 
+    DESCRIPTION:
+    Print the shortcuts that took the most time since SCtime was switched on.
+
+    USAGE:
+    SCstats [top [, sort [, fileName [, name [, reset]]]]]
+
+    ARGUMENTS:
+    top = int: number of shortcuts to print {default: 20}
+    sort = string: wall, cpu, calls, mean, longest, or peak {default: wall}
+    fileName = string: also write the statistics of all shortcuts to a .json or .csv file {default: no file}
+    name = string: print the cProfile of this shortcut instead (needs SCtime 1, profile=1) {default: none}
+    reset = 0 or 1: clear the statistics after printing them {default: 0}
+
+    EXAMPLE:
+    SCstats
+    SCstats 10, cpu
+    SCstats fileName=shortcutTimes.csv
+    SCstats name=sb
+
+    MORE DETAILS:
+    The columns are the number of calls, the total wall time and CPU time
+    in seconds, the mean and longest wall time per call, and the largest 
+    peak of memory allocated by a call in bytes (recorded only with 
+    SCtime 1, memory=1). Times include the commands that a shortcut runs 
+    in PyMOL. A shortcut that is called from another shortcut is counted 
+    only when it was called from the command line or with cmd.do.
+
+    RETURNS
+        A NumPy structured array with one record per shortcut that was
+        called and the fields ( shortcut, calls, wall, cpu, mean, longest,
+        peak ), sorted by sort.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def SCstats(top=20, sort='wall', fileName='', name='', reset=0):
+    if name:
+        if name not in _shortcutProfiles:
+            print('There is no profile of %s. Enter "SCtime 1, profile=1" and run %s again.' % (name, name))
+            return
+        _shortcutProfiles[name].sort_stats('cumulative').print_stats(int(top))
+        return
+
+    rows = [(shortcut, stats['calls'], stats['wall'], stats['cpu'], stats['wall'] / max(stats['calls'], 1),
+        stats['longest'], stats['peak']) for shortcut, stats in _shortcutStats.items()]
+    table = _record_array(rows, _shortcutStatsFields)
+    if sort not in table.dtype.names:
+        print('sort must be one of %s' % ', '.join(table.dtype.names[1:]))
+        return
+    table = table[numpy.argsort(-table[sort], kind='stable')] if sort != 'shortcut' else numpy.sort(table, order='shortcut')
+
+    print("%-16s %8s %10s %10s %10s %10s %12s" % ('shortcut', 'calls', 'wall/s', 'cpu/s', 'mean/s', 'longest/s', 'peak/bytes'))
+    for row in table[0:int(top)]:
+        print("%-16s %8d %10.3f %10.3f %10.4f %10.3f %12d" % tuple(row))
+    if not _shortcutOriginals:
+        print('Timing is off. Enter "SCtime" to switch it on.')
+
+    if fileName:
+        if fileName.endswith('.csv'):
+            import csv
+            with open(fileName, 'w') as f:
+                writer = csv.writer(f)
+                writer.writerow(table.dtype.names)
+                writer.writerows(table.tolist())
+        else:
+            with open(fileName, 'w') as f:
+                json.dump([dict(zip(table.dtype.names, row)) for row in table.tolist()], f, indent=1)
+        print('Wrote the statistics of %d shortcuts to %s' % (len(table), fileName))
+    if int(reset):
+        _shortcutStats.clear()
+        _shortcutProfiles.clear()
+    return table
+
+cmd.extend('SCstats', SCstats)
+    '''
+
+    if name:
+        if name not in _shortcutProfiles:
+            print('There is no profile of %s. Enter "SCtime 1, profile=1" and run %s again.' % (name, name))
+            return
+        _shortcutProfiles[name].sort_stats('cumulative').print_stats(int(top))
+        return
+
+    rows = [(shortcut, stats['calls'], stats['wall'], stats['cpu'], stats['wall'] / max(stats['calls'], 1),
+        stats['longest'], stats['peak']) for shortcut, stats in _shortcutStats.items()]
+    table = _record_array(rows, _shortcutStatsFields)
+    if sort not in table.dtype.names:
+        print('sort must be one of %s' % ', '.join(table.dtype.names[1:]))
+        return
+    table = table[numpy.argsort(-table[sort], kind='stable')] if sort != 'shortcut' else numpy.sort(table, order='shortcut')
+
+    print("%-16s %8s %10s %10s %10s %10s %12s" % ('shortcut', 'calls', 'wall/s', 'cpu/s', 'mean/s', 'longest/s', 'peak/bytes'))
+    for row in table[0:int(top)]:
+        print("%-16s %8d %10.3f %10.3f %10.4f %10.3f %12d" % tuple(row))
+    if not _shortcutOriginals:
+        print('Timing is off. Enter "SCtime" to switch it on.')
+
+    if fileName:
+        if fileName.endswith('.csv'):
+            import csv
+            with open(fileName, 'w') as f:
+                writer = csv.writer(f)
+                writer.writerow(table.dtype.names)
+                writer.writerows(table.tolist())
+        else:
+            with open(fileName, 'w') as f:
+                json.dump([dict(zip(table.dtype.names, row)) for row in table.tolist()], f, indent=1)
+        print('Wrote the statistics of %d shortcuts to %s' % (len(table), fileName))
+    if int(reset):
+        _shortcutStats.clear()
+        _shortcutProfiles.clear()
+    return table
+
+cmd.extend('SCstats', SCstats)
+
+
+def SCtime(on=1, memory=0, profile=0, quiet=0):
+    ''' 
+    DESCRIPTION:
+    Switch on or off the recording of the time that each shortcut takes.
+
+    USAGE:
+    SCtime [on [, memory [, profile [, quiet]]]]
+
+    ARGUMENTS:
+    on = 0 or 1: record the cost of every call of a shortcut {default: 1}
+    memory = 0 or 1: also record the peak memory of each call with tracemalloc {default: 0}
+    profile = 0 or 1: also collect a cProfile of each call {default: 0}
+    quiet = 0 or 1: do not print the number of shortcuts {default: 0}
+
+    EXAMPLE:
+    SCtime
+    SCtime 1, memory=1
+    SCtime 1, profile=1
+    SCtime 0
+
+    MORE DETAILS:
+    Every shortcut registered by this script is registered again with a 
+    thin wrapper that records the number of calls and the wall and CPU 
+    time of each call. SCtime 0 restores the original functions, so the 
+    shortcuts carry no cost at all when the timing is off. With timing on,
+    the cost is two clock reads per call; memory=1 and profile=1 slow the 
+    shortcuts down and are meant for short investigations. Use SCstats to 
+    print and save the results. Set shortcutTiming to True near the top of
+    this script to switch the timing on at startup.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def SCtime(on=1, memory=0, profile=0, quiet=0):
+    on, quiet = int(on), int(quiet)
+    _shortcutTracing['memory'] = bool(int(memory))
+    _shortcutTracing['profile'] = bool(int(profile))
+    if on and not _shortcutOriginals:
+        for name, entry in list(cmd.keyword.items()):
+            function = entry[0]
+            if getattr(function, '__globals__', None) is globals() and name not in ('SCstats', 'SCtime'):
+                _shortcutOriginals[name] = function
+                cmd.extend(name, _timed_shortcut(name, function))
+    elif not on:
+        for name, function in _shortcutOriginals.items():
+            cmd.extend(name, function)
+        _shortcutOriginals.clear()
+    if not quiet and on:
+        print('Timing of %d shortcuts is on.' % len(_shortcutOriginals))
+    elif not quiet:
+        print('Timing of the shortcuts is off.')
+
+cmd.extend('SCtime', SCtime)
+    '''
+
+    on, quiet = int(on), int(quiet)
+    _shortcutTracing['memory'] = bool(int(memory))
+    _shortcutTracing['profile'] = bool(int(profile))
+    if on and not _shortcutOriginals:
+        for name, entry in list(cmd.keyword.items()):
+            function = entry[0]
+            if getattr(function, '__globals__', None) is globals() and name not in ('SCstats', 'SCtime'):
+                _shortcutOriginals[name] = function
+                cmd.extend(name, _timed_shortcut(name, function))
+    elif not on:
+        for name, function in _shortcutOriginals.items():
+            cmd.extend(name, function)
+        _shortcutOriginals.clear()
+    if not quiet and on:
+        print('Timing of %d shortcuts is on.' % len(_shortcutOriginals))
+    elif not quiet:
+        print('Timing of the shortcuts is off.')
+
+cmd.extend('SCtime', SCtime)
+
+
 def SD(searchTerm="pymol"):
     ''' 
     DESCRIPTION:
@@ -6108,7 +7324,7 @@ def T4L():
     PYTHON CODE:
 def T4L():
     cmd.reinitialize()
-    cmd.fetch('3fa0', type='pdb')
+    _load_structure('3fa0', 'pdb')
     cmd.orient()
     cmd.turn('z', '-90')
     cmd.turn('y', '-5')
@@ -6127,7 +7343,7 @@ cmd.extend('T4L',T4L)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('3fa0', type='pdb')
+    _load_structure('3fa0', 'pdb')
     cmd.orient()
     cmd.turn('z', '-90')
     cmd.turn('y', '-5')
@@ -6194,7 +7410,7 @@ def U8():
     PYTHON CODE:
 def U8():
     cmd.reinitialize()
-    cmd.fetch('3nd3', type='pdb1')
+    _load_structure('3nd3', 'pdb1')
     cmd.do('split_states 3nd3')
     cmd.hide('everything')
     cmd.bg_color('white')
@@ -6212,7 +7428,7 @@ cmd.extend('U8',U8)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('3nd3', type='pdb1')
+    _load_structure('3nd3', 'pdb1')
     cmd.do('split_states 3nd3')
     cmd.hide('everything')
     cmd.bg_color('white')
@@ -6279,7 +7495,7 @@ def WC8():
     PYTHON CODE:
 def WC8():
     cmd.reinitialize()
-    cmd.fetch('3nd4', type='pdb1')
+    _load_structure('3nd4', 'pdb1')
     cmd.remove('name H*')
     cmd.hide('everything')
     cmd.do('split_states 3nd4')
@@ -6297,7 +7513,7 @@ cmd.extend('WC8',WC8)
     '''
 
     cmd.reinitialize()
-    cmd.fetch('3nd4', type='pdb1')
+    _load_structure('3nd4', 'pdb1')
     cmd.remove('name H*')
     cmd.hide('everything')
     cmd.do('split_states 3nd4')
@@ -6314,6 +7530,91 @@ cmd.extend('WC8',WC8)
 cmd.extend('WC8',WC8)
 
 
+def apps(stop=''):
+    ''' 
+    DESCRIPTION:
+    List the external applications started by the shortcuts in this session, or stop them.
+
+    USAGE:
+    apps [stop]
+
+    ARGUMENTS:
+    stop = string: name of a shortcut (e.g., coot), a process id, or all {default: none}
+
+    EXAMPLE:
+    apps
+    apps coot
+
+    MORE DETAILS:
+    The application shortcuts (coot, chimera, jmol, vmd, ccp4mg, the 
+    editors, ...) start their programs without waiting for them, so PyMOL
+    stays responsive. The program of each shortcut is looked up once per 
+    session: first the program of its Open command near the top of this 
+    file, then the usual executables on the PATH (e.g., coot on Linux, 
+    where the macOS open command is missing). startup is the time in ms
+    that PyMOL took to start the process, not the time until the window 
+    of the application appears. With stop, the running programs that 
+    match are terminated.
+
+    RETURNS
+        A NumPy structured array with one record per program and the fields
+        ( name, pid, status, startup, seconds, command ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def apps(stop=''):
+    stop = str(stop).strip()
+    rows = []
+    for entry in _appProcesses:
+        process = entry['process']
+        if stop and process.poll() is None and stop in ('all', entry['name'], str(process.pid)):
+            process.terminate()
+            try:
+                process.wait(5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        code = process.poll()
+        status = 'running' if code is None else 'exited %d' % code
+        rows.append((entry['name'], process.pid, status, 1000 * entry['latency'], time.time() - entry['started'],
+            entry['command']))
+    print("%-10s %8s %-12s %10s %10s  %s" % ("name", "pid", "status", "startup/ms", "seconds", "command"))
+    for row in rows:
+        print("%-10s %8d %-12s %10.0f %10.1f  %s" % row)
+    return _record_array(rows, [('name', 'U'), ('pid', 'i8'), ('status', 'U'), ('startup', 'f8'),
+        ('seconds', 'f8'), ('command', 'U')])
+
+cmd.extend('apps', apps)
+    '''
+
+    stop = str(stop).strip()
+    rows = []
+    for entry in _appProcesses:
+        process = entry['process']
+        if stop and process.poll() is None and stop in ('all', entry['name'], str(process.pid)):
+            process.terminate()
+            try:
+                process.wait(5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        code = process.poll()
+        status = 'running' if code is None else 'exited %d' % code
+        rows.append((entry['name'], process.pid, status, 1000 * entry['latency'], time.time() - entry['started'],
+            entry['command']))
+    print("%-10s %8s %-12s %10s %10s  %s" % ("name", "pid", "status", "startup/ms", "seconds", "command"))
+    for row in rows:
+        print("%-10s %8d %-12s %10.0f %10.1f  %s" % row)
+    return _record_array(rows, [('name', 'U'), ('pid', 'i8'), ('status', 'U'), ('startup', 'f8'),
+        ('seconds', 'f8'), ('command', 'U')])
+
+cmd.extend('apps', apps)
+
+
 def atom(fileName="test.pml"):
     ''' 
     DESCRIPTION:
@@ -6340,28 +7641,14 @@ def atom(fileName="test.pml"):
 
     PYTHON CODE:
 def atom(fileName="test.pml"):
-    try:
-        print("Opeing the text editor atom. Please be patient. It starts slowly.")
-        subprocess.check_output(atomOpen)
-        print("Success opening atom")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'atomOpen'. \n Or use 'atomPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opeing the text editor atom. Please be patient. It starts slowly.")
+    _launch_app('atom', atomOpen)
 
 cmd.extend('atom',atom)
     '''
 
-    try:
-        print("Opeing the text editor atom. Please be patient. It starts slowly.")
-        subprocess.check_output(atomOpen)
-        print("Success opening atom")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'atomOpen'. \n Or use 'atomPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opeing the text editor atom. Please be patient. It starts slowly.")
+    _launch_app('atom', atomOpen)
 
 cmd.extend('atom',atom)
 
@@ -6393,28 +7680,14 @@ def bbedit(fileName="test.pml"):
 
     PYTHON CODE:
 def bbedit(fileName="test.pml"):
-    try:
-        print("Opening the molecular graphics program bbedit.");
-        subprocess.check_output(bbeditOpen)
-        print("Success opening bbedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the bbeditOpen'. \n  Or use 'bbeditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program bbedit.")
+    _launch_app('bbedit', bbeditOpen)
 
 cmd.extend('bbedit',bbedit)
     '''
 
-    try:
-        print("Opening the molecular graphics program bbedit.");
-        subprocess.check_output(bbeditOpen)
-        print("Success opening bbedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the bbeditOpen'. \n  Or use 'bbeditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program bbedit.")
+    _launch_app('bbedit', bbeditOpen)
 
 cmd.extend('bbedit',bbedit)
 
@@ -6487,7 +7760,7 @@ def bs(selection='all'):
 
     MORE DETAILS:
     bs creates a ball and stick representation of an object. 
-    Bondi VDW values added below to override default Pymol settings.
+    The Bondi VDW values in _bondiRadii override the default PyMOL radii of the atoms in the selection.
     From https://gist.githubusercontent.com/bobbypaton/1cdc4784f3fc8374467bae5eb410edef/raw/9995d51d6a64b8bcf01590c944cc38059b2f8d7f/pymol_style.py
 
 
@@ -6498,302 +7771,16 @@ def bs(selection='all'):
     NA
     PYTHON CODE:
 def bs(selection='all'):
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("slate","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
+    _ball_and_stick(selection, _ballAndStickColors)
 
 cmd.extend('bs', bs)
     '''
 
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("slate","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
+    _ball_and_stick(selection, _ballAndStickColors)
 
 cmd.extend('bs', bs)
 
@@ -6821,311 +7808,17 @@ def bsbw(selection='all'):
     NA
     PYTHON CODE:
 def bsbw(selection='all'):
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
+    _ball_and_stick(selection, _ballAndStickGrays)
 
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("gray55","elem O and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem CL and "+selection)
-    cmd.color("gray40","elem K and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
 cmd.extend('bsbw', bsbw)
     '''
 
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
+    _ball_and_stick(selection, _ballAndStickGrays)
 
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("gray55","elem O and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem CL and "+selection)
-    cmd.color("gray40","elem K and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
 cmd.extend('bsbw', bsbw)
 
 
@@ -7155,315 +7848,21 @@ Only the side chains are shown as ball and stick when used with a cartoon (ribbo
     NA
     PYTHON CODE:
 def bsbwsc(selection='all'):
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
     cmd.show("cartoon", selection)
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("gray55","elem O and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem CL and "+selection)
-    cmd.color("gray40","elem K and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.do("set cartoon_side_chain_helper, on")
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
+    cmd.set("cartoon_side_chain_helper", "on")
+    _ball_and_stick(selection, _ballAndStickGrays)
+
 cmd.extend('bsbwsc', bsbwsc)
     '''
 
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
+    _set_vdw(selection)
+    _ball_and_stick_workspace()
     cmd.show("cartoon", selection)
-    cmd.show("sticks", selection)
-    cmd.show("spheres", selection)
-    cmd.color("gray85","elem C and "+selection)
-    cmd.color("gray98","elem H and "+selection)
-    cmd.color("gray55","elem O and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem CL and "+selection)
-    cmd.color("gray40","elem K and "+selection)
-    cmd.color("gray70","elem S and "+selection)
-    cmd.color("gray40","elem N and "+selection)
-    cmd.set("stick_radius",0.07, selection)
-    cmd.do("set cartoon_side_chain_helper, on")
-    cmd.set("sphere_scale",0.18, selection)
-    cmd.set("sphere_scale",0.13, selection+" and elem H")
-    cmd.set("dash_gap",0.01, selection)
-    cmd.set("dash_radius",0.07, selection)
-    cmd.set("stick_color","black", selection)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", selection)
-    cmd.hide("lines", selection)
-    cmd.zoom(selection)
-    cmd.hide("labels")
+    cmd.set("cartoon_side_chain_helper", "on")
+    _ball_and_stick(selection, _ballAndStickGrays)
+
 cmd.extend('bsbwsc', bsbwsc)
 
 
@@ -7488,336 +7887,18 @@ def bsvdw(arg1="all"):
     NA
     PYTHON CODE:
 def bsvdw(arg1="all"):
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", arg1)
-    cmd.show("spheres", arg1)
-    cmd.color("gray85","elem C and "+arg1)
-    cmd.color("gray98","elem H and "+arg1)
-    cmd.color("slate","elem N and "+arg1)
-    cmd.set("stick_radius",0.07, arg1)
-    cmd.set("sphere_scale",0.18, arg1)
-    cmd.set("sphere_scale",0.13, arg1+" and elem H")
-    cmd.set("dash_gap",0.01, arg1)
-    cmd.set("dash_radius",0.07, arg1)
-    cmd.set("stick_color","black", arg1)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", arg1)
-    cmd.hide("lines", arg1)
-    cmd.zoom(arg1)
-    cmd.hide("labels")
-
-    # defines VDW Sphere settings
-    cmd.copy(arg1+"_vdw", arg1)
-    cmd.set("sphere_scale",1.0, arg1+"_vdw and elem H")
-    cmd.rebuild()
-    cmd.set("sphere_scale", 1, arg1+"_vdw")
-    cmd.hide("nonbonded", arg1+"_vdw")
-    cmd.hide("lines", arg1+"_vdw")
-    cmd.hide("sticks", arg1+"_vdw")
-    cmd.hide("cartoon", arg1+"_vdw")
-    cmd.show("spheres", arg1+"_vdw")
-    cmd.set("sphere_transparency", 0.7, arg1+"_vdw")
-    print("Note that the selection of 'all' does not work when applying this function")
-    print("to multiple models as are found in pdb1 files and when multiple chains")
-    print("make up the biological unit.")
-    print("The shortcut has to be applied separately to each model.")
-
+    _set_vdw(arg1)
+    _ball_and_stick_workspace()
+    _ball_and_stick(arg1, _ballAndStickColors)
+    _vdw_copy(arg1)
 
 cmd.extend('bsvdw', bsvdw)
     '''
 
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-    # defines BallnStick settings
-    cmd.show("sticks", arg1)
-    cmd.show("spheres", arg1)
-    cmd.color("gray85","elem C and "+arg1)
-    cmd.color("gray98","elem H and "+arg1)
-    cmd.color("slate","elem N and "+arg1)
-    cmd.set("stick_radius",0.07, arg1)
-    cmd.set("sphere_scale",0.18, arg1)
-    cmd.set("sphere_scale",0.13, arg1+" and elem H")
-    cmd.set("dash_gap",0.01, arg1)
-    cmd.set("dash_radius",0.07, arg1)
-    cmd.set("stick_color","black", arg1)
-    cmd.set("dash_gap",0.01)
-    cmd.set("dash_radius",0.035)
-    cmd.hide("nonbonded", arg1)
-    cmd.hide("lines", arg1)
-    cmd.zoom(arg1)
-    cmd.hide("labels")
-
-    # defines VDW Sphere settings
-    cmd.copy(arg1+"_vdw", arg1)
-    cmd.set("sphere_scale",1.0, arg1+"_vdw and elem H")
-    cmd.rebuild()
-    cmd.set("sphere_scale", 1, arg1+"_vdw")
-    cmd.hide("nonbonded", arg1+"_vdw")
-    cmd.hide("lines", arg1+"_vdw")
-    cmd.hide("sticks", arg1+"_vdw")
-    cmd.hide("cartoon", arg1+"_vdw")
-    cmd.show("spheres", arg1+"_vdw")
-    cmd.set("sphere_transparency", 0.7, arg1+"_vdw")
-    print("Note that the selection of 'all' does not work when applying this function")
-    print("to multiple models as are found in pdb1 files and when multiple chains")
-    print("make up the biological unit.")
-    print("The shortcut has to be applied separately to each model.")
-
+    _set_vdw(arg1)
+    _ball_and_stick_workspace()
+    _ball_and_stick(arg1, _ballAndStickColors)
+    _vdw_copy(arg1)
 
 cmd.extend('bsvdw', bsvdw)
 
@@ -7867,8 +7948,7 @@ def buriedW(sele='all', cutoff=-1, state=1, quiet=1, _self=cmd):
 
     if cutoff < 0:
         cutoff = _self.get("surface_residue_cutoff")
-    _self.remove(tmpObj + " and not solvent")
-    _self.remove(tmpObj + " and b > %s" % cutoff)
+    _self.remove(tmpObj + " and (not solvent or b > %s)" % cutoff)
 
     exposed = set()
     _self.iterate(tmpObj, "exposed.add((chain,resv))", space=locals())
@@ -7876,7 +7956,7 @@ def buriedW(sele='all', cutoff=-1, state=1, quiet=1, _self=cmd):
     selName = _self.get_unused_name("buried")
     _self.select(selName, "(%s) in %s" % (sele, tmpObj))
 	
-    cmd.show("spheres","buried01")
+    _self.show("spheres", selName)
     
     # clean up
     _self.delete(tmpObj)
@@ -7899,8 +7979,7 @@ cmd.extend('buriedW', buriedW)
 
     if cutoff < 0:
         cutoff = _self.get("surface_residue_cutoff")
-    _self.remove(tmpObj + " and not solvent")
-    _self.remove(tmpObj + " and b > %s" % cutoff)
+    _self.remove(tmpObj + " and (not solvent or b > %s)" % cutoff)
 
     exposed = set()
     _self.iterate(tmpObj, "exposed.add((chain,resv))", space=locals())
@@ -7908,7 +7987,7 @@ cmd.extend('buriedW', buriedW)
     selName = _self.get_unused_name("buried")
     _self.select(selName, "(%s) in %s" % (sele, tmpObj))
 	
-    cmd.show("spheres","buried01")
+    _self.show("spheres", selName)
     
     # clean up
     _self.delete(tmpObj)
@@ -7921,6 +8000,252 @@ cmd.extend('buriedW', buriedW)
 cmd.extend('buriedW', buriedW)
 
 
+def buriedWbatch(objects='all', cutoff=-1, states=0, fraction=0.5, quiet=1, _self=cmd):
+    ''' 
+    DESCRIPTION:
+    Return a per-state table of buried waters for all states of one or more objects or files.
+
+    USAGE:
+    buriedWbatch [objects, [cutoff, [states, [fraction, [quiet]]]]]
+
+    ARGUMENTS:
+    objects = string: space or comma separated list of object names, selections,
+              or file patterns like ~/hydratedRNA/*.pdb {default: all}
+    cutoff = float: threshold on what one considers an "exposed"
+             atom (in A**2) {default: surface_residue_cutoff}
+    states = int: one state to analyze; 0 analyzes all states {default: 0}
+    fraction = float: waters buried in at least this fraction of the states 
+               are added to the buried selection {default: 0.5}
+    quiet = int: 0 prints the table {default: 1}
+
+    EXAMPLE:
+    buriedWbatch 2mxs, quiet=0
+    buriedWbatch ~/hydratedRNA/*.pdb, quiet=0
+
+    MORE DETAILS:
+    Batch version of buriedW for NMR and MD ensembles and for directories 
+    of hydrated structures. Each object is copied once with all of its states,
+    instead of once per state. The solvent accessible area of every water 
+    oxygen is collected into a NumPy array with one row per state. A water is
+    buried in a state when its area is at most the cutoff, as in buriedW.
+
+    The waters of loaded objects that are buried in at least the given
+    fraction of the states are selected and shown as spheres. Files are 
+    loaded one at a time and deleted after their waters are counted.
+
+    RETURNS
+        A NumPy structured array with one record per object and state and the
+        fields ( object, state, waters, buried, fraction ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def buriedWbatch(objects='all', cutoff=-1, states=0, fraction=0.5, quiet=1, _self=cmd):
+    cutoff, states, fraction, quiet = float(cutoff), int(states), float(fraction), int(quiet)
+    if cutoff < 0:
+        cutoff = float(_self.get("surface_residue_cutoff"))
+
+    # expand the arguments into loaded objects and files to load
+    sources = []
+    for token in objects.replace(",", " ").split():
+        files = [f for f in sorted(glob.glob(os.path.expanduser(token))) if os.path.isfile(f)]
+        if files:
+            sources.extend((None, f) for f in files)
+        else:
+            sources.extend((name, None) for name in _self.get_object_list(token) or [])
+
+    rows, buriedWaters = [], []
+    for name, fileName in sources:
+        # one copy of the object with all of its states
+        tmpObj = _self.get_unused_name("__tmp")
+        if fileName:
+            _self.load(fileName, tmpObj)
+            label = os.path.basename(fileName)
+        else:
+            _self.create(tmpObj, name, 0, 0, zoom=0)
+            label = name
+        _self.set("dot_solvent", 1, tmpObj)
+
+        waters = []
+        _self.iterate(tmpObj + " and solvent and not hydro", "waters.append((chain, resi))", space=locals())
+        stateList = [states] if states > 0 else list(range(1, _self.count_states(tmpObj) + 1))
+
+        areas = numpy.zeros((len(stateList), len(waters)))
+        for row, state in enumerate(stateList):
+            _self.get_area(tmpObj, state=state, load_b=1)
+            values = []
+            _self.iterate(tmpObj + " and solvent and not hydro", "values.append(b)", space=locals())
+            areas[row] = values
+        buried = areas <= cutoff
+
+        for row, state in enumerate(stateList):
+            nBuried = int(buried[row].sum())
+            rows.append((label, state, len(waters), nBuried, nBuried / max(len(waters), 1)))
+        if name and len(stateList):
+            frequency = buried.mean(axis=0)
+            buriedWaters.extend((name, chain, resi) for (chain, resi), f in zip(waters, frequency) if f >= fraction)
+
+        # clean up
+        _self.delete(tmpObj)
+
+    table = _record_array(rows, [('object', 'U'), ('state', 'i4'), ('waters', 'i4'), ('buried', 'i4'), ('fraction', 'f8')])
+
+    if buriedWaters:
+        selName = _self.get_unused_name("buried")
+        _select_residues(selName, buriedWaters)
+        _self.show("spheres", selName)
+
+    if not quiet:
+        print("%-24s %6s %7s %7s %9s" % ("object", "state", "waters", "buried", "fraction"))
+        for record in table:
+            print("%-24s %6d %7d %7d %9.3f" % tuple(record))
+
+    return table
+
+cmd.extend('buriedWbatch', buriedWbatch)
+    '''
+
+    cutoff, states, fraction, quiet = float(cutoff), int(states), float(fraction), int(quiet)
+    if cutoff < 0:
+        cutoff = float(_self.get("surface_residue_cutoff"))
+
+    # expand the arguments into loaded objects and files to load
+    sources = []
+    for token in objects.replace(",", " ").split():
+        files = [f for f in sorted(glob.glob(os.path.expanduser(token))) if os.path.isfile(f)]
+        if files:
+            sources.extend((None, f) for f in files)
+        else:
+            sources.extend((name, None) for name in _self.get_object_list(token) or [])
+
+    rows, buriedWaters = [], []
+    for name, fileName in sources:
+        # one copy of the object with all of its states
+        tmpObj = _self.get_unused_name("__tmp")
+        if fileName:
+            _self.load(fileName, tmpObj)
+            label = os.path.basename(fileName)
+        else:
+            _self.create(tmpObj, name, 0, 0, zoom=0)
+            label = name
+        _self.set("dot_solvent", 1, tmpObj)
+
+        waters = []
+        _self.iterate(tmpObj + " and solvent and not hydro", "waters.append((chain, resi))", space=locals())
+        stateList = [states] if states > 0 else list(range(1, _self.count_states(tmpObj) + 1))
+
+        areas = numpy.zeros((len(stateList), len(waters)))
+        for row, state in enumerate(stateList):
+            _self.get_area(tmpObj, state=state, load_b=1)
+            values = []
+            _self.iterate(tmpObj + " and solvent and not hydro", "values.append(b)", space=locals())
+            areas[row] = values
+        buried = areas <= cutoff
+
+        for row, state in enumerate(stateList):
+            nBuried = int(buried[row].sum())
+            rows.append((label, state, len(waters), nBuried, nBuried / max(len(waters), 1)))
+        if name and len(stateList):
+            frequency = buried.mean(axis=0)
+            buriedWaters.extend((name, chain, resi) for (chain, resi), f in zip(waters, frequency) if f >= fraction)
+
+        # clean up
+        _self.delete(tmpObj)
+
+    table = _record_array(rows, [('object', 'U'), ('state', 'i4'), ('waters', 'i4'), ('buried', 'i4'), ('fraction', 'f8')])
+
+    if buriedWaters:
+        selName = _self.get_unused_name("buried")
+        _select_residues(selName, buriedWaters)
+        _self.show("spheres", selName)
+
+    if not quiet:
+        print("%-24s %6s %7s %7s %9s" % ("object", "state", "waters", "buried", "fraction"))
+        for record in table:
+            print("%-24s %6d %7d %7d %9.3f" % tuple(record))
+
+    return table
+
+cmd.extend('buriedWbatch', buriedWbatch)
+
+
+def cachePDB(codes='', type='pdb'):
+    ''' 
+    DESCRIPTION:
+    Add structures or maps to the local structure cache or list the cached entries.
+
+    USAGE:
+    cachePDB [codes, [type]]
+
+    ARGUMENTS:
+    codes = string: space or comma separated list of PDB codes {default: list the cache}
+    type = string: fetch type: pdb, cif, pdb1, 2fofc, or fofc {default: pdb}
+
+    EXAMPLE:
+    cachePDB 4pco 3fa0 4gdx
+    cachePDB 3nd3 3nd4 4dgr, pdb1
+    cachePDB
+
+    MORE DETAILS:
+    The scene shortcuts (GU, BST, U8, WC8, T4L, N9, NA, GGT, LG and their
+    L-prefixed variants) find their structures in this order: the content-addressed
+    cache in structureCachePath, the local mirror of the PDB in local_mirror_divided, 
+    localPDBfilePath (localEMAPfilePath for maps), fetch_path, and only then the network.
+    Downloads and files found in fetch_path are copied into the cache under the 
+    SHA-256 hash of their content and recorded in index.json in the cache directory.
+
+    Run this shortcut once with the codes used in your figures to rebuild the 
+    figures later without a network connection. Set structureOffline = True 
+    near the top of this file to never use the network.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def cachePDB(codes='', type='pdb'):
+    if not codes:
+        index = _structure_index()
+        print("%d entries in %s" % (len(index), structureCachePath))
+        for key in sorted(index):
+            print("%-12s %-12s %s %s" % (key, index[key]['source'], index[key]['date'], index[key]['file']))
+        return
+
+    for code in codes.replace(",", " ").split():
+        path, source = _resolve_structure(code, type)
+        if path is None:
+            tmpObj = cmd.get_unused_name("__tmpFetch")
+            if _load_structure(code, type, tmpObj):
+                source = 'network'
+            cmd.delete(tmpObj)
+        print("%s (%s): %s" % (code, type, source or 'not found'))
+
+cmd.extend('cachePDB', cachePDB)
+    '''
+
+    if not codes:
+        index = _structure_index()
+        print("%d entries in %s" % (len(index), structureCachePath))
+        for key in sorted(index):
+            print("%-12s %-12s %s %s" % (key, index[key]['source'], index[key]['date'], index[key]['file']))
+        return
+
+    for code in codes.replace(",", " ").split():
+        path, source = _resolve_structure(code, type)
+        if path is None:
+            tmpObj = cmd.get_unused_name("__tmpFetch")
+            if _load_structure(code, type, tmpObj):
+                source = 'network'
+            cmd.delete(tmpObj)
+        print("%s (%s): %s" % (code, type, source or 'not found'))
+
+cmd.extend('cachePDB', cachePDB)
+
+
 def cartoonbw(arg1='all'):
     ''' 
     DESCRIPTION:
@@ -7994,28 +8319,14 @@ def ccp4mg():
 
     PYTHON CODE:
 def ccp4mg():
-    try:
-        print("Opening the molecular graphics program ccp4mg.");
-        subprocess.check_output(ccp4mgCommand)
-        print("Success opening ccp4mg.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the ccp4mgOpen'. \n  Or use 'ccp4mgPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program ccp4mg.")
+    _launch_app('ccp4mg', ccp4mgCommand)
 
 cmd.extend('ccp4mg',ccp4mg)
     '''
 
-    try:
-        print("Opening the molecular graphics program ccp4mg.");
-        subprocess.check_output(ccp4mgCommand)
-        print("Success opening ccp4mg.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the ccp4mgOpen'. \n  Or use 'ccp4mgPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program ccp4mg.")
+    _launch_app('ccp4mg', ccp4mgCommand)
 
 cmd.extend('ccp4mg',ccp4mg)
 
@@ -8101,29 +8412,29 @@ def checkParams(needle, haystack, selName, het, firstOnly):
     # check Needle
     if len(needle) == 0 or not cmd.is_string(needle):
         print("Error: Please provide a string 'needle' to search for.")
-        print("Error: For help type 'help motifFinder'.")
-    return False
+        print("Error: For help type 'help findSeq'.")
+        return False
 
     # check Haystack
     if len(haystack) == 0 or not cmd.is_string(haystack):
         print("Error: Please provide valid PyMOL object or selection name")
         print("Error: in which to search.")
-        print("Error: For help type 'help motifFinder'.")
-    return False
+        print("Error: For help type 'help findSeq'.")
+        return False
 
     # check het
     try:
         het = bool(int(het))
     except ValueError:
         print("Error: The 'het' parameter was not 0 or 1.")
-    return False
+        return False
 
     # check first Only
     try:
-        firstOnly = bool(int(het))
+        firstOnly = bool(int(firstOnly))
     except ValueError:
         print("Error: The 'firstOnly' parameter was not 0 or 1.")
-    return False
+        return False
 
     # check selName
     if not cmd.is_string(selName):
@@ -8139,29 +8450,29 @@ def checkParams(needle, haystack, selName, het, firstOnly):
     # check Needle
     if len(needle) == 0 or not cmd.is_string(needle):
         print("Error: Please provide a string 'needle' to search for.")
-        print("Error: For help type 'help motifFinder'.")
-    return False
+        print("Error: For help type 'help findSeq'.")
+        return False
 
     # check Haystack
     if len(haystack) == 0 or not cmd.is_string(haystack):
         print("Error: Please provide valid PyMOL object or selection name")
         print("Error: in which to search.")
-        print("Error: For help type 'help motifFinder'.")
-    return False
+        print("Error: For help type 'help findSeq'.")
+        return False
 
     # check het
     try:
         het = bool(int(het))
     except ValueError:
         print("Error: The 'het' parameter was not 0 or 1.")
-    return False
+        return False
 
     # check first Only
     try:
-        firstOnly = bool(int(het))
+        firstOnly = bool(int(firstOnly))
     except ValueError:
         print("Error: The 'firstOnly' parameter was not 0 or 1.")
-    return False
+        return False
 
     # check selName
     if not cmd.is_string(selName):
@@ -8171,23 +8482,27 @@ def checkParams(needle, haystack, selName, het, firstOnly):
 
 
 
-def chimera(fileName="test.pdb"):
+def chimera(fileName="", selection=""):
     ''' 
     DESCRIPTION:
     Open Chimera from within PyMOL. 
  
 
     USAGE:
-    chimera
+    chimera [fileName [, selection]]
 
     ARGUMENTS:
-    None
+    fileName = string: coordinate file to open in Chimera {default: none}
+    selection = string: atoms to hand over to Chimera {default: none}
     EXAMPLE:
     chimera
+    chimera selection=sele
 
     MORE DETAILS:
     Open Chimera from within PyMOL. 
     Adjust url for your location.
+    PyMOL does not wait for Chimera; use apps to list or stop the programs started from PyMOL.
+    With a selection, the atoms are saved to a temporary file that Chimera opens, so no manual save is needed.
 
 
     VERTICAL PML SCRIPT:
@@ -8196,30 +8511,23 @@ def chimera(fileName="test.pdb"):
 
     HORIZONTAL PML SCRIPT:
     subprocess.call(chimeraOpen);return
+
     PYTHON CODE:
-def chimera(fileName="test.pdb"):
-    try:
-        print("Opening the molecular graphics program CHIMERA.");
-        subprocess.check_output(chimeraOpen)
-        print("Success opening CHIMERA.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'chimeraOpen'. \n  Or use 'chimeraPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+def chimera(fileName="", selection=""):
+    arguments = [fileName] if fileName else []
+    if selection:
+        arguments.append(_handoff_selection(selection, 'chimera'))
+    print("Opening the molecular graphics program CHIMERA.")
+    _launch_app('chimera', chimeraOpen, arguments)
 
 cmd.extend('chimera',chimera)
     '''
 
-    try:
-        print("Opening the molecular graphics program CHIMERA.");
-        subprocess.check_output(chimeraOpen)
-        print("Success opening CHIMERA.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'chimeraOpen'. \n  Or use 'chimeraPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    arguments = [fileName] if fileName else []
+    if selection:
+        arguments.append(_handoff_selection(selection, 'chimera'))
+    print("Opening the molecular graphics program CHIMERA.")
+    _launch_app('chimera', chimeraOpen, arguments)
 
 cmd.extend('chimera',chimera)
 
@@ -8699,28 +9007,14 @@ def code():
 
     PYTHON CODE:
 def code():
-    try:
-        print("Opening the molecular graphics program Virtual Studio Code.");
-        subprocess.check_output(codeOpen)
-        print("Success opening Virtual Studio Code.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the codeOpen'. \n  Or use 'codePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program Virtual Studio Code.")
+    _launch_app('code', codeOpen)
 
 cmd.extend('code',code)
     '''
 
-    try:
-        print("Opening the molecular graphics program Virtual Studio Code.");
-        subprocess.check_output(codeOpen)
-        print("Success opening Virtual Studio Code.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the codeOpen'. \n  Or use 'codePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program Virtual Studio Code.")
+    _launch_app('code', codeOpen)
 
 cmd.extend('code',code)
 
@@ -8749,94 +9043,12 @@ colorh1 1lw9
     NotYet
     PYTHON CODE:
 def colorh1(selection='all'):
-    s = str(selection)
-    print(s)
-    cmd.set_color('color_ile',[0.996,0.062,0.062])
-    cmd.set_color('color_phe',[0.996,0.109,0.109])
-    cmd.set_color('color_val',[0.992,0.156,0.156])
-    cmd.set_color('color_leu',[0.992,0.207,0.207])
-    cmd.set_color('color_trp',[0.992,0.254,0.254])
-    cmd.set_color('color_met',[0.988,0.301,0.301])
-    cmd.set_color('color_ala',[0.988,0.348,0.348])
-    cmd.set_color('color_gly',[0.984,0.394,0.394])
-    cmd.set_color('color_cys',[0.984,0.445,0.445])
-    cmd.set_color('color_tyr',[0.984,0.492,0.492])
-    cmd.set_color('color_pro',[0.980,0.539,0.539])
-    cmd.set_color('color_thr',[0.980,0.586,0.586])
-    cmd.set_color('color_ser',[0.980,0.637,0.637])
-    cmd.set_color('color_his',[0.977,0.684,0.684])
-    cmd.set_color('color_glu',[0.977,0.730,0.730])
-    cmd.set_color('color_asn',[0.973,0.777,0.777])
-    cmd.set_color('color_gln',[0.973,0.824,0.824])
-    cmd.set_color('color_asp',[0.973,0.875,0.875])
-    cmd.set_color('color_lys',[0.899,0.922,0.922])
-    cmd.set_color('color_arg',[0.899,0.969,0.969])
-    cmd.color("color_ile","("+s+" and resn ile)")
-    cmd.color("color_phe","("+s+" and resn phe)")
-    cmd.color("color_val","("+s+" and resn val)")
-    cmd.color("color_leu","("+s+" and resn leu)")
-    cmd.color("color_trp","("+s+" and resn trp)")
-    cmd.color("color_met","("+s+" and resn met)")
-    cmd.color("color_ala","("+s+" and resn ala)")
-    cmd.color("color_gly","("+s+" and resn gly)")
-    cmd.color("color_cys","("+s+" and resn cys)")
-    cmd.color("color_tyr","("+s+" and resn tyr)")
-    cmd.color("color_pro","("+s+" and resn pro)")
-    cmd.color("color_thr","("+s+" and resn thr)")
-    cmd.color("color_ser","("+s+" and resn ser)")
-    cmd.color("color_his","("+s+" and resn his)")
-    cmd.color("color_glu","("+s+" and resn glu)")
-    cmd.color("color_asn","("+s+" and resn asn)")
-    cmd.color("color_gln","("+s+" and resn gln)")
-    cmd.color("color_asp","("+s+" and resn asp)")
-    cmd.color("color_lys","("+s+" and resn lys)")
-    cmd.color("color_arg","("+s+" and resn arg)")
+    _color_by_residue(selection, 'eisenberg1')
 
 cmd.extend('colorh1',colorh1)
     '''
 
-    s = str(selection)
-    print(s)
-    cmd.set_color('color_ile',[0.996,0.062,0.062])
-    cmd.set_color('color_phe',[0.996,0.109,0.109])
-    cmd.set_color('color_val',[0.992,0.156,0.156])
-    cmd.set_color('color_leu',[0.992,0.207,0.207])
-    cmd.set_color('color_trp',[0.992,0.254,0.254])
-    cmd.set_color('color_met',[0.988,0.301,0.301])
-    cmd.set_color('color_ala',[0.988,0.348,0.348])
-    cmd.set_color('color_gly',[0.984,0.394,0.394])
-    cmd.set_color('color_cys',[0.984,0.445,0.445])
-    cmd.set_color('color_tyr',[0.984,0.492,0.492])
-    cmd.set_color('color_pro',[0.980,0.539,0.539])
-    cmd.set_color('color_thr',[0.980,0.586,0.586])
-    cmd.set_color('color_ser',[0.980,0.637,0.637])
-    cmd.set_color('color_his',[0.977,0.684,0.684])
-    cmd.set_color('color_glu',[0.977,0.730,0.730])
-    cmd.set_color('color_asn',[0.973,0.777,0.777])
-    cmd.set_color('color_gln',[0.973,0.824,0.824])
-    cmd.set_color('color_asp',[0.973,0.875,0.875])
-    cmd.set_color('color_lys',[0.899,0.922,0.922])
-    cmd.set_color('color_arg',[0.899,0.969,0.969])
-    cmd.color("color_ile","("+s+" and resn ile)")
-    cmd.color("color_phe","("+s+" and resn phe)")
-    cmd.color("color_val","("+s+" and resn val)")
-    cmd.color("color_leu","("+s+" and resn leu)")
-    cmd.color("color_trp","("+s+" and resn trp)")
-    cmd.color("color_met","("+s+" and resn met)")
-    cmd.color("color_ala","("+s+" and resn ala)")
-    cmd.color("color_gly","("+s+" and resn gly)")
-    cmd.color("color_cys","("+s+" and resn cys)")
-    cmd.color("color_tyr","("+s+" and resn tyr)")
-    cmd.color("color_pro","("+s+" and resn pro)")
-    cmd.color("color_thr","("+s+" and resn thr)")
-    cmd.color("color_ser","("+s+" and resn ser)")
-    cmd.color("color_his","("+s+" and resn his)")
-    cmd.color("color_glu","("+s+" and resn glu)")
-    cmd.color("color_asn","("+s+" and resn asn)")
-    cmd.color("color_gln","("+s+" and resn gln)")
-    cmd.color("color_asp","("+s+" and resn asp)")
-    cmd.color("color_lys","("+s+" and resn lys)")
-    cmd.color("color_arg","("+s+" and resn arg)")
+    _color_by_residue(selection, 'eisenberg1')
 
 cmd.extend('colorh1',colorh1)
 
@@ -8865,99 +9077,17 @@ colorh2 1lw9
     NotYet
     PYTHON CODE:
 def colorh2(selection='all'):
-    s = str(selection)
-    print(s)
-    cmd.set_color("color_ile2",[0.938,1,0.938])
-    cmd.set_color("color_phe2",[0.891,1,0.891])
-    cmd.set_color("color_val2",[0.844,1,0.844])
-    cmd.set_color("color_leu2",[0.793,1,0.793])
-    cmd.set_color("color_trp2",[0.746,1,0.746])
-    cmd.set_color("color_met2",[0.699,1,0.699])
-    cmd.set_color("color_ala2",[0.652,1,0.652])
-    cmd.set_color("color_gly2",[0.606,1,0.606])
-    cmd.set_color("color_cys2",[0.555,1,0.555])
-    cmd.set_color("color_tyr2",[0.508,1,0.508])
-    cmd.set_color("color_pro2",[0.461,1,0.461])
-    cmd.set_color("color_thr2",[0.414,1,0.414])
-    cmd.set_color("color_ser2",[0.363,1,0.363])
-    cmd.set_color("color_his2",[0.316,1,0.316])
-    cmd.set_color("color_glu2",[0.27,1,0.27])
-    cmd.set_color("color_asn2",[0.223,1,0.223])
-    cmd.set_color("color_gln2",[0.176,1,0.176])
-    cmd.set_color("color_asp2",[0.125,1,0.125])
-    cmd.set_color("color_lys2",[0.078,1,0.078])
-    cmd.set_color("color_arg2",[0.031,1,0.031])   
-    cmd.color("color_ile2","("+s+" and resn ile)")
-    cmd.color("color_phe2","("+s+" and resn phe)")
-    cmd.color("color_val2","("+s+" and resn val)")
-    cmd.color("color_leu2","("+s+" and resn leu)")
-    cmd.color("color_trp2","("+s+" and resn trp)")
-    cmd.color("color_met2","("+s+" and resn met)")
-    cmd.color("color_ala2","("+s+" and resn ala)")
-    cmd.color("color_gly2","("+s+" and resn gly)")
-    cmd.color("color_cys2","("+s+" and resn cys)")
-    cmd.color("color_tyr2","("+s+" and resn tyr)")
-    cmd.color("color_pro2","("+s+" and resn pro)")
-    cmd.color("color_thr2","("+s+" and resn thr)")
-    cmd.color("color_ser2","("+s+" and resn ser)")
-    cmd.color("color_his2","("+s+" and resn his)")
-    cmd.color("color_glu2","("+s+" and resn glu)")
-    cmd.color("color_asn2","("+s+" and resn asn)")
-    cmd.color("color_gln2","("+s+" and resn gln)")
-    cmd.color("color_asp2","("+s+" and resn asp)")
-    cmd.color("color_lys2","("+s+" and resn lys)")
-    cmd.color("color_arg2","("+s+" and resn arg)")
+    _color_by_residue(selection, 'eisenberg2')
 
 cmd.extend('colorh2',colorh2)
     '''
 
-    s = str(selection)
-    print(s)
-    cmd.set_color("color_ile2",[0.938,1,0.938])
-    cmd.set_color("color_phe2",[0.891,1,0.891])
-    cmd.set_color("color_val2",[0.844,1,0.844])
-    cmd.set_color("color_leu2",[0.793,1,0.793])
-    cmd.set_color("color_trp2",[0.746,1,0.746])
-    cmd.set_color("color_met2",[0.699,1,0.699])
-    cmd.set_color("color_ala2",[0.652,1,0.652])
-    cmd.set_color("color_gly2",[0.606,1,0.606])
-    cmd.set_color("color_cys2",[0.555,1,0.555])
-    cmd.set_color("color_tyr2",[0.508,1,0.508])
-    cmd.set_color("color_pro2",[0.461,1,0.461])
-    cmd.set_color("color_thr2",[0.414,1,0.414])
-    cmd.set_color("color_ser2",[0.363,1,0.363])
-    cmd.set_color("color_his2",[0.316,1,0.316])
-    cmd.set_color("color_glu2",[0.27,1,0.27])
-    cmd.set_color("color_asn2",[0.223,1,0.223])
-    cmd.set_color("color_gln2",[0.176,1,0.176])
-    cmd.set_color("color_asp2",[0.125,1,0.125])
-    cmd.set_color("color_lys2",[0.078,1,0.078])
-    cmd.set_color("color_arg2",[0.031,1,0.031])   
-    cmd.color("color_ile2","("+s+" and resn ile)")
-    cmd.color("color_phe2","("+s+" and resn phe)")
-    cmd.color("color_val2","("+s+" and resn val)")
-    cmd.color("color_leu2","("+s+" and resn leu)")
-    cmd.color("color_trp2","("+s+" and resn trp)")
-    cmd.color("color_met2","("+s+" and resn met)")
-    cmd.color("color_ala2","("+s+" and resn ala)")
-    cmd.color("color_gly2","("+s+" and resn gly)")
-    cmd.color("color_cys2","("+s+" and resn cys)")
-    cmd.color("color_tyr2","("+s+" and resn tyr)")
-    cmd.color("color_pro2","("+s+" and resn pro)")
-    cmd.color("color_thr2","("+s+" and resn thr)")
-    cmd.color("color_ser2","("+s+" and resn ser)")
-    cmd.color("color_his2","("+s+" and resn his)")
-    cmd.color("color_glu2","("+s+" and resn glu)")
-    cmd.color("color_asn2","("+s+" and resn asn)")
-    cmd.color("color_gln2","("+s+" and resn gln)")
-    cmd.color("color_asp2","("+s+" and resn asp)")
-    cmd.color("color_lys2","("+s+" and resn lys)")
-    cmd.color("color_arg2","("+s+" and resn arg)")
+    _color_by_residue(selection, 'eisenberg2')
 
 cmd.extend('colorh2',colorh2)
 
 
-def coot(fileName="test.pdb"):
+def coot(fileName="", selection=""):
     ''' 
     DESCRIPTION:
     Open coot from within PyMOL. 
@@ -8965,15 +9095,19 @@ def coot(fileName="test.pdb"):
 
 
     USAGE:
-    coot
+    coot [fileName [, selection]]
 
     ARGUMENTS:
-    None
+    fileName = string: coordinate file to open in coot {default: none}
+    selection = string: atoms to hand over to coot {default: none}
     EXAMPLE:
     coot
+    coot selection=sele
 
     MORE DETAILS:
     Open coot from within PyMOL. 
+    PyMOL does not wait for coot; use apps to list or stop the programs started from PyMOL.
+    With a selection, the atoms are saved to a temporary file that coot opens, so no manual save is needed.
 
 
     VERTICAL PML SCRIPT:
@@ -8985,29 +9119,21 @@ def coot(fileName="test.pdb"):
     arg = (cootPath  + fileName);subprocess.call(arg,shell=True);return
 
     PYTHON CODE:
-def coot(fileName="test.pdb"):
-    try:
-        print("Opening the molecular graphics program COOT.");
-        subprocess.check_output(cootOpen)
-        print("Success opening COOT.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'cootOpen'. \n  Or use 'cootPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+def coot(fileName="", selection=""):
+    arguments = [fileName] if fileName else []
+    if selection:
+        arguments.append(_handoff_selection(selection, 'coot'))
+    print("Opening the molecular graphics program COOT.")
+    _launch_app('coot', cootOpen, arguments)
 
 cmd.extend('coot',coot)
     '''
 
-    try:
-        print("Opening the molecular graphics program COOT.");
-        subprocess.check_output(cootOpen)
-        print("Success opening COOT.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'cootOpen'. \n  Or use 'cootPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    arguments = [fileName] if fileName else []
+    if selection:
+        arguments.append(_handoff_selection(selection, 'coot'))
+    print("Opening the molecular graphics program COOT.")
+    _launch_app('coot', cootOpen, arguments)
 
 cmd.extend('coot',coot)
 
@@ -9038,28 +9164,14 @@ return
 
     PYTHON CODE:
 def cranR():
-    try:
-        print("Opening the Cran R.");
-        subprocess.check_output(ROpen)
-        print("Success opening R.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'RlOpen'. \n  Or use 'RPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the Cran R.")
+    _launch_app('cranR', ROpen)
 
 cmd.extend('cranR',cranR)
     '''
 
-    try:
-        print("Opening the Cran R.");
-        subprocess.check_output(ROpen)
-        print("Success opening R.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'RlOpen'. \n  Or use 'RPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the Cran R.")
+    _launch_app('cranR', ROpen)
 
 cmd.extend('cranR',cranR)
 
@@ -9090,28 +9202,14 @@ def ddb():
     arg = dbbrowserPath;subprocess.call(arg,shell=True);return
     PYTHON CODE:
 def ddb():
-    try:
-        print("Opening the DBBrowserSQLite.");
-        subprocess.check_output(DBBrowserSQLiteOpen)
-        print("Success opening DBBrowserSQLite.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'excelOpen'. \n  Or use 'excelPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the DBBrowserSQLite.")
+    _launch_app('ddb', DBBrowserSQLiteOpen)
 
 cmd.extend('ddb',ddb)
     '''
 
-    try:
-        print("Opening the DBBrowserSQLite.");
-        subprocess.check_output(DBBrowserSQLiteOpen)
-        print("Success opening DBBrowserSQLite.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'excelOpen'. \n  Or use 'excelPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the DBBrowserSQLite.")
+    _launch_app('ddb', DBBrowserSQLiteOpen)
 
 cmd.extend('ddb',ddb)
 
@@ -9141,28 +9239,14 @@ def emacs(fileName="test.pml"):
     subprocess.call(emacsOpen);return
     PYTHON CODE:
 def emacs(fileName="test.pml"):
-    try:
-        print("Opening the text editor emacs.");
-        subprocess.check_output(emacsOpen)
-        print("Success opening emacs.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the emacsOpen'. \n  Or use 'emacsPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor emacs.")
+    _launch_app('emacs', emacsOpen)
 
 cmd.extend('emacs',emacs)
     '''
 
-    try:
-        print("Opening the text editor emacs.");
-        subprocess.check_output(emacsOpen)
-        print("Success opening emacs.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the emacsOpen'. \n  Or use 'emacsPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor emacs.")
+    _launch_app('emacs', emacsOpen)
 
 cmd.extend('emacs',emacs)
 
@@ -9194,32 +9278,461 @@ def excel():
 
     PYTHON CODE:
 def excel():
-    try:
-        print("Opening the Microsoft Excel.");
-        subprocess.check_output(excelOpen)
-        print("Success opening Excel.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'excelOpen'. \n  Or use 'excelPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the Microsoft Excel.")
+    _launch_app('excel', excelOpen)
 
 cmd.extend('excel',excel)
     '''
 
-    try:
-        print("Opening the Microsoft Excel.");
-        subprocess.check_output(excelOpen)
-        print("Success opening Excel.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'excelOpen'. \n  Or use 'excelPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the Microsoft Excel.")
+    _launch_app('excel', excelOpen)
 
 cmd.extend('excel',excel)
 
 
+# One-letter codes of standard and modified residues of proteins and nucleic acids for findSeq.
+# Codes longer than one letter (chromophores) are indexed as X.
+_oneLetter = {
+    '00C': 'C', '01W': 'X', '0A0': 'D', '0A1': 'Y', '0A2': 'K', '0A8': 'C',
+    '0AA': 'V', '0AB': 'V', '0AC': 'G', '0AD': 'G', '0AF': 'W', '0AG': 'L',
+    '0AH': 'S', '0AK': 'D', '0AM': 'A', '0AP': 'C', '0AU': 'U', '0AV': 'A',
+    '0AZ': 'P', '0BN': 'F', '0C': 'C', '0CS': 'A', '0DC': 'C', '0DG': 'G',
+    '0DT': 'T', '0G': 'G', '0NC': 'A', '0SP': 'A', '0U': 'U', '0YG': 'YG',
+    '10C': 'C', '125': 'U', '126': 'U', '127': 'U', '128': 'N', '12A': 'A',
+    '143': 'C', '175': 'ASG', '193': 'X', '1AP': 'A', '1MA': 'A', '1MG': 'G',
+    '1PA': 'F', '1PI': 'A', '1PR': 'N', '1SC': 'C', '1TQ': 'W', '1TY': 'Y',
+    '200': 'F', '23F': 'F', '23S': 'X', '26B': 'T', '2AD': 'X', '2AG': 'G',
+    '2AO': 'X', '2AR': 'A', '2AS': 'X', '2AT': 'T', '2AU': 'U', '2BD': 'I',
+    '2BT': 'T', '2BU': 'A', '2CO': 'C', '2DA': 'A', '2DF': 'N', '2DM': 'N',
+    '2DO': 'X', '2DT': 'T', '2EG': 'G', '2FE': 'N', '2FI': 'N', '2FM': 'M',
+    '2GT': 'T', '2HF': 'H', '2LU': 'L', '2MA': 'A', '2MG': 'G', '2ML': 'L',
+    '2MR': 'R', '2MT': 'P', '2MU': 'U', '2NT': 'T', '2OM': 'U', '2OT': 'T',
+    '2PI': 'X', '2PR': 'G', '2SA': 'N', '2SI': 'X', '2ST': 'T', '2TL': 'T',
+    '2TY': 'Y', '2VA': 'V', '32S': 'X', '32T': 'X', '3AH': 'H', '3AR': 'X',
+    '3CF': 'F', '3DA': 'A', '3DR': 'N', '3GA': 'A', '3MD': 'D', '3ME': 'U',
+    '3NF': 'Y', '3TY': 'X', '3XH': 'G', '4AC': 'N', '4BF': 'Y', '4CF': 'F',
+    '4CY': 'M', '4DP': 'W', '4F3': 'GYG', '4FB': 'P', '4FW': 'W', '4HT': 'W',
+    '4IN': 'X', '4MF': 'N', '4MM': 'X', '4OC': 'C', '4PC': 'C', '4PD': 'C',
+    '4PE': 'C', '4PH': 'F', '4SC': 'C', '4SU': 'U', '4TA': 'N', '5AA': 'A',
+    '5AT': 'T', '5BU': 'U', '5CG': 'G', '5CM': 'C', '5CS': 'C', '5FA': 'A',
+    '5FC': 'C', '5FU': 'U', '5HP': 'E', '5HT': 'T', '5HU': 'U', '5IC': 'C',
+    '5IT': 'T', '5IU': 'U', '5MC': 'C', '5MD': 'N', '5MU': 'U', '5NC': 'C',
+    '5PC': 'C', '5PY': 'T', '5SE': 'U', '5ZA': 'TWG', '64T': 'T', '6CL': 'K',
+    '6CT': 'T', '6CW': 'W', '6HA': 'A', '6HC': 'C', '6HG': 'G', '6HN': 'K',
+    '6HT': 'T', '6IA': 'A', '6MA': 'A', '6MC': 'A', '6MI': 'N', '6MT': 'A',
+    '6MZ': 'N', '6OG': 'G', '70U': 'U', '7DA': 'A', '7GU': 'G', '7JA': 'I',
+    '7MG': 'G', '8AN': 'A', '8FG': 'G', '8MG': 'G', '8OG': 'G', '9NE': 'E',
+    '9NF': 'F', '9NR': 'R', '9NV': 'V', 'A': 'A', 'A1P': 'N', 'A23': 'A',
+    'A2L': 'A', 'A2M': 'A', 'A34': 'A', 'A35': 'A', 'A38': 'A', 'A39': 'A',
+    'A3A': 'A', 'A3P': 'A', 'A40': 'A', 'A43': 'A', 'A44': 'A', 'A47': 'A',
+    'A5L': 'A', 'A5M': 'C', 'A5O': 'A', 'A66': 'X', 'AA3': 'A', 'AA4': 'A',
+    'AAR': 'R', 'AB7': 'X', 'ABA': 'A', 'ABR': 'A', 'ABS': 'A', 'ABT': 'N',
+    'ACB': 'D', 'ACL': 'R', 'AD2': 'A', 'ADD': 'X', 'ADX': 'N', 'AEA': 'X',
+    'AEI': 'D', 'AET': 'A', 'AFA': 'N', 'AFF': 'N', 'AFG': 'G', 'AGM': 'R',
+    'AGT': 'X', 'AHB': 'N', 'AHH': 'X', 'AHO': 'A', 'AHP': 'A', 'AHS': 'X',
+    'AHT': 'X', 'AIB': 'A', 'AKL': 'D', 'ALA': 'A', 'ALC': 'A', 'ALG': 'R',
+    'ALM': 'A', 'ALN': 'A', 'ALO': 'T', 'ALQ': 'X', 'ALS': 'A', 'ALT': 'A',
+    'ALY': 'K', 'AP7': 'A', 'APE': 'X', 'APH': 'A', 'API': 'K', 'APK': 'K',
+    'APM': 'X', 'APP': 'X', 'AR2': 'R', 'AR4': 'E', 'ARG': 'R', 'ARM': 'R',
+    'ARO': 'R', 'ARV': 'X', 'AS': 'A', 'AS2': 'D', 'AS9': 'X', 'ASA': 'D',
+    'ASB': 'D', 'ASI': 'D', 'ASK': 'D', 'ASL': 'D', 'ASM': 'X', 'ASN': 'N',
+    'ASP': 'D', 'ASQ': 'D', 'ASU': 'N', 'ASX': 'B', 'ATD': 'T', 'ATL': 'T',
+    'ATM': 'T', 'AVC': 'A', 'AVN': 'X', 'AYA': 'A', 'AYG': 'AYG', 'AZK': 'K',
+    'AZS': 'S', 'AZY': 'Y', 'B1F': 'F', 'B1P': 'N', 'B2A': 'A', 'B2F': 'F',
+    'B2I': 'I', 'B2V': 'V', 'B3A': 'A', 'B3D': 'D', 'B3E': 'E', 'B3K': 'K',
+    'B3L': 'X', 'B3M': 'X', 'B3Q': 'X', 'B3S': 'S', 'B3T': 'X', 'B3U': 'H',
+    'B3X': 'N', 'B3Y': 'Y', 'BB6': 'C', 'BB7': 'C', 'BB9': 'C', 'BBC': 'C',
+    'BCS': 'C', 'BCX': 'C', 'BE2': 'X', 'BFD': 'D', 'BG1': 'S', 'BGM': 'G',
+    'BHD': 'D', 'BIF': 'F', 'BIL': 'X', 'BIU': 'I', 'BJH': 'X', 'BLE': 'L',
+    'BLY': 'K', 'BMP': 'N', 'BMT': 'T', 'BNN': 'A', 'BNO': 'X', 'BOE': 'T',
+    'BOR': 'R', 'BPE': 'C', 'BRU': 'U', 'BSE': 'S', 'BT5': 'N', 'BTA': 'L',
+    'BTC': 'C', 'BTR': 'W', 'BUC': 'C', 'BUG': 'V', 'BVP': 'U', 'BZG': 'N',
+    'C': 'C', 'C12': 'TYG', 'C1X': 'K', 'C25': 'C', 'C2L': 'C', 'C2S': 'C',
+    'C31': 'C', 'C32': 'C', 'C34': 'C', 'C36': 'C', 'C37': 'C', 'C38': 'C',
+    'C3Y': 'C', 'C42': 'C', 'C43': 'C', 'C45': 'C', 'C46': 'C', 'C49': 'C',
+    'C4R': 'C', 'C4S': 'C', 'C5C': 'C', 'C66': 'X', 'C6C': 'C', 'C99': 'TFG',
+    'CAF': 'C', 'CAL': 'X', 'CAR': 'C', 'CAS': 'C', 'CAV': 'X', 'CAY': 'C',
+    'CB2': 'C', 'CBR': 'C', 'CBV': 'C', 'CCC': 'C', 'CCL': 'K', 'CCS': 'C',
+    'CCY': 'CYG', 'CDE': 'X', 'CDV': 'X', 'CDW': 'C', 'CEA': 'C', 'CFL': 'C',
+    'CFY': 'FCYG', 'CG1': 'G', 'CGA': 'E', 'CGU': 'E', 'CH': 'C', 'CH6': 'MYG',
+    'CH7': 'KYG', 'CHF': 'X', 'CHG': 'X', 'CHP': 'G', 'CHS': 'X', 'CIR': 'R',
+    'CJO': 'GYG', 'CLE': 'L', 'CLG': 'K', 'CLH': 'K', 'CLV': 'AFG', 'CM0': 'N',
+    'CME': 'C', 'CMH': 'C', 'CML': 'C', 'CMR': 'C', 'CMT': 'C', 'CNU': 'U',
+    'CP1': 'C', 'CPC': 'X', 'CPI': 'X', 'CQR': 'GYG', 'CR0': 'TLG', 'CR2': 'GYG',
+    'CR5': 'G', 'CR7': 'KYG', 'CR8': 'HYG', 'CRF': 'TWG', 'CRG': 'THG', 'CRK': 'MYG',
+    'CRO': 'GYG', 'CRQ': 'QYG', 'CRU': 'E', 'CRW': 'ASG', 'CRX': 'ASG', 'CS0': 'C',
+    'CS1': 'C', 'CS3': 'C', 'CS4': 'C', 'CS8': 'N', 'CSA': 'C', 'CSB': 'C',
+    'CSD': 'C', 'CSE': 'C', 'CSF': 'C', 'CSH': 'SHG', 'CSI': 'G', 'CSJ': 'C',
+    'CSL': 'C', 'CSO': 'C', 'CSP': 'C', 'CSR': 'C', 'CSS': 'C', 'CSU': 'C',
+    'CSW': 'C', 'CSX': 'C', 'CSY': 'SYG', 'CSZ': 'C', 'CTE': 'W', 'CTG': 'T',
+    'CTH': 'T', 'CUC': 'X', 'CWR': 'S', 'CXM': 'M', 'CY0': 'C', 'CY1': 'C',
+    'CY3': 'C', 'CY4': 'C', 'CYA': 'C', 'CYD': 'C', 'CYF': 'C', 'CYG': 'C',
+    'CYJ': 'X', 'CYM': 'C', 'CYQ': 'C', 'CYR': 'C', 'CYS': 'C', 'CZ2': 'C',
+    'CZO': 'GYG', 'CZZ': 'C', 'D11': 'T', 'D1P': 'N', 'D3': 'N', 'D33': 'N',
+    'D3P': 'G', 'D3T': 'T', 'D4M': 'T', 'D4P': 'X', 'DA': 'A', 'DA2': 'X',
+    'DAB': 'A', 'DAH': 'F', 'DAL': 'A', 'DAR': 'R', 'DAS': 'D', 'DBB': 'T',
+    'DBM': 'N', 'DBS': 'S', 'DBU': 'T', 'DBY': 'Y', 'DBZ': 'A', 'DC': 'C',
+    'DC2': 'C', 'DCG': 'G', 'DCI': 'X', 'DCL': 'X', 'DCT': 'C', 'DCY': 'C',
+    'DDE': 'H', 'DDG': 'G', 'DDN': 'U', 'DDX': 'N', 'DFC': 'C', 'DFG': 'G',
+    'DFI': 'X', 'DFO': 'X', 'DFT': 'N', 'DG': 'G', 'DGH': 'G', 'DGI': 'G',
+    'DGL': 'E', 'DGN': 'Q', 'DHA': 'A', 'DHI': 'H', 'DHL': 'X', 'DHN': 'V',
+    'DHP': 'X', 'DHU': 'U', 'DHV': 'V', 'DI': 'I', 'DIL': 'I', 'DIR': 'R',
+    'DIV': 'V', 'DLE': 'L', 'DLS': 'K', 'DLY': 'K', 'DM0': 'K', 'DMH': 'N',
+    'DMK': 'D', 'DMT': 'X', 'DN': 'N', 'DNE': 'L', 'DNG': 'L', 'DNL': 'K',
+    'DNM': 'L', 'DNP': 'A', 'DNR': 'C', 'DNS': 'K', 'DOA': 'X', 'DOC': 'C',
+    'DOH': 'D', 'DON': 'L', 'DPB': 'T', 'DPH': 'F', 'DPL': 'P', 'DPP': 'A',
+    'DPQ': 'Y', 'DPR': 'P', 'DPY': 'N', 'DRM': 'U', 'DRP': 'N', 'DRT': 'T',
+    'DRZ': 'N', 'DSE': 'S', 'DSG': 'N', 'DSN': 'S', 'DSP': 'D', 'DT': 'T',
+    'DTH': 'T', 'DTR': 'W', 'DTY': 'Y', 'DU': 'U', 'DVA': 'V', 'DXD': 'N',
+    'DXN': 'N', 'DYG': 'DYG', 'DYS': 'C', 'DZM': 'A', 'E': 'A', 'E1X': 'A',
+    'EDA': 'A', 'EDC': 'G', 'EFC': 'C', 'EHP': 'F', 'EIT': 'T', 'ENP': 'N',
+    'ESB': 'Y', 'ESC': 'M', 'EXY': 'L', 'EY5': 'N', 'EYS': 'X', 'F2F': 'F',
+    'FA2': 'A', 'FA5': 'N', 'FAG': 'N', 'FAI': 'N', 'FCL': 'F', 'FFD': 'N',
+    'FGL': 'G', 'FGP': 'S', 'FHL': 'X', 'FHO': 'K', 'FHU': 'U', 'FLA': 'A',
+    'FLE': 'L', 'FLT': 'Y', 'FME': 'M', 'FMG': 'G', 'FMU': 'N', 'FOE': 'C',
+    'FOX': 'G', 'FP9': 'P', 'FPA': 'F', 'FRD': 'X', 'FT6': 'W', 'FTR': 'W',
+    'FTY': 'Y', 'FZN': 'K', 'G': 'G', 'G25': 'G', 'G2L': 'G', 'G2S': 'G',
+    'G31': 'G', 'G32': 'G', 'G33': 'G', 'G36': 'G', 'G38': 'G', 'G42': 'G',
+    'G46': 'G', 'G47': 'G', 'G48': 'G', 'G49': 'G', 'G4P': 'N', 'G7M': 'G',
+    'GAO': 'G', 'GAU': 'E', 'GCK': 'C', 'GCM': 'X', 'GDP': 'G', 'GDR': 'G',
+    'GFL': 'G', 'GGL': 'E', 'GH3': 'G', 'GHG': 'Q', 'GHP': 'G', 'GL3': 'G',
+    'GLH': 'Q', 'GLM': 'X', 'GLN': 'Q', 'GLQ': 'E', 'GLU': 'E', 'GLX': 'Z',
+    'GLY': 'G', 'GLZ': 'G', 'GMA': 'E', 'GMS': 'G', 'GMU': 'U', 'GN7': 'G',
+    'GND': 'X', 'GNE': 'N', 'GOM': 'G', 'GPL': 'K', 'GS': 'G', 'GSC': 'G',
+    'GSR': 'G', 'GSS': 'G', 'GSU': 'E', 'GT9': 'C', 'GTP': 'G', 'GVL': 'X',
+    'GYC': 'CYG', 'GYS': 'SYG', 'H2U': 'U', 'H5M': 'P', 'HAC': 'A', 'HAR': 'R',
+    'HBN': 'H', 'HCS': 'X', 'HDP': 'U', 'HEU': 'U', 'HFA': 'X', 'HGL': 'X',
+    'HHI': 'H', 'HHK': 'AK', 'HIA': 'H', 'HIC': 'H', 'HIP': 'H', 'HIQ': 'H',
+    'HIS': 'H', 'HL2': 'L', 'HLU': 'L', 'HMF': 'A', 'HMR': 'R', 'HOL': 'N',
+    'HPC': 'F', 'HPE': 'F', 'HPQ': 'F', 'HQA': 'A', 'HRG': 'R', 'HRP': 'W',
+    'HS8': 'H', 'HS9': 'H', 'HSE': 'S', 'HSL': 'S', 'HSO': 'H', 'HTI': 'C',
+    'HTN': 'N', 'HTR': 'W', 'HV5': 'A', 'HVA': 'V', 'HY3': 'P', 'HYP': 'P',
+    'HZP': 'P', 'I': 'I', 'I2M': 'I', 'I58': 'K', 'I5C': 'C', 'IAM': 'A',
+    'IAR': 'R', 'IAS': 'D', 'IC': 'C', 'IEL': 'K', 'IEY': 'HYG', 'IG': 'G',
+    'IGL': 'G', 'IGU': 'G', 'IIC': 'SHG', 'IIL': 'I', 'ILE': 'I', 'ILG': 'E',
+    'ILX': 'I', 'IMC': 'C', 'IML': 'I', 'IOY': 'F', 'IPG': 'G', 'IPN': 'N',
+    'IRN': 'N', 'IT1': 'K', 'IU': 'U', 'IYR': 'Y', 'IYT': 'T', 'JJJ': 'C',
+    'JJK': 'C', 'JJL': 'C', 'JW5': 'N', 'K1R': 'C', 'KAG': 'G', 'KCX': 'K',
+    'KGC': 'K', 'KOR': 'M', 'KPI': 'K', 'KST': 'K', 'KYQ': 'K', 'L2A': 'X',
+    'LA2': 'K', 'LAA': 'D', 'LAL': 'A', 'LBY': 'K', 'LC': 'C', 'LCA': 'A',
+    'LCC': 'N', 'LCG': 'G', 'LCH': 'N', 'LCK': 'K', 'LCX': 'K', 'LDH': 'K',
+    'LED': 'L', 'LEF': 'L', 'LEH': 'L', 'LEI': 'V', 'LEM': 'L', 'LEN': 'L',
+    'LET': 'X', 'LEU': 'L', 'LG': 'G', 'LGP': 'G', 'LHC': 'X', 'LHU': 'U',
+    'LKC': 'N', 'LLP': 'K', 'LLY': 'K', 'LME': 'E', 'LMQ': 'Q', 'LMS': 'N',
+    'LP6': 'K', 'LPD': 'P', 'LPG': 'G', 'LPL': 'X', 'LPS': 'S', 'LSO': 'X',
+    'LTA': 'X', 'LTR': 'W', 'LVG': 'G', 'LVN': 'V', 'LYM': 'K', 'LYN': 'K',
+    'LYR': 'K', 'LYS': 'K', 'LYX': 'K', 'LYZ': 'K', 'M0H': 'C', 'M1G': 'G',
+    'M2G': 'G', 'M2L': 'K', 'M2S': 'M', 'M3L': 'K', 'M5M': 'C', 'MA': 'A',
+    'MA6': 'A', 'MA7': 'A', 'MAA': 'A', 'MAD': 'A', 'MAI': 'R', 'MBQ': 'Y',
+    'MBZ': 'N', 'MC1': 'S', 'MCG': 'X', 'MCL': 'K', 'MCS': 'C', 'MCY': 'C',
+    'MDH': 'X', 'MDO': 'ASG', 'MDR': 'N', 'MEA': 'F', 'MED': 'M', 'MEG': 'E',
+    'MEN': 'N', 'MEP': 'U', 'MEQ': 'Q', 'MET': 'M', 'MEU': 'G', 'MF3': 'X',
+    'MFC': 'GYG', 'MG1': 'G', 'MGG': 'R', 'MGN': 'Q', 'MGQ': 'A', 'MGV': 'G',
+    'MGY': 'G', 'MHL': 'L', 'MHO': 'M', 'MHS': 'H', 'MIA': 'A', 'MIS': 'S',
+    'MK8': 'L', 'ML3': 'K', 'MLE': 'L', 'MLL': 'L', 'MLY': 'K', 'MLZ': 'K',
+    'MME': 'M', 'MMT': 'T', 'MND': 'N', 'MNL': 'L', 'MNU': 'U', 'MNV': 'V',
+    'MOD': 'X', 'MP8': 'P', 'MPH': 'X', 'MPJ': 'X', 'MPQ': 'G', 'MRG': 'G',
+    'MSA': 'G', 'MSE': 'M', 'MSL': 'M', 'MSO': 'M', 'MSP': 'X', 'MT2': 'M',
+    'MTR': 'T', 'MTU': 'A', 'MTY': 'Y', 'MVA': 'V', 'N': 'N', 'N10': 'S',
+    'N2C': 'X', 'N5I': 'N', 'N5M': 'C', 'N6G': 'G', 'N7P': 'P', 'NA8': 'A',
+    'NAL': 'A', 'NAM': 'A', 'NB8': 'N', 'NBQ': 'Y', 'NC1': 'S', 'NCB': 'A',
+    'NCX': 'N', 'NCY': 'X', 'NDF': 'F', 'NDN': 'U', 'NEM': 'H', 'NEP': 'H',
+    'NF2': 'N', 'NFA': 'F', 'NHL': 'E', 'NIT': 'X', 'NIY': 'Y', 'NLE': 'L',
+    'NLN': 'L', 'NLO': 'L', 'NLP': 'L', 'NLQ': 'Q', 'NMC': 'G', 'NMM': 'R',
+    'NMS': 'T', 'NMT': 'T', 'NNH': 'R', 'NP3': 'N', 'NPH': 'C', 'NRP': 'LYG',
+    'NRQ': 'MYG', 'NSK': 'X', 'NTY': 'Y', 'NVA': 'V', 'NYC': 'TWG', 'NYG': 'NYG',
+    'NYM': 'N', 'NYS': 'C', 'NZH': 'H', 'O12': 'X', 'O2C': 'N', 'O2G': 'G',
+    'OAD': 'N', 'OAS': 'S', 'OBF': 'X', 'OBS': 'X', 'OCS': 'C', 'OCY': 'C',
+    'ODP': 'N', 'OHI': 'H', 'OHS': 'D', 'OIC': 'X', 'OIP': 'I', 'OLE': 'X',
+    'OLT': 'T', 'OLZ': 'S', 'OMC': 'C', 'OMG': 'G', 'OMT': 'M', 'OMU': 'U',
+    'ONE': 'U', 'ONL': 'X', 'OPR': 'R', 'ORN': 'A', 'ORQ': 'R', 'OSE': 'S',
+    'OTB': 'X', 'OTH': 'T', 'OTY': 'Y', 'OXX': 'D', 'P': 'G', 'P1L': 'C',
+    'P1P': 'N', 'P2T': 'T', 'P2U': 'U', 'P2Y': 'P', 'P5P': 'A', 'PAQ': 'Y',
+    'PAS': 'D', 'PAT': 'W', 'PAU': 'A', 'PBB': 'C', 'PBF': 'F', 'PBT': 'N',
+    'PCA': 'E', 'PCC': 'P', 'PCE': 'X', 'PCS': 'F', 'PDL': 'X', 'PDU': 'U',
+    'PEC': 'C', 'PF5': 'F', 'PFF': 'F', 'PFX': 'X', 'PG1': 'S', 'PG7': 'G',
+    'PG9': 'G', 'PGL': 'X', 'PGN': 'G', 'PGP': 'G', 'PGY': 'G', 'PHA': 'F',
+    'PHD': 'D', 'PHE': 'F', 'PHI': 'F', 'PHL': 'F', 'PHM': 'F', 'PIV': 'X',
+    'PLE': 'L', 'PM3': 'F', 'PMT': 'C', 'POM': 'P', 'PPN': 'F', 'PPU': 'A',
+    'PPW': 'G', 'PQ1': 'N', 'PR3': 'C', 'PR5': 'A', 'PR9': 'P', 'PRN': 'A',
+    'PRO': 'P', 'PRS': 'P', 'PSA': 'F', 'PSH': 'H', 'PST': 'T', 'PSU': 'U',
+    'PSW': 'C', 'PTA': 'X', 'PTH': 'Y', 'PTM': 'Y', 'PTR': 'Y', 'PU': 'A',
+    'PUY': 'N', 'PVH': 'H', 'PVL': 'X', 'PYA': 'A', 'PYO': 'U', 'PYX': 'C',
+    'PYY': 'N', 'QLG': 'QLG', 'QUO': 'G', 'R': 'A', 'R1A': 'C', 'R1B': 'C',
+    'R1F': 'C', 'R7A': 'C', 'RC7': 'HYG', 'RCY': 'C', 'RIA': 'A', 'RMP': 'A',
+    'RON': 'X', 'RT': 'T', 'RTP': 'N', 'S1H': 'S', 'S2C': 'C', 'S2D': 'A',
+    'S2M': 'T', 'S2P': 'A', 'S4A': 'A', 'S4C': 'C', 'S4G': 'G', 'S4U': 'U',
+    'S6G': 'G', 'SAC': 'S', 'SAH': 'C', 'SAR': 'G', 'SBL': 'S', 'SC': 'C',
+    'SCH': 'C', 'SCS': 'C', 'SCY': 'C', 'SD2': 'X', 'SDG': 'G', 'SDP': 'S',
+    'SEB': 'S', 'SEC': 'A', 'SEG': 'A', 'SEL': 'S', 'SEM': 'X', 'SEN': 'S',
+    'SEP': 'S', 'SER': 'S', 'SET': 'S', 'SGB': 'S', 'SHC': 'C', 'SHP': 'G',
+    'SHR': 'K', 'SIB': 'C', 'SIC': 'DC', 'SLA': 'P', 'SLR': 'P', 'SLZ': 'K',
+    'SMC': 'C', 'SME': 'M', 'SMF': 'F', 'SMP': 'A', 'SMT': 'T', 'SNC': 'C',
+    'SNN': 'N', 'SOC': 'C', 'SOS': 'N', 'SOY': 'S', 'SPT': 'T', 'SRA': 'A',
+    'SSU': 'U', 'STY': 'Y', 'SUB': 'X', 'SUI': 'DG', 'SUN': 'S', 'SUR': 'U',
+    'SVA': 'S', 'SVX': 'S', 'SVZ': 'X', 'SYS': 'C', 'T': 'T', 'T11': 'F',
+    'T23': 'T', 'T2S': 'T', 'T2T': 'N', 'T31': 'U', 'T32': 'T', 'T36': 'T',
+    'T37': 'T', 'T38': 'T', 'T39': 'T', 'T3P': 'T', 'T41': 'T', 'T48': 'T',
+    'T49': 'T', 'T4S': 'T', 'T5O': 'U', 'T5S': 'T', 'T66': 'X', 'T6A': 'A',
+    'TA3': 'T', 'TA4': 'X', 'TAF': 'T', 'TAL': 'N', 'TAV': 'D', 'TBG': 'V',
+    'TBM': 'T', 'TC1': 'C', 'TCP': 'T', 'TCQ': 'X', 'TCR': 'W', 'TCY': 'A',
+    'TDD': 'L', 'TDY': 'T', 'TFE': 'T', 'TFO': 'A', 'TFQ': 'F', 'TFT': 'T',
+    'TGP': 'G', 'TH6': 'T', 'THC': 'T', 'THO': 'X', 'THR': 'T', 'THX': 'N',
+    'THZ': 'R', 'TIH': 'A', 'TLB': 'N', 'TLC': 'T', 'TLN': 'U', 'TMB': 'T',
+    'TMD': 'T', 'TNB': 'C', 'TNR': 'S', 'TOX': 'W', 'TP1': 'T', 'TPC': 'C',
+    'TPG': 'G', 'TPH': 'X', 'TPL': 'W', 'TPO': 'T', 'TPQ': 'Y', 'TQQ': 'W',
+    'TRF': 'W', 'TRG': 'K', 'TRN': 'W', 'TRO': 'W', 'TRP': 'W', 'TRQ': 'W',
+    'TRW': 'W', 'TRX': 'W', 'TS': 'N', 'TST': 'X', 'TT': 'N', 'TTD': 'T',
+    'TTI': 'U', 'TTM': 'T', 'TTQ': 'W', 'TTS': 'Y', 'TY2': 'Y', 'TY3': 'Y',
+    'TYB': 'Y', 'TYI': 'Y', 'TYN': 'Y', 'TYO': 'Y', 'TYQ': 'Y', 'TYR': 'Y',
+    'TYS': 'Y', 'TYT': 'Y', 'TYU': 'N', 'TYX': 'X', 'TYY': 'Y', 'TZB': 'X',
+    'TZO': 'X', 'U': 'U', 'U25': 'U', 'U2L': 'U', 'U2N': 'U', 'U2P': 'U',
+    'U31': 'U', 'U33': 'U', 'U34': 'U', 'U36': 'U', 'U37': 'U', 'U8U': 'U',
+    'UAR': 'U', 'UCL': 'U', 'UD5': 'U', 'UDP': 'N', 'UFP': 'N', 'UFR': 'U',
+    'UFT': 'U', 'UMA': 'A', 'UMP': 'U', 'UMS': 'U', 'UN1': 'X', 'UN2': 'X',
+    'UNK': 'X', 'UR3': 'U', 'URD': 'U', 'US1': 'U', 'US2': 'U', 'US3': 'T',
+    'US5': 'U', 'USM': 'U', 'V1A': 'C', 'VAD': 'V', 'VAF': 'V', 'VAL': 'V',
+    'VB1': 'K', 'VDL': 'X', 'VLL': 'X', 'VLM': 'X', 'VMS': 'X', 'VOL': 'X',
+    'X': 'G', 'X2W': 'E', 'X4A': 'N', 'X9Q': 'AFG', 'XAD': 'A', 'XAE': 'N',
+    'XAL': 'A', 'XAR': 'N', 'XCL': 'C', 'XCP': 'X', 'XCR': 'C', 'XCS': 'N',
+    'XCT': 'C', 'XCY': 'C', 'XGA': 'N', 'XGL': 'G', 'XGR': 'G', 'XGU': 'G',
+    'XTH': 'T', 'XTL': 'T', 'XTR': 'T', 'XTS': 'G', 'XTY': 'N', 'XUA': 'A',
+    'XUG': 'G', 'XX1': 'K', 'XXY': 'THG', 'XYG': 'DYG', 'Y': 'A', 'YCM': 'C',
+    'YG': 'G', 'YOF': 'Y', 'YRR': 'N', 'YYG': 'G', 'Z': 'C', 'ZAD': 'A',
+    'ZAL': 'A', 'ZBC': 'C', 'ZCY': 'C', 'ZDU': 'U', 'ZFB': 'X', 'ZGU': 'G',
+    'ZHP': 'N', 'ZTH': 'T', 'ZZJ': 'A',
+    }
+
+# IUPAC ambiguity codes of nucleotides for findSeq with iupac=1. T and U match each other.
+_iupacCodes = {'R': 'AG', 'Y': 'CTU', 'S': 'CG', 'W': 'ATU', 'K': 'GTU', 'M': 'AC', 'B': 'CGTU',
+    'D': 'AGTU', 'H': 'ACTU', 'V': 'ACG', 'N': 'ACGTU', 'T': 'TU', 'U': 'TU'}
+
+# Sequence index of each object: object name -> (signature, {chain: {het: (sequence, resi list)}}).
+_sequenceIndex = {}
+
+
+def _sequence_index(obj):
+    '''
+    Return the sequences of the chains of an object, indexed once and cached.
+
+    Each residue is found by its CA atom (protein) or its C4' or P atom
+    (nucleotides) in one cmd.iterate pass and converted to one letter with
+    _oneLetter. Residues that are not in the table, such as water and ions,
+    are skipped. The index is rebuilt when the number of atoms, the chains,
+    or the sequence from cmd.get_fastastr of the object change (e.g., after
+    alter resn); clear _sequenceIndex after renumbering residues. The check
+    is not free: every call runs cmd.get_fastastr over the whole object and
+    hashes the result, which is cheaper than rebuilding the index but still
+    scales with the size of the object.
+    '''
+    signature = (cmd.count_atoms(obj), tuple(cmd.get_chains(obj)),
+        hashlib.sha1(cmd.get_fastastr(obj).encode()).hexdigest())
+    cached = _sequenceIndex.get(obj)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    rows = []
+    cmd.iterate("(%s) and name CA+C4'+C4*+P" % obj, "rows.append((chain, resi, resn, type == 'HETATM'))",
+        space={'rows': rows})
+    chains, seen = {}, set()
+    for chain, resi, resn, hetatm in rows:
+        if (chain, resi) in seen or resn.upper() not in _oneLetter:
+            continue
+        seen.add((chain, resi))
+        letter = _oneLetter[resn.upper()]
+        letter = letter if len(letter) == 1 else 'X'
+        residues = chains.setdefault(chain, {True: ([], []), False: ([], [])})
+        residues[True][0].append(letter)
+        residues[True][1].append(resi)
+        if not hetatm:
+            residues[False][0].append(letter)
+            residues[False][1].append(resi)
+
+    chains = dict((chain, dict((het, (''.join(letters), resis)) for het, (letters, resis) in residues.items()))
+        for chain, residues in chains.items())
+    _sequenceIndex[obj] = (signature, chains)
+    return chains
+
+
+def _needle_pattern(needle, iupac=False):
+    '''
+    Return the regular expression of a findSeq needle. The residue letters
+    are upper-cased and, with iupac, their ambiguity codes are expanded. 
+    Escapes (\\w, \\S, ...), quantifiers ({2,3}), and group syntax ((?P<name>,
+    (?:, ...) are kept as they are.
+    '''
+    pattern, inClass, k = [], False, 0
+    while k < len(needle):
+        char = needle[k]
+        token = None
+        if char == '\\':
+            token = needle[k:k + 2]
+        elif inClass:
+            if char == ']':
+                inClass = False
+        elif char == '[':
+            inClass = True
+            # A leading ^ or ] belongs to the syntax of the class.
+            token = re.match(r'\[\^?\]?', needle[k:]).group()
+        elif char == '{':
+            token = re.match(r'\{\d*(,\d*)?\}', needle[k:])
+            token = token and token.group()
+        elif needle.startswith('(?', k):
+            token = re.match(r'\(\?(P<\w+>|P=\w+\)|<\w+>|<[=!]|[:=!>|]|[aiLmsux-]+[:)]|#[^)]*\))', needle[k:])
+            token = token and token.group()
+        if token:
+            pattern.append(token)
+            k += len(token)
+            continue
+        if char.isalpha():
+            char = char.upper()
+            if iupac and char in _iupacCodes:
+                char = _iupacCodes[char] if inClass else '[%s]' % _iupacCodes[char]
+        pattern.append(char)
+        k += 1
+    return ''.join(pattern)
+
+
+def findSeq(needle, haystack='all', selName=None, het=0, firstOnly=0, iupac=0):
+    ''' 
+    DESCRIPTION:
+    Select the residues that match a sequence or regular expression in proteins and nucleic acids.
+
+    USAGE:
+    findSeq needle, [haystack, [selName, [het, [firstOnly, [iupac]]]]]
+
+    ARGUMENTS:
+    needle = string: sequence in one-letter codes or a regular expression
+    haystack = string: object or selection to search {default: all}
+    selName = string: name of the new selection {default: foundSeq<random number>}
+    het = 0 or 1: include residues in HETATM records such as modified nucleotides {default: 0}
+    firstOnly = 0 or 1: select only the first match {default: 0}
+    iupac = 0 or 1: read the IUPAC ambiguity codes of nucleotides (R, Y, N, ...) {default: 0}
+
+    EXAMPLE:
+    findSeq GGAC, 3nd4
+    findSeq GNRA, 1ffk, tetraloops, 0, 0, 1
+    findSeq GMS.*QWY, 1a3h, sele
+
+    MORE DETAILS:
+    Returns the name of the selection. If selName is "sele", the usual 
+    PyMOL (sele) is used.
+
+    The residues of each chain are indexed once per object by their CA atom
+    (protein) or their C4' or P atom (nucleotides). Modified residues are
+    converted with the table of one-letter codes in _oneLetter (e.g., PSU to U,
+    5MC to C). The index is cached and rebuilt only when the atom count, the
+    chains, or the sequence (cmd.get_fastastr) of the object change, so 
+    repeated searches are fast. Matches do not span chains. All matched residues are selected at once with a few 
+    cmd.select calls.
+
+    With iupac=1, T and U match each other. Do not use iupac=1 for protein 
+    sequences because several IUPAC codes are also amino acids.
+
+    Based on findseq by Jason Vertrees (https://pymolwiki.org/index.php/Findseq).
+    License:  GNU Free Documentation License 1.2
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def findSeq(needle, haystack='all', selName=None, het=0, firstOnly=0, iupac=0):
+    # set the name of the selection to return.
+    if selName == None:
+        rSelName = "foundSeq" + str(random.randint(0, 32000))
+        selName = rSelName
+    elif selName == "sele":
+        rSelName = "sele"
+    else:
+        rSelName = selName
+
+    # input checking
+    if not checkParams(needle, haystack, selName, het, firstOnly):
+        print("There was an error with a parameter.  Please see")
+        print("the above error message for how to fix it.")
+        return None
+
+    het, firstOnly = bool(int(het)), bool(int(firstOnly))
+    reNeedle = re.compile(_needle_pattern(needle, int(iupac)))
+
+    # Residues of the haystack when it is a selection rather than whole objects.
+    objects = cmd.get_object_list('(%s)' % haystack)
+    inHaystack = None
+    if haystack != 'all' and sorted(objects) != sorted(haystack.replace('+', ' ').split()):
+        inHaystack = set()
+        cmd.iterate('(%s)' % haystack, 'inHaystack.add((model, chain, resi))', space={'inHaystack': inHaystack})
+
+    found = []
+    for obj in objects:
+        for chain, residues in sorted(_sequence_index(obj).items()):
+            sequence, resis = residues[het]
+            for match in reNeedle.finditer(sequence):
+                residueRange = [(obj, chain, resi) for resi in resis[match.start():match.end()]]
+                if inHaystack is not None and not all(residue in inHaystack for residue in residueRange):
+                    continue
+                found.extend(residueRange)
+                if firstOnly:
+                    break
+            if firstOnly and found:
+                break
+        if firstOnly and found:
+            break
+
+    _select_residues(rSelName, found)
+    return rSelName
+
+cmd.extend('findSeq', findSeq)
+    '''
+
+    # set the name of the selection to return.
+    if selName == None:
+        rSelName = "foundSeq" + str(random.randint(0, 32000))
+        selName = rSelName
+    elif selName == "sele":
+        rSelName = "sele"
+    else:
+        rSelName = selName
+
+    # input checking
+    if not checkParams(needle, haystack, selName, het, firstOnly):
+        print("There was an error with a parameter.  Please see")
+        print("the above error message for how to fix it.")
+        return None
+
+    het, firstOnly = bool(int(het)), bool(int(firstOnly))
+    reNeedle = re.compile(_needle_pattern(needle, int(iupac)))
+
+    # Residues of the haystack when it is a selection rather than whole objects.
+    objects = cmd.get_object_list('(%s)' % haystack)
+    inHaystack = None
+    if haystack != 'all' and sorted(objects) != sorted(haystack.replace('+', ' ').split()):
+        inHaystack = set()
+        cmd.iterate('(%s)' % haystack, 'inHaystack.add((model, chain, resi))', space={'inHaystack': inHaystack})
+
+    found = []
+    for obj in objects:
+        for chain, residues in sorted(_sequence_index(obj).items()):
+            sequence, resis = residues[het]
+            for match in reNeedle.finditer(sequence):
+                residueRange = [(obj, chain, resi) for resi in resis[match.start():match.end()]]
+                if inHaystack is not None and not all(residue in inHaystack for residue in residueRange):
+                    continue
+                found.extend(residueRange)
+                if firstOnly:
+                    break
+            if firstOnly and found:
+                break
+        if firstOnly and found:
+            break
+
+    _select_residues(rSelName, found)
+    return rSelName
+
+cmd.extend('findSeq', findSeq)
+
+
 def gcal():
     ''' 
     DESCRIPTION:
@@ -9297,28 +9810,14 @@ def gedit():
 
     PYTHON CODE:
 def gedit():
-    try:
-        print("Opening the molecular graphics program gedit.");
-        subprocess.check_output(geditOpen)
-        print("Success opening gedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the geditOpen'. \n  Or use 'geditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program gedit.")
+    _launch_app('gedit', geditOpen)
 
 cmd.extend('gedit',gedit)
     '''
 
-    try:
-        print("Opening the molecular graphics program gedit.");
-        subprocess.check_output(geditOpen)
-        print("Success opening gedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the geditOpen'. \n  Or use 'geditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program gedit.")
+    _launch_app('gedit', geditOpen)
 
 cmd.extend('gedit',gedit)
 
@@ -9351,28 +9850,14 @@ def gimp():
 
     PYTHON CODE:
 def gimp():
-    try:
-        print("Opening the gimp.");
-        subprocess.check_output(gimpOpen)
-        print("Success opening gimp.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'gimpOpen'. \n  Or use 'gimpPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the gimp.")
+    _launch_app('gimp', gimpOpen)
 
 cmd.extend('gimp',gimp)
     '''
 
-    try:
-        print("Opening the gimp.");
-        subprocess.check_output(gimpOpen)
-        print("Success opening gimp.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'gimpOpen'. \n  Or use 'gimpPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the gimp.")
+    _launch_app('gimp', gimpOpen)
 
 cmd.extend('gimp',gimp)
 
@@ -9706,6 +10191,8 @@ def gscale(selection="all"):
 
     where Y is the grayscale. 
     Wrote out the colors and elements as pml and python commands. 
+    The Python code keeps them in the table _elementGrays and colors 
+    only the atoms in the selection in one pass.
     VERTICAL PML SCRIPT:
     color grey64, (elem Ac)
 color grey67, (elem Al)
@@ -9824,278 +10311,377 @@ color grey81, (elem Zr)
 
     PYTHON CODE:
 def gscale(selection="all"):
-    cmd.color('grey64', 'elem Ac')
-    cmd.color('grey67', 'elem Al')
-    cmd.color('grey39', 'elem Am')
-    cmd.color('grey46', 'elem Sb')
-    cmd.color('grey75', 'elem Ar')
-    cmd.color('grey58', 'elem As')
-    cmd.color('grey33', 'elem At')
-    cmd.color('grey56', 'elem Ba')
-    cmd.color('grey40', 'elem Bk')
-    cmd.color('grey87', 'elem Be')
-    cmd.color('grey40', 'elem Bi')
-    cmd.color('grey20', 'elem Bh')
-    cmd.color('grey77', 'elem B')
-    cmd.color('grey26', 'elem Br')
-    cmd.color('grey86', 'elem Cd')
-    cmd.color('grey76', 'elem Ca')
-    cmd.color('grey34', 'elem Cf')
-    cmd.color('grey77', 'elem C')
-    cmd.color('grey98', 'elem Ce')
-    cmd.color('grey17', 'elem Cs')
-    cmd.color('grey70', 'elem Cl')
-    cmd.color('grey60', 'elem Cr')
-    cmd.color('grey64', 'elem Co')
-    cmd.color('grey54', 'elem Cu')
-    cmd.color('grey42', 'elem Cm')
-    cmd.color('grey89', 'elem D')
-    cmd.color('grey19', 'elem Db')
-    cmd.color('grey79', 'elem Dy')
-    cmd.color('grey29', 'elem Es')
-    cmd.color('grey67', 'elem Er')
-    cmd.color('grey85', 'elem Eu')
-    cmd.color('grey28', 'elem Fm')
-    cmd.color('grey93', 'elem F')
-    cmd.color('grey8', 'elem Fr')
-    cmd.color('grey82', 'elem Gd')
-    cmd.color('grey60', 'elem Ga')
-    cmd.color('grey52', 'elem Ge')
-    cmd.color('grey80', 'elem Au')
-    cmd.color('grey68', 'elem Hf')
-    cmd.color('grey20', 'elem Hs')
-    cmd.color('grey96', 'elem He')
-    cmd.color('grey75', 'elem Ho')
-    cmd.color('grey89', 'elem H')
-    cmd.color('grey49', 'elem In')
-    cmd.color('grey16', 'elem I')
-    cmd.color('grey29', 'elem Ir')
-    cmd.color('grey48', 'elem Fe')
-    cmd.color('grey65', 'elem Kr')
-    cmd.color('grey76', 'elem La')
-    cmd.color('grey19', 'elem Lr')
-    cmd.color('grey34', 'elem Pb')
-    cmd.color('grey60', 'elem Li')
-    cmd.color('grey48', 'elem Lu')
-    cmd.color('grey83', 'elem Mg')
-    cmd.color('grey52', 'elem Mn')
-    cmd.color('grey20', 'elem Mt')
-    cmd.color('grey23', 'elem Md')
-    cmd.color('grey72', 'elem Hg')
-    cmd.color('grey62', 'elem Mo')
-    cmd.color('grey93', 'elem Nd')
-    cmd.color('grey85', 'elem Ne')
-    cmd.color('grey43', 'elem Np')
-    cmd.color('grey67', 'elem Ni')
-    cmd.color('grey69', 'elem Nb')
-    cmd.color('grey25', 'elem N')
-    cmd.color('grey23', 'elem No')
-    cmd.color('grey36', 'elem Os')
-    cmd.color('grey44', 'elem O')
-    cmd.color('grey33', 'elem Pd')
-    cmd.color('grey57', 'elem P')
-    cmd.color('grey82', 'elem Pt')
-    cmd.color('grey37', 'elem Pu')
-    cmd.color('grey40', 'elem Po')
-    cmd.color('grey35', 'elem K')
-    cmd.color('grey95', 'elem Pr')
-    cmd.color('grey90', 'elem Pm')
-    cmd.color('grey52', 'elem Pa')
-    cmd.color('grey35', 'elem Ra')
-    cmd.color('grey46', 'elem Rn')
-    cmd.color('grey43', 'elem Re')
-    cmd.color('grey39', 'elem Rh')
-    cmd.color('grey27', 'elem Rb')
-    cmd.color('grey47', 'elem Ru')
-    cmd.color('grey19', 'elem Rf')
-    cmd.color('grey89', 'elem Sm')
-    cmd.color('grey90', 'elem Sc')
-    cmd.color('grey20', 'elem Sg')
-    cmd.color('grey66', 'elem Se')
-    cmd.color('grey80', 'elem Si')
-    cmd.color('grey75', 'elem Ag')
-    cmd.color('grey46', 'elem Na')
-    cmd.color('grey71', 'elem Sr')
-    cmd.color('grey76', 'elem S')
-    cmd.color('grey60', 'elem Ta')
-    cmd.color('grey53', 'elem Tc')
-    cmd.color('grey51', 'elem Te')
-    cmd.color('grey81', 'elem Tb')
-    cmd.color('grey39', 'elem Tl')
-    cmd.color('grey59', 'elem Th')
-    cmd.color('grey61', 'elem Tm')
-    cmd.color('grey48', 'elem Sn')
-    cmd.color('grey75', 'elem Ti')
-    cmd.color('grey50', 'elem W')
-    cmd.color('grey47', 'elem U')
-    cmd.color('grey65', 'elem V')
-    cmd.color('grey54', 'elem Xe')
-    cmd.color('grey55', 'elem Yb')
-    cmd.color('grey91', 'elem Y')
-    cmd.color('grey51', 'elem Zn')
-    cmd.color('grey81', 'elem Zr')
+    _color_by_element(selection, _elementGrays)
+
 cmd.extend('gscale',gscale)
     '''
 
-    cmd.color('grey64', 'elem Ac')
-    cmd.color('grey67', 'elem Al')
-    cmd.color('grey39', 'elem Am')
-    cmd.color('grey46', 'elem Sb')
-    cmd.color('grey75', 'elem Ar')
-    cmd.color('grey58', 'elem As')
-    cmd.color('grey33', 'elem At')
-    cmd.color('grey56', 'elem Ba')
-    cmd.color('grey40', 'elem Bk')
-    cmd.color('grey87', 'elem Be')
-    cmd.color('grey40', 'elem Bi')
-    cmd.color('grey20', 'elem Bh')
-    cmd.color('grey77', 'elem B')
-    cmd.color('grey26', 'elem Br')
-    cmd.color('grey86', 'elem Cd')
-    cmd.color('grey76', 'elem Ca')
-    cmd.color('grey34', 'elem Cf')
-    cmd.color('grey77', 'elem C')
-    cmd.color('grey98', 'elem Ce')
-    cmd.color('grey17', 'elem Cs')
-    cmd.color('grey70', 'elem Cl')
-    cmd.color('grey60', 'elem Cr')
-    cmd.color('grey64', 'elem Co')
-    cmd.color('grey54', 'elem Cu')
-    cmd.color('grey42', 'elem Cm')
-    cmd.color('grey89', 'elem D')
-    cmd.color('grey19', 'elem Db')
-    cmd.color('grey79', 'elem Dy')
-    cmd.color('grey29', 'elem Es')
-    cmd.color('grey67', 'elem Er')
-    cmd.color('grey85', 'elem Eu')
-    cmd.color('grey28', 'elem Fm')
-    cmd.color('grey93', 'elem F')
-    cmd.color('grey8', 'elem Fr')
-    cmd.color('grey82', 'elem Gd')
-    cmd.color('grey60', 'elem Ga')
-    cmd.color('grey52', 'elem Ge')
-    cmd.color('grey80', 'elem Au')
-    cmd.color('grey68', 'elem Hf')
-    cmd.color('grey20', 'elem Hs')
-    cmd.color('grey96', 'elem He')
-    cmd.color('grey75', 'elem Ho')
-    cmd.color('grey89', 'elem H')
-    cmd.color('grey49', 'elem In')
-    cmd.color('grey16', 'elem I')
-    cmd.color('grey29', 'elem Ir')
-    cmd.color('grey48', 'elem Fe')
-    cmd.color('grey65', 'elem Kr')
-    cmd.color('grey76', 'elem La')
-    cmd.color('grey19', 'elem Lr')
-    cmd.color('grey34', 'elem Pb')
-    cmd.color('grey60', 'elem Li')
-    cmd.color('grey48', 'elem Lu')
-    cmd.color('grey83', 'elem Mg')
-    cmd.color('grey52', 'elem Mn')
-    cmd.color('grey20', 'elem Mt')
-    cmd.color('grey23', 'elem Md')
-    cmd.color('grey72', 'elem Hg')
-    cmd.color('grey62', 'elem Mo')
-    cmd.color('grey93', 'elem Nd')
-    cmd.color('grey85', 'elem Ne')
-    cmd.color('grey43', 'elem Np')
-    cmd.color('grey67', 'elem Ni')
-    cmd.color('grey69', 'elem Nb')
-    cmd.color('grey25', 'elem N')
-    cmd.color('grey23', 'elem No')
-    cmd.color('grey36', 'elem Os')
-    cmd.color('grey44', 'elem O')
-    cmd.color('grey33', 'elem Pd')
-    cmd.color('grey57', 'elem P')
-    cmd.color('grey82', 'elem Pt')
-    cmd.color('grey37', 'elem Pu')
-    cmd.color('grey40', 'elem Po')
-    cmd.color('grey35', 'elem K')
-    cmd.color('grey95', 'elem Pr')
-    cmd.color('grey90', 'elem Pm')
-    cmd.color('grey52', 'elem Pa')
-    cmd.color('grey35', 'elem Ra')
-    cmd.color('grey46', 'elem Rn')
-    cmd.color('grey43', 'elem Re')
-    cmd.color('grey39', 'elem Rh')
-    cmd.color('grey27', 'elem Rb')
-    cmd.color('grey47', 'elem Ru')
-    cmd.color('grey19', 'elem Rf')
-    cmd.color('grey89', 'elem Sm')
-    cmd.color('grey90', 'elem Sc')
-    cmd.color('grey20', 'elem Sg')
-    cmd.color('grey66', 'elem Se')
-    cmd.color('grey80', 'elem Si')
-    cmd.color('grey75', 'elem Ag')
-    cmd.color('grey46', 'elem Na')
-    cmd.color('grey71', 'elem Sr')
-    cmd.color('grey76', 'elem S')
-    cmd.color('grey60', 'elem Ta')
-    cmd.color('grey53', 'elem Tc')
-    cmd.color('grey51', 'elem Te')
-    cmd.color('grey81', 'elem Tb')
-    cmd.color('grey39', 'elem Tl')
-    cmd.color('grey59', 'elem Th')
-    cmd.color('grey61', 'elem Tm')
-    cmd.color('grey48', 'elem Sn')
-    cmd.color('grey75', 'elem Ti')
-    cmd.color('grey50', 'elem W')
-    cmd.color('grey47', 'elem U')
-    cmd.color('grey65', 'elem V')
-    cmd.color('grey54', 'elem Xe')
-    cmd.color('grey55', 'elem Yb')
-    cmd.color('grey91', 'elem Y')
-    cmd.color('grey51', 'elem Zn')
-    cmd.color('grey81', 'elem Zr')
+    _color_by_element(selection, _elementGrays)
+
 cmd.extend('gscale',gscale)
 
 
-def hb(selection='all'):
+# Hydrogen-bond donors and acceptors of nucleic acids, proteins, and water by residue and atom name.
+# The value of a donor is the heavy atom bonded to it, which is used to check the angle at the donor.
+# Water has no such atom ('').
+_hbondDonors = {
+    'A': {'N6': 'C6', "O2'": "C2'"},
+    'G': {'N1': 'C6', 'N2': 'C2', "O2'": "C2'"},
+    'C': {'N4': 'C4', "O2'": "C2'"},
+    'U': {'N3': 'C4', "O2'": "C2'"},
+    'PSU': {'N1': 'C6', 'N3': 'C4', "O2'": "C2'"},
+    'DA': {'N6': 'C6'},
+    'DG': {'N1': 'C6', 'N2': 'C2'},
+    'DC': {'N4': 'C4'},
+    'DT': {'N3': 'C4'},
+    'ARG': {'NE': 'CD', 'NH1': 'CZ', 'NH2': 'CZ'},
+    'ASN': {'ND2': 'CG'},
+    'GLN': {'NE2': 'CD'},
+    'HIS': {'ND1': 'CG', 'NE2': 'CE1'},
+    'TRP': {'NE1': 'CD1'},
+    'LYS': {'NZ': 'CE'},
+    'SER': {'OG': 'CB'},
+    'THR': {'OG1': 'CB'},
+    'TYR': {'OH': 'CZ'},
+    'CYS': {'SG': 'CB'},
+    }
+_hbondAcceptors = {
+    'A': ['N1', 'N3', 'N7'],
+    'G': ['O6', 'N3', 'N7'],
+    'C': ['O2', 'N3'],
+    'U': ['O2', 'O4'],
+    'PSU': ['O2', 'O4'],
+    'DA': ['N1', 'N3', 'N7'],
+    'DG': ['O6', 'N3', 'N7'],
+    'DC': ['O2', 'N3'],
+    'DT': ['O2', 'O4'],
+    'ASP': ['OD1', 'OD2'],
+    'GLU': ['OE1', 'OE2'],
+    'ASN': ['OD1'],
+    'GLN': ['OE1'],
+    'HIS': ['ND1', 'NE2'],
+    'SER': ['OG'],
+    'THR': ['OG1'],
+    'TYR': ['OH'],
+    'MET': ['SD'],
+    }
+_nucleicBackboneAcceptors = ['OP1', 'OP2', 'O1P', 'O2P', "O2'", "O3'", "O4'", "O5'"]
+_aminoAcids = ['ALA', 'ARG', 'ASN', 'ASP', 'CYS', 'GLN', 'GLU', 'GLY', 'HIS', 'ILE',
+    'LEU', 'LYS', 'MET', 'PHE', 'PRO', 'SER', 'THR', 'TRP', 'TYR', 'VAL', 'MSE']
+_waters = ['HOH', 'WAT', 'H2O', 'DOD', 'TIP', 'TIP3', 'SOL']
+
+
+def _hbond_type(resn, name):
+    '''Return (bonded heavy atom of a donor or None, True for an acceptor) for one atom.'''
+    if resn in _waters:
+        return ('', True) if name.startswith('O') else (None, False)
+    antecedent = _hbondDonors.get(resn, {}).get(name)
+    acceptor = name in _hbondAcceptors.get(resn, [])
+    if resn in _aminoAcids:
+        if name == 'N' and resn != 'PRO':
+            antecedent = 'CA'
+        acceptor = acceptor or name in ('O', 'OXT')
+    elif resn in _hbondAcceptors:
+        acceptor = acceptor or name in _nucleicBackboneAcceptors
+    return antecedent, acceptor
+
+
+def hb(selection='all', cutoff=3.2, angle=90, state=1, name='hbonds', quiet=1):
     ''' 
     DESCRIPTION:
-    Creates an object of all H-bonds found by PyMOL.
+    Creates an object of the H-bonds between donors and acceptors in the selection.
 
 
     USAGE:
-    hb <selection>
+    hb [selection, [cutoff, [angle, [state, [name, [quiet]]]]]]
 
     ARGUMENTS:
-    The selection is optional. It is "all" by default.
+    selection = string: atoms to search {default: all}
+    cutoff = float: maximum donor-acceptor distance in Angstroms {default: 3.2}
+    angle = float: minimum angle in degrees between the donor, the heavy atom
+            bonded to the donor, and the acceptor {default: 90}
+    state = int: object state {default: 1}
+    name = string: name of the dashed-line object {default: hbonds}
+    quiet = int: 0 prints each H-bond {default: 1}
 
 
     EXAMPLE:
-    hbond 1lw9
+    hb 1lw9
+    hb chain A, 3.5
 
     MORE DETAILS:
-    Creates an object of all polar contacts found by PyMOL. 
-    They all may not be H-bonds (e.g., a water cannot partake in 
-    five H-bonds at once). User be aware!
+    Finds the H-bonds between the heavy atoms of donors and acceptors within
+    the selection. The atoms are typed by residue and atom name for RNA, DNA 
+    (e.g., N1, N2, N3, N6, O6, N7, O2, O4, O2', OP1, OP2), proteins, and water.
+    The pairs within the cutoff are found with a cell list in one pass. A pair
+    is kept when the angle at the donor is at least the given angle; waters 
+    have no angle check. Pairs within the same residue are skipped. An H-bond
+    between two atoms that are both donors and acceptors (e.g., water, O2', 
+    and the hydroxyls of SER, THR, and TYR) is reported once, in the 
+    direction with the larger angle at the donor.
+
+    The H-bonds are drawn as one CGO object of dashed lines. 
+    Enter 'rmhb' (or 'rmhb name=<name>') to remove the hbonds.
+
+    RETURNS
+        A NumPy structured array with one record per H-bond and the fields
+        ( donor_object, donor_index, acceptor_object, acceptor_index, distance, angle ).
+        The angle is NaN for donors without a bonded heavy atom in the selection.
 
 
     VERTICAL PML SCRIPT:
-    hbonds, all, all, 3.2, mode=2 
+    NA
     HORIZONTAL PML SCRIPT:
-    hbonds, all, all, 3.2, mode=2 
+    NA
+
     PYTHON CODE:
-def hb(selection='all'):
-    cmd.distance("hbonds", "all", "all", "3.2", mode="2")
-    cmd.set("dash_gap","0.4")
-    cmd.set("dash_color","grey30")
-    cmd.set("dash_width","1.5")
-    cmd.set("dash_length",".25")
-    print("Enter 'rmhb' to remove the hbonds.")
+def hb(selection='all', cutoff=3.2, angle=90, state=1, name='hbonds', quiet=1):
+    cutoff, angle, state, quiet = float(cutoff), float(angle), int(state), int(quiet)
+    fields = [('donor_object', 'U'), ('donor_index', 'i4'), ('acceptor_object', 'U'),
+        ('acceptor_index', 'i4'), ('distance', 'f4'), ('angle', 'f4')]
+
+    sele = "(%s) and not hydro" % selection
+    # identifiers and coordinates from one pass, so that their rows match across objects
+    stored.hbAtoms = []
+    cmd.iterate_state(state, sele, "stored.hbAtoms.append((model, index, segi, chain, resi, resn, name, x, y, z))")
+    atoms = stored.hbAtoms
+    if not atoms:
+        print("No atoms found in %s." % selection)
+        return _record_array([], fields)
+    xyz = numpy.array([atom[7:] for atom in atoms], dtype=float)
+
+    # type each atom once per (resn, name) and find the bonded heavy atom of each donor
+    residueOf, rowOf, types = {}, {}, {}
+    for row, (model, index, segi, chain, resi, resn, atomName, x, y, z) in enumerate(atoms):
+        rowOf[(model, segi, chain, resi, atomName)] = row
+    residue = numpy.zeros(len(atoms), dtype=int)
+    antecedent = numpy.full(len(atoms), -1, dtype=int)
+    isDonor = numpy.zeros(len(atoms), dtype=bool)
+    isAcceptor = numpy.zeros(len(atoms), dtype=bool)
+    for row, (model, index, segi, chain, resi, resn, atomName, x, y, z) in enumerate(atoms):
+        residue[row] = residueOf.setdefault((model, segi, chain, resi), len(residueOf))
+        if (resn, atomName) not in types:
+            types[(resn, atomName)] = _hbond_type(resn, atomName)
+        bondedName, isAcceptor[row] = types[(resn, atomName)]
+        if bondedName is not None:
+            isDonor[row] = True
+            if bondedName:
+                antecedent[row] = rowOf.get((model, segi, chain, resi, bondedName), -1)
+
+    # donor-acceptor pairs within the cutoff
+    donors, acceptors = numpy.flatnonzero(isDonor), numpy.flatnonzero(isAcceptor)
+    i, j, distances = _neighbor_pairs(xyz[donors], xyz[acceptors], cutoff)
+    D, A = donors[i], acceptors[j]
+
+    # angle at the donor between its bonded heavy atom and the acceptor
+    angles = numpy.full(len(D), numpy.nan)
+    bonded = antecedent[D] >= 0
+    v1 = xyz[antecedent[D][bonded]] - xyz[D][bonded]
+    v2 = xyz[A][bonded] - xyz[D][bonded]
+    cosines = (v1 * v2).sum(axis=1) / numpy.maximum(numpy.sqrt((v1 ** 2).sum(axis=1) * (v2 ** 2).sum(axis=1)), 1e-9)
+    angles[bonded] = numpy.degrees(numpy.arccos(numpy.clip(cosines, -1.0, 1.0)))
+    keep = (residue[D] != residue[A]) & (~bonded | (angles >= angle))
+    D, A, distances, angles = D[keep], A[keep], distances[keep], angles[keep]
+
+    # Atoms that are both donors and acceptors (water, O2', OG, OH, ...) give an H-bond
+    # in both directions; keep the direction with the larger angle at the donor.
+    if len(D):
+        order = numpy.argsort(-numpy.where(numpy.isnan(angles), -1.0, angles), kind='stable')
+        pairs = numpy.sort(numpy.column_stack((D, A)), axis=1)[order]
+        unique = numpy.sort(order[numpy.unique(pairs, axis=0, return_index=True)[1]])
+        D, A, distances, angles = D[unique], A[unique], distances[unique], angles[unique]
+
+    result = _record_array([(atoms[d][0], atoms[d][1], atoms[a][0], atoms[a][1], dist, ang)
+        for d, a, dist, ang in zip(D.tolist(), A.tolist(), distances.tolist(), angles.tolist())], fields)
+
+    # one bulk call for all of the dashed lines
+    cmd.delete(name)
+    if len(D):
+        cmd.load_cgo(_dash_cgo(xyz[D], xyz[A], color=cmd.get_color_tuple("grey30")), name)
+
+    if not quiet:
+        for d, a, dist, ang in zip(D.tolist(), A.tolist(), distances.tolist(), angles.tolist()):
+            print("%s/%s/%s/%s`%s/%s -> %s/%s/%s/%s`%s/%s: %.2f A, %.0f deg" % (atoms[d][0], atoms[d][2],
+                atoms[d][3], atoms[d][5], atoms[d][4], atoms[d][6], atoms[a][0], atoms[a][2],
+                atoms[a][3], atoms[a][5], atoms[a][4], atoms[a][6], dist, ang))
+    print("Found %d H-bonds. Enter 'rmhb%s' to remove the hbonds." % (len(D), '' if name == 'hbonds' else ' name=' + name))
+    return result
 cmd.extend('hb',hb)
     '''
 
-    cmd.distance("hbonds", "all", "all", "3.2", mode="2")
-    cmd.set("dash_gap","0.4")
-    cmd.set("dash_color","grey30")
-    cmd.set("dash_width","1.5")
-    cmd.set("dash_length",".25")
-    print("Enter 'rmhb' to remove the hbonds.")
+    cutoff, angle, state, quiet = float(cutoff), float(angle), int(state), int(quiet)
+    fields = [('donor_object', 'U'), ('donor_index', 'i4'), ('acceptor_object', 'U'),
+        ('acceptor_index', 'i4'), ('distance', 'f4'), ('angle', 'f4')]
+
+    sele = "(%s) and not hydro" % selection
+    # identifiers and coordinates from one pass, so that their rows match across objects
+    stored.hbAtoms = []
+    cmd.iterate_state(state, sele, "stored.hbAtoms.append((model, index, segi, chain, resi, resn, name, x, y, z))")
+    atoms = stored.hbAtoms
+    if not atoms:
+        print("No atoms found in %s." % selection)
+        return _record_array([], fields)
+    xyz = numpy.array([atom[7:] for atom in atoms], dtype=float)
+
+    # type each atom once per (resn, name) and find the bonded heavy atom of each donor
+    residueOf, rowOf, types = {}, {}, {}
+    for row, (model, index, segi, chain, resi, resn, atomName, x, y, z) in enumerate(atoms):
+        rowOf[(model, segi, chain, resi, atomName)] = row
+    residue = numpy.zeros(len(atoms), dtype=int)
+    antecedent = numpy.full(len(atoms), -1, dtype=int)
+    isDonor = numpy.zeros(len(atoms), dtype=bool)
+    isAcceptor = numpy.zeros(len(atoms), dtype=bool)
+    for row, (model, index, segi, chain, resi, resn, atomName, x, y, z) in enumerate(atoms):
+        residue[row] = residueOf.setdefault((model, segi, chain, resi), len(residueOf))
+        if (resn, atomName) not in types:
+            types[(resn, atomName)] = _hbond_type(resn, atomName)
+        bondedName, isAcceptor[row] = types[(resn, atomName)]
+        if bondedName is not None:
+            isDonor[row] = True
+            if bondedName:
+                antecedent[row] = rowOf.get((model, segi, chain, resi, bondedName), -1)
+
+    # donor-acceptor pairs within the cutoff
+    donors, acceptors = numpy.flatnonzero(isDonor), numpy.flatnonzero(isAcceptor)
+    i, j, distances = _neighbor_pairs(xyz[donors], xyz[acceptors], cutoff)
+    D, A = donors[i], acceptors[j]
+
+    # angle at the donor between its bonded heavy atom and the acceptor
+    angles = numpy.full(len(D), numpy.nan)
+    bonded = antecedent[D] >= 0
+    v1 = xyz[antecedent[D][bonded]] - xyz[D][bonded]
+    v2 = xyz[A][bonded] - xyz[D][bonded]
+    cosines = (v1 * v2).sum(axis=1) / numpy.maximum(numpy.sqrt((v1 ** 2).sum(axis=1) * (v2 ** 2).sum(axis=1)), 1e-9)
+    angles[bonded] = numpy.degrees(numpy.arccos(numpy.clip(cosines, -1.0, 1.0)))
+    keep = (residue[D] != residue[A]) & (~bonded | (angles >= angle))
+    D, A, distances, angles = D[keep], A[keep], distances[keep], angles[keep]
+
+    # Atoms that are both donors and acceptors (water, O2', OG, OH, ...) give an H-bond
+    # in both directions; keep the direction with the larger angle at the donor.
+    if len(D):
+        order = numpy.argsort(-numpy.where(numpy.isnan(angles), -1.0, angles), kind='stable')
+        pairs = numpy.sort(numpy.column_stack((D, A)), axis=1)[order]
+        unique = numpy.sort(order[numpy.unique(pairs, axis=0, return_index=True)[1]])
+        D, A, distances, angles = D[unique], A[unique], distances[unique], angles[unique]
+
+    result = _record_array([(atoms[d][0], atoms[d][1], atoms[a][0], atoms[a][1], dist, ang)
+        for d, a, dist, ang in zip(D.tolist(), A.tolist(), distances.tolist(), angles.tolist())], fields)
+
+    # one bulk call for all of the dashed lines
+    cmd.delete(name)
+    if len(D):
+        cmd.load_cgo(_dash_cgo(xyz[D], xyz[A], color=cmd.get_color_tuple("grey30")), name)
+
+    if not quiet:
+        for d, a, dist, ang in zip(D.tolist(), A.tolist(), distances.tolist(), angles.tolist()):
+            print("%s/%s/%s/%s`%s/%s -> %s/%s/%s/%s`%s/%s: %.2f A, %.0f deg" % (atoms[d][0], atoms[d][2],
+                atoms[d][3], atoms[d][5], atoms[d][4], atoms[d][6], atoms[a][0], atoms[a][2],
+                atoms[a][3], atoms[a][5], atoms[a][4], atoms[a][6], dist, ang))
+    print("Found %d H-bonds. Enter 'rmhb%s' to remove the hbonds." % (len(D), '' if name == 'hbonds' else ' name=' + name))
+    return result
 cmd.extend('hb',hb)
 
 
+def indexAssemblies(codes='', path=None, quiet=0):
+    ''' 
+    DESCRIPTION:
+    Read the biological assemblies of many PDB or mmCIF files into the index used by quat.
+
+    USAGE:
+    indexAssemblies [codes [, path [, quiet]]]
+
+    ARGUMENTS:
+    codes = string: PDB ids separated by spaces or commas {default: all files in path}
+    path = string: directory of a divided mirror of the PDB {default: local_mirror_divided}
+    quiet = 0 or 1: do not print the summary {default: 0}
+
+    EXAMPLE:
+    indexAssemblies 1stp 4dgr 3nd4
+    indexAssemblies path=/mnt/bio/db/pdb.divided
+
+    MORE DETAILS:
+    Fills assemblyIndexFile ahead of time so that quat finds the assemblies
+    of mirror files without reading them. The files of the mirror 
+    (xx/pdbxxxx.ent.gz and xx/xxxx.cif.gz) are read only up to the first 
+    coordinate record; files that are already in the index with the same 
+    size and modification time are skipped. The index is written once at
+    the end.
+
+    RETURNS
+        A NumPy structured array with one record per assembly and the 
+        fields ( file, assembly, copies ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def indexAssemblies(codes='', path=None, quiet=0):
+    if path is None:
+        path = local_mirror_divided
+    quiet = int(quiet)
+    patterns = ('%s/%s/pdb%s.ent.gz', '%s/%s/%s.cif.gz', '%s/%s/%s.cif')
+    if codes:
+        files = []
+        for code in codes.lower().replace(',', ' ').split():
+            for pattern in patterns:
+                fileName = pattern % (path, code[1:3], code)
+                if os.path.exists(fileName):
+                    files.append(fileName)
+                    break
+            else:
+                print('No file for %s in %s' % (code, path))
+    else:
+        files = sorted(glob.glob(os.path.join(path, '*', 'pdb*.ent.gz')) +
+            glob.glob(os.path.join(path, '*', '*.cif.gz')))
+
+    start = time.time()
+    rows = []
+    for fileName in files:
+        entry = _read_assemblies(fileName, save=False)
+        for assembly, copies in sorted(entry['assemblies'].items()):
+            rows.append((fileName, assembly, len(copies)))
+    _save_assembly_index()
+    if not quiet:
+        print('Indexed %d assemblies of %d files in %.1f s' % (len(rows), len(files), time.time() - start))
+    return _record_array(rows, [('file', 'U'), ('assembly', 'U'), ('copies', 'i4')])
+
+cmd.extend('indexAssemblies', indexAssemblies)
+    '''
+
+    if path is None:
+        path = local_mirror_divided
+    quiet = int(quiet)
+    patterns = ('%s/%s/pdb%s.ent.gz', '%s/%s/%s.cif.gz', '%s/%s/%s.cif')
+    if codes:
+        files = []
+        for code in codes.lower().replace(',', ' ').split():
+            for pattern in patterns:
+                fileName = pattern % (path, code[1:3], code)
+                if os.path.exists(fileName):
+                    files.append(fileName)
+                    break
+            else:
+                print('No file for %s in %s' % (code, path))
+    else:
+        files = sorted(glob.glob(os.path.join(path, '*', 'pdb*.ent.gz')) +
+            glob.glob(os.path.join(path, '*', '*.cif.gz')))
+
+    start = time.time()
+    rows = []
+    for fileName in files:
+        entry = _read_assemblies(fileName, save=False)
+        for assembly, copies in sorted(entry['assemblies'].items()):
+            rows.append((fileName, assembly, len(copies)))
+    _save_assembly_index()
+    if not quiet:
+        print('Indexed %d assemblies of %d files in %.1f s' % (len(rows), len(files), time.time() - start))
+    return _record_array(rows, [('file', 'U'), ('assembly', 'U'), ('copies', 'i4')])
+
+cmd.extend('indexAssemblies', indexAssemblies)
+
+
 def inkscape():
     ''' 
     DESCRIPTION:
@@ -10126,28 +10712,14 @@ def inkscape():
 
     PYTHON CODE:
 def inkscape():
-    try:
-        print("Opening the inkscape.");
-        subprocess.check_output(inkscapeOpen)
-        print("Success opening inkscape.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'inkscapeOpen'. \n  Or use 'inkscapePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the inkscape.")
+    _launch_app('inkscape', inkscapeOpen)
 
 cmd.extend('inkscape',inkscape)
     '''
 
-    try:
-        print("Opening the inkscape.");
-        subprocess.check_output(inkscapeOpen)
-        print("Success opening inkscape.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'inkscapeOpen'. \n  Or use 'inkscapePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the inkscape.")
+    _launch_app('inkscape', inkscapeOpen)
 
 cmd.extend('inkscape',inkscape)
 
@@ -10213,8 +10785,12 @@ def interface(cmpx, cA='c. A', cB='c. B', cutoff=1.0, selName="interface"):
     RETURNS
 	* A selection of interface residues is created and named
 		depending on what you passed into selName
-	* An array of values is returned where each value is:
-		( modelName, residueNumber, dASA )
+	* A NumPy structured array is returned with one record per
+		interface residue and the fields:
+		( model, chain, resi, resn, dASA )
+		dASA is the sum of the atom differences in the residue.
+		A residue is kept when any of its atoms changes by at
+		least the cutoff.
 
     NOTES
 	If you have two chains that are not from the same PDB that you want
@@ -10277,25 +10853,30 @@ def interface(cmpx, cA='c. A', cB='c. B', cutoff=1.0, selName="interface"):
     # update the chain-only objects w/the difference
     cmd.alter( "%s or %s" % (chA,chB), "b=b-q" )
 
-    # The calculations are done.  Now, all we need to
-    # do is to determine which residues are over the cutoff
-    # and save them.
-    stored.r, rVal, seen = [], [], []
-    cmd.iterate('%s or %s' % (chA, chB), 'stored.r.append((model,resi,b))')
-
+    # The calculations are done.  Now, sum the atom differences by residue
+    # in one pass. A residue is kept when any one of its atoms changes by
+    # at least the cutoff.
+    stored.r = []
+    cmd.iterate('%s or %s' % (chA, chB), 'stored.r.append((model,chain,resi,resn,b))')
+
+    cutoff = float(cutoff)
+    dASA, resnames, order, kept = {}, {}, [], set()
+    for (model,chain,resi,resn,diff) in stored.r:
+        key = (model,chain,resi)
+        if key not in dASA:
+            dASA[key] = 0.0
+            resnames[key] = resn
+            order.append(key)
+        dASA[key] += diff
+        if abs(diff) >= cutoff:
+            kept.add(key)
+    residues = [key for key in order if key in kept]
+    rVal = _record_array([key + (resnames[key], dASA[key]) for key in residues],
+        [('model', 'U'), ('chain', 'U'), ('resi', 'U'), ('resn', 'U'), ('dASA', 'f8')])
+
+    # push the residues to PyMOL as one selection built in bounded chunks
     cmd.enable(cmpx)
-    cmd.select(selName1, None)
-    for (model,resi,diff) in stored.r:
-        key=resi+"-"+model
-        if abs(diff)>=float(cutoff):
-            if key in seen: continue
-            else: seen.append(key)
-            rVal.append( (model,resi,diff) )
-            # expand the selection here; I chose to iterate over stored.r instead of
-            # creating one large selection b/c if there are too many residues PyMOL
-            # might crash on a very large selection.  This is pretty much guaranteed
-            # not to kill PyMOL; but, it might take a little longer to run.
-            cmd.select( selName1, selName1 + " or (%s and i. %s)" % (model,resi))
+    _select_residues(selName1, residues)
 
     # this is how you transfer a selection to another object.
     cmd.select(selName, cmpx + " in " + selName1)
@@ -10346,25 +10927,30 @@ cmd.extend('interface', interface)
     # update the chain-only objects w/the difference
     cmd.alter( "%s or %s" % (chA,chB), "b=b-q" )
 
-    # The calculations are done.  Now, all we need to
-    # do is to determine which residues are over the cutoff
-    # and save them.
-    stored.r, rVal, seen = [], [], []
-    cmd.iterate('%s or %s' % (chA, chB), 'stored.r.append((model,resi,b))')
-
+    # The calculations are done.  Now, sum the atom differences by residue
+    # in one pass. A residue is kept when any one of its atoms changes by
+    # at least the cutoff.
+    stored.r = []
+    cmd.iterate('%s or %s' % (chA, chB), 'stored.r.append((model,chain,resi,resn,b))')
+
+    cutoff = float(cutoff)
+    dASA, resnames, order, kept = {}, {}, [], set()
+    for (model,chain,resi,resn,diff) in stored.r:
+        key = (model,chain,resi)
+        if key not in dASA:
+            dASA[key] = 0.0
+            resnames[key] = resn
+            order.append(key)
+        dASA[key] += diff
+        if abs(diff) >= cutoff:
+            kept.add(key)
+    residues = [key for key in order if key in kept]
+    rVal = _record_array([key + (resnames[key], dASA[key]) for key in residues],
+        [('model', 'U'), ('chain', 'U'), ('resi', 'U'), ('resn', 'U'), ('dASA', 'f8')])
+
+    # push the residues to PyMOL as one selection built in bounded chunks
     cmd.enable(cmpx)
-    cmd.select(selName1, None)
-    for (model,resi,diff) in stored.r:
-        key=resi+"-"+model
-        if abs(diff)>=float(cutoff):
-            if key in seen: continue
-            else: seen.append(key)
-            rVal.append( (model,resi,diff) )
-            # expand the selection here; I chose to iterate over stored.r instead of
-            # creating one large selection b/c if there are too many residues PyMOL
-            # might crash on a very large selection.  This is pretty much guaranteed
-            # not to kill PyMOL; but, it might take a little longer to run.
-            cmd.select( selName1, selName1 + " or (%s and i. %s)" % (model,resi))
+    _select_residues(selName1, residues)
 
     # this is how you transfer a selection to another object.
     cmd.select(selName, cmpx + " in " + selName1)
@@ -10384,6 +10970,337 @@ cmd.extend('interface', interface)
 cmd.extend('interface', interface)
 
 
+# Script run by each worker process of interfaceMatrix: the areas of its share of the chain pairs.
+_pairAreaJob = '''python
+import json
+cmd.set('dot_solvent', 1)
+cmd.set('dot_density', %(dotDensity)s)
+cmd.set('solvent_radius', %(solventRadius)r)
+areas = []
+for fileName in %(files)r:
+    cmd.delete('all')
+    cmd.load(fileName, 'pair')
+    cmd.alter('pair', 'vdw = b')
+    areas.append(cmd.get_area('pair'))
+with open(%(output)r, 'w') as f:
+    json.dump(areas, f)
+python end
+'''
+
+
+def _pair_areas(files, processes, dotDensity, solventRadius):
+    '''
+    Return the solvent accessible area of the atoms in each file, computed
+    by up to processes headless PyMOL processes started with 
+    pymolBatchCommand, or None when a worker fails. The workers are new 
+    processes, not forks of this session, so nothing has to be pickled.
+    '''
+    from concurrent.futures import ThreadPoolExecutor
+    directory = os.path.dirname(files[0])
+    shares = [files[n::processes] for n in range(min(processes, len(files)))]
+
+    def run(n):
+        jobFile = os.path.join(directory, 'job%d.pml' % n)
+        output = os.path.join(directory, 'areas%d.json' % n)
+        with open(jobFile, 'w') as f:
+            f.write(_pairAreaJob % {'files': shares[n], 'output': output,
+                'dotDensity': dotDensity, 'solventRadius': solventRadius})
+        process = subprocess.run(pymolBatchCommand + [jobFile], cwd=directory,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if process.returncode != 0 or not os.path.exists(output):
+            print(process.stdout.decode('utf-8', 'replace')[-2000:])
+            return None
+        with open(output) as f:
+            return json.load(f)
+
+    # Threads only wait on the worker processes, which compute the areas.
+    with ThreadPoolExecutor(max_workers=len(shares)) as pool:
+        results = list(pool.map(run, range(len(shares))))
+    if any(areas is None for areas in results):
+        return None
+    areas = [0.0] * len(files)
+    for n, share in enumerate(results):
+        areas[n::processes] = share
+    return areas
+
+
+def interfaceMatrix(cmpx, chains='', exact=0, processes=0, quiet=0):
+    ''' 
+    DESCRIPTION:
+    Return the matrix of buried surface areas between all pairs of chains in a complex.
+
+    USAGE:
+    interfaceMatrix cmpx, [chains, [exact=0/1, [processes, [quiet=0/1]]]]
+
+    ARGUMENTS:
+    cmpx
+        The complex that contains the chains.
+
+    chains
+        Space or comma separated list of chain identifiers.
+        All chains of the polymer atoms in cmpx by default.
+
+    exact
+        0: split the area buried in the full complex among the neighboring
+           chains {default}.
+        1: compute the area of each pair of touching chains on its own.
+
+    processes
+        Number of headless PyMOL processes for the pair jobs with exact=1.
+        0 computes the pairs in the current session {default: 0}.
+
+    quiet
+        1 suppresses the printing of the matrix {default: 0}.
+
+    EXAMPLE:
+    interfaceMatrix 4v9d
+    interfaceMatrix 4v9d, A B C D, exact=1, processes=4
+
+    MORE DETAILS:
+    Batch version of the interface shortcut for assemblies with many chains.
+    The solvent accessible area of every atom is computed once in the full
+    complex and once in its isolated chain. The buried area of an atom is
+    the difference between the two values.
+
+    With exact=0, the buried area of each atom is split among the other chains 
+    that have atoms within the sum of the van der Waals radii plus the diameter
+    of the solvent probe. The split is proportional to the number of such atoms
+    in each chain. No further area calculations are needed. The value is exact
+    when an atom is buried by only one other chain.
+
+    With exact=1, the area of the union of each pair of touching chains is 
+    computed and the buried area is area(A) + area(B) - area(A+B). Pairs
+    of chains that do not touch are set to zero without computing their area.
+    With processes > 1, the pairs are saved to temporary mmCIF files and split 
+    among headless PyMOL processes started with pymolBatchCommand, as in 
+    renderScenes. The pairs are computed in the current session when a 
+    worker fails.
+
+    RETURNS
+        A tuple of the list of chain identifiers and a symmetric NumPy 
+        array with the buried surface area (in A**2) of each pair of chains.
+        The diagonal is zero. Both are empty when no polymer atoms of the
+        chains are in cmpx.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def interfaceMatrix(cmpx, chains='', exact=0, processes=0, quiet=0):
+    exact, processes, quiet = int(exact), int(processes), int(quiet)
+
+    # Save user's settings, before setting dot_solvent
+    oldDS = cmd.get("dot_solvent")
+    cmd.set("dot_solvent", 1)
+
+    tempC = cmd.get_unused_name("__tmpComplex")
+    cmd.create(tempC, "(%s) and polymer" % cmpx)
+    if chains:
+        chainIDs = chains.replace(",", " ").split()
+        cmd.remove(tempC + " and not (%s)" % " or ".join('chain "%s"' % chain for chain in chainIDs))
+    else:
+        chainIDs = cmd.get_chains(tempC)
+    if cmd.count_atoms(tempC) == 0:
+        cmd.delete(tempC)
+        cmd.set("dot_solvent", oldDS)
+        print("No atoms found in %s." % cmpx)
+        return [], numpy.zeros((0, 0))
+    # The ID of each atom becomes its row in the per-atom arrays.
+    cmd.alter(tempC, "ID=index-1")
+
+    # area of every atom in the full complex, computed once
+    cmd.get_area(tempC, load_b=1)
+    stored.atoms = []
+    cmd.iterate(tempC, "stored.atoms.append((chain, b, vdw))")
+    xyz = cmd.get_coords(tempC)
+    chainIndex = dict((chain, n) for n, chain in enumerate(chainIDs))
+    atomChain = numpy.array([chainIndex[atom[0]] for atom in stored.atoms], dtype=int)
+    complexArea = numpy.array([atom[1] for atom in stored.atoms])
+    vdw = numpy.array([atom[2] for atom in stored.atoms])
+
+    # area of every atom in its isolated chain, computed once per chain
+    isolatedArea = numpy.zeros(len(stored.atoms))
+    tempChain = cmd.get_unused_name("__tmpChain")
+    for chain in chainIDs:
+        cmd.create(tempChain, '%s and chain "%s"' % (tempC, chain))
+        cmd.get_area(tempChain, load_b=1)
+        stored.areas = []
+        cmd.iterate(tempChain, "stored.areas.append((ID, b))")
+        rows = numpy.array([area[0] for area in stored.areas], dtype=int)
+        isolatedArea[rows] = [area[1] for area in stored.areas]
+        cmd.delete(tempChain)
+    buried = isolatedArea - complexArea
+
+    # atoms of different chains that are close enough to occlude each other
+    probe = float(cmd.get("solvent_radius"))
+    i, j, d = _neighbor_pairs(xyz, xyz, 2 * vdw.max() + 2 * probe)
+    keep = (atomChain[i] != atomChain[j]) & (d < vdw[i] + vdw[j] + 2 * probe)
+    i, j = i[keep], j[keep]
+
+    nChains = len(chainIDs)
+    matrix = numpy.zeros((nChains, nChains))
+    if not exact:
+        # split the buried area of each atom among its neighboring chains
+        atomPartner, counts = numpy.unique(i * nChains + atomChain[j], return_counts=True)
+        atoms, partners = atomPartner // nChains, atomPartner % nChains
+        share = buried[atoms] * counts / numpy.bincount(i, minlength=len(buried))[atoms]
+        numpy.add.at(matrix, (atomChain[atoms], partners), share)
+        matrix = matrix + matrix.T
+    else:
+        chainArea = numpy.bincount(atomChain, weights=isolatedArea, minlength=nChains)
+        touching = sorted(set(zip(atomChain[i].tolist(), atomChain[j].tolist())))
+        touching = [(a, b) for (a, b) in touching if a < b]
+        pairs = ['%s and (chain "%s" or chain "%s")' % (tempC, chainIDs[a], chainIDs[b]) for (a, b) in touching]
+        areas = None
+        if processes > 1 and pairs:
+            # The pairs are written to files only for the worker processes; the
+            # B-factors carry the radii of this session, which loading would reset.
+            workDirectory = tempfile.mkdtemp(prefix='interfaceMatrix')
+            try:
+                cmd.alter(tempC, "b=vdw")
+                files = [os.path.join(workDirectory, 'pair%d.cif' % n) for n in range(len(pairs))]
+                for fileName, pair in zip(files, pairs):
+                    cmd.save(fileName, pair)
+                areas = _pair_areas(files, processes, cmd.get("dot_density"), probe)
+            except OSError as e:
+                print("Could not start the worker processes: %s" % e)
+            finally:
+                shutil.rmtree(workDirectory, ignore_errors=True)
+            if areas is None:
+                print("Computing the pairs in this session.")
+        if areas is None:
+            areas = []
+            tempPair = cmd.get_unused_name("__tmpPair")
+            for pair in pairs:
+                cmd.create(tempPair, pair)
+                areas.append(cmd.get_area(tempPair))
+                cmd.delete(tempPair)
+        for (a, b), pairArea in zip(touching, areas):
+            matrix[a, b] = matrix[b, a] = chainArea[a] + chainArea[b] - pairArea
+
+    cmd.delete(tempC)
+    # reset users settings
+    cmd.set("dot_solvent", oldDS)
+
+    if not quiet:
+        print("Buried surface area (A**2) between pairs of chains in %s:" % cmpx)
+        print("      " + "".join("%9s" % chain for chain in chainIDs))
+        for n, chain in enumerate(chainIDs):
+            print("%6s" % chain + "".join("%9.1f" % value for value in matrix[n]))
+
+    return chainIDs, matrix
+
+cmd.extend('interfaceMatrix', interfaceMatrix)
+    '''
+
+    exact, processes, quiet = int(exact), int(processes), int(quiet)
+
+    # Save user's settings, before setting dot_solvent
+    oldDS = cmd.get("dot_solvent")
+    cmd.set("dot_solvent", 1)
+
+    tempC = cmd.get_unused_name("__tmpComplex")
+    cmd.create(tempC, "(%s) and polymer" % cmpx)
+    if chains:
+        chainIDs = chains.replace(",", " ").split()
+        cmd.remove(tempC + " and not (%s)" % " or ".join('chain "%s"' % chain for chain in chainIDs))
+    else:
+        chainIDs = cmd.get_chains(tempC)
+    if cmd.count_atoms(tempC) == 0:
+        cmd.delete(tempC)
+        cmd.set("dot_solvent", oldDS)
+        print("No atoms found in %s." % cmpx)
+        return [], numpy.zeros((0, 0))
+    # The ID of each atom becomes its row in the per-atom arrays.
+    cmd.alter(tempC, "ID=index-1")
+
+    # area of every atom in the full complex, computed once
+    cmd.get_area(tempC, load_b=1)
+    stored.atoms = []
+    cmd.iterate(tempC, "stored.atoms.append((chain, b, vdw))")
+    xyz = cmd.get_coords(tempC)
+    chainIndex = dict((chain, n) for n, chain in enumerate(chainIDs))
+    atomChain = numpy.array([chainIndex[atom[0]] for atom in stored.atoms], dtype=int)
+    complexArea = numpy.array([atom[1] for atom in stored.atoms])
+    vdw = numpy.array([atom[2] for atom in stored.atoms])
+
+    # area of every atom in its isolated chain, computed once per chain
+    isolatedArea = numpy.zeros(len(stored.atoms))
+    tempChain = cmd.get_unused_name("__tmpChain")
+    for chain in chainIDs:
+        cmd.create(tempChain, '%s and chain "%s"' % (tempC, chain))
+        cmd.get_area(tempChain, load_b=1)
+        stored.areas = []
+        cmd.iterate(tempChain, "stored.areas.append((ID, b))")
+        rows = numpy.array([area[0] for area in stored.areas], dtype=int)
+        isolatedArea[rows] = [area[1] for area in stored.areas]
+        cmd.delete(tempChain)
+    buried = isolatedArea - complexArea
+
+    # atoms of different chains that are close enough to occlude each other
+    probe = float(cmd.get("solvent_radius"))
+    i, j, d = _neighbor_pairs(xyz, xyz, 2 * vdw.max() + 2 * probe)
+    keep = (atomChain[i] != atomChain[j]) & (d < vdw[i] + vdw[j] + 2 * probe)
+    i, j = i[keep], j[keep]
+
+    nChains = len(chainIDs)
+    matrix = numpy.zeros((nChains, nChains))
+    if not exact:
+        # split the buried area of each atom among its neighboring chains
+        atomPartner, counts = numpy.unique(i * nChains + atomChain[j], return_counts=True)
+        atoms, partners = atomPartner // nChains, atomPartner % nChains
+        share = buried[atoms] * counts / numpy.bincount(i, minlength=len(buried))[atoms]
+        numpy.add.at(matrix, (atomChain[atoms], partners), share)
+        matrix = matrix + matrix.T
+    else:
+        chainArea = numpy.bincount(atomChain, weights=isolatedArea, minlength=nChains)
+        touching = sorted(set(zip(atomChain[i].tolist(), atomChain[j].tolist())))
+        touching = [(a, b) for (a, b) in touching if a < b]
+        pairs = ['%s and (chain "%s" or chain "%s")' % (tempC, chainIDs[a], chainIDs[b]) for (a, b) in touching]
+        areas = None
+        if processes > 1 and pairs:
+            # The pairs are written to files only for the worker processes; the
+            # B-factors carry the radii of this session, which loading would reset.
+            workDirectory = tempfile.mkdtemp(prefix='interfaceMatrix')
+            try:
+                cmd.alter(tempC, "b=vdw")
+                files = [os.path.join(workDirectory, 'pair%d.cif' % n) for n in range(len(pairs))]
+                for fileName, pair in zip(files, pairs):
+                    cmd.save(fileName, pair)
+                areas = _pair_areas(files, processes, cmd.get("dot_density"), probe)
+            except OSError as e:
+                print("Could not start the worker processes: %s" % e)
+            finally:
+                shutil.rmtree(workDirectory, ignore_errors=True)
+            if areas is None:
+                print("Computing the pairs in this session.")
+        if areas is None:
+            areas = []
+            tempPair = cmd.get_unused_name("__tmpPair")
+            for pair in pairs:
+                cmd.create(tempPair, pair)
+                areas.append(cmd.get_area(tempPair))
+                cmd.delete(tempPair)
+        for (a, b), pairArea in zip(touching, areas):
+            matrix[a, b] = matrix[b, a] = chainArea[a] + chainArea[b] - pairArea
+
+    cmd.delete(tempC)
+    # reset users settings
+    cmd.set("dot_solvent", oldDS)
+
+    if not quiet:
+        print("Buried surface area (A**2) between pairs of chains in %s:" % cmpx)
+        print("      " + "".join("%9s" % chain for chain in chainIDs))
+        for n, chain in enumerate(chainIDs):
+            print("%6s" % chain + "".join("%9.1f" % value for value in matrix[n]))
+
+    return chainIDs, matrix
+
+cmd.extend('interfaceMatrix', interfaceMatrix)
+
+
 def iterm():
     ''' 
     DESCRIPTION:
@@ -10411,25 +11328,15 @@ def iterm():
 
     PYTHON CODE:
 def iterm():
-    try:
-        print("Opening an iTerm window.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.Popen(itermOpen)
-        print("Opened an iTerm window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening an iTerm window.")
+    _launch_app('iterm', itermOpen)
 
 
 cmd.extend('iterm',iterm)
     '''
 
-    try:
-        print("Opening an iTerm window.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.Popen(itermOpen)
-        print("Opened an iTerm window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening an iTerm window.")
+    _launch_app('iterm', itermOpen)
 
 
 cmd.extend('iterm',iterm)
@@ -10460,28 +11367,14 @@ def jabref():
         subprocess.call(jabrefOpen);return
     PYTHON CODE:
 def jabref():
-    try:
-        print("Opening the bibliography manager JabRef.");
-        subprocess.check_output(JabRefOpen)
-        print("Success opening JabRef.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jabrefOpen'. \n  Or use 'jabrefPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the bibliography manager JabRef.")
+    _launch_app('jabref', JabRefOpen)
 
 cmd.extend('jabref',jabref)
     '''
 
-    try:
-        print("Opening the bibliography manager JabRef.");
-        subprocess.check_output(JabRefOpen)
-        print("Success opening JabRef.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jabrefOpen'. \n  Or use 'jabrefPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the bibliography manager JabRef.")
+    _launch_app('jabref', JabRefOpen)
 
 cmd.extend('jabref',jabref)
 
@@ -10514,28 +11407,14 @@ def jedit(fileName="test.pml"):
 
     PYTHON CODE:
 def jedit(fileName="test.pml"):
-    try:
-        print("Opening the molecular graphics program jedit.");
-        subprocess.check_output(jeditOpen)
-        print("Success opening jedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the jeditOpen'. \n  Or use 'jeditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program jedit.")
+    _launch_app('jedit', jeditOpen)
 
 cmd.extend('jedit',jedit)
     '''
 
-    try:
-        print("Opening the molecular graphics program jedit.");
-        subprocess.check_output(jeditOpen)
-        print("Success opening jedit.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the jeditOpen'. \n  Or use 'jeditPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program jedit.")
+    _launch_app('jedit', jeditOpen)
 
 cmd.extend('jedit',jedit)
 
@@ -10572,28 +11451,14 @@ def jmol():
 
     PYTHON CODE:
 def jmol():
-    try:
-        print("Opening the molecular graphics program JMOL.");
-        subprocess.check_output(jmolOpen)
-        print("Success opening JMOL.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jmolOpen'. \n  Or use 'jmolPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program JMOL.")
+    _launch_app('jmol', jmolOpen)
 
 cmd.extend('jmol',jmol)
     '''
 
-    try:
-        print("Opening the molecular graphics program JMOL.");
-        subprocess.check_output(jmolOpen)
-        print("Success opening JMOL.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'jmolOpen'. \n  Or use 'jmolPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program JMOL.")
+    _launch_app('jmol', jmolOpen)
 
 cmd.extend('jmol',jmol)
 
@@ -10626,28 +11491,14 @@ def julia():
 
     PYTHON CODE:
 def julia():
-    try:
-        print("Opening the REPL of the programming language julia REPL.");
-        subprocess.check_output(juliaOpen)
-        print("Success opening julia.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'juliaOpen'. \n  Or use 'juliaPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the REPL of the programming language julia REPL.")
+    _launch_app('julia', juliaOpen)
 
 cmd.extend('julia',julia)
     '''
 
-    try:
-        print("Opening the REPL of the programming language julia REPL.");
-        subprocess.check_output(juliaOpen)
-        print("Success opening julia.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'juliaOpen'. \n  Or use 'juliaPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the REPL of the programming language julia REPL.")
+    _launch_app('julia', juliaOpen)
 
 cmd.extend('julia',julia)
 
@@ -10681,29 +11532,15 @@ def juliapro():
 
     PYTHON CODE:
 def juliapro():
-    try:
-        print("Please be patient. Juliapro depends on atom which starts slowly.");
-        subprocess.check_output(juliaproOpen)
-        print("Success opening juliapro")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'juliaproOpen'. \n  Or use 'juliaproPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Please be patient. Juliapro depends on atom which starts slowly.")
+    _launch_app('juliapro', juliaproOpen)
 
 cmd.extend('juliapro',juliapro)
 
     '''
 
-    try:
-        print("Please be patient. Juliapro depends on atom which starts slowly.");
-        subprocess.check_output(juliaproOpen)
-        print("Success opening juliapro")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'juliaproOpen'. \n  Or use 'juliaproPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Please be patient. Juliapro depends on atom which starts slowly.")
+    _launch_app('juliapro', juliaproOpen)
 
 cmd.extend('juliapro',juliapro)
 
@@ -10738,30 +11575,16 @@ def mate():
 
     PYTHON CODE:
 def mate():
-    try:
-        print("Opening the molecular graphics program mate.");
-        subprocess.check_output(textMateOpen)
-        print("Success opening mate.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the mateOpen'. \n  Or use 'matePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program mate.")
+    _launch_app('mate', textMateOpen)
 
 cmd.extend('mate',mate)
 
 
     '''
 
-    try:
-        print("Opening the molecular graphics program mate.");
-        subprocess.check_output(textMateOpen)
-        print("Success opening mate.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the mateOpen'. \n  Or use 'matePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program mate.")
+    _launch_app('mate', textMateOpen)
 
 cmd.extend('mate',mate)
 
@@ -10835,13 +11658,13 @@ def nmroff():
 
     cmd.do('set all_states, off')
 
-cmd.extend("nmr", nmr)
+cmd.extend("nmroff", nmroff)
 
     '''
 
     cmd.do('set all_states, off')
 
-cmd.extend("nmr", nmr)
+cmd.extend("nmroff", nmroff)
 
 
 
@@ -10872,28 +11695,14 @@ def npp():
 
     PYTHON CODE:
 def npp():
-    try:
-        print("Opening the molecular graphics program notepad++.");
-        subprocess.check_output(nppOpen)
-        print("Success opening notepad++.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the nppOpen'. \n  Or use 'nppPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program notepad++.")
+    _launch_app('npp', nppOpen)
 
 cmd.extend('npp',npp)
     '''
 
-    try:
-        print("Opening the molecular graphics program notepad++.");
-        subprocess.check_output(nppOpen)
-        print("Success opening notepad++.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the nppOpen'. \n  Or use 'nppPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program notepad++.")
+    _launch_app('npp', nppOpen)
 
 cmd.extend('npp',npp)
 
@@ -10924,28 +11733,14 @@ def nv():
 
     PYTHON CODE:
 def nv():
-    try:
-        print("Opening the text editor neovim.");
-        subprocess.check_output(neovimOpen)
-        print("Success opening neovim.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the neovimOpen'. \n  Or use 'neovimPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor neovim.")
+    _launch_app('nv', neovimOpen)
 
 cmd.extend('nv',nv)
     '''
 
-    try:
-        print("Opening the text editor neovim.");
-        subprocess.check_output(neovimOpen)
-        print("Success opening neovim.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the neovimOpen'. \n  Or use 'neovimPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor neovim.")
+    _launch_app('nv', neovimOpen)
 
 cmd.extend('nv',nv)
 
@@ -10977,28 +11772,14 @@ def oc():
 
     PYTHON CODE:
 def oc():
-    try:
-        print("Opening octave.");
-        subprocess.check_output(octaveOpen)
-        print("Success opening octave.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'octaveOpen'. \n  Or use 'octavePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening octave.")
+    _launch_app('oc', octaveOpen)
 
 cmd.extend('oc',oc)
     '''
 
-    try:
-        print("Opening octave.");
-        subprocess.check_output(octaveOpen)
-        print("Success opening octave.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'octaveOpen'. \n  Or use 'octavePath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening octave.")
+    _launch_app('oc', octaveOpen)
 
 cmd.extend('oc',oc)
 
@@ -11225,27 +12006,13 @@ def oni():
 
     PYTHON CODE:
 def oni():
-    try:
-        print("Opening the text editor oni.");
-        subprocess.check_output(oniOpen)
-        print("Success opening oni.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'oniOpen'. \n  Or use 'oniPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor oni.")
+    _launch_app('oni', oniOpen)
 cmd.extend('oni',oni)
     '''
 
-    try:
-        print("Opening the text editor oni.");
-        subprocess.check_output(oniOpen)
-        print("Success opening oni.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'oniOpen'. \n  Or use 'oniPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor oni.")
+    _launch_app('oni', oniOpen)
 cmd.extend('oni',oni)
 
 
@@ -11445,6 +12212,175 @@ cmd.extend('oz',oz)
 cmd.extend('oz',oz)
 
 
+def packingContacts(object=None, cutoff=4.0, cells=1, mates='full', prefix='pack', quiet=0):
+    ''' 
+    DESCRIPTION:
+    Create only the symmetry mates that touch the asymmetric unit and return a table of their contacts.
+
+    USAGE:
+    packingContacts [object, [cutoff, [cells, [mates, [prefix, [quiet]]]]]]
+
+    ARGUMENTS:
+    object = string: object with the crystal symmetry {default: first object}
+    cutoff = float: largest distance between heavy atoms in contact in Angstroms {default: 4.0}
+    cells = int: number of unit cells searched in each direction around the asymmetric unit {default: 1}
+    mates = string: full, trace (CA and P atoms only), or cgo (one CGO object <prefix>_mates); see supercell {default: full}
+    prefix = string: prefix of the names of the new objects {default: pack}
+    quiet = 0 or 1: do not print the summary of the contacts {default: 0}
+
+    EXAMPLE:
+    packingContacts 3nd4, 3.5
+    packingContacts 4pco, 4.0, 1, trace
+
+    MORE DETAILS:
+    Makes figures of crystal packing without the full expansion of sc222 or 
+    sc333. Every combination of a symmetry operator and a lattice translation
+    within cells unit cells of the asymmetric unit is tested. A combination
+    is skipped at once when the bounding spheres of the asymmetric unit and
+    of the mate are farther apart than the cutoff. The heavy atoms of the
+    remaining mates are compared with the heavy atoms of the asymmetric unit
+    with a cell-list search (the spatial index used by pairD). Only mates 
+    with at least one contact within the cutoff are created.
+
+    RETURNS
+        A NumPy structured array with one record per pair of residues in 
+        contact and the fields ( mate, operator, a, b, c, chain1, resi1, 
+        resn1, chain2, resi2, resn2, distance ). chain1, resi1, and resn1 are 
+        in the asymmetric unit; a, b, c is the lattice translation of the 
+        mate relative to the cell of the asymmetric unit; distance is the 
+        shortest distance between the two residues.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def packingContacts(object=None, cutoff=4.0, cells=1, mates='full', prefix='pack', quiet=0):
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
+    if object is None:
+        object = cmd.get_object_list()[0]
+    cutoff, cells, quiet = float(cutoff), int(cells), int(quiet)
+
+    # residues and coordinates from one pass, so that their rows match
+    atoms = []
+    cmd.iterate_state(1, '(%s) and not hydro' % object, 'atoms.append((chain, resi, resn, x, y, z))', space={'atoms': atoms})
+    residues = [atom[0:3] for atom in atoms]
+    xyz = numpy.array([atom[3:6] for atom in atoms], dtype=float).reshape(-1, 3)
+    center = xyz.mean(axis=0)
+    radius = numpy.sqrt(((xyz - center) ** 2).sum(axis=1)).max()
+
+    basis, basisInverse, operators = _symmetry_operators(object)
+    homeCell = numpy.floor(basisInverse.dot(numpy.append(center, 1.0))[0:3]).astype(int)
+    steps = range(-cells, cells + 1)
+    translations = [(i, j, k) for i in steps for j in steps for k in steps]
+    # the mates are placed around the same center that sets the home cell
+    transforms = _cell_transforms(object, [homeCell + t for t in translations], center)
+
+    names, kept, colors, rows = [], [], [], []
+    tested = 0
+    for m, translation in enumerate(translations):
+        for n in range(len(operators)):
+            mat = transforms[m, n]
+            if numpy.allclose(mat, numpy.identity(4)):
+                continue
+            tested += 1
+            mateCenter = mat[0:3, 0:3].dot(center) + mat[0:3, 3]
+            if numpy.sqrt(((mateCenter - center) ** 2).sum()) > 2 * radius + cutoff:
+                continue
+            i, j, d = _neighbor_pairs(xyz, xyz.dot(mat[0:3, 0:3].T) + mat[0:3, 3], cutoff)
+            if len(i) == 0:
+                continue
+            name = '%s%02d' % (prefix, len(names) + 1)
+            names.append(name)
+            kept.append(mat)
+            colors.append(n + 2)
+            closest = {}
+            for atom1, atom2, distance in zip(i, j, d):
+                key = residues[atom1] + residues[atom2]
+                if key not in closest or distance < closest[key]:
+                    closest[key] = distance
+            for key in sorted(closest):
+                rows.append((name, n + 1) + tuple(translation) + key + (closest[key],))
+
+    if kept:
+        _make_mates(object, names, kept, colors, mates, '%s_mates' % prefix)
+    if not quiet:
+        print("%d of %d symmetry mates are within %.1f Angstroms of %s." % (len(names), tested, cutoff, object))
+        for name in names:
+            mateRows = [row for row in rows if row[0] == name]
+            print("%s: operator %d, translation (%d, %d, %d), %d residue pairs" % ((name,) + mateRows[0][1:5] + (len(mateRows),)))
+    return _record_array(rows, [('mate', 'U'), ('operator', 'i4'), ('a', 'i4'), ('b', 'i4'), ('c', 'i4'),
+        ('chain1', 'U'), ('resi1', 'U'), ('resn1', 'U'), ('chain2', 'U'), ('resi2', 'U'), ('resn2', 'U'),
+        ('distance', 'f4')])
+
+cmd.extend('packingContacts', packingContacts)
+    '''
+
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
+    if object is None:
+        object = cmd.get_object_list()[0]
+    cutoff, cells, quiet = float(cutoff), int(cells), int(quiet)
+
+    # residues and coordinates from one pass, so that their rows match
+    atoms = []
+    cmd.iterate_state(1, '(%s) and not hydro' % object, 'atoms.append((chain, resi, resn, x, y, z))', space={'atoms': atoms})
+    residues = [atom[0:3] for atom in atoms]
+    xyz = numpy.array([atom[3:6] for atom in atoms], dtype=float).reshape(-1, 3)
+    center = xyz.mean(axis=0)
+    radius = numpy.sqrt(((xyz - center) ** 2).sum(axis=1)).max()
+
+    basis, basisInverse, operators = _symmetry_operators(object)
+    homeCell = numpy.floor(basisInverse.dot(numpy.append(center, 1.0))[0:3]).astype(int)
+    steps = range(-cells, cells + 1)
+    translations = [(i, j, k) for i in steps for j in steps for k in steps]
+    # the mates are placed around the same center that sets the home cell
+    transforms = _cell_transforms(object, [homeCell + t for t in translations], center)
+
+    names, kept, colors, rows = [], [], [], []
+    tested = 0
+    for m, translation in enumerate(translations):
+        for n in range(len(operators)):
+            mat = transforms[m, n]
+            if numpy.allclose(mat, numpy.identity(4)):
+                continue
+            tested += 1
+            mateCenter = mat[0:3, 0:3].dot(center) + mat[0:3, 3]
+            if numpy.sqrt(((mateCenter - center) ** 2).sum()) > 2 * radius + cutoff:
+                continue
+            i, j, d = _neighbor_pairs(xyz, xyz.dot(mat[0:3, 0:3].T) + mat[0:3, 3], cutoff)
+            if len(i) == 0:
+                continue
+            name = '%s%02d' % (prefix, len(names) + 1)
+            names.append(name)
+            kept.append(mat)
+            colors.append(n + 2)
+            closest = {}
+            for atom1, atom2, distance in zip(i, j, d):
+                key = residues[atom1] + residues[atom2]
+                if key not in closest or distance < closest[key]:
+                    closest[key] = distance
+            for key in sorted(closest):
+                rows.append((name, n + 1) + tuple(translation) + key + (closest[key],))
+
+    if kept:
+        _make_mates(object, names, kept, colors, mates, '%s_mates' % prefix)
+    if not quiet:
+        print("%d of %d symmetry mates are within %.1f Angstroms of %s." % (len(names), tested, cutoff, object))
+        for name in names:
+            mateRows = [row for row in rows if row[0] == name]
+            print("%s: operator %d, translation (%d, %d, %d), %d residue pairs" % ((name,) + mateRows[0][1:5] + (len(mateRows),)))
+    return _record_array(rows, [('mate', 'U'), ('operator', 'i4'), ('a', 'i4'), ('b', 'i4'), ('c', 'i4'),
+        ('chain1', 'U'), ('resi1', 'U'), ('resn1', 'U'), ('chain2', 'U'), ('resi2', 'U'), ('resn2', 'U'),
+        ('distance', 'f4')])
+
+cmd.extend('packingContacts', packingContacts)
+
+
 def pairD(sel1, sel2, max_dist, output="N", sidechain="N", show="N"):
     ''' 
     DESCRIPTION:
@@ -11471,6 +12407,10 @@ pairD i. 80, i. 89, 20, output=P, sidechain=Y, show=Y
     sidechain: limits (Y) results to sidechain atoms (default N)
     show: shows (Y) individual distances in pymol menu (default=N)
 
+    The pairs of atoms are found with a cell list (see _neighbor_pairs) 
+    in one vectorized pass, so the time grows with the number of atoms 
+    rather than with the product of the sizes of the two selections.
+
 
     VERTICAL PML SCRIPT:
     NA
@@ -11483,17 +12423,18 @@ def pairD(sel1, sel2, max_dist, output="N", sidechain="N", show="N"):
     cmd.delete ("dist*")
     extra=""
     if sidechain=="Y": extra=" and not name c+o+n"
+    max_dist=str(max_dist)
 
     #builds models
-    m1=cmd.get_model(sel2+" around "+str(max_dist)+" and "+sel1+extra)
+    m1=cmd.get_model(sel2+" around "+max_dist+" and "+sel1+extra)
     m1o=cmd.get_object_list(sel1)
-    m2=cmd.get_model(sel1+" around "+str(max_dist)+" and "+sel2+extra)
+    m2=cmd.get_model(sel1+" around "+max_dist+" and "+sel2+extra)
     m2o=cmd.get_object_list(sel2)
 
     #defines selections
-    cmd.select("__tsel1a", sel1+" around "+str(max_dist)+" and "+sel2+extra)
+    cmd.select("__tsel1a", sel1+" around "+max_dist+" and "+sel2+extra)
     cmd.select("__tsel1", "__tsel1a and "+sel2+extra)
-    cmd.select("__tsel2a", sel2+" around "+str(max_dist)+" and "+sel1+extra)
+    cmd.select("__tsel2a", sel2+" around "+max_dist+" and "+sel1+extra)
     cmd.select("__tsel2", "__tsel2a and "+sel1+extra)
     cmd.select("IntAtoms_"+max_dist, "__tsel1 or __tsel2")
     cmd.select("IntRes_"+max_dist, "byres IntAtoms_"+max_dist)
@@ -11506,16 +12447,16 @@ def pairD(sel1, sel2, max_dist, output="N", sidechain="N", show="N"):
         print("warning, '"+sel2+extra+"' does not contain any atoms.")
         return
 
-    #measures distances
-    s=""
-    counter=0
-    for c1 in range(len(m1.atom)):
-        for c2 in range(len(m2.atom)):
-            distance=math.sqrt(sum(map(lambda f: (f[0]-f[1])**2, zip(m1.atom[c1].coord,m2.atom[c2].coord))))
-            if distance<float(max_dist):
-                s+="%s/%s/%s/%s/%s to %s/%s/%s/%s/%s: %.3f\n" % (m1o[0],m1.atom[c1].chain,m1.atom[c1].resn,m1.atom[c1].resi,m1.atom[c1].name,m2o[0],m2.atom[c2].chain,m2.atom[c2].resn,m2.atom[c2].resi,m2.atom[c2].name, distance)
-                counter+=1
-                if show=="Y": cmd.distance (m1o[0]+" and "+m1.atom[c1].chain+"/"+m1.atom[c1].resi+"/"+m1.atom[c1].name, m2o[0]+" and "+m2.atom[c2].chain+"/"+m2.atom[c2].resi+"/"+m2.atom[c2].name)
+    #measures distances in one pass over a cell list instead of over all pairs
+    xyz1=numpy.array([a.coord for a in m1.atom], dtype=float)
+    xyz2=numpy.array([a.coord for a in m2.atom], dtype=float)
+    pairs1, pairs2, distances = _neighbor_pairs(xyz1, xyz2, float(max_dist))
+    lines=[]
+    for c1, c2, distance in zip(pairs1.tolist(), pairs2.tolist(), distances.tolist()):
+        a1, a2 = m1.atom[c1], m2.atom[c2]
+        lines.append("%s/%s/%s/%s/%s to %s/%s/%s/%s/%s: %.3f\n" % (m1o[0],a1.chain,a1.resn,a1.resi,a1.name,m2o[0],a2.chain,a2.resn,a2.resi,a2.name, distance))
+        if show=="Y": cmd.distance (m1o[0]+" and "+a1.chain+"/"+a1.resi+"/"+a1.name, m2o[0]+" and "+a2.chain+"/"+a2.resi+"/"+a2.name)
+    counter=len(lines)
 
     #controler-2
     if counter==0:
@@ -11523,11 +12464,12 @@ def pairD(sel1, sel2, max_dist, output="N", sidechain="N", show="N"):
         return
 
     #outputs
+    s="".join(lines)
     if output=="S": print(s)
     if output=="P":
         f=open('IntAtoms_'+max_dist+'.txt','w')
         f.write("Number of distances calculated: %s\n" % (counter))
-        f.write(s)
+        f.writelines(lines)
         f.close()
         print("Results saved in IntAtoms_%s.txt" % max_dist)
     print("Number of distances calculated: %s" % (counter))
@@ -11541,17 +12483,18 @@ cmd.extend('pairD', pairD)
     cmd.delete ("dist*")
     extra=""
     if sidechain=="Y": extra=" and not name c+o+n"
+    max_dist=str(max_dist)
 
     #builds models
-    m1=cmd.get_model(sel2+" around "+str(max_dist)+" and "+sel1+extra)
+    m1=cmd.get_model(sel2+" around "+max_dist+" and "+sel1+extra)
     m1o=cmd.get_object_list(sel1)
-    m2=cmd.get_model(sel1+" around "+str(max_dist)+" and "+sel2+extra)
+    m2=cmd.get_model(sel1+" around "+max_dist+" and "+sel2+extra)
     m2o=cmd.get_object_list(sel2)
 
     #defines selections
-    cmd.select("__tsel1a", sel1+" around "+str(max_dist)+" and "+sel2+extra)
+    cmd.select("__tsel1a", sel1+" around "+max_dist+" and "+sel2+extra)
     cmd.select("__tsel1", "__tsel1a and "+sel2+extra)
-    cmd.select("__tsel2a", sel2+" around "+str(max_dist)+" and "+sel1+extra)
+    cmd.select("__tsel2a", sel2+" around "+max_dist+" and "+sel1+extra)
     cmd.select("__tsel2", "__tsel2a and "+sel1+extra)
     cmd.select("IntAtoms_"+max_dist, "__tsel1 or __tsel2")
     cmd.select("IntRes_"+max_dist, "byres IntAtoms_"+max_dist)
@@ -11564,16 +12507,16 @@ cmd.extend('pairD', pairD)
         print("warning, '"+sel2+extra+"' does not contain any atoms.")
         return
 
-    #measures distances
-    s=""
-    counter=0
-    for c1 in range(len(m1.atom)):
-        for c2 in range(len(m2.atom)):
-            distance=math.sqrt(sum(map(lambda f: (f[0]-f[1])**2, zip(m1.atom[c1].coord,m2.atom[c2].coord))))
-            if distance<float(max_dist):
-                s+="%s/%s/%s/%s/%s to %s/%s/%s/%s/%s: %.3f\n" % (m1o[0],m1.atom[c1].chain,m1.atom[c1].resn,m1.atom[c1].resi,m1.atom[c1].name,m2o[0],m2.atom[c2].chain,m2.atom[c2].resn,m2.atom[c2].resi,m2.atom[c2].name, distance)
-                counter+=1
-                if show=="Y": cmd.distance (m1o[0]+" and "+m1.atom[c1].chain+"/"+m1.atom[c1].resi+"/"+m1.atom[c1].name, m2o[0]+" and "+m2.atom[c2].chain+"/"+m2.atom[c2].resi+"/"+m2.atom[c2].name)
+    #measures distances in one pass over a cell list instead of over all pairs
+    xyz1=numpy.array([a.coord for a in m1.atom], dtype=float)
+    xyz2=numpy.array([a.coord for a in m2.atom], dtype=float)
+    pairs1, pairs2, distances = _neighbor_pairs(xyz1, xyz2, float(max_dist))
+    lines=[]
+    for c1, c2, distance in zip(pairs1.tolist(), pairs2.tolist(), distances.tolist()):
+        a1, a2 = m1.atom[c1], m2.atom[c2]
+        lines.append("%s/%s/%s/%s/%s to %s/%s/%s/%s/%s: %.3f\n" % (m1o[0],a1.chain,a1.resn,a1.resi,a1.name,m2o[0],a2.chain,a2.resn,a2.resi,a2.name, distance))
+        if show=="Y": cmd.distance (m1o[0]+" and "+a1.chain+"/"+a1.resi+"/"+a1.name, m2o[0]+" and "+a2.chain+"/"+a2.resi+"/"+a2.name)
+    counter=len(lines)
 
     #controler-2
     if counter==0:
@@ -11581,11 +12524,12 @@ cmd.extend('pairD', pairD)
         return
 
     #outputs
+    s="".join(lines)
     if output=="S": print(s)
     if output=="P":
         f=open('IntAtoms_'+max_dist+'.txt','w')
         f.write("Number of distances calculated: %s\n" % (counter))
-        f.write(s)
+        f.writelines(lines)
         f.close()
         print("Results saved in IntAtoms_%s.txt" % max_dist)
     print("Number of distances calculated: %s" % (counter))
@@ -11627,32 +12571,251 @@ def pdbed():
 
     PYTHON CODE:
 def pdbed():
-    try:
-        print("Opening PDB_Editor.");
-        subprocess.check_output(pdbeditorOpen)
-        print("Success opening PDBeditor.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'pdbeditorOpen'. \n  Or use 'pdbeditorPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening PDB_Editor.")
+    _launch_app('pdbed', pdbeditorOpen)
 
 cmd.extend('pdbed',pdbed)
     '''
 
-    try:
-        print("Opening PDB_Editor.");
-        subprocess.check_output(pdbeditorOpen)
-        print("Success opening PDBeditor.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'pdbeditorOpen'. \n  Or use 'pdbeditorPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening PDB_Editor.")
+    _launch_app('pdbed', pdbeditorOpen)
 
 cmd.extend('pdbed',pdbed)
 
 
+_assemblyIndex = {}
+_assemblyCategories = ('_pdbx_struct_assembly_gen', '_pdbx_struct_oper_list')
+_cifToken = re.compile(r"""'(?:[^']|'(?=\S))*'|"(?:[^"]|"(?=\S))*"|\S+""")
+
+
+def _open_text(filename):
+    '''Open a plain or gzipped text file for reading, or return an open file as it is.'''
+    if not isinstance(filename, str):
+        return filename
+    if filename.endswith('.gz'):
+        import gzip
+        return gzip.open(filename, 'rt')
+    return open(filename)
+
+
+def _header_lines(f):
+    '''Yield the lines of f as text; the caller stops reading where the header ends.'''
+    for line in f:
+        if isinstance(line, bytes):
+            line = line.decode('latin-1')
+        yield line
+
+
+def _pdb_header(lines):
+    '''Return {remarkNum: [lines]} from the REMARK records that come before the first coordinate record.'''
+    remarks = dict()
+    for line in lines:
+        recname = line[0:6]
+        if recname in ('ATOM  ', 'HETATM', 'MODEL '):
+            break
+        if recname == 'REMARK':
+            num = int(line[7:10])
+            lstring = line[11:]
+            remarks.setdefault(num, []).append(lstring)
+    return remarks
+
+
+def _pdb_assemblies(rem350):
+    '''Return {biomolecule: {chains: {num: [12 floats]}}} for all biomolecules in REMARK 350.'''
+    assemblies = dict()
+    biomt = None
+    chains = tuple()
+    for line in rem350:
+        if line.startswith('BIOMOLECULE:'):
+            biomt = assemblies.setdefault(line[12:].strip(), dict())
+        elif line.startswith('APPLY THE FOLLOWING TO CHAINS:'):
+            chains = tuple(chain.strip() for chain in line[30:].split(',') if chain.strip())
+        elif line.startswith('                   AND CHAINS:'):
+            chains += tuple(chain.strip() for chain in line[30:].split(',') if chain.strip())
+        elif line.startswith('  BIOMT'):
+            if biomt is None:
+                biomt = assemblies.setdefault('1', dict())
+            num = int(line[8:12])
+            vec = [float(value) for value in line[12:].split()]
+            biomt.setdefault(chains, dict()).setdefault(num, []).extend(vec)
+    return assemblies
+
+
+def _cif_tokens(lines):
+    '''Yield the tokens of mmCIF text. Quotes are kept; a text field is one token that starts with ";".'''
+    text = None
+    for line in lines:
+        if text is not None:
+            if line.startswith(';'):
+                yield ';' + ''.join(text).strip()
+                text = None
+            else:
+                text.append(line)
+            continue
+        if line.startswith(';'):
+            text = [line[1:]]
+            continue
+        for token in _cifToken.findall(line):
+            if token.startswith('#'):
+                break
+            yield token
+
+
+def _cif_value(token):
+    '''Return the value of an mmCIF token without its quotes or text field marker.'''
+    if token[0] == ';':
+        return token[1:]
+    if len(token) > 1 and token[0] in '\'"' and token[-1] == token[0]:
+        return token[1:-1]
+    return token
+
+
+def _cif_categories(tokens, categories, stop='_atom_site.'):
+    '''
+    Return {category: [row dict]} for the categories of an mmCIF file.
+
+    Reading ends at the first item of the stop category, so the coordinates
+    are not parsed. Both the loop_ form and the single-row form of a category
+    are read. The keys of a row are the item names without the category.
+    '''
+    tables = dict((category, []) for category in categories)
+    tokens = iter(tokens)
+    token = next(tokens, None)
+    while token is not None:
+        if token.startswith(stop):
+            break
+        if token == 'loop_':
+            tags = []
+            token = next(tokens, None)
+            while token is not None and token.startswith('_'):
+                tags.append(token)
+                token = next(tokens, None)
+            if tags and tags[0].startswith(stop):
+                break
+            values = []
+            while token is not None and token != 'loop_' and not token.startswith(('_', 'data_')):
+                values.append(_cif_value(token))
+                token = next(tokens, None)
+            category = tags[0].split('.')[0] if tags else None
+            if category in tables:
+                items = [tag.split('.', 1)[1] for tag in tags]
+                for k in range(0, len(values) - len(items) + 1, len(items)):
+                    tables[category].append(dict(zip(items, values[k:k + len(items)])))
+            continue
+        if token.startswith('_'):
+            category, _, item = token.partition('.')
+            value = next(tokens, None)
+            if category in tables and value is not None:
+                if not tables[category]:
+                    tables[category].append(dict())
+                tables[category][0][item] = _cif_value(value)
+        token = next(tokens, None)
+    return tables
+
+
+def _cif_operator_products(expression, operators):
+    '''
+    Return the 12-float matrices of a _pdbx_struct_assembly_gen.oper_expression.
+
+    The expression is a list of operator ids with ranges, like 1,2,5 or 1-60,
+    or a product of such lists in parentheses, like (1-60)(61-88), in which
+    the operators on the right are applied first.
+    '''
+    groups = re.findall(r'\(([^)]*)\)', expression) or [expression]
+    products = [numpy.identity(4)]
+    for group in groups:
+        ids = []
+        for part in group.split(','):
+            first, dash, last = part.strip().partition('-')
+            if dash and first.isdigit() and last.isdigit():
+                ids.extend(str(k) for k in range(int(first), int(last) + 1))
+            elif part.strip():
+                ids.append(part.strip())
+        matrices = [numpy.array(operators[k] + [0, 0, 0, 1]).reshape(4, 4) for k in ids]
+        products = [product.dot(mat) for product in products for mat in matrices]
+    return [product[0:3].ravel().tolist() for product in products]
+
+
+def _cif_assemblies(tables):
+    '''Return {assembly: [[asym ids, num, [12 floats]], ...]} from the assembly categories of an mmCIF file.'''
+    operators = dict()
+    for row in tables['_pdbx_struct_oper_list']:
+        mat = []
+        for i in (1, 2, 3):
+            mat.extend(float(row['matrix[%d][%d]' % (i, j)]) for j in (1, 2, 3))
+            mat.append(float(row['vector[%d]' % i]))
+        operators[row['id']] = mat
+    assemblies = dict()
+    for row in tables['_pdbx_struct_assembly_gen']:
+        chains = [chain.strip() for chain in row['asym_id_list'].split(',') if chain.strip()]
+        copies = assemblies.setdefault(row['assembly_id'], [])
+        for mat in _cif_operator_products(row['oper_expression'], operators):
+            copies.append([chains, len(copies) + 1, mat])
+    return assemblies
+
+
+def _assembly_index():
+    '''Return the index of biological assemblies. It is read from disk once per session.'''
+    if not _assemblyIndex and os.path.exists(assemblyIndexFile):
+        with open(assemblyIndexFile) as f:
+            _assemblyIndex.update(json.load(f))
+    return _assemblyIndex
+
+
+def _save_assembly_index():
+    '''Write the index of biological assemblies to assemblyIndexFile.'''
+    index = _assembly_index()
+    if not os.path.isdir(os.path.dirname(assemblyIndexFile)):
+        os.makedirs(os.path.dirname(assemblyIndexFile))
+    with open(assemblyIndexFile + '.part', 'w') as f:
+        json.dump(index, f, sort_keys=True)
+    if os.path.exists(assemblyIndexFile):
+        os.remove(assemblyIndexFile)
+    os.rename(assemblyIndexFile + '.part', assemblyIndexFile)
+
+
+def _read_assemblies(filename, save=True):
+    '''
+    Return the index entry with the biological assemblies of a PDB or mmCIF file.
+
+    The entry is a dict with the keys size and mtime of the file, selector
+    ('chain' for PDB files and 'segi' for mmCIF files, whose asym ids PyMOL
+    stores in segi), and assemblies, which maps each assembly id to a list
+    of [chains, num, [12 floats]]. Only the assemblies are indexed; reading
+    stops at the first coordinate record. Entries are kept in 
+    assemblyIndexFile and reused while the size and modification time of
+    the file are unchanged, so an indexed file is not opened again.
+    '''
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    index = _assembly_index()
+    entry = index.get(path)
+    if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+        return entry
+
+    f = _open_text(path)
+    try:
+        lines = _header_lines(f)
+        stem = path[:-3] if path.endswith('.gz') else path
+        if stem.endswith(('.cif', '.mmcif')):
+            selector = 'segi'
+            assemblies = _cif_assemblies(_cif_categories(_cif_tokens(lines), _assemblyCategories))
+        else:
+            selector = 'chain'
+            assemblies = dict()
+            for biomolecule, biomt in _pdb_assemblies(_pdb_header(lines).get(350, [])).items():
+                assemblies[biomolecule] = [[list(chains), num, mat]
+                    for chains, matrices in biomt.items() for num, mat in matrices.items()]
+    finally:
+        f.close()
+
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime, 'selector': selector, 'assemblies': assemblies}
+    index[path] = entry
+    if save:
+        _save_assembly_index()
+    return entry
+
+
 def pdbremarks(filename):
     ''' 
     DESCRIPTION:
@@ -11674,47 +12837,33 @@ Called by the function quat().
     Return dictionary with remarkNum as key and list of lines as value.
     Called by the function quat().
 
+    The file can be gzipped (.gz) or an open file. Reading stops at the 
+    first ATOM, HETATM, or MODEL record, so the coordinates are not read.
+
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
 def pdbremarks(filename):
-    remarks = dict()
-    if not isinstance(filename, basestring):
-        f = filename
-    elif filename[-3:] == '.gz':
-        import gzip
-        f = gzip.open(filename)
-    else:
-        f = open(filename)
-    for line in f:
-        recname = line[0:6]
-        if recname == 'REMARK':
-            num = int(line[7:10])
-            lstring = line[11:]
-            remarks.setdefault(num, []).append(lstring)
-    return remarks
+    f = _open_text(filename)
+    try:
+        return _pdb_header(_header_lines(f))
+    finally:
+        if f is not filename:
+            f.close()
 
 cmd.extend('pdbremarks', pdbremarks)
     '''
 
-    remarks = dict()
-    if not isinstance(filename, basestring):
-        f = filename
-    elif filename[-3:] == '.gz':
-        import gzip
-        f = gzip.open(filename)
-    else:
-        f = open(filename)
-    for line in f:
-        recname = line[0:6]
-        if recname == 'REMARK':
-            num = int(line[7:10])
-            lstring = line[11:]
-            remarks.setdefault(num, []).append(lstring)
-    return remarks
+    f = _open_text(filename)
+    try:
+        return _pdb_header(_header_lines(f))
+    finally:
+        if f is not filename:
+            f.close()
 
 cmd.extend('pdbremarks', pdbremarks)
 
@@ -11747,51 +12896,93 @@ def ppt():
 
     PYTHON CODE:
 def ppt():
-    try:
-        print("Opening the MS powerpoint.");
-        subprocess.check_output(pptOpen)
-        print("Success opening ppt.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'pptOpen'. \n  Or use 'pptPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the MS powerpoint.")
+    _launch_app('ppt', pptOpen)
 cmd.extend('ppt',ppt)
     '''
 
-    try:
-        print("Opening the MS powerpoint.");
-        subprocess.check_output(pptOpen)
-        print("Success opening ppt.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'pptOpen'. \n  Or use 'pptPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the MS powerpoint.")
+    _launch_app('ppt', pptOpen)
 cmd.extend('ppt',ppt)
 
 
-def quat(name=None, filename=None, prefix=None, quiet=0):
+def _build_assembly(object, name, copies, selector='chain', mode='segments'):
+    '''
+    Build the copies of a biological assembly of object as the single object name.
+
+    copies is a list of [chains, num, [12 floats]] from the assembly index;
+    selector is 'chain' or 'segi', the atom property that holds the chains.
+    In the segments mode, the coordinates of each chain group are read once,
+    all of the operators of the group are applied to them in one NumPy 
+    operation, and the copies are loaded with one chempy model in which the
+    segi of every copy is num. In the states mode, copy k becomes state k of
+    name and is transformed in place. Return the number of atoms of name.
+    '''
+    import copy
+    from chempy import models
+    selection = '/%s//%s' if selector == 'chain' else '/%s/%s/'
+    cmd.delete(name)
+    if mode == 'states':
+        for state, (chains, num, matrix) in enumerate(copies, 1):
+            cmd.create(name, selection % (object, '+'.join(chains)), 1, state)
+            cmd.transform_object(name, list(matrix[0:12]) + [0, 0, 0, 1], state)
+        return cmd.count_atoms(name)
+
+    groups = dict()
+    for chains, num, matrix in copies:
+        groups.setdefault(tuple(chains), []).append((num, matrix[0:12]))
+    assembly = models.Indexed()
+    for chains, members in groups.items():
+        model = cmd.get_model(selection % (object, '+'.join(chains)))
+        if not model.atom:
+            continue
+        xyz = numpy.array(model.get_coord_list())
+        mats = numpy.array([matrix for num, matrix in members]).reshape(-1, 3, 4)
+        coords = numpy.einsum('kij,nj->kni', mats[:, :, 0:3], xyz) + mats[:, None, :, 3]
+        for (num, matrix), block in zip(members, coords.tolist()):
+            offset = len(assembly.atom)
+            segi = str(num)
+            for atom, coord in zip(model.atom, block):
+                atom = copy.copy(atom)
+                atom.segi = segi
+                atom.coord = coord
+                assembly.atom.append(atom)
+            for bond in model.bond:
+                bond = copy.copy(bond)
+                bond.index = [bond.index[0] + offset, bond.index[1] + offset]
+                assembly.bond.append(bond)
+    if not assembly.atom:
+        return 0
+    cmd.load_model(assembly, name)
+    return len(assembly.atom)
+
+
+def quat(name=None, filename=None, prefix=None, quiet=0, assembly=1, mode='objects'):
     ''' 
     DESCRIPTION:
     Runs Thomas Holder's quat.py script to generate a biological unit using crystallographic symmetry.
-    Requires a pdb file. The defult file type with the fetch command is *.cif.
-    When using fetch, add the optional parameter type=pdb.
+    Reads a pdb file or an mmCIF file. The defult file type with the fetch command is *.cif.
     Of course, you can also use type=pdb1 to retrieve the biological unit form the PDB. 
-    Reads REMARK 350 from the pdb file  `filename` and creates the biological unit (quaternary structure).
+    Reads REMARK 350 from the pdb file  `filename` (or _pdbx_struct_oper_list from the mmCIF file) and creates the biological unit (quaternary structure).
 
     USAGE:
-    quat [name [, filename [, prefix]]]
+    quat [name [, filename [, prefix [, quiet [, assembly [, mode]]]]]]
 
     ARGUMENTS:
     The code for a molecular object with symmetry information. 
     name = string: name of object and basename of PDB file, if filename is not given {default: first loaded object}
-    filename = string: file path {default: <name>.pdb}
+    filename = string: file path {default: <name>.pdb or <name>.cif}
     prefix = string: prefix for new objects {default: <name>}
+    quiet = 0 or 1: do not print the names of the new objects {default: 0}
+    assembly = string: id of the biological assembly (BIOMOLECULE in REMARK 350) {default: 1}
+    mode = string: objects, segments, or states; see below {default: objects}
 
     EXAMPLE:
     fetch 4dgr
     quat 4dgr
+    quat 1stp, assembly=2
+    quat 1m4x, mode=segments
+    quat 1m1k, mode=states
 
 
 
@@ -11808,14 +12999,34 @@ def quat(name=None, filename=None, prefix=None, quiet=0):
     See https://pymolwiki.org/index.php/BiologicalUnit/Quat for more information.
 
     quat is equavalent to biomolecule in the psico package.
+
+    The assemblies of a file are read once and kept in assemblyIndexFile
+    (see indexAssemblies), so later calls do not read the file again.
+    The asym ids of mmCIF assemblies are matched with segi, where PyMOL 
+    stores them.
+
+    The mode sets how the copies are made:
+        objects:  one object <prefix>_<num> per copy in the group 
+                  <prefix>_quat, as in earlier versions. Scenes such as 
+                  LNA select these objects by name.
+        segments: one object <prefix>_quat; the segi of each copy is the 
+                  number of its operator. All operators are applied to the
+                  coordinates in one NumPy operation, so the time and 
+                  memory scale with the number of atoms in the assembly,
+                  not with the number of operators. Use this mode for 
+                  icosahedral and helical assemblies with 60 to 1000 
+                  operators. The copies start with the default 
+                  representations and colors.
+        states:   one object <prefix>_quat with one state per copy.
  
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
-def quat(name=None, filename=None, prefix=None, quiet=0):
+def quat(name=None, filename=None, prefix=None, quiet=0, assembly=1, mode='objects'):
     quiet = int(quiet)
     if name is None:
         name = cmd.get_object_list()[0]
@@ -11826,6 +13037,8 @@ def quat(name=None, filename=None, prefix=None, quiet=0):
         '%s.pdb' % (name),
         '%s/%s.pdb' % (cmd.get('fetch_path'), name),
         '%s/%s/pdb%s.ent.gz' % (local_mirror_divided, name[1:3], name),
+        '%s.cif' % (name),
+        '%s/%s.cif' % (cmd.get('fetch_path'), name),
         ]
         for filename in candidates:
             if os.path.exists(filename):
@@ -11835,20 +13048,32 @@ def quat(name=None, filename=None, prefix=None, quiet=0):
             return
         if not quiet:
             print('loading from %s' % (filename))
-    remarks = pdbremarks(filename)
-    if 350 not in remarks:
-            print('There is no REMARK 350 in', filename)
+    entry = _read_assemblies(filename)
+    if not entry['assemblies']:
+            print('There is no REMARK 350 or _pdbx_struct_oper_list in', filename)
+            return
+    if str(assembly) not in entry['assemblies']:
+            print('There is no assembly %s in %s; the assemblies are %s' % (assembly, filename,
+                ', '.join(sorted(entry['assemblies']))))
             return
-    quat = quat350(remarks[350])
-    for chains in quat:
-            matrices = quat[chains]
-            for num in matrices:
-                mat = matrices[num][0:12]
+    if mode not in ('segments', 'states', 'objects'):
+            print('mode must be segments, states, or objects')
+            return
+    copies = entry['assemblies'][str(assembly)]
+    if mode in ('segments', 'states'):
+        nAtoms = _build_assembly(name, '%s_quat' % (prefix), copies, entry['selector'], mode)
+        if not quiet:
+            print('created %s_quat with %d copies and %d atoms' % (prefix, len(copies), nAtoms))
+        cmd.disable(name)
+        return
+    selector = '/%s//%s' if entry['selector'] == 'chain' else '/%s/%s/'
+    for chains, num, matrix in copies:
+                mat = matrix[0:12]
                 mat.extend([0,0,0,1])
                 copy = '%s_%d' % (prefix, num)
                 if not quiet:
                     print('creating %s' % (copy))
-                cmd.create(copy, '/%s//%s' % (name, '+'.join(chains)))
+                cmd.create(copy, selector % (name, '+'.join(chains)))
                 cmd.alter(copy, 'segi="%d"' % (num))
                 cmd.transform_object(copy, mat)
     cmd.disable(name)
@@ -11866,6 +13091,8 @@ cmd.extend('quat', quat)
         '%s.pdb' % (name),
         '%s/%s.pdb' % (cmd.get('fetch_path'), name),
         '%s/%s/pdb%s.ent.gz' % (local_mirror_divided, name[1:3], name),
+        '%s.cif' % (name),
+        '%s/%s.cif' % (cmd.get('fetch_path'), name),
         ]
         for filename in candidates:
             if os.path.exists(filename):
@@ -11875,20 +13102,32 @@ cmd.extend('quat', quat)
             return
         if not quiet:
             print('loading from %s' % (filename))
-    remarks = pdbremarks(filename)
-    if 350 not in remarks:
-            print('There is no REMARK 350 in', filename)
+    entry = _read_assemblies(filename)
+    if not entry['assemblies']:
+            print('There is no REMARK 350 or _pdbx_struct_oper_list in', filename)
+            return
+    if str(assembly) not in entry['assemblies']:
+            print('There is no assembly %s in %s; the assemblies are %s' % (assembly, filename,
+                ', '.join(sorted(entry['assemblies']))))
             return
-    quat = quat350(remarks[350])
-    for chains in quat:
-            matrices = quat[chains]
-            for num in matrices:
-                mat = matrices[num][0:12]
+    if mode not in ('segments', 'states', 'objects'):
+            print('mode must be segments, states, or objects')
+            return
+    copies = entry['assemblies'][str(assembly)]
+    if mode in ('segments', 'states'):
+        nAtoms = _build_assembly(name, '%s_quat' % (prefix), copies, entry['selector'], mode)
+        if not quiet:
+            print('created %s_quat with %d copies and %d atoms' % (prefix, len(copies), nAtoms))
+        cmd.disable(name)
+        return
+    selector = '/%s//%s' if entry['selector'] == 'chain' else '/%s/%s/'
+    for chains, num, matrix in copies:
+                mat = matrix[0:12]
                 mat.extend([0,0,0,1])
                 copy = '%s_%d' % (prefix, num)
                 if not quiet:
                     print('creating %s' % (copy))
-                cmd.create(copy, '/%s//%s' % (name, '+'.join(chains)))
+                cmd.create(copy, selector % (name, '+'.join(chains)))
                 cmd.alter(copy, 'segi="%d"' % (num))
                 cmd.transform_object(copy, mat)
     cmd.disable(name)
@@ -11896,81 +13135,284 @@ cmd.extend('quat', quat)
 cmd.extend('quat', quat)
 
 
-def quat350(rem350):
+def quat350(rem350, biomolecule=1):
     ''' 
     DESCRIPTION:
-    Get transformation matrices for biomolecule 1 from REMARK 350.
+    Get transformation matrices for a biomolecule from REMARK 350.
 
 
 
     USAGE:
-    quat350(rem350)
+    quat350(rem350 [, biomolecule])
 
 
 
     ARGUMENTS:
-    rem350
+    rem350 = list: lines of REMARK 350 as returned by pdbremarks
+    biomolecule = int: number of the biomolecule {default: 1}
 
 
     EXAMPLE:
     quat350(rem350)
+    quat350(rem350, 2)
 
 
 
     MORE DETAILS:
-    Get transformation matrices for biomolecule 1 from REMARK 350.
+    Get transformation matrices for a biomolecule from REMARK 350.
+    Returns {chains: {num: [12 floats]}}; it is empty when the biomolecule 
+    is not in REMARK 350. Earlier versions read only biomolecule 1.
 
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
-def quat350(rem350):
-    biomt = dict()
-    chains = tuple()
-    seenbiomolecule = False
-    for line in rem350:
-        if line.startswith('BIOMOLECULE:'):
-            if seenbiomolecule:
-                break
-            seenbiomolecule = True
-        elif line.startswith('APPLY THE FOLLOWING TO CHAINS:'):
-            chains = tuple(chain.strip() for chain in line[30:].split(','))
-        elif line.startswith('                   AND CHAINS:'):
-            chains += tuple(chain.strip() for chain in line[30:].split(','))
-        elif line.startswith('  BIOMT'):
-            row = int(line[7])
-            num = int(line[8:12])
-            vec = line[12:].split()
-            vec = map(float, vec)
-            biomt.setdefault(chains, dict()).setdefault(num, []).extend(vec)
-    return biomt
+def quat350(rem350, biomolecule=1):
+    return _pdb_assemblies(rem350).get(str(biomolecule), dict())
 cmd.extend('quat350', quat350)
     '''
 
-    biomt = dict()
-    chains = tuple()
-    seenbiomolecule = False
-    for line in rem350:
-        if line.startswith('BIOMOLECULE:'):
-            if seenbiomolecule:
-                break
-            seenbiomolecule = True
-        elif line.startswith('APPLY THE FOLLOWING TO CHAINS:'):
-            chains = tuple(chain.strip() for chain in line[30:].split(','))
-        elif line.startswith('                   AND CHAINS:'):
-            chains += tuple(chain.strip() for chain in line[30:].split(','))
-        elif line.startswith('  BIOMT'):
-            row = int(line[7])
-            num = int(line[8:12])
-            vec = line[12:].split()
-            vec = map(float, vec)
-            biomt.setdefault(chains, dict()).setdefault(num, []).extend(vec)
-    return biomt
+    return _pdb_assemblies(rem350).get(str(biomolecule), dict())
 cmd.extend('quat350', quat350)
 
 
+_renderJob = '''run %(script)s
+python
+# The scenes end with their own ray and png calls; only the final render is kept.
+_sceneRay, _scenePng = cmd.ray, cmd.png
+cmd.ray = cmd.png = lambda *args, **kwargs: None
+try:
+    cmd.keyword[%(scene)r][0]()
+finally:
+    cmd.ray, cmd.png = _sceneRay, _scenePng
+cmd.set('ray_opaque_background', 'on')
+cmd.png(%(output)r, width=%(width)d, height=%(height)d, dpi=%(dpi)d, ray=1)
+python end
+'''
+
+
+def _scene_sources(scene):
+    '''
+    Return (sources, structures) of a scene shortcut.
+
+    The sources are the code of the shortcut and of every function in this 
+    file that it calls, directly or through other shortcuts (e.g., LBST calls
+    BST), and the entries of _sceneDefinitions that they build. The 
+    structures are the (code, type) pairs that they load.
+    '''
+    fileName = globals()[scene].__code__.co_filename
+    sources, structures, seen = [], set(), set()
+    pending = [globals()[scene].__code__]
+    while pending:
+        code = pending.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        constants = [c for c in code.co_consts if isinstance(c, str)]
+        sources.append((code.co_name, code.co_code, constants, code.co_names))
+        pending.extend(c for c in code.co_consts if hasattr(c, 'co_code'))
+        for name in code.co_names:
+            function = globals().get(name)
+            if getattr(function, '__code__', None) is not None and function.__code__.co_filename == fileName:
+                pending.append(function.__code__)
+        if '_build_scene' in code.co_names:
+            for constant in constants:
+                if constant in _sceneDefinitions:
+                    definition = _sceneDefinitions[constant]
+                    sources.append(json.dumps(definition, sort_keys=True))
+                    structures.add((definition['structure'][0].lower(), definition['structure'][1]))
+        if '_load_structure' in code.co_names:
+            for i, constant in enumerate(constants):
+                # PDB codes, e.g., 4PCO but not the image size in cmd.ray('1600', '1000')
+                if re.match('^[0-9](?=.*[a-z])[0-9a-z]{3}$', constant, re.I):
+                    following = constants[i + 1] if i + 1 < len(constants) else ''
+                    structures.add((constant.lower(), following if following in _structureFormats else 'pdb'))
+    return sources, structures
+
+
+def _scene_key(scene, width, height, dpi):
+    '''
+    Return a hash of the inputs of a rendered scene: its resolved code and 
+    definitions (see _scene_sources), the image size, and the codes of the 
+    structures it loads with the hashes of their local files.
+    '''
+    sources, structures = _scene_sources(scene)
+    files = []
+    for code, type in sorted(structures):
+        path, source = _resolve_structure(code, type)
+        if source == 'cache':
+            files.append((code, type, _structure_index()['%s:%s' % (code, type)]['sha256']))
+        else:
+            files.append((code, type, _file_sha256(path) if path else None))
+    inputs = repr((scene, sources, width, height, dpi, files))
+    return hashlib.sha256(inputs.encode('utf-8')).hexdigest()
+
+
+def _render_scene(job):
+    '''Render one scene in a new headless PyMOL process and return (job, seconds, status).'''
+    scene, width, height, dpi, output, key = job
+    start = time.time()
+    cached = os.path.join(figureCachePath, key + '.png')
+    if os.path.exists(cached):
+        shutil.copyfile(cached, output)
+        return job, time.time() - start, 'cached'
+
+    workDirectory = tempfile.mkdtemp(prefix='renderScenes')
+    try:
+        jobFile = os.path.join(workDirectory, 'job.pml')
+        image = os.path.join(workDirectory, 'figure.png')
+        with open(jobFile, 'w') as f:
+            f.write(_renderJob % {'script': shortcutsFilePath, 'scene': scene,
+                'output': image, 'width': width, 'height': height, 'dpi': dpi})
+        process = subprocess.Popen(pymolBatchCommand + [jobFile], cwd=workDirectory,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        log = process.communicate()[0]
+        if process.returncode != 0 or not os.path.exists(image):
+            print(log.decode('utf-8', 'replace')[-2000:])
+            return job, time.time() - start, 'failed'
+        if not os.path.isdir(figureCachePath):
+            os.makedirs(figureCachePath)
+        shutil.copyfile(image, cached)
+        shutil.copyfile(image, output)
+    finally:
+        shutil.rmtree(workDirectory, ignore_errors=True)
+    return job, time.time() - start, 'rendered'
+
+
+def renderScenes(scenes='BST T4L', sizes='1600x1000', outdir='figures', processes=4, dpi=300):
+    ''' 
+    DESCRIPTION:
+    Render a list of scene shortcuts to png files in parallel headless PyMOL processes.
+
+    USAGE:
+    renderScenes scenes, [sizes, [outdir, [processes, [dpi]]]]
+
+    ARGUMENTS:
+    scenes = string: space or comma separated list of scene shortcuts {default: BST T4L}
+    sizes = string: space separated list of image sizes as WIDTHxHEIGHT in pixels {default: 1600x1000}
+    outdir = string: directory for the png files {default: figures}
+    processes = int: number of PyMOL worker processes {default: 4}
+    dpi = int: resolution written into the png files {default: 300}
+
+    EXAMPLE:
+    renderScenes BST T4L GU U8 NA, 1600x1000 800x500, manuscriptFigures
+
+    MORE DETAILS:
+    Regenerates the figures of a manuscript without running each scene by hand 
+    in the GUI. Each pair of scene and size is rendered in its own headless PyMOL
+    process started with pymolBatchCommand, so the jobs run in parallel and 
+    do not change the current session. The ray and png calls inside the scenes
+    (e.g., '4PCO.png' in BST) are skipped; each figure is ray traced once at 
+    the requested size and saved as outdir/<scene>_<width>x<height>.png.
+
+    The figures are cached in figureCachePath under a hash of the code of the 
+    scene and of the shortcuts and helpers it calls, its scene definitions in
+    _sceneDefinitions, the size, the dpi, and the content of the structures 
+    that the scene loads. Structures that are not on disk are fetched into the
+    structure cache once, before the worker processes start.
+    Figures whose inputs have not changed are copied from the cache instead of
+    being ray traced again. Delete the cache directory to force new renders.
+
+    RETURNS
+        A NumPy structured array with one record per figure and the fields
+        ( scene, width, height, seconds, status, file ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def renderScenes(scenes='BST T4L', sizes='1600x1000', outdir='figures', processes=4, dpi=300):
+    processes, dpi = int(processes), int(dpi)
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    names = []
+    for scene in scenes.replace(",", " ").split():
+        if not callable(globals().get(scene)):
+            print("%s is not a shortcut in this file; skipped." % scene)
+            continue
+        names.append(scene)
+
+    # Structures missing on disk are fetched once here, before the workers start,
+    # so that the workers only read the cache and the keys hold the file hashes.
+    for code, type in sorted(set().union(*[_scene_sources(scene)[1] for scene in names])):
+        if _resolve_structure(code, type)[0] is None and not structureOffline:
+            name = cmd.get_unused_name('renderScenes')
+            if _load_structure(code, type, name) is not None:
+                cmd.delete(name)
+
+    jobs = []
+    for scene in names:
+        for size in sizes.replace(",", " ").split():
+            width, height = [int(value) for value in size.lower().split('x')]
+            output = os.path.abspath(os.path.join(outdir, '%s_%dx%d.png' % (scene, width, height)))
+            jobs.append((scene, width, height, dpi, output, _scene_key(scene, width, height, dpi)))
+
+    start = time.time()
+    from concurrent.futures import ThreadPoolExecutor
+    # Threads only wait on the worker processes, which do the ray tracing.
+    with ThreadPoolExecutor(max_workers=max(processes, 1)) as pool:
+        results = list(pool.map(_render_scene, jobs))
+
+    rows = [(job[0], job[1], job[2], seconds, status, job[4]) for job, seconds, status in results]
+    print("%-10s %12s %9s %9s  %s" % ("scene", "size", "seconds", "status", "file"))
+    for scene, width, height, seconds, status, output in rows:
+        print("%-10s %12s %9.1f %9s  %s" % (scene, '%dx%d' % (width, height), seconds, status, output))
+    print("Rendered %d figures in %.1f s of wall time." % (len(rows), time.time() - start))
+    return _record_array(rows, [('scene', 'U'), ('width', 'i4'), ('height', 'i4'),
+        ('seconds', 'f8'), ('status', 'U'), ('file', 'U')])
+
+cmd.extend('renderScenes', renderScenes)
+    '''
+
+    processes, dpi = int(processes), int(dpi)
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    names = []
+    for scene in scenes.replace(",", " ").split():
+        if not callable(globals().get(scene)):
+            print("%s is not a shortcut in this file; skipped." % scene)
+            continue
+        names.append(scene)
+
+    # Structures missing on disk are fetched once here, before the workers start,
+    # so that the workers only read the cache and the keys hold the file hashes.
+    for code, type in sorted(set().union(*[_scene_sources(scene)[1] for scene in names])):
+        if _resolve_structure(code, type)[0] is None and not structureOffline:
+            name = cmd.get_unused_name('renderScenes')
+            if _load_structure(code, type, name) is not None:
+                cmd.delete(name)
+
+    jobs = []
+    for scene in names:
+        for size in sizes.replace(",", " ").split():
+            width, height = [int(value) for value in size.lower().split('x')]
+            output = os.path.abspath(os.path.join(outdir, '%s_%dx%d.png' % (scene, width, height)))
+            jobs.append((scene, width, height, dpi, output, _scene_key(scene, width, height, dpi)))
+
+    start = time.time()
+    from concurrent.futures import ThreadPoolExecutor
+    # Threads only wait on the worker processes, which do the ray tracing.
+    with ThreadPoolExecutor(max_workers=max(processes, 1)) as pool:
+        results = list(pool.map(_render_scene, jobs))
+
+    rows = [(job[0], job[1], job[2], seconds, status, job[4]) for job, seconds, status in results]
+    print("%-10s %12s %9s %9s  %s" % ("scene", "size", "seconds", "status", "file"))
+    for scene, width, height, seconds, status, output in rows:
+        print("%-10s %12s %9.1f %9s  %s" % (scene, '%dx%d' % (width, height), seconds, status, output))
+    print("Rendered %d figures in %.1f s of wall time." % (len(rows), time.time() - start))
+    return _record_array(rows, [('scene', 'U'), ('width', 'i4'), ('height', 'i4'),
+        ('seconds', 'f8'), ('status', 'U'), ('file', 'U')])
+
+cmd.extend('renderScenes', renderScenes)
+
+
 def rline():
     ''' 
     DESCRIPTION:
@@ -12069,7 +13511,7 @@ cmd.extend("rmd", rmd)
 cmd.extend("rmd", rmd)
 
 
-def rmhb(selection='all'):
+def rmhb(selection='all', name='hbonds'):
     ''' 
     DESCRIPTION:
     Delete all H-bonds in the selection, which is all by default.
@@ -12078,10 +13520,11 @@ def rmhb(selection='all'):
 
 
     USAGE:
-    rmhb <selection>
+    rmhb <selection> [, name]
 
     ARGUMENTS:
     The selection is optional. It is "all" by default.
+    name = string: name of the H-bond object made by hb {default: hbonds}
 
 
     EXAMPLE:
@@ -12091,6 +13534,10 @@ def rmhb(selection='all'):
 
 rmhb 1lw9
 
+ or
+
+rmhb name=rnaHbonds
+
 
 
     MORE DETAILS:
@@ -12104,16 +13551,15 @@ rmhb 1lw9
     HORIZONTAL PML SCRIPT:
     cmd.delete('hbonds')
 
-
     PYTHON CODE:
-def rmhb(selection='all'):
-    cmd.delete('hbonds')
+def rmhb(selection='all', name='hbonds'):
+    cmd.delete(name)
 
 
 cmd.extend('rmhb',rmhb)
     '''
 
-    cmd.delete('hbonds')
+    cmd.delete(name)
 
 
 cmd.extend('rmhb',rmhb)
@@ -12154,6 +13600,65 @@ cmd.extend("rmsc", rmsc)
 
 
 
+def runScene(name='NA', fileName=''):
+    ''' 
+    DESCRIPTION:
+    Build a scene that is stored as data instead of as a series of commands.
+
+    USAGE:
+    runScene [name, [fileName]]
+
+    ARGUMENTS:
+    name = string: name of a scene in _sceneDefinitions {default: NA}
+    fileName = string: JSON file with the definition of a scene {default: none}
+
+    EXAMPLE:
+    runScene NA
+    runScene mySodium, mySodium.json
+
+    MORE DETAILS:
+    A scene definition gives the structure to load as [code, fetch type], the
+    viewport, PyMOL commands to run after loading, settings, representations,
+    new objects, bonds, distances, colors, the view, and commands to run at the end.
+    See _sceneDefinitions['NA'] for an example; the JSON file uses the same keys.
+    Atoms in bonds and distances are named object/chain/resi/name,
+    like 3nd4_0001/A/HOH`319/O.
+
+    The atoms are looked up by one pass over each object and converted to 
+    atom indices. The indices are cached for each scene and structure file,
+    so rebuilding a scene does not parse one selection per bond or distance.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def runScene(name='NA', fileName=''):
+    definition = None
+    if fileName:
+        with open(fileName) as f:
+            definition = json.load(f)
+    elif name not in _sceneDefinitions:
+        print("No scene named %s. Scenes: %s" % (name, ", ".join(sorted(_sceneDefinitions))))
+        return
+    _build_scene(name, definition)
+
+cmd.extend('runScene', runScene)
+    '''
+
+    definition = None
+    if fileName:
+        with open(fileName) as f:
+            definition = json.load(f)
+    elif name not in _sceneDefinitions:
+        print("No scene named %s. Scenes: %s" % (name, ", ".join(sorted(_sceneDefinitions))))
+        return
+    _build_scene(name, definition)
+
+cmd.extend('runScene', runScene)
+
+
 def rv(StoredView=0, decimal_places=2, outname="roundedview.txt"):
     ''' 
     DESCRIPTION:
@@ -12310,6 +13815,7 @@ def saln(stemName="saved"):
     Save a aln file (alignment file) with a time stamp included in the filename to avoid
     overwriting work. Read as a commandline argument, a string as the filename 
     stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -12320,15 +13826,11 @@ def saln(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".aln")
     PYTHON CODE:
 def saln(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".aln") 
+    _store_output(stemName, 'aln')
 cmd.extend('saln',saln)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".aln") 
+    _store_output(stemName, 'aln')
 cmd.extend('saln',saln)
 
 
@@ -12381,21 +13883,86 @@ cmd.extend('sasbdb',sasbdb)
 cmd.extend('sasbdb',sasbdb)
 
 
-def sb(selection='(all)', name='bump_check', quiet=1):
+def _bump_check(selection='all', tolerance=0.4, radii=_bondiRadii):
+    '''
+    Find the van der Waals clashes in all states of selection in one batch.
+
+    Two atoms clash when they are neither bonded to each other nor bonded to
+    a common atom and when their radii overlap by more than tolerance. The
+    radii come from the table radii; elements that are not in the table keep
+    their vdw radius (1.2 for H). The states are laid side by side along x,
+    far enough apart that no pair crosses between states, so a single call
+    of _neighbor_pairs searches all of them.
+
+    Return (model, states, xyz, k, i, j, distance, overlap). model is the
+    chempy model of selection in state 1, states lists the checked states,
+    and xyz holds their coordinates (states x atoms x 3). Each clash is the
+    pair of atoms i and j of model.atom in states[k].
+    '''
+    model = cmd.get_model(selection)
+    n = len(model.atom)
+    table = dict((element.upper(), radius) for element, radius in radii.items())
+    r = numpy.array([table.get(atom.symbol.upper(), atom.vdw) for atom in model.atom], dtype=float)
+
+    neighbors = [[] for atom in model.atom]
+    for bond in model.bond:
+        a, b = bond.index[0], bond.index[1]
+        neighbors[a].append(b)
+        neighbors[b].append(a)
+    excluded = set()
+    for a, partners in enumerate(neighbors):
+        for b in partners:
+            excluded.add(min(a, b) * n + max(a, b))
+            for c in partners:
+                if b < c:
+                    excluded.add(b * n + c)
+    excluded = numpy.array(sorted(excluded), dtype=numpy.int64)
+
+    states, blocks = [], []
+    for state in range(1, cmd.count_states(selection) + 1):
+        coords = cmd.get_coords(selection, state)
+        if coords is not None and len(coords) == n:
+            states.append(state)
+            blocks.append(coords)
+    empty = numpy.zeros(0, dtype=int)
+    if n == 0 or not blocks:
+        return model, states, numpy.zeros((0, n, 3)), empty, empty, empty, numpy.zeros(0), numpy.zeros(0)
+
+    xyz = numpy.array(blocks, dtype=float)
+    cutoff = 2 * r.max()
+    shift = xyz[:, :, 0].max() - xyz[:, :, 0].min() + 2 * cutoff
+    side = xyz.copy()
+    side[:, :, 0] += shift * numpy.arange(len(states))[:, None]
+    pairs1, pairs2, distance = _neighbor_pairs(side.reshape(-1, 3), side.reshape(-1, 3), cutoff)
+    k, i, j = pairs1 // n, pairs1 % n, pairs2 % n
+    keep = (pairs1 < pairs2) & (k == pairs2 // n)
+    k, i, j, distance = k[keep], i[keep], j[keep], distance[keep]
+    overlap = r[i] + r[j] - distance
+    keep = (overlap > tolerance) & ~numpy.isin(i * n + j, excluded)
+    return model, states, xyz, k[keep], i[keep], j[keep], distance[keep], overlap[keep]
+
+
+def sb(selection='(all)', name='bump_check', quiet=1, tolerance=0.4, show=1, pairs=0):
     ''' 
     DESCRIPTION:
     Show van der Waals clashes as red discs. 
 
     USAGE:
-    show_bumps [ selection [, name ]]
+    sb [ selection [, name [, quiet [, tolerance [, show [, pairs ]]]]]]
 
     ARGUMENTS:
-    show_bumps [ selection [, name ]]
-
     selection = string: atom selection {default: all}
 
     name = string: name of CGO object to create {default: bump_check}
 
+    quiet = 0 or 1: do not print the clashes of each state {default: 1}
+
+    tolerance = float: smallest overlap of the van der Waals radii that counts as a clash in Angstroms {default: 0.4}
+
+    show = 0 or 1: draw the clashes as red discs {default: 1}
+
+    pairs = 0 or 1: return one record per clash instead of one per state {default: 0}
+
     EXAMPLE:
     sb
 	
@@ -12403,6 +13970,8 @@ def sb(selection='(all)', name='bump_check', quiet=1):
 
     sb i. 60:80
 
+    sb poses, show=0
+
     MORE DETAILS:
     Show van der Waals clashes as red discs. 
 
@@ -12412,37 +13981,109 @@ def sb(selection='(all)', name='bump_check', quiet=1):
     License: BSD-2-Clause:
     https://opensource.org/licenses/BSD-2-Clause
 
+    The clashes are no longer found with the VDW term of the sculpting 
+    engine, one state at a time. All states of the selection are searched 
+    together with a cell list (the spatial index used by pairD). The radii 
+    are the Bondi radii used by bs. Atoms that are bonded to each other or 
+    to a common atom do not clash. The disc at the middle of each clash has
+    a radius equal to the overlap. Use show=0 to screen ensembles and 
+    docking poses with thousands of states without drawing.
+
+    RETURNS
+        A NumPy structured array with one record per state and the fields
+        ( state, clashes, overlap, atom1, atom2 ), where overlap is the 
+        largest overlap in the state and atom1 and atom2 are the atoms with
+        that overlap. With pairs=1, one record per clash with the fields
+        ( state, atom1, atom2, distance, overlap ), sorted by state and 
+        then by decreasing overlap.
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
+
     PYTHON CODE:
-def sb(selection='(all)', name='bump_check', quiet=1):
+def sb(selection='(all)', name='bump_check', quiet=1, tolerance=0.4, show=1, pairs=0):
+    quiet, show, pairs, tolerance = int(quiet), int(show), int(pairs), float(tolerance)
+    model, states, xyz, k, i, j, distance, overlap = _bump_check(selection, tolerance)
+    labels = ['%s/%s/%s/%s' % (atom.chain, atom.resn, atom.resi, atom.name) for atom in model.atom]
+    order = numpy.lexsort((-overlap, k))
+    k, i, j, distance, overlap = k[order], i[order], j[order], distance[order], overlap[order]
+
     cmd.delete(name)
-    cmd.create(name, selection, zoom=0)
-    cmd.set('sculpt_vdw_vis_mode', 1, name)
-    cmd.set('sculpt_field_mask', 0x020)  # cSculptVDW
-    for state in range(1, 1 + cmd.count_states('%' + name)):
-        cmd.sculpt_activate(name, state)
-        strain = cmd.sculpt_iterate(name, state, cycles=0)
-        if not int(quiet):
-            print('VDW Strain in state %d: %f' % (state, strain))
-    cmd.show_as('cgo', name)
+    if show and len(k):
+        for m in numpy.unique(k):
+            rows = k == m
+            start, end = xyz[m, i[rows]], xyz[m, j[rows]]
+            axis = (end - start) / distance[rows][:, None]
+            middle = (start + end) / 2
+            discs = numpy.empty((rows.sum(), 14))
+            discs[:, 0] = cgo.CYLINDER
+            discs[:, 1:4] = middle - 0.05 * axis
+            discs[:, 4:7] = middle + 0.05 * axis
+            discs[:, 7] = overlap[rows]
+            discs[:, 8:14] = [1.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+            cmd.load_cgo(discs.ravel().tolist(), name, states[m])
+
+    if pairs:
+        rows = [(states[m], labels[a], labels[b], d, o)
+            for m, a, b, d, o in zip(k.tolist(), i.tolist(), j.tolist(), distance.tolist(), overlap.tolist())]
+        return _record_array(rows, [('state', 'i4'), ('atom1', 'U'), ('atom2', 'U'), ('distance', 'f8'), ('overlap', 'f8')])
+
+    counts = numpy.bincount(k, minlength=len(states))
+    firsts = numpy.searchsorted(k, numpy.arange(len(states)))
+    rows = []
+    for m, state in enumerate(states):
+        if counts[m]:
+            f = firsts[m]
+            rows.append((state, counts[m], overlap[f], labels[i[f]], labels[j[f]]))
+        else:
+            rows.append((state, 0, 0.0, '', ''))
+        if not quiet:
+            print('Clashes in state %d: %d; largest overlap %.2f A %s %s' % rows[-1])
+    return _record_array(rows, [('state', 'i4'), ('clashes', 'i4'), ('overlap', 'f8'), ('atom1', 'U'), ('atom2', 'U')])
 
 cmd.extend('sb',sb)
     '''
 
+    quiet, show, pairs, tolerance = int(quiet), int(show), int(pairs), float(tolerance)
+    model, states, xyz, k, i, j, distance, overlap = _bump_check(selection, tolerance)
+    labels = ['%s/%s/%s/%s' % (atom.chain, atom.resn, atom.resi, atom.name) for atom in model.atom]
+    order = numpy.lexsort((-overlap, k))
+    k, i, j, distance, overlap = k[order], i[order], j[order], distance[order], overlap[order]
+
     cmd.delete(name)
-    cmd.create(name, selection, zoom=0)
-    cmd.set('sculpt_vdw_vis_mode', 1, name)
-    cmd.set('sculpt_field_mask', 0x020)  # cSculptVDW
-    for state in range(1, 1 + cmd.count_states('%' + name)):
-        cmd.sculpt_activate(name, state)
-        strain = cmd.sculpt_iterate(name, state, cycles=0)
-        if not int(quiet):
-            print('VDW Strain in state %d: %f' % (state, strain))
-    cmd.show_as('cgo', name)
+    if show and len(k):
+        for m in numpy.unique(k):
+            rows = k == m
+            start, end = xyz[m, i[rows]], xyz[m, j[rows]]
+            axis = (end - start) / distance[rows][:, None]
+            middle = (start + end) / 2
+            discs = numpy.empty((rows.sum(), 14))
+            discs[:, 0] = cgo.CYLINDER
+            discs[:, 1:4] = middle - 0.05 * axis
+            discs[:, 4:7] = middle + 0.05 * axis
+            discs[:, 7] = overlap[rows]
+            discs[:, 8:14] = [1.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+            cmd.load_cgo(discs.ravel().tolist(), name, states[m])
+
+    if pairs:
+        rows = [(states[m], labels[a], labels[b], d, o)
+            for m, a, b, d, o in zip(k.tolist(), i.tolist(), j.tolist(), distance.tolist(), overlap.tolist())]
+        return _record_array(rows, [('state', 'i4'), ('atom1', 'U'), ('atom2', 'U'), ('distance', 'f8'), ('overlap', 'f8')])
+
+    counts = numpy.bincount(k, minlength=len(states))
+    firsts = numpy.searchsorted(k, numpy.arange(len(states)))
+    rows = []
+    for m, state in enumerate(states):
+        if counts[m]:
+            f = firsts[m]
+            rows.append((state, counts[m], overlap[f], labels[i[f]], labels[j[f]]))
+        else:
+            rows.append((state, 0, 0.0, '', ''))
+        if not quiet:
+            print('Clashes in state %d: %d; largest overlap %.2f A %s %s' % rows[-1])
+    return _record_array(rows, [('state', 'i4'), ('clashes', 'i4'), ('overlap', 'f8'), ('atom1', 'U'), ('atom2', 'U')])
 
 cmd.extend('sb',sb)
 
@@ -13307,6 +14948,7 @@ def sccp4(stemName="saved"):
     Save a ccp4 electron density map with a time stamp included in the 
     filename to avoid overwriting an existing file.Read as a commandline 
     argument, a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13317,15 +14959,11 @@ def sccp4(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".ccp4")
     PYTHON CODE:
 def sccp4(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".ccp4") 
+    _store_output(stemName, 'ccp4')
 cmd.extend('sccp4',sccp4)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".ccp4") 
+    _store_output(stemName, 'ccp4')
 cmd.extend('sccp4',sccp4)
 
 
@@ -13347,6 +14985,7 @@ def scif(stemName="saved"):
     included in the filename to avoid overwriting an existing file.Read 
     as a commandline argument, a string as the filename stem or use 
     the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13357,15 +14996,11 @@ def scif(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".cif")
     PYTHON CODE:
 def scif(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".cif") 
+    _store_output(stemName, 'cif')
 cmd.extend('scif',scif)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".cif") 
+    _store_output(stemName, 'cif')
 cmd.extend('scif',scif)
 
 
@@ -13386,6 +15021,7 @@ def sdae(stemName="saved"):
     Save a dae file (Collada File) with a time stamp included in the filename 
     to avoid overwriting an existing file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13396,15 +15032,11 @@ def sdae(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".ccp4")
     PYTHON CODE:
 def sdae(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".ccp4") 
+    _store_output(stemName, 'dae')
 cmd.extend('sdae',sdae)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".ccp4") 
+    _store_output(stemName, 'dae')
 cmd.extend('sdae',sdae)
 
 
@@ -13422,29 +15054,245 @@ def sdat(stemName="saved"):
     sdat  testFile
 
     MORE DETAILS:
-    Save a dat file (output data file) with a time stamp included in the filename 
-    to avoid overwriting an existing dat file. Read as a commandline argument, 
-    a string as the filename stem, or use the default filename stem "saved".
+    Save a dat file (output data file) with a time stamp included in the filename 
+    to avoid overwriting an existing dat file. Read as a commandline argument, 
+    a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
+
+
+    VERTICAL PML SCRIPT:
+    DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S")
+    s = str(DT)
+    cmd.save(stemName+s+".dat")
+    HORIZONTAL PML SCRIPT:
+    DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".dat")
+    PYTHON CODE:
+def sdat(stemName="saved"):
+    _store_output(stemName, 'dat')
+cmd.extend('sdat',sdat)
+    '''
+
+    _store_output(stemName, 'dat')
+cmd.extend('sdat',sdat)
+
+
+def searchSweep(terms='', sites='', fetch=1, show=0, hours=None):
+    ''' 
+    DESCRIPTION:
+    Send many search terms to many of the search sites of MC at once.
+
+    USAGE:
+    searchSweep terms [, sites [, fetch [, show [, hours]]]]
+
+    ARGUMENTS:
+    terms = string: search terms separated by |, or the name of a text file with one term per line
+    sites = string: shortcuts of the sites separated by spaces {default: the ten sites of MC}
+    fetch = 0 or 1: save the result pages in searchCachePath {default: 1}
+    show = 0 or 1: open the searches in the default browser {default: 0}
+    hours = float: age in hours up to which saved pages are reused {default: searchCacheHours}
+
+    EXAMPLE:
+    searchSweep ribozyme | riboswitch | kink turn, PM GS
+    searchSweep ~/searchTerms.txt
+
+    MORE DETAILS:
+    Literature sweep over dozens of terms. All searches (terms times 
+    sites) are sent at once; requests to the same host start at least 
+    searchHostInterval seconds apart, so one slow or strict site does not
+    hold up the others. The result pages are saved in searchCachePath and
+    a repeated search within searchCacheHours is answered from the saved
+    page. The sites are BX, GH, GO, GS, PM, PML, PW, RG, SD, and SF.
+
+    RETURNS
+        A NumPy structured array with one record per search and the fields
+        ( term, site, status, cached, bytes, seconds, path ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def searchSweep(terms='', sites='', fetch=1, show=0, hours=None):
+    fetch, show = int(fetch), int(show)
+    if isinstance(terms, str):
+        if os.path.isfile(os.path.expanduser(terms.strip())):
+            with open(os.path.expanduser(terms.strip())) as f:
+                terms = f.read().splitlines()
+        else:
+            terms = terms.split('|')
+    terms = [term.strip() for term in terms if term.strip()]
+    sites = sites.replace(',', ' ').split() or _coreSearchSites
+    for site in sites:
+        if site not in _searchURLs:
+            print("%s is not one of the search sites %s." % (site, ' '.join(_coreSearchSites)))
+            return None
+
+    searches = [(term, site) for term in terms for site in sites]
+    start = time.time()
+    results = _search_requests([_search_url(site, term) for term, site in searches], fetch, show, hours)
+    rows = [(term, site, r['status'], r['cached'], r['bytes'], r['seconds'], r['path'])
+        for (term, site), r in zip(searches, results)]
+    print("Sent %d searches (%d from the cache) in %.1f s." % (len(rows),
+        sum(row[3] for row in rows), time.time() - start))
+    return _record_array(rows, [('term', 'U'), ('site', 'U'), ('status', 'i4'), ('cached', '?'),
+        ('bytes', 'i8'), ('seconds', 'f8'), ('path', 'U')])
+
+cmd.extend('searchSweep', searchSweep)
+    '''
+
+    fetch, show = int(fetch), int(show)
+    if isinstance(terms, str):
+        if os.path.isfile(os.path.expanduser(terms.strip())):
+            with open(os.path.expanduser(terms.strip())) as f:
+                terms = f.read().splitlines()
+        else:
+            terms = terms.split('|')
+    terms = [term.strip() for term in terms if term.strip()]
+    sites = sites.replace(',', ' ').split() or _coreSearchSites
+    for site in sites:
+        if site not in _searchURLs:
+            print("%s is not one of the search sites %s." % (site, ' '.join(_coreSearchSites)))
+            return None
+
+    searches = [(term, site) for term in terms for site in sites]
+    start = time.time()
+    results = _search_requests([_search_url(site, term) for term, site in searches], fetch, show, hours)
+    rows = [(term, site, r['status'], r['cached'], r['bytes'], r['seconds'], r['path'])
+        for (term, site), r in zip(searches, results)]
+    print("Sent %d searches (%d from the cache) in %.1f s." % (len(rows),
+        sum(row[3] for row in rows), time.time() - start))
+    return _record_array(rows, [('term', 'U'), ('site', 'U'), ('status', 'i4'), ('cached', '?'),
+        ('bytes', 'i8'), ('seconds', 'f8'), ('path', 'U')])
+
+cmd.extend('searchSweep', searchSweep)
+
+
+def sexport(formats='pdb cif mol2 fasta pse png obj', selection='all', stemName='saved', outdir='.', state=-1, compress=0):
+    ''' 
+    DESCRIPTION:
+    Save a selection in many formats at once under one time stamp.
+
+    USAGE:
+    sexport [formats [, selection [, stemName [, outdir [, state [, compress]]]]]]
+
+    ARGUMENTS:
+    formats = string: file extensions separated by spaces {default: pdb cif mol2 fasta pse png obj}
+    selection = string: atoms to save {default: all}
+    stemName = string: filename stem {default: saved}
+    outdir = string: directory of the files {default: current directory}
+    state = integer: state to save; -1 is the current state {default: -1}
+    compress = 0 or 1: gzip the files made in memory {default: 0}
+
+    EXAMPLE:
+    sexport
+    sexport pdb cif sdf, chain A, figure2, outdir=publication
+
+    MORE DETAILS:
+    Replaces running spdb, scif, smol2, sfasta, spse, spng, and sobj one
+    after the other. All files get the same time stamp, so they are easy
+    to match. The files of the formats in _outputSerialized (the 
+    coordinate formats, fasta, and pse) are made in memory one after the
+    other, because PyMOL serializes one at a time, and are then 
+    compressed and written to disk by worker threads in parallel. 
+    Other formats (png, obj, wrl, ...) are written by cmd.save directly.
+    A pse file always holds the whole session.
 
+    RETURNS
+        A NumPy structured array with one record per format and the fields
+        ( format, file, bytes, serialize, write ) with the times in seconds.
 
     VERTICAL PML SCRIPT:
-    DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S")
-    s = str(DT)
-    cmd.save(stemName+s+".dat")
+    NA
     HORIZONTAL PML SCRIPT:
-    DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".dat")
+    NA
+
     PYTHON CODE:
-def sdat(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".dat") 
-cmd.extend('sdat',sdat)
+def sexport(formats='pdb cif mol2 fasta pse png obj', selection='all', stemName='saved', outdir='.', state=-1, compress=0):
+    formats = [format.lstrip('.').lower() for format in formats.replace(',', ' ').split()]
+    state, compress = int(state), int(compress)
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+    DT = datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
+
+    start = time.time()
+    jobs = []
+    for format in formats:
+        fileName = os.path.join(outdir, stemName + DT + '.' + format)
+        t0 = time.time()
+        content = _serialize_output(format, selection, state)
+        if content is None:
+            cmd.save(fileName, selection, state)
+        jobs.append((format, fileName, content, time.time() - t0))
+
+    def write(job):
+        format, fileName, content, serializeSeconds = job
+        t0 = time.time()
+        if content is not None:
+            if compress:
+                import gzip
+                content = gzip.compress(content, 6)
+                fileName += '.gz'
+            with open(fileName, 'wb') as f:
+                f.write(content)
+        return (format, fileName, os.path.getsize(fileName), serializeSeconds, time.time() - t0)
+
+    from concurrent.futures import ThreadPoolExecutor
+    # zlib and file writes release the GIL, so the formats are compressed and written in parallel.
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        rows = list(pool.map(write, jobs))
+
+    print("%-6s %12s %10s %10s  %s" % ("format", "bytes", "serialize", "write", "file"))
+    for format, fileName, size, serializeSeconds, writeSeconds in rows:
+        print("%-6s %12d %10.3f %10.3f  %s" % (format, size, serializeSeconds, writeSeconds, fileName))
+    print("Saved %d formats (%d bytes) in %.2f s." % (len(rows), sum(row[2] for row in rows), time.time() - start))
+    return _record_array(rows, [('format', 'U'), ('file', 'U'), ('bytes', 'i8'), ('serialize', 'f8'),
+        ('write', 'f8')])
+
+cmd.extend('sexport', sexport)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".dat") 
-cmd.extend('sdat',sdat)
+    formats = [format.lstrip('.').lower() for format in formats.replace(',', ' ').split()]
+    state, compress = int(state), int(compress)
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+    DT = datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
+
+    start = time.time()
+    jobs = []
+    for format in formats:
+        fileName = os.path.join(outdir, stemName + DT + '.' + format)
+        t0 = time.time()
+        content = _serialize_output(format, selection, state)
+        if content is None:
+            cmd.save(fileName, selection, state)
+        jobs.append((format, fileName, content, time.time() - t0))
+
+    def write(job):
+        format, fileName, content, serializeSeconds = job
+        t0 = time.time()
+        if content is not None:
+            if compress:
+                import gzip
+                content = gzip.compress(content, 6)
+                fileName += '.gz'
+            with open(fileName, 'wb') as f:
+                f.write(content)
+        return (format, fileName, os.path.getsize(fileName), serializeSeconds, time.time() - t0)
+
+    from concurrent.futures import ThreadPoolExecutor
+    # zlib and file writes release the GIL, so the formats are compressed and written in parallel.
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        rows = list(pool.map(write, jobs))
+
+    print("%-6s %12s %10s %10s  %s" % ("format", "bytes", "serialize", "write", "file"))
+    for format, fileName, size, serializeSeconds, writeSeconds in rows:
+        print("%-6s %12d %10.3f %10.3f  %s" % (format, size, serializeSeconds, writeSeconds, fileName))
+    print("Saved %d formats (%d bytes) in %.2f s." % (len(rows), sum(row[2] for row in rows), time.time() - start))
+    return _record_array(rows, [('format', 'U'), ('file', 'U'), ('bytes', 'i8'), ('serialize', 'f8'),
+        ('write', 'f8')])
+
+cmd.extend('sexport', sexport)
 
 
 def sfasta(stemName="saved"):
@@ -13464,6 +15312,7 @@ def sfasta(stemName="saved"):
     Save a fasta (sequence) file with a time stamp included in the filename 
     to avoid overwriting an existing dat file.\n Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13474,15 +15323,11 @@ def sfasta(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".fasta")
     PYTHON CODE:
 def sfasta(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".fasta") 
+    _store_output(stemName, 'fasta')
 cmd.extend('sfasta',sfasta)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".fasta") 
+    _store_output(stemName, 'fasta')
 cmd.extend('sfasta',sfasta)
 
 
@@ -13504,6 +15349,7 @@ def sidtf(stemName="saved"):
     included in the filename to avoid overwriting an existing dat file. 
     Read as a commandline argument, a string as the filename stem, 
     or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13514,18 +15360,81 @@ def sidtf(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".idtf")
     PYTHON CODE:
 def sidtf(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".idtf") 
+    _store_output(stemName, 'idtf')
 cmd.extend('sidtf',sidtf)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".idtf") 
+    _store_output(stemName, 'idtf')
 cmd.extend('sidtf',sidtf)
 
 
+def slist(stemName='', format='', last=20):
+    ''' 
+    DESCRIPTION:
+    List the versions in the output store of the save shortcuts (spdb, spse, scif, spng, ...).
+
+    USAGE:
+    slist [stemName [, format [, last]]]
+
+    ARGUMENTS:
+    stemName = string: filename stem of the saves {default: all stems}
+    format = string: file extension, e.g., pse {default: all formats}
+    last = integer: number of the most recent versions to list; 0 lists all {default: 20}
+
+    EXAMPLE:
+    slist
+    slist saved, pse
+
+    MORE DETAILS:
+    Every save by a save shortcut is a new version of its stem and format
+    in the manifest of outputStorePath, with the date, the SHA-256 hash of
+    the content, and its size. A save whose content is already in the 
+    store is marked as a duplicate and takes no space. Pending background
+    writes are finished first. Use srestore to load or export a version.
+
+    RETURNS
+        A NumPy structured array with one record per version and the fields
+        ( stem, format, version, date, bytes, stored, duplicate, sha256 ).
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def slist(stemName='', format='', last=20):
+    _output_store()['queue'].join()
+    entries = [entry for entry in _output_manifest() if (not stemName or entry['stem'] == stemName) and
+        (not format or entry['format'] == format.lstrip('.'))]
+    if int(last):
+        entries = entries[-int(last):]
+    rows = [(entry['stem'], entry['format'], entry['version'], entry['date'], entry['bytes'], entry['stored'],
+        entry['duplicate'], entry['sha256']) for entry in entries]
+    print("%-16s %-6s %7s %-19s %12s %12s  %s" % ("stem", "format", "version", "date", "bytes", "stored", "sha256"))
+    for row in rows:
+        print("%-16s %-6s %7d %-19s %12d %12s  %s" % (row[:5] + ('duplicate' if row[6] else row[5], row[7][:12])))
+    return _record_array(rows, [('stem', 'U'), ('format', 'U'), ('version', 'i4'), ('date', 'U'),
+        ('bytes', 'i8'), ('stored', 'i8'), ('duplicate', '?'), ('sha256', 'U')])
+
+cmd.extend('slist', slist)
+    '''
+
+    _output_store()['queue'].join()
+    entries = [entry for entry in _output_manifest() if (not stemName or entry['stem'] == stemName) and
+        (not format or entry['format'] == format.lstrip('.'))]
+    if int(last):
+        entries = entries[-int(last):]
+    rows = [(entry['stem'], entry['format'], entry['version'], entry['date'], entry['bytes'], entry['stored'],
+        entry['duplicate'], entry['sha256']) for entry in entries]
+    print("%-16s %-6s %7s %-19s %12s %12s  %s" % ("stem", "format", "version", "date", "bytes", "stored", "sha256"))
+    for row in rows:
+        print("%-16s %-6s %7d %-19s %12d %12s  %s" % (row[:5] + ('duplicate' if row[6] else row[5], row[7][:12])))
+    return _record_array(rows, [('stem', 'U'), ('format', 'U'), ('version', 'i4'), ('date', 'U'),
+        ('bytes', 'i8'), ('stored', 'i8'), ('duplicate', '?'), ('sha256', 'U')])
+
+cmd.extend('slist', slist)
+
+
 def smae(stemName="saved"):
     ''' 
     DESCRIPTION:
@@ -13543,6 +15452,7 @@ def smae(stemName="saved"):
     Save a mae (Maestro) file with a time stamp included in the filename 
     to avoid overwriting an existing dat file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13553,15 +15463,11 @@ def smae(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mae")
     PYTHON CODE:
 def smae(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mae") 
+    _store_output(stemName, 'mae')
 cmd.extend('smae',smae)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mae") 
+    _store_output(stemName, 'mae')
 cmd.extend('smae',smae)
 
 
@@ -13582,6 +15488,7 @@ def smmd(stemName="saved"):
     Save a mmd (Macromodel) file with a time stamp included in the filename to avoid
     overwriting an existing Macromodel file. Read as a commandline argument, a string 
     as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13592,15 +15499,11 @@ def smmd(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mmd")
     PYTHON CODE:
 def smmd(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mmd") 
+    _store_output(stemName, 'mmd')
 cmd.extend('smmd',smmd)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mmd") 
+    _store_output(stemName, 'mmd')
 cmd.extend('smmd',smmd)
 
 
@@ -13621,6 +15524,7 @@ def smmod(stemName="saved"):
     Save a mmod (Macromodel) file with a time stamp included in the filename 
     to avoid overwriting an existing Macromodel file.  Read as a commandline 
     argument, a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13631,15 +15535,11 @@ def smmod(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mmod")
     PYTHON CODE:
 def smmod(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mmod") 
+    _store_output(stemName, 'mmod')
 cmd.extend('smmod',smmod)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mmod") 
+    _store_output(stemName, 'mmod')
 cmd.extend('smmod',smmod)
 
 
@@ -13660,6 +15560,7 @@ def smoe(stemName="saved"):
     Save moe file (Molecular Operating Environment) with a time stamp included 
     in the filename to avoid overwriting an existing moe file. Read as a commandline
     argument, a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13670,15 +15571,11 @@ def smoe(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".moe")
     PYTHON CODE:
 def smoe(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".moe") 
+    _store_output(stemName, 'moe')
 cmd.extend('smoe',smoe)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".moe") 
+    _store_output(stemName, 'moe')
 cmd.extend('smoe',smoe)
 
 
@@ -13699,6 +15596,7 @@ def smol(stemName="saved"):
     Save mol file with a time stamp included in the filename to avoid overwriting 
     an existing pmo file. Read as a commandline argument, a string as the 
     filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13709,15 +15607,11 @@ def smol(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mol")
     PYTHON CODE:
 def smol(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mol") 
+    _store_output(stemName, 'mol')
 cmd.extend('smol',smol)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mol") 
+    _store_output(stemName, 'mol')
 cmd.extend('smol',smol)
 
 
@@ -13738,6 +15632,7 @@ def smol2(stemName="saved"):
     Save mol2 (Sybyl file format) file with a time stamp included in the filename 
     to avoid overwriting an existing mol2 file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13748,15 +15643,11 @@ def smol2(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mol2")
     PYTHON CODE:
 def smol2(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mol2") 
+    _store_output(stemName, 'mol2')
 cmd.extend('smol2',smol2)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mol2") 
+    _store_output(stemName, 'mol2')
 cmd.extend('smol2',smol2)
 
 
@@ -13778,6 +15669,7 @@ def smtl(stemName="saved"):
     in the filename to avoid overwriting an existing mtl file. Read as a 
     commandline argument, a string as the filename stem, or use the default 
     filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13788,15 +15680,11 @@ def smtl(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".mtl")
     PYTHON CODE:
 def smtl(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mtl") 
+    _store_output(stemName, 'mtl')
 cmd.extend('smtl',smtl)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".mtl") 
+    _store_output(stemName, 'mtl')
 cmd.extend('smtl',smtl)
 
 
@@ -13818,6 +15706,7 @@ def sobj(stemName="saved"):
     included in the filename to avoid overwriting an existing obj file. Read 
     as a commandline argument, a string as the filename stem, or use the 
     default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13828,15 +15717,11 @@ def sobj(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".obj")
     PYTHON CODE:
 def sobj(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".obj") 
+    _store_output(stemName, 'obj')
 cmd.extend('sobj',sobj)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".obj") 
+    _store_output(stemName, 'obj')
 cmd.extend('sobj',sobj)
 
 
@@ -13857,6 +15742,7 @@ def sout(stemName="saved"):
     Save output data file format with a time stamp included in the filename 
     to avoid overwriting an existing out file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13867,15 +15753,11 @@ def sout(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".out")
     PYTHON CODE:
 def sout(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".out") 
+    _store_output(stemName, 'out')
 cmd.extend('sout',sout)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".out") 
+    _store_output(stemName, 'out')
 cmd.extend('sout',sout)
 
 
@@ -13896,6 +15778,7 @@ def spdb(stemName="saved"):
     Save pdb (Protein Data Bank) file format with a time stamp included in the 
     filename to avoid overwriting an existing out file. Read as a commandline 
     argument, a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13906,15 +15789,11 @@ def spdb(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pdb")
     PYTHON CODE:
 def spdb(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pdb") 
+    _store_output(stemName, 'pdb')
 cmd.extend('spdb',spdb)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pdb") 
+    _store_output(stemName, 'pdb')
 cmd.extend('spdb',spdb)
 
 
@@ -13935,6 +15814,7 @@ def spkl(stemName="saved"):
     Save a pkl file (Python pickle file) with a time stamp included in the filename 
     to avoid overwriting an existing out file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13945,15 +15825,11 @@ def spkl(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pkl")
     PYTHON CODE:
 def spkl(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pkl") 
+    _store_output(stemName, 'pkl')
 cmd.extend('spkl',spkl)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pkl") 
+    _store_output(stemName, 'pkl')
 cmd.extend('spkl',spkl)
 
 
@@ -13975,6 +15851,7 @@ def spkla(stemName="saved"):
     the filename to avoid overwriting an existing out file. Read as a 
     commandline argument, a string as the filename stem, or use the 
     default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -13985,15 +15862,11 @@ def spkla(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pkla")
     PYTHON CODE:
 def spkla(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pkla") 
+    _store_output(stemName, 'pkla')
 cmd.extend('spkla',spkla)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pkla") 
+    _store_output(stemName, 'pkla')
 cmd.extend('spkla',spkla)
 
 
@@ -14014,6 +15887,7 @@ def spmo(stemName="saved"):
     Save pmo file (XYZ, binary format file) with a time stamp included in the filename 
     to avoid overwriting an existing pmo file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14024,15 +15898,11 @@ def spmo(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pmo")
     PYTHON CODE:
 def spmo(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pmo") 
+    _store_output(stemName, 'pmo')
 cmd.extend('spmo',spmo)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pmo") 
+    _store_output(stemName, 'pmo')
 cmd.extend('spmo',spmo)
 
 
@@ -14053,6 +15923,7 @@ def spng(stemName="saved"):
     Save a png file (Python pickle file) with a time stamp included in the filename to avoid     
     overwriting an existing out file.\n Read as a commandline argument, a string as the 
     ilename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14063,15 +15934,11 @@ def spng(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".png")
     PYTHON CODE:
 def spng(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".png") 
+    _store_output(stemName, 'png')
 cmd.extend('spng',spng)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".png") 
+    _store_output(stemName, 'png')
 cmd.extend('spng',spng)
 
 
@@ -14092,6 +15959,7 @@ def spov(stemName="saved"):
     Save pov (POV-ray tracing file format) file with a time stamp included in the filename 
     to avoid overwriting an existing out file. Read as a commandline argument, a string 
     as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14102,15 +15970,11 @@ def spov(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pov")
     PYTHON CODE:
 def spov(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pov") 
+    _store_output(stemName, 'pov')
 cmd.extend('spov',spov)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pov") 
+    _store_output(stemName, 'pov')
 cmd.extend('spov',spov)
 
 
@@ -14135,6 +15999,7 @@ A pqr (PDB file with the temperature and occupancy columns replaced
     a time stamp included in the filename to avoid overwriting an existing 
     out file. Read as a commandline argument, a string as the filename stem, 
     or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14145,15 +16010,11 @@ A pqr (PDB file with the temperature and occupancy columns replaced
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pqr")
     PYTHON CODE:
 def spqr(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pqr") 
+    _store_output(stemName, 'pqr')
 cmd.extend('spqr',spqr)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pqr") 
+    _store_output(stemName, 'pqr')
 cmd.extend('spqr',spqr)
 
 
@@ -14174,6 +16035,7 @@ def spse(stemName="saved"):
     Save session file with a time stamp included in the filename to avoid 
     overwriting an existing pse file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14184,18 +16046,115 @@ def spse(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".pse")
     PYTHON CODE:
 def spse(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pse") 
+    _store_output(stemName, 'pse')
 cmd.extend('spse',spse)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".pse") 
+    _store_output(stemName, 'pse')
 cmd.extend('spse',spse)
 
 
+def srestore(stemName='saved', format='pse', version=0, name='', fileName=''):
+    ''' 
+    DESCRIPTION:
+    Load a version from the output store of the save shortcuts or copy it to a file.
+
+    USAGE:
+    srestore [stemName [, format [, version [, name [, fileName]]]]]
+
+    ARGUMENTS:
+    stemName = string: filename stem of the save {default: saved}
+    format = string: file extension of the save {default: pse}
+    version = integer: version number from slist; 0 is the latest and -1 the one before {default: 0}
+    name = string: name of the new object {default: stemName_vN}
+    fileName = string: write the version to this file instead of loading it {default: none}
+
+    EXAMPLE:
+    srestore
+    srestore saved, pdb, 3
+    srestore saved, png, fileName=figure1.png
+
+    MORE DETAILS:
+    A pse version replaces the current session. Versions of coordinate 
+    formats (pdb, cif, sdf, mol, mol2, mae, pqr, xyz) are loaded from 
+    memory as a new object. Other formats (png, wrl, ...) can only be
+    copied to a file. Compressed versions are decompressed.
+
+    VERTICAL PML SCRIPT:
+    NA
+    HORIZONTAL PML SCRIPT:
+    NA
+
+    PYTHON CODE:
+def srestore(stemName='saved', format='pse', version=0, name='', fileName=''):
+    format, version = format.lstrip('.'), int(version)
+    _output_store()['queue'].join()
+    entries = [entry for entry in _output_manifest() if entry['stem'] == stemName and entry['format'] == format]
+    if version > 0:
+        entries = [entry for entry in entries if entry['version'] == version]
+    elif entries and -version < len(entries):
+        entries = [entries[version - 1]]
+    else:
+        entries = []
+    if not entries:
+        print("No version %d of %s (%s) in the output store; see slist." % (version, stemName, format))
+        return
+    entry = entries[-1]
+    with open(os.path.join(outputStorePath, entry['file']), 'rb') as f:
+        content = _decompress_output(f.read(), entry.get('compression'))
+
+    if fileName:
+        with open(fileName, 'wb') as f:
+            f.write(content)
+        print("Wrote version %d of %s (%s) to %s." % (entry['version'], stemName, format, fileName))
+    elif format == 'pse':
+        import pickle
+        cmd.set_session(pickle.loads(content))
+        print("Restored version %d of the session %s from %s." % (entry['version'], stemName, entry['date']))
+    elif format in _outputLoadable:
+        name = name or '%s_v%d' % (stemName, entry['version'])
+        cmd.load_raw(content.decode(), format, name)
+        print("Loaded version %d of %s (%s) as %s." % (entry['version'], stemName, format, name))
+    else:
+        print("%s files cannot be loaded into PyMOL; give a fileName to copy the version to." % format)
+
+cmd.extend('srestore', srestore)
+    '''
+
+    format, version = format.lstrip('.'), int(version)
+    _output_store()['queue'].join()
+    entries = [entry for entry in _output_manifest() if entry['stem'] == stemName and entry['format'] == format]
+    if version > 0:
+        entries = [entry for entry in entries if entry['version'] == version]
+    elif entries and -version < len(entries):
+        entries = [entries[version - 1]]
+    else:
+        entries = []
+    if not entries:
+        print("No version %d of %s (%s) in the output store; see slist." % (version, stemName, format))
+        return
+    entry = entries[-1]
+    with open(os.path.join(outputStorePath, entry['file']), 'rb') as f:
+        content = _decompress_output(f.read(), entry.get('compression'))
+
+    if fileName:
+        with open(fileName, 'wb') as f:
+            f.write(content)
+        print("Wrote version %d of %s (%s) to %s." % (entry['version'], stemName, format, fileName))
+    elif format == 'pse':
+        import pickle
+        cmd.set_session(pickle.loads(content))
+        print("Restored version %d of the session %s from %s." % (entry['version'], stemName, entry['date']))
+    elif format in _outputLoadable:
+        name = name or '%s_v%d' % (stemName, entry['version'])
+        cmd.load_raw(content.decode(), format, name)
+        print("Loaded version %d of %s (%s) as %s." % (entry['version'], stemName, format, name))
+    else:
+        print("%s files cannot be loaded into PyMOL; give a fileName to copy the version to." % format)
+
+cmd.extend('srestore', srestore)
+
+
 def srv(StoredView=0, decimal_places=2, fileStemName="roundedview"):
     ''' 
     DESCRIPTION:
@@ -14356,6 +16315,7 @@ def ssdf(stemName="saved"):
     Save session file with a time stamp included in the filename to avoid 
     overwriting an existing sdf file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14366,15 +16326,11 @@ def ssdf(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".sdf")
     PYTHON CODE:
 def ssdf(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".sdf") 
+    _store_output(stemName, 'sdf')
 cmd.extend('ssdf',ssdf)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".sdf") 
+    _store_output(stemName, 'sdf')
 cmd.extend('ssdf',ssdf)
 
 
@@ -14460,33 +16416,97 @@ def st3(fileName="test.pml"):
 
     PYTHON CODE:
 def st3(fileName="test.pml"):
-    try:
-        print("Opening the text editor Sublime Text 3.");
-        subprocess.Popen(sublimeText3Open)
-        print("Success opening Sublime Text 3.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the sublpen'. \n  Or use 'sublimeText3Path' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor Sublime Text 3.")
+    _launch_app('st3', sublimeText3Open)
 
 cmd.extend('st3',st3)
     '''
 
-    try:
-        print("Opening the text editor Sublime Text 3.");
-        subprocess.Popen(sublimeText3Open)
-        print("Success opening Sublime Text 3.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the sublpen'. \n  Or use 'sublimeText3Path' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the text editor Sublime Text 3.")
+    _launch_app('st3', sublimeText3Open)
 
 cmd.extend('st3',st3)
 
 
-def supercell(a=1, b=1, c=1, object=None, color='blue', name='supercell', withmates=1):
+# Cell basis and fractional symmetry operators by space group and cell, shared by supercell and symexpcell.
+_symmetryOperators = {}
+
+
+def _symmetry_operators(object):
+    '''
+    Return (basis, inverse of basis, operators) of the crystal symmetry of an object.
+
+    basis is the 4x4 matrix from cellbasis and operators is an (n, 4, 4)
+    array of the fractional operators of the space group. They are computed
+    once per cell and space group and cached.
+    '''
+    sym = tuple(cmd.get_symmetry(object))
+    if sym not in _symmetryOperators:
+        basis = cellbasis(list(sym[3:6]), list(sym[0:3]))
+        operators = numpy.array(xray.sg_sym_to_mat_list(sym[6]), dtype=float)
+        _symmetryOperators[sym] = (basis, numpy.linalg.inv(basis), operators)
+    return _symmetryOperators[sym]
+
+
+def _cell_transforms(object, cells, center=None):
+    '''
+    Return an (m, n, 4, 4) array of the Cartesian transforms that place the n
+    symmetry mates of object with their center in each of the m unit cells 
+    in cells, a list of (a, b, c) lattice translations. center is the 
+    Cartesian center of object {default: the center of its bounding box}.
+
+    All of the transforms are made with one batch of NumPy matrix products.
+    '''
+    basis, basisInverse, operators = _symmetry_operators(object)
+    if center is None:
+        center = numpy.array(cmd.get_extent(object)).sum(axis=0) * 0.5
+    centerCell = basisInverse.dot(numpy.append(center, 1.0))
+    shifts = numpy.floor(operators.dot(centerCell))[:, 0:3]
+
+    fractional = numpy.repeat(operators[None], len(cells), axis=0)
+    fractional[:, :, 0:3, 3] += numpy.asarray(cells, dtype=float)[:, None, :] - shifts[None, :, :]
+    return numpy.einsum('ij,mnjk,kl->mnil', basis, fractional, basisInverse)
+
+
+# Values of the mates argument of supercell, symexpcell, and packingContacts.
+_mateModes = ('full', 'trace', 'cgo')
+
+
+def _make_mates(object, names, transforms, colors, mates='full', cgoName='mates'):
+    '''
+    Make symmetry mates of object with the 4x4 transforms in transforms.
+
+    mates is 'full' for copies of the whole object, 'trace' for copies of
+    the CA and P atoms only, or 'cgo' for a single CGO object named cgoName
+    with a sphere at each CA and P atom of every mate. The mates get the
+    names in names and the color indices in colors.
+    '''
+    transforms = numpy.asarray(transforms)
+    if mates == 'cgo':
+        xyz = cmd.get_coords('(%s) and name CA+P' % object)
+        if xyz is None:
+            print("%s has no CA or P atoms." % object)
+            return
+        spheres = numpy.empty((len(transforms), len(xyz), 5))
+        spheres[:, :, 0] = cgo.SPHERE
+        spheres[:, :, 1:4] = numpy.einsum('nij,pj->npi', transforms[:, 0:3, 0:3], xyz) + transforms[:, None, 0:3, 3]
+        spheres[:, :, 4] = 1.0
+        obj = []
+        for color, block in zip(colors, spheres):
+            obj.extend([cgo.COLOR] + list(cmd.get_color_tuple(color)))
+            obj.extend(block.ravel().tolist())
+        cmd.delete(cgoName)
+        cmd.load_cgo(obj, cgoName)
+        return
+
+    source = object if mates == 'full' else '(%s) and name CA+P' % object
+    for name, mat, color in zip(names, transforms, colors):
+        cmd.create(name, source)
+        cmd.transform_object(name, list(mat.flat), 0)
+        cmd.color(color, name)
+
+
+def supercell(a=1, b=1, c=1, object=None, color='blue', name='supercell', withmates=1, mates='full'):
 
     ''' 
     DESCRIPTION:
@@ -14509,6 +16529,8 @@ color = string: color of cell {default: blue}
 name = string: name of the cgo object to create {default: supercell}
  
 withmates = bool: also create symmetry mates in displayed cells {default: 1}
+ 
+mates = string: full, trace, or cgo; see below {default: full}
 
     EXAMPLE:
     NA
@@ -14520,8 +16542,17 @@ withmates = bool: also create symmetry mates in displayed cells {default: 1}
 
     source: https://pymolwiki.org/index.php/Supercell
 
-    Calls two other functions: cellbasis and symexpcell.
-    Both of these functions are also in this collection.
+    Calls cellbasis, which is also in this collection.
+
+    The cell basis and the symmetry operators are computed once per cell
+    and space group, and the transforms of all mates in all cells are made
+    in one batch of NumPy matrix products.
+
+    mates=full makes a copy of the whole object for each mate (the behavior
+    of the original script). mates=trace copies only the CA and P atoms,
+    which saves memory for large crystals. mates=cgo makes one CGO object
+    named <name>_mates with a sphere at each CA and P atom of every mate;
+    it is the fastest to make and to render.
 
     (c) 2010 Thomas Holder
 
@@ -14533,17 +16564,15 @@ withmates = bool: also create symmetry mates in displayed cells {default: 1}
     HORIZONTAL PML SCRIPT:
     NotYet
     PYTHON CODE:
-def supercell(a=1, b=1, c=1, object=None, color='blue', name='supercell', withmates=1):
+def supercell(a=1, b=1, c=1, object=None, color='blue', name='supercell', withmates=1, mates='full'):
 
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
     if object is None:
         object = cmd.get_object_list()[0]
     withmates = int(withmates)
-    sym = cmd.get_symmetry(object)
-    cell_edges = sym[0:3]
-    cell_angles = sym[3:6]
- 
-    basis = cellbasis(cell_angles, cell_edges)
-    assert isinstance(basis, numpy.ndarray)
+    basis = _symmetry_operators(object)[0]
  
     ts = list()
     for i in range(int(a)):
@@ -14575,25 +16604,27 @@ def supercell(a=1, b=1, c=1, object=None, color='blue', name='supercell', withma
                 obj.append(cgo.VERTEX)
                 obj.extend((shift + vj[j] + vi).tolist())
  
-        if withmates:
-            symexpcell('m%d%d%d_' % tuple(t), object, *t)
- 
     obj.append(cgo.END)
     cmd.delete(name)
     cmd.load_cgo(obj, name)
 
+    if withmates:
+        transforms = _cell_transforms(object, ts)
+        nOperators = transforms.shape[1]
+        names = ['m%d%d%d_%d' % (t[0], t[1], t[2], i + 1) for t in ts for i in range(nOperators)]
+        colors = [i + 2 for t in ts for i in range(nOperators)]
+        _make_mates(object, names, transforms.reshape(-1, 4, 4), colors, mates, name + '_mates')
+
 cmd.extend('supercell', supercell)
     '''
 
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
     if object is None:
         object = cmd.get_object_list()[0]
     withmates = int(withmates)
-    sym = cmd.get_symmetry(object)
-    cell_edges = sym[0:3]
-    cell_angles = sym[3:6]
- 
-    basis = cellbasis(cell_angles, cell_edges)
-    assert isinstance(basis, numpy.ndarray)
+    basis = _symmetry_operators(object)[0]
  
     ts = list()
     for i in range(int(a)):
@@ -14625,13 +16656,17 @@ cmd.extend('supercell', supercell)
                 obj.append(cgo.VERTEX)
                 obj.extend((shift + vj[j] + vi).tolist())
  
-        if withmates:
-            symexpcell('m%d%d%d_' % tuple(t), object, *t)
- 
     obj.append(cgo.END)
     cmd.delete(name)
     cmd.load_cgo(obj, name)
 
+    if withmates:
+        transforms = _cell_transforms(object, ts)
+        nOperators = transforms.shape[1]
+        names = ['m%d%d%d_%d' % (t[0], t[1], t[2], i + 1) for t in ts for i in range(nOperators)]
+        colors = [i + 2 for t in ts for i in range(nOperators)]
+        _make_mates(object, names, transforms.reshape(-1, 4, 4), colors, mates, name + '_mates')
+
 cmd.extend('supercell', supercell)
 
 
@@ -14654,6 +16689,7 @@ def swrl(stemName="saved"):
     Save wrl (VRML 2 file format) file with a time stamp included in the filename 
     to avoid overwriting an existing sdf file. Read as a commandline argument, 
     a string as the filename stem, or use the default filename stem "saved".
+    The file is kept as a new version in the output store (outputStorePath); see slist and srestore.
 
 
     VERTICAL PML SCRIPT:
@@ -14664,19 +16700,15 @@ def swrl(stemName="saved"):
     DT =datetime.datetime.now().strftime("y%Ym%md%dh%Hm%Ms%S");s = str(DT);cmd.save(stemName+s+".wrl")
     PYTHON CODE:
 def swrl(stemName="saved"):
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".wrl") 
+    _store_output(stemName, 'wrl')
 cmd.extend('swrlf',swrl)
     '''
 
-    DT =datetime.datetime.now().strftime("yr%Ymo%mday%dhr%Hmin%Msec%S")
-    s = str(DT)
-    cmd.save(stemName+s+".wrl") 
+    _store_output(stemName, 'wrl')
 cmd.extend('swrlf',swrl)
 
 
-def symexpcell(prefix='mate', object=None, a=0, b=0, c=0):
+def symexpcell(prefix='mate', object=None, a=0, b=0, c=0, mates='full'):
     ''' 
     DESCRIPTION:
     Creates all symmetry-related objects for the specified object that occur with their bounding box center within the unit cell.
@@ -14694,6 +16726,8 @@ object = string: object for which to create symmetry mates
 
 a, b, c = integer: create neighboring cell {default: 0,0,0}
 
+mates = string: full, trace (CA and P atoms only), or cgo (one CGO object <prefix>_mates of spheres) {default: full}
+
     EXAMPLE:
     NA
 
@@ -14701,7 +16735,7 @@ a, b, c = integer: create neighboring cell {default: 0,0,0}
     Creates all symmetry-related objects for the specified object that occur with their 
     bounding box center within the unit cell.
 
-    Used by the function supercell.
+    Used by the function supercell. See supercell for the mates argument.
 
     Also see symexp, http://www.pymolwiki.org/index.php/SuperSym.
 
@@ -14712,81 +16746,33 @@ a, b, c = integer: create neighboring cell {default: 0,0,0}
     HORIZONTAL PML SCRIPT:
     NotYet
     PYTHON CODE:
-def symexpcell(prefix='mate', object=None, a=0, b=0, c=0):
+def symexpcell(prefix='mate', object=None, a=0, b=0, c=0, mates='full'):
+
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
     if object is None:
         object = cmd.get_object_list()[0]
 
-    sym = cmd.get_symmetry(object)
-    cell_edges = sym[0:3]
-    cell_angles = sym[3:6]
-    spacegroup = sym[6]
-
-    basis = cellbasis(cell_angles, cell_edges)
-    basis = numpy.matrix(basis)
-
-    extent = cmd.get_extent(object)
-    center = sum(numpy.array(extent)) * 0.5
-    center = numpy.matrix(center.tolist() + [1.0]).T
-    center_cell = basis.I * center
+    transforms = _cell_transforms(object, [(int(a), int(b), int(c))])[0]
+    names = ['%s%d' % (prefix, i + 1) for i in range(len(transforms))]
+    colors = [i + 2 for i in range(len(transforms))]
+    _make_mates(object, names, transforms, colors, mates, '%s_mates' % prefix)
 
-    extra_shift = [[float(i)] for i in (a,b,c)]
-
-    i = 0
-    matrices = xray.sg_sym_to_mat_list(spacegroup)
-    for mat in matrices:
-        i += 1
-
-        mat = numpy.matrix(mat)
-        shift = numpy.floor(mat * center_cell)
-        mat[0:3,3] -= shift[0:3,0]
-        mat[0:3,3] += extra_shift
-
-        mat = basis * mat * basis.I
-        mat_list = list(mat.flat)
-
-        name = '%s%d' % (prefix, i)
-        cmd.create(name, object)
-        cmd.transform_object(name, mat_list, 0)
-        cmd.color(i+1, name)
 cmd.extend('symexpcell', symexpcell)
-
     '''
 
+    if mates not in _mateModes:
+        print("mates must be full, trace, or cgo, not %s." % mates)
+        return
     if object is None:
         object = cmd.get_object_list()[0]
 
-    sym = cmd.get_symmetry(object)
-    cell_edges = sym[0:3]
-    cell_angles = sym[3:6]
-    spacegroup = sym[6]
-
-    basis = cellbasis(cell_angles, cell_edges)
-    basis = numpy.matrix(basis)
-
-    extent = cmd.get_extent(object)
-    center = sum(numpy.array(extent)) * 0.5
-    center = numpy.matrix(center.tolist() + [1.0]).T
-    center_cell = basis.I * center
+    transforms = _cell_transforms(object, [(int(a), int(b), int(c))])[0]
+    names = ['%s%d' % (prefix, i + 1) for i in range(len(transforms))]
+    colors = [i + 2 for i in range(len(transforms))]
+    _make_mates(object, names, transforms, colors, mates, '%s_mates' % prefix)
 
-    extra_shift = [[float(i)] for i in (a,b,c)]
-
-    i = 0
-    matrices = xray.sg_sym_to_mat_list(spacegroup)
-    for mat in matrices:
-        i += 1
-
-        mat = numpy.matrix(mat)
-        shift = numpy.floor(mat * center_cell)
-        mat[0:3,3] -= shift[0:3,0]
-        mat[0:3,3] += extra_shift
-
-        mat = basis * mat * basis.I
-        mat_list = list(mat.flat)
-
-        name = '%s%d' % (prefix, i)
-        cmd.create(name, object)
-        cmd.transform_object(name, mat_list, 0)
-        cmd.color(i+1, name)
 cmd.extend('symexpcell', symexpcell)
 
 
@@ -14819,25 +16805,15 @@ def term():
 
     PYTHON CODE:
 def term():
-    try:
-        print("Opening a terminal.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.check_output(terminalOpen)
-        print("Opened a terminal.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening a terminal.")
+    _launch_app('term', terminalOpen)
 
 
 cmd.extend('term',term)
     '''
 
-    try:
-        print("Opening a terminal.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.check_output(terminalOpen)
-        print("Opened a terminal.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening a terminal.")
+    _launch_app('term', terminalOpen)
 
 
 cmd.extend('term',term)
@@ -14861,7 +16837,9 @@ def timcolor(selection='all'):
 
     MORE DETAILS:
     Tim Mather's biophyscial coloring scheme for proteins.
-    The scheme is defined in the dictionary below.
+    The scheme is defined in the dictionary below and stored
+    as the 'timcolor' palette in _colorPalettes. The backbone
+    atoms (CA, N, C, O) are colored white.
     This scheme applies only to proteins. 
     See the yrb shortcut for an alternate coloring scheme. 
 
@@ -14877,62 +16855,16 @@ def timcolor(selection='all'):
     NA
     PYTHON CODE:
 def timcolor(selection='all'):
-    print(selection)
-    code={'acid'    :  'red'    ,
-          'basic'   :  'blue'   ,
-          'nonpolar':  'orange' ,
-          'polar'   :  'green'  ,
-          'cys'     :  'yellow'}
-
-    cmd.select('calcium', 'resn ca or resn cal')
-    cmd.select('acid', 'resn asp or resn glu or resn cgu')
-    cmd.select('basic', 'resn arg or resn lys or resn his')
-    cmd.select('nonpolar', 'resn met or resn phe or resn pro or resn trp or resn val or resn leu or resn ile or resn ala')
-    cmd.select('polar', 'resn ser or resn thr or resn asn or resn gln or resn tyr')
-    cmd.select('cys', 'resn cys or resn cyx')
-    cmd.select('backbone', 'name ca or name n or name c or name o')
-
-    cmd.select ('none')
-    for elem in code:
-        line='color '+code[elem]+','+elem+'&'+selection
-        print(line)
-        cmd.do (line)
-    word='color white,backbone &'+selection
-    print(word)
-    cmd.do (word)  #Used to be in code, but looks like
-                              #dictionnaries are accessed at random
-    cmd.hide ('everything','resn HOH')
-    cmd.show('surface',selection)
+    _color_by_residue(selection, 'timcolor')
+    cmd.hide('everything', 'resn HOH')
+    cmd.show('surface', selection)
 
 cmd.extend('timcolor',timcolor)
     '''
 
-    print(selection)
-    code={'acid'    :  'red'    ,
-          'basic'   :  'blue'   ,
-          'nonpolar':  'orange' ,
-          'polar'   :  'green'  ,
-          'cys'     :  'yellow'}
-
-    cmd.select('calcium', 'resn ca or resn cal')
-    cmd.select('acid', 'resn asp or resn glu or resn cgu')
-    cmd.select('basic', 'resn arg or resn lys or resn his')
-    cmd.select('nonpolar', 'resn met or resn phe or resn pro or resn trp or resn val or resn leu or resn ile or resn ala')
-    cmd.select('polar', 'resn ser or resn thr or resn asn or resn gln or resn tyr')
-    cmd.select('cys', 'resn cys or resn cyx')
-    cmd.select('backbone', 'name ca or name n or name c or name o')
-
-    cmd.select ('none')
-    for elem in code:
-        line='color '+code[elem]+','+elem+'&'+selection
-        print(line)
-        cmd.do (line)
-    word='color white,backbone &'+selection
-    print(word)
-    cmd.do (word)  #Used to be in code, but looks like
-                              #dictionnaries are accessed at random
-    cmd.hide ('everything','resn HOH')
-    cmd.show('surface',selection)
+    _color_by_residue(selection, 'timcolor')
+    cmd.hide('everything', 'resn HOH')
+    cmd.show('surface', selection)
 
 cmd.extend('timcolor',timcolor)
 
@@ -14954,7 +16886,7 @@ def tvdw(arg1='all'):
     MORE DETAILS:
     vdwTrans creates a copy of an object with full-sized, transparent spheres.
     This looks cool when combined with the bs shortcut. 
-    Bondi VDW values added below to override default Pymol settings
+    The Bondi VDW values in _bondiRadii override the default PyMOL radii of the atoms in the selection.
     The code is from  Bobby Paton at Colorado State University
      https://gist.githubusercontent.com/bobbypaton/\
     1cdc4784f3fc8374467bae5eb410edef/raw/\
@@ -14967,300 +16899,16 @@ def tvdw(arg1='all'):
     NA
     PYTHON CODE:
 def tvdw(arg1='all'):
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-   #van der Waals settings
-    cmd.copy(arg1+"_vdw", arg1)
-    cmd.set("sphere_scale",1.0, arg1+"_vdw and elem H")
-    cmd.rebuild()
-    cmd.set("sphere_scale", 1, arg1+"_vdw")
-    cmd.hide("nonbonded", arg1+"_vdw")
-    cmd.hide("lines", arg1+"_vdw")
-    cmd.hide("sticks", arg1+"_vdw")
-    cmd.hide("cartoon", arg1+"_vdw")
-    cmd.show("spheres", arg1+"_vdw")
-    cmd.set("sphere_transparency", 0.7, arg1+"_vdw")
-
-    print("Note that the selection of 'all' does not work when applying this function")
-    print("to multiple models as are found in pdb1 files and when multiple chains")
-    print("make up the biological unit.")
-    print("The shortcut has to be applied separately to each model.")
-
+    _set_vdw(arg1)
+    _ball_and_stick_workspace()
+    _vdw_copy(arg1)
 
 cmd.extend('tvdw', tvdw)
     '''
 
-    # Bondi VDW values 
-    cmd.alter("elem Ac", "vdw=2.00")
-    cmd.alter("elem Al", "vdw=2.00")
-    cmd.alter("elem Am", "vdw=2.00")
-    cmd.alter("elem Sb", "vdw=2.00")
-    cmd.alter("elem Ar", "vdw=1.88")
-    cmd.alter("elem As", "vdw=1.85")
-    cmd.alter("elem At", "vdw=2.00")
-    cmd.alter("elem Ba", "vdw=2.00")
-    cmd.alter("elem Bk", "vdw=2.00")
-    cmd.alter("elem Be", "vdw=2.00")
-    cmd.alter("elem Bi", "vdw=2.00")
-    cmd.alter("elem Bh", "vdw=2.00")
-    cmd.alter("elem B ", "vdw=2.00")
-    cmd.alter("elem Br", "vdw=1.85")
-    cmd.alter("elem Cd", "vdw=1.58")
-    cmd.alter("elem Cs", "vdw=2.00")
-    cmd.alter("elem Ca", "vdw=2.00")
-    cmd.alter("elem Cf", "vdw=2.00")
-    cmd.alter("elem C ", "vdw=1.70")
-    cmd.alter("elem Ce", "vdw=2.00")
-    cmd.alter("elem Cl", "vdw=1.75")
-    cmd.alter("elem Cr", "vdw=2.00")
-    cmd.alter("elem Co", "vdw=2.00")
-    cmd.alter("elem Cu", "vdw=1.40")
-    cmd.alter("elem Cm", "vdw=2.00")
-    cmd.alter("elem Ds", "vdw=2.00")
-    cmd.alter("elem Db", "vdw=2.00")
-    cmd.alter("elem Dy", "vdw=2.00")
-    cmd.alter("elem Es", "vdw=2.00")
-    cmd.alter("elem Er", "vdw=2.00")
-    cmd.alter("elem Eu", "vdw=2.00")
-    cmd.alter("elem Fm", "vdw=2.00")
-    cmd.alter("elem F ", "vdw=1.47")
-    cmd.alter("elem Fr", "vdw=2.00")
-    cmd.alter("elem Gd", "vdw=2.00")
-    cmd.alter("elem Ga", "vdw=1.87")
-    cmd.alter("elem Ge", "vdw=2.00")
-    cmd.alter("elem Au", "vdw=1.66")
-    cmd.alter("elem Hf", "vdw=2.00")
-    cmd.alter("elem Hs", "vdw=2.00")
-    cmd.alter("elem He", "vdw=1.40")
-    cmd.alter("elem Ho", "vdw=2.00")
-    cmd.alter("elem In", "vdw=1.93")
-    cmd.alter("elem I ", "vdw=1.98")
-    cmd.alter("elem Ir", "vdw=2.00")
-    cmd.alter("elem Fe", "vdw=2.00")
-    cmd.alter("elem Kr", "vdw=2.02")
-    cmd.alter("elem La", "vdw=2.00")
-    cmd.alter("elem Lr", "vdw=2.00")
-    cmd.alter("elem Pb", "vdw=2.02")
-    cmd.alter("elem Li", "vdw=1.82")
-    cmd.alter("elem Lu", "vdw=2.00")
-    cmd.alter("elem Mg", "vdw=1.73")
-    cmd.alter("elem Mn", "vdw=2.00")
-    cmd.alter("elem Mt", "vdw=2.00")
-    cmd.alter("elem Md", "vdw=2.00")
-    cmd.alter("elem Hg", "vdw=1.55")
-    cmd.alter("elem Mo", "vdw=2.00")
-    cmd.alter("elem Nd", "vdw=2.00")
-    cmd.alter("elem Ne", "vdw=1.54")
-    cmd.alter("elem Np", "vdw=2.00")
-    cmd.alter("elem Ni", "vdw=1.63")
-    cmd.alter("elem Nb", "vdw=2.00")
-    cmd.alter("elem N ", "vdw=1.55")
-    cmd.alter("elem No", "vdw=2.00")
-    cmd.alter("elem Os", "vdw=2.00")
-    cmd.alter("elem O ", "vdw=1.52")
-    cmd.alter("elem Pd", "vdw=1.63")
-    cmd.alter("elem P ", "vdw=1.80")
-    cmd.alter("elem Pt", "vdw=1.72")
-    cmd.alter("elem Pu", "vdw=2.00")
-    cmd.alter("elem Po", "vdw=2.00")
-    cmd.alter("elem K ", "vdw=2.75")
-    cmd.alter("elem Pr", "vdw=2.00")
-    cmd.alter("elem Pm", "vdw=2.00")
-    cmd.alter("elem Pa", "vdw=2.00")
-    cmd.alter("elem Ra", "vdw=2.00")
-    cmd.alter("elem Rn", "vdw=2.00")
-    cmd.alter("elem Re", "vdw=2.00")
-    cmd.alter("elem Rh", "vdw=2.00")
-    cmd.alter("elem Rb", "vdw=2.00")
-    cmd.alter("elem Ru", "vdw=2.00")
-    cmd.alter("elem Rf", "vdw=2.00")
-    cmd.alter("elem Sm", "vdw=2.00")
-    cmd.alter("elem Sc", "vdw=2.00")
-    cmd.alter("elem Sg", "vdw=2.00")
-    cmd.alter("elem Se", "vdw=1.90")
-    cmd.alter("elem Si", "vdw=2.10")
-    cmd.alter("elem Ag", "vdw=1.72")
-    cmd.alter("elem Na", "vdw=2.27")
-    cmd.alter("elem Sr", "vdw=2.00")
-    cmd.alter("elem S ", "vdw=1.80")
-    cmd.alter("elem Ta", "vdw=2.00")
-    cmd.alter("elem Tc", "vdw=2.00")
-    cmd.alter("elem Te", "vdw=2.06")
-    cmd.alter("elem Tb", "vdw=2.00")
-    cmd.alter("elem Tl", "vdw=1.96")
-    cmd.alter("elem Th", "vdw=2.00")
-    cmd.alter("elem Tm", "vdw=2.00")
-    cmd.alter("elem Sn", "vdw=2.17")
-    cmd.alter("elem Ti", "vdw=2.00")
-    cmd.alter("elem W ", "vdw=2.00")
-    cmd.alter("elem U ", "vdw=1.86")
-    cmd.alter("elem V ", "vdw=2.00")
-    cmd.alter("elem Xe", "vdw=2.16")
-    cmd.alter("elem Yb", "vdw=2.00")
-    cmd.alter("elem Y ", "vdw=2.00")
-    cmd.alter("elem Zn", "vdw=1.39")
-    cmd.alter("elem Zr", "vdw=2.00")
-    cmd.rebuild()
-
-    # workspace settings
-    cmd.bg_color("white")
-    cmd.set("ray_opaque_background", "off")
-    cmd.set("orthoscopic", 0)
-    cmd.set("transparency", 0.5)
-    cmd.set("dash_gap", 0)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_texture", 2)
-    cmd.set("antialias", 3)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("specular", 1)
-    cmd.set("reflect", .1)
-    cmd.space("cmyk")
-
-   #van der Waals settings
-    cmd.copy(arg1+"_vdw", arg1)
-    cmd.set("sphere_scale",1.0, arg1+"_vdw and elem H")
-    cmd.rebuild()
-    cmd.set("sphere_scale", 1, arg1+"_vdw")
-    cmd.hide("nonbonded", arg1+"_vdw")
-    cmd.hide("lines", arg1+"_vdw")
-    cmd.hide("sticks", arg1+"_vdw")
-    cmd.hide("cartoon", arg1+"_vdw")
-    cmd.show("spheres", arg1+"_vdw")
-    cmd.set("sphere_transparency", 0.7, arg1+"_vdw")
-
-    print("Note that the selection of 'all' does not work when applying this function")
-    print("to multiple models as are found in pdb1 files and when multiple chains")
-    print("make up the biological unit.")
-    print("The shortcut has to be applied separately to each model.")
-
+    _set_vdw(arg1)
+    _ball_and_stick_workspace()
+    _vdw_copy(arg1)
 
 cmd.extend('tvdw', tvdw)
 
@@ -15288,13 +16936,13 @@ def tvdwbw(arg1='all'):
     PYTHON CODE:
 def tvdwbw(arg1='all'):
     tvdw(arg1)
-    gscale(ag1)
+    gscale(arg1)
 
 cmd.extend('tvdwbw', tvdwbw)
     '''
 
     tvdw(arg1)
-    gscale(ag1)
+    gscale(arg1)
 
 cmd.extend('tvdwbw', tvdwbw)
 
@@ -15326,28 +16974,14 @@ def vim():
 
     PYTHON CODE:
 def vim():
-    try:
-        print("Opening the molecular graphics program vim.");
-        subprocess.check_output(vimOpen)
-        print("Success opening vim.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the vimOpen'. \n  Or use 'vimPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program vim.")
+    _launch_app('vim', vimOpen)
 
 cmd.extend('vim',vim)
     '''
 
-    try:
-        print("Opening the molecular graphics program vim.");
-        subprocess.check_output(vimOpen)
-        print("Success opening vim.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the vimOpen'. \n  Or use 'vimPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program vim.")
+    _launch_app('vim', vimOpen)
 
 cmd.extend('vim',vim)
 
@@ -15378,28 +17012,14 @@ return
     subprocess.call(vmdOpen);return
     PYTHON CODE:
 def vmd():
-    try:
-        print("Opening the molecular graphics program VMD.");
-        subprocess.check_output(vmdOpen)
-        print("Success opening VMD.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'vmdOpen'. \n  Or use 'vmdPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program VMD.")
+    _launch_app('vmd', vmdOpen)
 
 cmd.extend('vmd',vmd)
     '''
 
-    try:
-        print("Opening the molecular graphics program VMD.");
-        subprocess.check_output(vmdOpen)
-        print("Success opening VMD.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'vmdOpen'. \n  Or use 'vmdPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program VMD.")
+    _launch_app('vmd', vmdOpen)
 
 cmd.extend('vmd',vmd)
 
@@ -15534,28 +17154,14 @@ return
 
     PYTHON CODE:
 def word():
-    try:
-        print("Opening the program Microsoft Word.");
-        subprocess.check_output(wordOpen)
-        print("Success opening Microsoft Word.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the wordopen'. \n  Or use 'wordPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the program Microsoft Word.")
+    _launch_app('word', wordOpen)
 
 cmd.extend('word',word)
     '''
 
-    try:
-        print("Opening the program Microsoft Word.");
-        subprocess.check_output(wordOpen)
-        print("Success opening Microsoft Word.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the wordopen'. \n  Or use 'wordPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the program Microsoft Word.")
+    _launch_app('word', wordOpen)
 
 cmd.extend('word',word)
 
@@ -15584,25 +17190,15 @@ return
     subprocess.call(x11Open);return
     PYTHON CODE:
 def x11():
-    try:
-        print("Opening an X11 window.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.check_output(x11Open)
-        print("Opened an X11 window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening an X11 window.")
+    _launch_app('x11', x11Open)
 
 
 cmd.extend('x11',x11)
     '''
 
-    try:
-        print("Opening an X11 window.");                               
-        # URL must be in single quotes                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
-        subprocess.check_output(x11Open)
-        print("Opened an X11 window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening an X11 window.")
+    _launch_app('x11', x11Open)
 
 
 cmd.extend('x11',x11)
@@ -15636,23 +17232,15 @@ def xquartz():
 
     PYTHON CODE:
 def xquartz():
-    try:
-        print("Opening a new XQuartz window.");                               
-        subprocess.Popen(xquartzOpen)
-        print("Opened a new XQuartz window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening a new XQuartz window.")
+    _launch_app('xquartz', xquartzOpen)
 
 
 cmd.extend('xquartz',xquartz)
     '''
 
-    try:
-        print("Opening a new XQuartz window.");                               
-        subprocess.Popen(xquartzOpen)
-        print("Opened a new XQuartz window.")
-    except Exception as e:
-        print("Subprocess error: " % e) # prints error if browser is not found 
+    print("Opening a new XQuartz window.")
+    _launch_app('xquartz', xquartzOpen)
 
 
 cmd.extend('xquartz',xquartz)
@@ -15685,31 +17273,17 @@ return
 
     PYTHON CODE:
 def yasara(fileName="test.pml"):
-    try:
-        print("Opening the molecular graphics program Yasara.");
-        subprocess.check_output(yasaraOpen)
-        print("Success opening Yasara.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'yasaraOpen'. \n  Or use 'yasaraPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program Yasara.")
+    _launch_app('yasara', yasaraOpen)
 cmd.extend('yasara',yasara)
     '''
 
-    try:
-        print("Opening the molecular graphics program Yasara.");
-        subprocess.check_output(yasaraOpen)
-        print("Success opening Yasara.")
-    except subprocess.CalledProcessError:
-        print("Executable not found! \n  Check syntax of the 'yasaraOpen'. \n  Or use 'yasaraPath' as the argument of check_output().")
-        pass # handle errors in the called executable
-    except OSError:
-        pass # executable not found
+    print("Opening the molecular graphics program Yasara.")
+    _launch_app('yasara', yasaraOpen)
 cmd.extend('yasara',yasara)
 
 
-def yrb(selection='all'):
+def yrb(selection='all', removeH=1):
     ''' 
     DESCRIPTION:
     A script to highlight hydrophobicity and charge on protein surfaces (Hagemans et al. 2015).
@@ -15721,9 +17295,11 @@ def yrb(selection='all'):
 
     ARGUMENTS:
     None to apply to all or a selection
+    removeH = int: 1 deletes the hydrogen atoms, 0 only hides them {default: 1}
     EXAMPLE:
     yrb
 yrb 1lw9
+yrb 1lw9, 0
 
     MORE DETAILS:
     A script to highlight hydrophobicity and charge on protein surfaces.
@@ -15749,92 +17325,41 @@ yrb 1lw9
     blue: positively charged atoms
     grey: backbone, polar groups and remaining atoms
 
+    The colors are stored as the 'yrb' palette in _colorPalettes and are
+    applied in one pass over the selection. They are defined as new colors
+    (yrb_yellow, yrb_grey, yrb_red, yrb_blue), so the built-in colors of
+    PyMOL are not changed. Use removeH=0 to keep the hydrogen atoms.
+
 
     VERTICAL PML SCRIPT:
     NA
     HORIZONTAL PML SCRIPT:
     NA
     PYTHON CODE:
-def yrb(selection='all'):
-    cmd.remove("hydro")
-    cmd.set_color('yellow',[0.950,0.78,0.0])
-    cmd.set_color('grey',[0.95,0.95,0.95])
-    cmd.set_color('red',[1.0,0.4,0.4])  
-    cmd.set_color('blue',[0.2,0.5,0.8]) 
-
-    mapping = {}
-    mapping['arg'] = [ ('NE,NH2,NH1', 'blue'), ('CD,CZ', 'grey'), ('CG', 'yellow') ]
-    mapping['asn'] = [ ('CG,OD1,ND2', 'grey') ]
-    mapping['asp'] = [ ('CG', 'grey'), ('OD2,OD1', 'red')  ]
-    mapping['cys'] = [ ('SG', 'grey') ] 
-    mapping['gln'] = [ ('CG', 'yellow'), ('CD,OE1,NE2', 'grey') ]
-    mapping['glu'] = [ ('CG', 'yellow'), ('CD', 'grey'), ('OE1,OE2', 'red') ]
-    mapping['his'] = [ ('CG,CD2,ND1,NE2,CE1', 'grey') ] 
-    mapping['ile'] = [ ('CG1,CG2,CD1', 'yellow') ]
-    mapping['leu'] = [ ('CG,CD1,CD2', 'yellow') ]
-    mapping['lys'] = [ ('CG,CD', 'yellow'), ('CE', 'grey'), ('NZ', 'blue') ]
-    mapping['met'] = [ ('CG,CE', 'yellow'), ('SD', 'grey') ]
-    mapping['phe'] = [ ('CG,CD1,CE1,CZ,CE2,CD2', 'yellow') ]
-    mapping['pro'] = [ ('CG', 'yellow'), ('CD', 'grey') ]
-    mapping['ser'] = [ ('CB,OG', 'grey') ]
-    mapping['thr'] = [ ('CB,OG1', 'grey'), ('CG2', 'yellow') ]
-    mapping['trp'] = [ ('CG,CD2,CZ2,CH2,CZ3,CE3', 'yellow'), ('CD1,NE1,CE2', 'grey') ]
-    mapping['tyr'] = [ ('CG,CE1,CD1,CE2,CD2', 'yellow'), ('CZ,OH', 'grey') ]
-    mapping['val'] = [ ('CG1,CG2', 'yellow') ]
-
-    obj_list = cmd.get_names('objects')
-    for obj in obj_list:
-        if (obj == selection or selection == 'all'):
-            cmd.color('grey','(n. N,C,CA,O and ' + obj + ')')
-            cmd.color('yellow','(n. CB and ' + obj + ')')
-
-            for key in mapping:
-                for (atom, color) in mapping[key]:
-                    cmd.color(color, '( n. ' + atom + ' and r. ' + key + ' and ' + obj + ' )')
+def yrb(selection='all', removeH=1):
+    if int(removeH):
+        cmd.remove("hydro")
+    else:
+        cmd.hide("everything", "hydro and (%s)" % selection)
+    _color_by_residue(selection, 'yrb')
 
 cmd.extend('yrb',yrb)
     '''
 
-    cmd.remove("hydro")
-    cmd.set_color('yellow',[0.950,0.78,0.0])
-    cmd.set_color('grey',[0.95,0.95,0.95])
-    cmd.set_color('red',[1.0,0.4,0.4])  
-    cmd.set_color('blue',[0.2,0.5,0.8]) 
-
-    mapping = {}
-    mapping['arg'] = [ ('NE,NH2,NH1', 'blue'), ('CD,CZ', 'grey'), ('CG', 'yellow') ]
-    mapping['asn'] = [ ('CG,OD1,ND2', 'grey') ]
-    mapping['asp'] = [ ('CG', 'grey'), ('OD2,OD1', 'red')  ]
-    mapping['cys'] = [ ('SG', 'grey') ] 
-    mapping['gln'] = [ ('CG', 'yellow'), ('CD,OE1,NE2', 'grey') ]
-    mapping['glu'] = [ ('CG', 'yellow'), ('CD', 'grey'), ('OE1,OE2', 'red') ]
-    mapping['his'] = [ ('CG,CD2,ND1,NE2,CE1', 'grey') ] 
-    mapping['ile'] = [ ('CG1,CG2,CD1', 'yellow') ]
-    mapping['leu'] = [ ('CG,CD1,CD2', 'yellow') ]
-    mapping['lys'] = [ ('CG,CD', 'yellow'), ('CE', 'grey'), ('NZ', 'blue') ]
-    mapping['met'] = [ ('CG,CE', 'yellow'), ('SD', 'grey') ]
-    mapping['phe'] = [ ('CG,CD1,CE1,CZ,CE2,CD2', 'yellow') ]
-    mapping['pro'] = [ ('CG', 'yellow'), ('CD', 'grey') ]
-    mapping['ser'] = [ ('CB,OG', 'grey') ]
-    mapping['thr'] = [ ('CB,OG1', 'grey'), ('CG2', 'yellow') ]
-    mapping['trp'] = [ ('CG,CD2,CZ2,CH2,CZ3,CE3', 'yellow'), ('CD1,NE1,CE2', 'grey') ]
-    mapping['tyr'] = [ ('CG,CE1,CD1,CE2,CD2', 'yellow'), ('CZ,OH', 'grey') ]
-    mapping['val'] = [ ('CG1,CG2', 'yellow') ]
-
-    obj_list = cmd.get_names('objects')
-    for obj in obj_list:
-        if (obj == selection or selection == 'all'):
-            cmd.color('grey','(n. N,C,CA,O and ' + obj + ')')
-            cmd.color('yellow','(n. CB and ' + obj + ')')
-
-            for key in mapping:
-                for (atom, color) in mapping[key]:
-                    cmd.color(color, '( n. ' + atom + ' and r. ' + key + ' and ' + obj + ' )')
+    if int(removeH):
+        cmd.remove("hydro")
+    else:
+        cmd.hide("everything", "hydro and (%s)" % selection)
+    _color_by_residue(selection, 'yrb')
 
 cmd.extend('yrb',yrb)
 
 
 
  
+if shortcutTiming:
+    SCtime(1, quiet=1)
+
 """ Print the shortcuts on startup of PyMOL"""
-print(SC.__doc__)
+if not shortcutsLoadedLazily:
+    print(SC.__doc__)
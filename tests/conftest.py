@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+'''
+Fixtures shared by the tests: the shortcuts module loaded from the
+repository, separate headless PyMOL processes for the scripts sourced 
+with run, and local HTTP/1.1 servers that stand in for the web services
+used by the shortcuts, so that no test uses the network.
+
+Run with the Python interpreter that PyMOL uses:
+
+    python -m pytest tests
+'''
+from __future__ import division, print_function
+
+import http.server, importlib.util, os, os.path, subprocess, sys, threading, time
+
+import pytest
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def shortcuts():
+    '''The module pymolshortcuts4rnaUpdated.py, loaded once per test session.'''
+    pytest.importorskip('pymol')
+    spec = importlib.util.spec_from_file_location('pymolshortcuts4rnaUpdated',
+        os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def headless_pymol(tmp_path):
+    '''
+    Return a function that runs a pml script in a new headless PyMOL and
+    returns its output. The process starts in tmp_path, away from the 
+    repository; the test fails if PyMOL exits with an error or prints a
+    traceback.
+    '''
+    pytest.importorskip('pymol')
+
+    def run(script):
+        scriptFile = tmp_path / 'test.pml'
+        scriptFile.write_text(script)
+        completed = subprocess.run([sys.executable, '-m', 'pymol', '-cq', str(scriptFile)], cwd=str(tmp_path),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True, timeout=300)
+        assert completed.returncode == 0, completed.stdout
+        assert 'Traceback' not in completed.stdout, completed.stdout
+        return completed.stdout
+
+    return run
+
+
+@pytest.fixture
+def local_server():
+    '''
+    Return a function that starts a local server and returns it.
+
+    respond(path) returns (status, content) for each GET; latency delays
+    every answer. server.url is the base URL, server.requests lists
+    (time, path) of the requests, and server.connections counts the
+    connections accepted. The servers are shut down after the test.
+    '''
+    servers = []
+
+    def start(respond, latency=0.0):
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                server.connections += 1
+                http.server.BaseHTTPRequestHandler.setup(self)
+
+            def do_GET(self):
+                server.requests.append((time.time(), self.path))
+                time.sleep(latency)
+                status, content = respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html' if content.startswith(b'<') else 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.url = 'http://127.0.0.1:%d' % server.server_address[1]
+        server.requests, server.connections = [], 0
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
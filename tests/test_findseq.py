@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''Tests of findSeq and its cached sequence index.'''
+from __future__ import division, print_function
+
+import pytest
+
+
+@pytest.fixture
+def cmd(shortcuts):
+    '''An empty session with an empty sequence index.'''
+    from pymol import cmd
+    cmd.reinitialize()
+    shortcuts._sequenceIndex.clear()
+    yield cmd
+    cmd.reinitialize()
+    shortcuts._sequenceIndex.clear()
+
+
+def found(cmd, selName):
+    '''The residues in a selection as (chain, resi) pairs in sequence order.'''
+    residues = []
+    cmd.iterate('(%s) and name CA+P' % selName, 'residues.append((chain, int(resi)))', space={'residues': residues})
+    return residues
+
+
+def test_protein(shortcuts, cmd):
+    cmd.fab('AKLVDEGRW', 'prot', chain='A')
+    assert shortcuts.findSeq('LVDE', 'prot', 'hit') == 'hit'
+    assert found(cmd, 'hit') == [('A', 3), ('A', 4), ('A', 5), ('A', 6)]
+    shortcuts.findSeq('GW', 'prot', 'miss')
+    assert found(cmd, 'miss') == []
+
+
+def test_rna(shortcuts, cmd):
+    cmd.fnab('GGACUCC', 'rna', mode='RNA', form='A', dbl_helix=0)
+    # fnab writes the nucleotides as HETATM records, unlike a PDB entry
+    cmd.alter('rna', 'chain="R"; type="ATOM"')
+    shortcuts.findSeq('ACU', 'rna', 'hit')
+    assert found(cmd, 'hit') == [('R', 3), ('R', 4), ('R', 5)]
+
+
+def test_het(shortcuts, cmd):
+    cmd.fab('AKLVDEGRW', 'prot', chain='A')
+    cmd.alter('prot and resi 4', 'type="HETATM"')
+    # the HETATM residue is left out of the sequence unless het is set
+    shortcuts.findSeq('KLD', 'prot', 'withoutHet', het=0)
+    assert found(cmd, 'withoutHet') == [('A', 2), ('A', 3), ('A', 5)]
+    shortcuts.findSeq('KLD', 'prot', 'withHet', het=1)
+    assert found(cmd, 'withHet') == []
+    shortcuts.findSeq('KLVD', 'prot', 'withHet', het=1)
+    assert found(cmd, 'withHet') == [('A', 2), ('A', 3), ('A', 4), ('A', 5)]
+
+
+def test_index_is_rebuilt_after_alter_resn(shortcuts, cmd):
+    cmd.fab('AKLVDEGRW', 'prot', chain='A')
+    shortcuts.findSeq('LVD', 'prot', 'before')
+    assert len(found(cmd, 'before')) == 3
+    signature = shortcuts._sequenceIndex['prot'][0]
+
+    cmd.alter('prot and resi 4', 'resn="ALA"')
+    shortcuts.findSeq('LVD', 'prot', 'after')
+    assert found(cmd, 'after') == []
+    shortcuts.findSeq('LAD', 'prot', 'after')
+    assert found(cmd, 'after') == [('A', 3), ('A', 4), ('A', 5)]
+    assert shortcuts._sequenceIndex['prot'][0] != signature
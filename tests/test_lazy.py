@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+'''Tests of pymolshortcuts4rnaLazy.py sourced with the run command of headless PyMOL.'''
+from __future__ import division, print_function
+
+import os, re
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_run_registers_the_shortcuts(headless_pymol):
+    # started away from the repository, so the path must come from the run command
+    output = headless_pymol('run %s\nSCload\n' % os.path.join(repoDirectory, 'pymolshortcuts4rnaLazy.py'))
+    assert int(re.search(r'Registered (\d+) shortcuts', output).group(1)) > 100
+    assert 'Loaded the shortcuts from %s.' % os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py') in output
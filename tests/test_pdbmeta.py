@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+'''Tests of PDBmeta against a local stand-in for the RCSB Data API.'''
+from __future__ import division, print_function
+
+import json, math, sqlite3
+
+import pytest
+
+# Entries served by the stand-in; 2NMR is an NMR entry without a resolution.
+entries = {
+    '1EHZ': {'struct': {'title': 'tRNA(Phe)'}, 'exptl': [{'method': 'X-RAY DIFFRACTION'}],
+        'rcsb_accession_info': {'deposit_date': '2000-03-15T00:00:00+0000'},
+        'rcsb_entry_info': {'resolution_combined': [1.93], 'deposited_polymer_entity_instance_count': 1,
+            'polymer_entity_count_protein': 0, 'polymer_entity_count_RNA': 1, 'polymer_entity_count_DNA': 0,
+            'nonpolymer_bound_components': ['MG']}},
+    '2NMR': {'struct': {'title': 'RNA hairpin'}, 'exptl': [{'method': 'SOLUTION NMR'}],
+        'rcsb_accession_info': {'deposit_date': '2006-11-02T00:00:00+0000'},
+        'rcsb_entry_info': {'deposited_polymer_entity_instance_count': 1, 'polymer_entity_count_RNA': 1}},
+    }
+
+
+def entry(code):
+    '''Return the entry of code, made up for the codes that are not in entries.'''
+    return entries.get(code, {'struct': {'title': 'Entry %s' % code}, 'exptl': [{'method': 'X-RAY DIFFRACTION'}],
+        'rcsb_entry_info': {'resolution_combined': [2.5], 'deposited_polymer_entity_instance_count': 2,
+            'polymer_entity_count_RNA': 1, 'polymer_entity_count_protein': 1}})
+
+
+def respond(path):
+    code = path.rsplit('/', 1)[1]
+    if code.startswith('9'):
+        return 404, b'{"status": 404}'
+    return 200, json.dumps(entry(code)).encode()
+
+
+@pytest.fixture
+def rcsb(shortcuts, local_server, monkeypatch, tmp_path):
+    '''A stand-in server with pdbMetaURL and pdbMetaDatabase pointed at it and at an empty store.'''
+    server = local_server(respond)
+    monkeypatch.setattr(shortcuts, 'pdbMetaURL', server.url + '/rest/v1/core/entry/')
+    monkeypatch.setattr(shortcuts, 'pdbMetaDatabase', str(tmp_path / 'pdbmeta.sqlite'))
+    monkeypatch.setattr(shortcuts, 'structureOffline', False)
+    return server
+
+
+def test_fetched_entries_are_stored(shortcuts, rcsb):
+    table = shortcuts.PDBmeta('1ehz, 2nmr', quiet=1)
+    assert list(table['id']) == ['1EHZ', '2NMR']
+    assert list(table['source']) == ['network', 'network']
+    assert table['method'][0] == 'X-RAY DIFFRACTION'
+    assert table['resolution'][0] == pytest.approx(1.93)
+    assert math.isnan(table['resolution'][1])
+    assert (table['rna'][0], table['protein'][0], table['ligands'][0]) == (1, 0, 'MG')
+    assert table['deposited'][0] == '2000-03-15'
+
+    database = sqlite3.connect(shortcuts.pdbMetaDatabase)
+    stored = dict(database.execute('SELECT id, json FROM entries'))
+    database.close()
+    assert sorted(stored) == ['1EHZ', '2NMR']
+    assert json.loads(stored['1EHZ']) == entries['1EHZ']
+
+
+def test_stored_entries_are_answered_from_the_store(shortcuts, rcsb):
+    shortcuts.PDBmeta('1ehz 2nmr', quiet=1)
+    nRequests = len(rcsb.requests)
+    table = shortcuts.PDBmeta('2nmr 1ehz', quiet=0)
+    assert len(rcsb.requests) == nRequests
+    assert list(table['source']) == ['store', 'store']
+    assert math.isnan(table['resolution'][0])
+    assert table['resolution'][1] == pytest.approx(1.93)
+
+    shortcuts.PDBmeta('1ehz', refresh=1, quiet=1)
+    assert len(rcsb.requests) == nRequests + 1
+
+
+def test_offline_uses_only_the_store(shortcuts, rcsb):
+    shortcuts.PDBmeta('1ehz 2nmr', quiet=1)
+    nRequests = len(rcsb.requests)
+    table = shortcuts.PDBmeta('1ehz 4fe5', offline=1, quiet=1)
+    assert list(table['source']) == ['store', 'not stored']
+    everything = shortcuts.PDBmeta(offline=1, quiet=0)
+    assert list(everything['id']) == ['1EHZ', '2NMR']
+    assert len(rcsb.requests) == nRequests
+
+
+def test_missing_entries_are_reported_and_not_stored(shortcuts, rcsb):
+    table = shortcuts.PDBmeta('9zzz 1ehz', quiet=1)
+    assert list(table['source']) == ['not found', 'network']
+    table = shortcuts.PDBmeta('9zzz', offline=1, quiet=1)
+    assert list(table['source']) == ['not stored']
+
+
+def test_connections_are_reused(shortcuts, rcsb):
+    codes = ['%d%03d' % (1 + k % 8, k) for k in range(40)]
+    table = shortcuts.PDBmeta(' '.join(codes), workers=4, quiet=1)
+    assert list(table['source']) == ['network'] * 40
+    assert len(rcsb.requests) == 40
+    assert rcsb.connections <= 4
+
+
+def test_codes_are_read_from_a_file(shortcuts, rcsb, tmp_path):
+    fileName = tmp_path / 'codes.txt'
+    fileName.write_text('1ehz 2nmr\n1abc\n')
+    table = shortcuts.PDBmeta(str(fileName), quiet=1)
+    assert list(table['id']) == ['1EHZ', '2NMR', '1ABC']
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+'''Tests of renderScenes in a session that sourced the shortcuts with the run command.'''
+from __future__ import division, print_function
+
+import os
+
+repoDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# bs loads no structure, so nothing is fetched; the figure cache is kept in tmp_path.
+renderJob = '''run %(script)s
+python
+figureCachePath = %(cache)r
+structureOffline = True
+print('shortcutsFilePath = ' + shortcutsFilePath)
+table = renderScenes('bs', '40x30', %(outdir)r, 1, 72)
+print('status = ' + ' '.join(table['status']))
+python end
+'''
+
+
+def test_workers_run_the_sourced_script(headless_pymol, tmp_path):
+    script = os.path.join(repoDirectory, 'pymolshortcuts4rnaUpdated.py')
+    job = {'script': script, 'cache': str(tmp_path / 'cache'), 'outdir': str(tmp_path / 'figures')}
+    output = headless_pymol(renderJob % job)
+    assert 'shortcutsFilePath = %s\n' % script in output
+    assert 'status = rendered\n' in output
+    assert os.path.getsize(str(tmp_path / 'figures' / 'bs_40x30.png')) > 0
+    assert len(os.listdir(str(tmp_path / 'cache'))) == 1
+
+    # a second session finds the figure in the cache
+    output = headless_pymol(renderJob % job)
+    assert 'status = cached\n' in output
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+'''Tests of the clash discs drawn by sb.'''
+from __future__ import division, print_function
+
+import pytest
+
+
+@pytest.fixture
+def clashes(shortcuts):
+    '''Two carbon atoms 2.5 A apart in two states; their Bondi radii overlap by 0.9 A.'''
+    cmd = shortcuts.cmd
+    cmd.reinitialize()
+    cmd.pseudoatom('pair', name='C1', resi=1, elem='C', pos=[0.0, 0.0, 0.0])
+    cmd.pseudoatom('pair', name='C2', resi=2, elem='C', pos=[2.5, 0.0, 0.0])
+    cmd.create('pair', 'pair', 1, 2)
+    yield cmd
+    cmd.reinitialize()
+
+
+def test_each_state_with_clashes_gets_discs(shortcuts, clashes):
+    table = shortcuts.sb('pair')
+    assert list(table['clashes']) == [1, 1]
+    assert table['overlap'][0] == pytest.approx(0.9)
+    assert clashes.count_states('bump_check') == 2
+
+
+def test_discs_of_an_earlier_run_are_replaced(shortcuts, clashes):
+    shortcuts.sb('pair', name='discs')
+    clashes.alter_state(2, 'pair and name C2', 'x = 5.0')
+    table = shortcuts.sb('pair', name='discs')
+    assert list(table['clashes']) == [1, 0]
+    assert clashes.count_states('discs') == 1
+
+    shortcuts.sb('pair', name='discs', show=0)
+    assert 'discs' not in clashes.get_names('objects')
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+'''Tests of the concurrent searches of MC and IPM against local stand-ins for the search sites.'''
+from __future__ import division, print_function
+
+import os, time
+
+import pytest
+
+
+def assert_spaced(times, interval):
+    '''The starts claimed by the limiter are interval apart; a thread may pick up its request a little late.'''
+    times = sorted(times)
+    assert times[-1] - times[0] >= (len(times) - 1) * interval - 0.05
+    assert min(b - a for a, b in zip(times, times[1:])) >= interval / 2
+
+
+def respond(path):
+    if 'fail' in path:
+        return 503, b'<html>busy</html>'
+    return 200, ('<html>results for %s</html>' % path).encode()
+
+
+@pytest.fixture
+def search(shortcuts, monkeypatch, tmp_path):
+    '''The search settings pointed at an empty cache; the browser tabs are recorded instead of opened.'''
+    monkeypatch.setattr(shortcuts, 'searchCachePath', str(tmp_path / 'searches'))
+    monkeypatch.setattr(shortcuts, 'searchHostInterval', 0.2)
+    tabs = []
+    monkeypatch.setattr(shortcuts.webbrowser, 'open_new_tab', lambda url: tabs.append((time.time(), url)))
+    return tabs
+
+
+def test_requests_to_one_host_are_spaced(shortcuts, local_server, search):
+    server = local_server(respond)
+    urls = ['%s/q?term=%d' % (server.url, i) for i in range(4)]
+    results = shortcuts._search_requests(urls, fetch=True, show=False)
+    assert [r['status'] for r in results] == [200] * 4
+    assert len(server.requests) == 4
+    assert_spaced([start for start, path in server.requests], 0.2)
+
+
+def test_requests_to_different_hosts_overlap(shortcuts, local_server, search):
+    servers = [local_server(respond, latency=1.0) for i in range(4)]
+    start = time.time()
+    results = shortcuts._search_requests([server.url + '/q?term=rna' for server in servers], fetch=True, show=False)
+    assert [r['status'] for r in results] == [200] * 4
+    # one request after the other would take 4 s
+    assert time.time() - start < 2.5
+
+
+def test_saved_pages_are_reused_until_they_expire(shortcuts, local_server, search):
+    server = local_server(respond)
+    url = server.url + '/q?term=pymol'
+    first = shortcuts._search_requests([url], fetch=True, show=False)[0]
+    assert (first['status'], first['cached']) == (200, False)
+    with open(first['path'], 'rb') as f:
+        assert f.read() == b'<html>results for /q?term=pymol</html>'
+    assert first['bytes'] == os.path.getsize(first['path'])
+    assert not [name for name in os.listdir(shortcuts.searchCachePath) if name.endswith('.part')]
+
+    second = shortcuts._search_requests([url], fetch=True, show=False, hours=1)[0]
+    assert (second['status'], second['cached'], second['path']) == (200, True, first['path'])
+    assert len(server.requests) == 1
+
+    twoHoursAgo = time.time() - 7200
+    os.utime(first['path'], (twoHoursAgo, twoHoursAgo))
+    third = shortcuts._search_requests([url], fetch=True, show=False, hours=1)[0]
+    assert (third['status'], third['cached']) == (200, False)
+    assert len(server.requests) == 2
+
+
+def test_http_errors_are_reported_in_the_rows(shortcuts, local_server, search):
+    server = local_server(respond)
+    results = shortcuts._search_requests([server.url + '/fail?term=rna', server.url + '/q?term=rna'],
+        fetch=True, show=True)
+    assert (results[0]['status'], results[0]['bytes'], results[0]['path']) == (503, 0, '')
+    assert results[1]['status'] == 200
+    # the failed page is opened at its URL, the saved page from the cache
+    assert [url for opened, url in search] == [server.url + '/fail?term=rna', 'file://' + results[1]['path']]
+    assert len(os.listdir(shortcuts.searchCachePath)) == 1
+
+
+def test_MC_returns_one_row_per_site(shortcuts, local_server, search, monkeypatch):
+    server = local_server(respond)
+    monkeypatch.setattr(shortcuts, '_searchURLs',
+        dict((site, server.url + '/' + site + '?q={term}') for site in shortcuts._coreSearchSites))
+    table = shortcuts.MC('RNA packing', fetch=1, show=0)
+    assert list(table['site']) == shortcuts._coreSearchSites
+    assert table['url'][0] == server.url + '/BX?q=RNA%20packing'
+    assert list(table['status']) == [200] * len(shortcuts._coreSearchSites)
+    assert not table['cached'].any()
+    assert shortcuts.MC('RNA packing', fetch=1, show=0)['cached'].all()
+
+
+def test_IPM_opens_one_spaced_tab_per_term(shortcuts, local_server, search, monkeypatch):
+    server = local_server(respond)
+    monkeypatch.setattr(shortcuts, 'ipmURL', server.url + '/pubmed/?term=')
+    shortcuts.IPM('pymol', 'RNA crystal', ' vmd ')
+    assert sorted(url for opened, url in search) == [server.url + '/pubmed/?term=' + term
+        for term in ('RNA%20crystal', 'pymol', 'vmd')]
+    assert_spaced([opened for opened, url in search], 0.2)
+    assert server.requests == []